@@ -0,0 +1,218 @@
+"""
+character rig 캐시를 사용할 때 render 마다 줄어드는 캐릭터 준비 시간을 측정합니다.
+animated_drawings 없이 같은 방식(mask 외곽선과 내부 격자 점의 Delaunay 삼각형 분할,
+mesh 간선과 관절 pin으로 만드는 ARAP 최소 제곱 행렬)으로 rig를 만들어
+캐시가 없을 때(생성 + 저장)와 있을 때(읽기)의 시간을 비교합니다.
+animated_drawings가 설치되어 있으면(render 이미지) 실제 render 워커에서 hook을 거친
+예제 캐릭터의 render 시간도 비교합니다.
+"""
+from pathlib import Path
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import cv2
+import numpy as np
+from scipy import sparse
+from scipy.spatial import Delaunay
+from rig_cache import (
+    ARAP_KIND,
+    MESH_KIND,
+    RIG_CACHE_DIR_ENV,
+    RigCache,
+    compute_rig_cache_key,
+)
+from test_rig_cache import EXAMPLE_FRAME_COUNT, render_example, write_example_mvc_cfg
+
+
+# animated_drawings는 mask를 정사각형으로 채운 뒤 mesh를 만듦
+IMAGE_SIZES = [400, 800]
+# animated_drawings의 내부 격자 점 수 (한 변)
+GRID_SIZE = 40
+PIN_WEIGHT = 1000
+NUM_REPEATS = 5
+
+
+# (시작, 끝) 400px 기준, 팔다리
+LIMBS = [
+    ((150, 150), (60, 230)),
+    ((250, 150), (340, 230)),
+    ((180, 280), (150, 390)),
+    ((220, 280), (250, 390)),
+]
+JOINTS = [
+    (200, 70),
+    (200, 150),
+    (200, 260),
+    (60, 230),
+    (340, 230),
+    (150, 390),
+    (250, 390),
+]
+
+
+def create_mask(image_size: int) -> np.ndarray:
+    """몸통, 머리, 팔다리가 있는 캐릭터 mask"""
+    scale = image_size / 400
+
+    def to_point(point):
+        return (int(point[0] * scale), int(point[1] * scale))
+
+    mask = np.zeros((image_size, image_size), dtype=np.uint8)
+    cv2.ellipse(mask, to_point((200, 200)), to_point((60, 100)), 0, 0, 360, 255, -1)
+    cv2.circle(mask, to_point((200, 70)), int(45 * scale), 255, -1)
+    for start, end in LIMBS:
+        cv2.line(mask, to_point(start), to_point(end), 255, int(24 * scale))
+    return mask
+
+
+def create_joints(image_size: int) -> np.ndarray:
+    return np.array(JOINTS, dtype=np.float32) * (image_size / 400)
+
+
+def contains_point(contour: np.ndarray, point) -> bool:
+    return cv2.pointPolygonTest(contour, (float(point[0]), float(point[1])), False) > 0
+
+
+def generate_mesh(mask: np.ndarray) -> dict:
+    contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_NONE)
+    contour = max(contours, key=cv2.contourArea).astype(np.float32)
+    outside_vertices = cv2.approxPolyDP(contour, 0.25, True)[:, 0, :]
+
+    grid = np.linspace(0, mask.shape[0], GRID_SIZE)
+    inside_vertices = [
+        (x, y) for x in grid for y in grid if contains_point(contour, (x, y))
+    ]
+    vertices = np.concatenate([outside_vertices, inside_vertices]).astype(np.float32)
+
+    # convex hull의 삼각형 중 중심이 외곽선 밖에 있는 삼각형은 제외
+    triangles = [
+        triangle
+        for triangle in Delaunay(vertices).simplices
+        if contains_point(contour, vertices[triangle].mean(axis=0))
+    ]
+    return {"mesh": {"vertices": vertices, "triangles": triangles}}
+
+
+def setup_arap(pins_xy: np.ndarray, triangles: list, vertices: np.ndarray) -> dict:
+    edges = sorted(
+        {
+            tuple(sorted((int(triangle[i]), int(triangle[(i + 1) % 3]))))
+            for triangle in triangles
+            for i in range(3)
+        }
+    )
+    num_vertices = len(vertices)
+    pin_vertex_indexes = [
+        int(np.argmin(np.linalg.norm(vertices - pin, axis=1))) for pin in pins_xy
+    ]
+
+    rows, columns, values = [], [], []
+    for row, (start, end) in enumerate(edges):
+        rows += [row, row]
+        columns += [start, end]
+        values += [-1.0, 1.0]
+    for index, vertex_index in enumerate(pin_vertex_indexes):
+        rows.append(len(edges) + index)
+        columns.append(vertex_index)
+        values.append(float(PIN_WEIGHT))
+    a = sparse.csr_matrix(
+        (values, (rows, columns)),
+        shape=(len(edges) + len(pins_xy), num_vertices),
+    )
+    # 프레임마다 푸는 정규 방정식의 행렬과 간선별 회전 추정에 쓰는 이웃 정점
+    gram = (a.T @ a).tocsc()
+    neighbors = [gram[:, i].indices for i in range(num_vertices)]
+    return {
+        "pins_xy": pins_xy,
+        "edges": np.array(edges),
+        "a": a,
+        "gram": gram,
+        "neighbors": neighbors,
+    }
+
+
+def measure(rig_cache: RigCache, mask: np.ndarray, joints: np.ndarray) -> float:
+    start_time = time.perf_counter()
+    mesh = rig_cache.get_or_create(
+        MESH_KIND,
+        compute_rig_cache_key(mask),
+        lambda: generate_mesh(mask),
+    )["mesh"]
+    rig_cache.get_or_create(
+        ARAP_KIND,
+        compute_rig_cache_key(joints, mesh["triangles"], mesh["vertices"]),
+        lambda: setup_arap(joints, mesh["triangles"], mesh["vertices"]),
+    )
+    return time.perf_counter() - start_time
+
+
+def case_benchmark_rig_cache():
+    for image_size in IMAGE_SIZES:
+        mask = create_mask(image_size)
+        joints = create_joints(image_size)
+        # 관절 하나만 옮긴 경우
+        moved_joints = joints.copy()
+        moved_joints[-1, 0] += 5
+        miss_seconds, hit_seconds, joint_edit_seconds = [], [], []
+        for _ in range(NUM_REPEATS):
+            with tempfile.TemporaryDirectory() as temp_dir:
+                # 워커마다 새로 만드는 것과 같도록 매번 새 RigCache 사용
+                cache_dir = Path(temp_dir)
+                for seconds, character_joints in [
+                    (miss_seconds, joints),
+                    (hit_seconds, joints),
+                    (joint_edit_seconds, moved_joints),
+                ]:
+                    rig_cache = RigCache(cache_dir, max_bytes=1 << 30)
+                    seconds.append(measure(rig_cache, mask, character_joints))
+                cache_bytes = sum(
+                    cache_path.stat().st_size
+                    for cache_path in cache_dir.glob("*/*.npz")
+                )
+
+        miss = float(np.median(miss_seconds))
+        hit = float(np.median(hit_seconds))
+        print(
+            f"image {image_size}px: "
+            f"no cache {miss * 1000:.0f}ms, "
+            f"cached {hit * 1000:.0f}ms "
+            f"(saved {(miss - hit) * 1000:.0f}ms per render), "
+            f"joint edit {float(np.median(joint_edit_seconds)) * 1000:.0f}ms, "
+            f"cache {cache_bytes / 1024:.0f} KiB"
+        )
+
+
+def case_benchmark_rig_cache_hooks():
+    try:
+        import animated_drawings  # type: ignore # noqa: F401
+    except ImportError:
+        print("animated_drawings가 없어 실제 hook을 거친 render는 측정하지 않습니다.")
+        return
+
+    os.environ.pop(RIG_CACHE_DIR_ENV, None)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        base_path = Path(temp_dir)
+        mvc_cfg_path = write_example_mvc_cfg(base_path)
+        worker_env = {RIG_CACHE_DIR_ENV: base_path.joinpath("rig_cache").as_posix()}
+        for name, env in [
+            ("no cache", {}),
+            ("cache miss", worker_env),
+            ("cache hit", worker_env),
+        ]:
+            result = render_example(mvc_cfg_path, worker_env=env)
+            print(
+                f"animated_drawings {EXAMPLE_FRAME_COUNT} frames, {name}: "
+                f"{result.duration_seconds:.2f}s"
+            )
+
+
+if __name__ == "__main__":
+    case_benchmark_rig_cache()
+    case_benchmark_rig_cache_hooks()
+
+
+# python ad_animated_drawings/case_rig_cache.py
@@ -0,0 +1,129 @@
+"""
+render 결과 출력 형식별 파일 크기와 인코딩 시간을 비교합니다.
+animated_drawings 없이 렌더링한 프레임과 비슷한 프레임(투명 배경 위에서 움직이는 텍스처)을 만들어
+animated_drawings의 GIFWriter, MP4Writer와 같은 방식으로 인코딩합니다.
+"""
+from pathlib import Path
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import cv2
+import numpy as np
+from PIL import Image, ImageDraw
+from gif_optimizer import optimize_gif
+from render_worker_pool import FALLBACK_VIDEO_CODECS
+
+
+NUM_FRAMES = 100
+FRAME_SIZE = 500
+FPS = 30
+# (이름, 확장자, 코덱)
+VIDEO_FORMATS = [
+    ("mp4 H.264", ".mp4", "avc1"),
+    ("mp4 MPEG-4", ".mp4", "mp4v"),
+    ("webm VP8", ".webm", "VP80"),
+    ("webm VP9", ".webm", "VP90"),
+]
+
+
+def create_frames(background_alpha: int):
+    """BGRA 프레임, 텍스처를 입힌 팔이 흔들리고 몸통은 멈춰 있음"""
+    rng = np.random.default_rng(0)
+    texture = (
+        rng.random((160, 100, 3)) * 60 + np.linspace(80, 200, 100)[None, :, None]
+    ).astype(np.uint8)
+    texture_image = Image.fromarray(texture, "RGB")
+    body = texture_image.resize((140, 200))
+    frames = []
+    for i in range(NUM_FRAMES):
+        image = Image.new(
+            "RGBA", (FRAME_SIZE, FRAME_SIZE), (255, 255, 255, background_alpha)
+        )
+        arm = texture_image.rotate(
+            20 * np.sin(i / 6), expand=True, resample=Image.BILINEAR
+        )
+        mask = Image.new("L", arm.size, 0)
+        ImageDraw.Draw(mask).ellipse((5, 5, arm.size[0] - 5, arm.size[1] - 5), 255)
+        image.paste(arm, (200 + i, 80), mask)
+        image.paste(body, (180, 260))
+        frames.append(cv2.cvtColor(np.asarray(image), cv2.COLOR_RGBA2BGRA))
+    return frames
+
+
+def encode_gif(frames, file_path: Path):
+    # animated_drawings GIFWriter와 같은 방식
+    images = [
+        Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGRA2RGBA)) for frame in frames
+    ]
+    images[0].save(
+        file_path.as_posix(),
+        save_all=True,
+        append_images=images[1:],
+        duration=int(1000 / FPS),
+        disposal=2,
+        loop=0,
+    )
+
+
+def encode_video(frames, file_path: Path, codec: str) -> bool:
+    # animated_drawings MP4Writer와 같은 방식
+    video_writer = cv2.VideoWriter(
+        file_path.as_posix(),
+        cv2.VideoWriter_fourcc(*codec),
+        FPS,
+        (FRAME_SIZE, FRAME_SIZE),
+    )
+    if not video_writer.isOpened():
+        return False
+    for frame in frames:
+        video_writer.write(frame[:, :, :3])
+    video_writer.release()
+    return True
+
+
+def print_result(name: str, file_path: Path, seconds: float):
+    print(
+        f"  {name:<14} {file_path.stat().st_size / 1024:>8.0f} KiB "
+        f"{seconds * 1000:>7.0f} ms"
+    )
+
+
+def case_video_formats():
+    for background_alpha, background_name in [(0, "transparent"), (255, "white")]:
+        frames = create_frames(background_alpha)
+        print(
+            f"{background_name} background, "
+            f"{NUM_FRAMES} frames {FRAME_SIZE}x{FRAME_SIZE}"
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            gif_path = Path(temp_dir, "dab.gif")
+            start_time = time.perf_counter()
+            encode_gif(frames, gif_path)
+            gif_seconds = time.perf_counter() - start_time
+            print_result("gif", gif_path, gif_seconds)
+
+            start_time = time.perf_counter()
+            optimize_gif(gif_path)
+            optimize_seconds = time.perf_counter() - start_time
+            print_result("gif optimized", gif_path, gif_seconds + optimize_seconds)
+
+            for name, suffix, codec in VIDEO_FORMATS:
+                video_path = Path(temp_dir, f"dab_{codec}{suffix}")
+                start_time = time.perf_counter()
+                if not encode_video(frames, video_path, codec):
+                    print(
+                        f"  {name:<14} {codec} 코덱을 사용할 수 없음 "
+                        f"(render 워커는 {FALLBACK_VIDEO_CODECS[suffix]} 코덱 사용)"
+                    )
+                    continue
+                print_result(name, video_path, time.perf_counter() - start_time)
+
+
+if __name__ == "__main__":
+    case_video_formats()
+
+
+# python case_video_formats.py
@@ -0,0 +1,189 @@
+import logging
+import os
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Tuple
+import numpy as np
+from PIL import Image, ImageSequence
+
+
+GIF_OPTIMIZE_ENV = "AD_GIF_OPTIMIZE"
+# 투명 픽셀과 바뀌지 않은 픽셀에 사용하는 palette index, 나머지 255색은 프레임들이 공유
+TRANSPARENT_INDEX = 255
+MAX_PALETTE_COLORS = 255
+# palette를 만들 때 사용할 최대 프레임 수, 고르게 뽑음
+MAX_PALETTE_SAMPLE_FRAMES = 16
+ALPHA_THRESHOLD = 128
+DISPOSAL_NONE = 1
+DISPOSAL_BACKGROUND = 2
+
+
+class GifFrame(NamedTuple):
+    # (left, top, right, bottom)
+    box: Tuple[int, int, int, int]
+    disposal: int
+
+
+def is_gif_optimize_enabled() -> bool:
+    return os.environ.get(GIF_OPTIMIZE_ENV, "1") == "1"
+
+
+def read_gif_frames(file_path: Path) -> Tuple[List[np.ndarray], List[int], int]:
+    """gif의 프레임(RGBA), 프레임별 재생 시간(ms), 반복 횟수를 반환합니다."""
+    frames = []
+    durations = []
+    with Image.open(file_path.as_posix()) as im:
+        loop = im.info.get("loop", 0)
+        for frame in ImageSequence.Iterator(im):
+            frames.append(np.asarray(frame.convert("RGBA")))
+            durations.append(frame.info.get("duration", im.info.get("duration", 0)))
+    return frames, durations, loop
+
+
+def create_shared_palette(frames: List[np.ndarray]) -> Image.Image:
+    """모든 프레임이 함께 사용할 palette를 불투명 픽셀로 만듭니다."""
+    step = max(1, len(frames) // MAX_PALETTE_SAMPLE_FRAMES)
+    pixels = np.concatenate(
+        [frame[frame[..., 3] >= ALPHA_THRESHOLD][:, :3] for frame in frames[::step]]
+    )
+    if len(pixels) == 0:
+        pixels = np.zeros((1, 3), dtype=np.uint8)
+    # quantize는 이미지 단위로 동작하므로 픽셀을 한 줄로 펼침
+    sample = Image.fromarray(pixels.reshape(1, -1, 3), "RGB")
+    # 0: MEDIANCUT, 1: MAXCOVERAGE (pillow 버전마다 상수 이름이 달라 숫자로 사용)
+    return sample.quantize(colors=MAX_PALETTE_COLORS, method=0)
+
+
+def quantize_frame(frame: np.ndarray, palette: Image.Image) -> np.ndarray:
+    rgb = Image.fromarray(np.ascontiguousarray(frame[..., :3]), "RGB")
+    # dither 0: NONE, 프레임마다 dither 무늬가 달라지면 바뀐 픽셀이 많아짐
+    indexes = np.array(rgb.quantize(palette=palette, dither=0))
+    indexes[frame[..., 3] < ALPHA_THRESHOLD] = TRANSPARENT_INDEX
+    return indexes
+
+
+def get_box(mask: np.ndarray) -> Optional[Tuple[int, int, int, int]]:
+    rows = np.flatnonzero(mask.any(axis=1))
+    if len(rows) == 0:
+        return None
+    columns = np.flatnonzero(mask.any(axis=0))
+    return (
+        int(columns[0]),
+        int(rows[0]),
+        int(columns[-1]) + 1,
+        int(rows[-1]) + 1,
+    )
+
+
+def union_box(
+    box: Tuple[int, int, int, int],
+    other: Tuple[int, int, int, int],
+) -> Tuple[int, int, int, int]:
+    return (
+        min(box[0], other[0]),
+        min(box[1], other[1]),
+        max(box[2], other[2]),
+        max(box[3], other[3]),
+    )
+
+
+def plan_gif_frames(indexed_frames: List[np.ndarray]) -> List[GifFrame]:
+    """
+    프레임마다 이전 화면에서 바뀐 영역과 disposal을 정합니다.
+    gif의 투명 픽셀은 이전 화면을 그대로 두므로, 불투명에서 투명으로 바뀌는 픽셀은
+    이전 프레임의 영역을 그 픽셀까지 넓히고 disposal 2(배경으로 지움)로 지웁니다.
+    """
+    frames: List[GifFrame] = []
+    canvas = np.full_like(indexed_frames[0], TRANSPARENT_INDEX)
+    for indexes in indexed_frames:
+        if frames:
+            cleared = (canvas != TRANSPARENT_INDEX) & (indexes == TRANSPARENT_INDEX)
+            cleared_box = get_box(cleared)
+            if cleared_box is not None:
+                box = union_box(frames[-1].box, cleared_box)
+                frames[-1] = GifFrame(box=box, disposal=DISPOSAL_BACKGROUND)
+                canvas[box[1] : box[3], box[0] : box[2]] = TRANSPARENT_INDEX
+
+        box = get_box(indexes != canvas) or (0, 0, 1, 1)
+        frames.append(GifFrame(box=box, disposal=DISPOSAL_NONE))
+        canvas = indexes.copy()
+    return frames
+
+
+def create_delta_frames(
+    indexed_frames: List[np.ndarray],
+    gif_frames: List[GifFrame],
+) -> List[np.ndarray]:
+    """바뀐 영역 밖과 이전 화면과 같은 픽셀을 투명으로 채운 프레임을 반환합니다."""
+    delta_frames = []
+    canvas = np.full_like(indexed_frames[0], TRANSPARENT_INDEX)
+    for indexes, gif_frame in zip(indexed_frames, gif_frames):
+        left, top, right, bottom = gif_frame.box
+        delta = np.full_like(indexes, TRANSPARENT_INDEX)
+        region = indexes[top:bottom, left:right]
+        delta[top:bottom, left:right] = np.where(
+            region == canvas[top:bottom, left:right],
+            TRANSPARENT_INDEX,
+            region,
+        )
+        delta_frames.append(delta)
+
+        canvas = indexes.copy()
+        if gif_frame.disposal == DISPOSAL_BACKGROUND:
+            canvas[top:bottom, left:right] = TRANSPARENT_INDEX
+    return delta_frames
+
+
+def optimize_gif(file_path: Path) -> Tuple[int, int]:
+    """
+    gif 파일을 공유 palette와 프레임 차이(바뀌지 않은 픽셀은 투명)로 다시 인코딩합니다.
+    줄어든 경우에만 교체하며, (원래 크기, 최적화 후 크기)를 반환합니다.
+    """
+    original_size = file_path.stat().st_size
+    frames, durations, loop = read_gif_frames(file_path)
+    palette = create_shared_palette(frames)
+    indexed_frames = [quantize_frame(frame, palette) for frame in frames]
+    del frames
+    gif_frames = plan_gif_frames(indexed_frames)
+    delta_frames = create_delta_frames(indexed_frames, gif_frames)
+
+    # palette의 마지막 색(TRANSPARENT_INDEX)은 투명으로 사용
+    palette_colors = palette.getpalette()[: MAX_PALETTE_COLORS * 3]
+    palette_colors += [0] * (256 * 3 - len(palette_colors))
+    images = []
+    for delta in delta_frames:
+        image = Image.fromarray(delta, "P")
+        image.putpalette(palette_colors)
+        images.append(image)
+
+    optimized_path = file_path.with_name(f".{file_path.stem}.optimizing.gif")
+    try:
+        images[0].save(
+            optimized_path.as_posix(),
+            save_all=True,
+            append_images=images[1:],
+            duration=durations,
+            disposal=[gif_frame.disposal for gif_frame in gif_frames],
+            transparency=TRANSPARENT_INDEX,
+            loop=loop,
+            # palette index를 다시 정렬하지 않도록 함
+            optimize=False,
+        )
+        optimized_size = optimized_path.stat().st_size
+        if optimized_size < original_size:
+            os.replace(optimized_path.as_posix(), file_path.as_posix())
+            return original_size, optimized_size
+        return original_size, original_size
+    finally:
+        optimized_path.unlink(missing_ok=True)
+
+
+def try_optimize_gif(file_path: Path):
+    """gif 최적화에 실패해도 render 결과는 그대로 사용합니다."""
+    try:
+        original_size, optimized_size = optimize_gif(file_path)
+    except (OSError, ValueError) as e:
+        logging.warning(f"gif를 최적화하지 못했습니다. {file_path} {e}")
+        return
+    logging.info(
+        f"gif 최적화: {file_path} {original_size} -> {optimized_size} bytes",
+    )
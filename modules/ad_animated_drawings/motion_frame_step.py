@@ -0,0 +1,109 @@
+import math
+from pathlib import Path
+from typing import Any, Dict
+import yaml
+
+
+# mvc 설정 controller의 추가 항목, N이면 motion의 N 프레임마다 한 프레임만 render (미리보기)
+# animated_drawings에는 없는 설정이므로 render 전에 bvh를 다시 샘플링한 motion 설정으로 바꿈
+FRAME_STEP_KEY = "FRAME_STEP"
+
+
+def downsample_bvh(
+    bvh_text: str,
+    frame_step: int,
+) -> str:
+    """bvh의 frame_step 프레임마다 한 프레임만 남기고 Frame Time을 frame_step배로 늘립니다."""
+    lines = bvh_text.splitlines()
+    motion_index = next(
+        index for index, line in enumerate(lines) if line.strip() == "MOTION"
+    )
+    frame_time = float(lines[motion_index + 2].split(":")[1])
+    frames = [line for line in lines[motion_index + 3 :] if line.strip()]
+    sampled_frames = frames[::frame_step]
+
+    return "\n".join(
+        lines[: motion_index + 1]
+        + [
+            f"Frames: {len(sampled_frames)}",
+            f"Frame Time: {frame_time * frame_step:.6f}",
+        ]
+        + sampled_frames
+        + [""]
+    )
+
+
+def resolve_bvh_path(file_name: str) -> Path:
+    # animated_drawings와 같은 방식으로 상대 경로를 찾음 (현재 디렉토리, animated_drawings 저장소)
+    try:
+        from animated_drawings.utils import resolve_ad_filepath  # type: ignore
+    except ImportError:
+        return Path(file_name)
+    return Path(resolve_ad_filepath(file_name, "bvh filepath"))
+
+
+def create_sampled_motion_cfg(
+    motion_cfg: Dict[str, Any],
+    bvh_path: Path,
+    frame_step: int,
+) -> Dict[str, Any]:
+    start_frame_idx = int(motion_cfg.get("start_frame_idx") or 0)
+    sampled_motion_cfg = dict(motion_cfg)
+    sampled_motion_cfg["filepath"] = bvh_path.as_posix()
+    sampled_motion_cfg["start_frame_idx"] = math.ceil(start_frame_idx / frame_step)
+    if motion_cfg.get("end_frame_idx") is not None:
+        sampled_motion_cfg["end_frame_idx"] = (
+            int(motion_cfg["end_frame_idx"]) // frame_step
+        )
+    return sampled_motion_cfg
+
+
+def get_sampled_motion_name(
+    rendering_cfg_path: Path,
+    index: int,
+) -> str:
+    return f"{rendering_cfg_path.stem}.motion_{index}"
+
+
+def apply_frame_step(
+    mvc_cfg: Dict[str, Any],
+    rendering_cfg_path: Path,
+) -> int:
+    """
+    controller의 FRAME_STEP을 꺼내어 캐릭터마다 bvh를 다시 샘플링한 motion 설정으로 바꾸고
+    FRAME_STEP을 반환합니다. 샘플링한 bvh, motion 설정 파일은 render 설정 파일 옆에 씁니다.
+    """
+    frame_step = int(mvc_cfg["controller"].pop(FRAME_STEP_KEY, 1) or 1)
+    if frame_step <= 1:
+        return 1
+
+    for index, character in enumerate(mvc_cfg["scene"]["ANIMATED_CHARACTERS"]):
+        with open(character["motion_cfg"], "r") as f:
+            motion_cfg = yaml.load(f, Loader=yaml.FullLoader)
+        bvh_path = resolve_bvh_path(motion_cfg["filepath"])
+        name = get_sampled_motion_name(rendering_cfg_path, index)
+        sampled_bvh_path = rendering_cfg_path.with_name(f"{name}.bvh")
+        sampled_motion_cfg_path = rendering_cfg_path.with_name(f"{name}.yaml")
+
+        with open(bvh_path.as_posix(), "r") as f:
+            sampled_bvh_text = downsample_bvh(f.read(), frame_step)
+        with open(sampled_bvh_path.as_posix(), "w") as f:
+            f.write(sampled_bvh_text)
+        with open(sampled_motion_cfg_path.as_posix(), "w") as f:
+            yaml.dump(
+                create_sampled_motion_cfg(
+                    motion_cfg,
+                    sampled_bvh_path.absolute(),
+                    frame_step,
+                ),
+                f,
+            )
+        character["motion_cfg"] = sampled_motion_cfg_path.absolute().as_posix()
+    return frame_step
+
+
+def remove_sampled_motion_files(rendering_cfg_path: Path):
+    for file_path in rendering_cfg_path.parent.glob(
+        f"{rendering_cfg_path.stem}.motion_*.*"
+    ):
+        file_path.unlink()
@@ -0,0 +1,191 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, Optional
+from render_scheduler import load_yaml
+
+
+# 키 계산 방식이 바뀌면 올려서 이전 캐시를 무효화
+RENDER_CACHE_VERSION = "1"
+# animated_drawings가 char_cfg.yaml과 같은 디렉토리에서 읽는 이미지
+CHARACTER_IMAGE_NAMES = ["texture.png", "mask.png"]
+
+
+class RenderCacheEntry(NamedTuple):
+    key: str
+    output_path: Path
+
+
+def update_hash_with_file(
+    hasher,
+    file_path: Path,
+):
+    with open(file_path.as_posix(), "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            hasher.update(chunk)
+
+
+def compute_render_cache_key(mvc_cfg: Dict[str, Any]) -> str:
+    """
+    render 결과에 영향을 주는 입력으로 캐시 키를 계산합니다.
+    - 캐릭터별 char_cfg.yaml, texture.png, mask.png, motion, retarget 설정 파일 내용
+    - view(카메라 등) 설정과 출력 경로를 제외한 controller 설정, 출력 파일 확장자
+    """
+    hasher = hashlib.sha256(RENDER_CACHE_VERSION.encode())
+
+    for character in mvc_cfg["scene"]["ANIMATED_CHARACTERS"]:
+        char_cfg_path = Path(character["character_cfg"])
+        file_paths = [char_cfg_path]
+        file_paths += [
+            char_cfg_path.parent.joinpath(name) for name in CHARACTER_IMAGE_NAMES
+        ]
+        file_paths += [Path(character["motion_cfg"]), Path(character["retarget_cfg"])]
+        for file_path in file_paths:
+            hasher.update(file_path.name.encode())
+            update_hash_with_file(hasher, file_path)
+
+    controller_cfg = dict(mvc_cfg.get("controller") or {})
+    output_path = Path(controller_cfg.pop("OUTPUT_VIDEO_PATH"))
+    settings = {
+        "view": mvc_cfg.get("view") or {},
+        "controller": controller_cfg,
+        "suffix": output_path.suffix,
+    }
+    hasher.update(json.dumps(settings, sort_keys=True).encode())
+    return hasher.hexdigest()
+
+
+def link_or_copy(
+    src_path: Path,
+    dst_path: Path,
+):
+    # 다른 파일 시스템이면 hardlink를 만들 수 없으므로 복사
+    try:
+        os.link(src_path.as_posix(), dst_path.as_posix())
+    except OSError:
+        shutil.copyfile(src_path.as_posix(), dst_path.as_posix())
+
+
+def unlink_shared_output(output_path: Path):
+    # render가 기존 출력 파일을 덮어쓸 때 hardlink 된 캐시 파일이 바뀌지 않도록 연결을 끊음
+    try:
+        if output_path.stat().st_nlink > 1:
+            output_path.unlink()
+    except OSError:
+        pass
+
+
+class RenderCache:
+    """
+    내용 해시 기반 render 결과 캐시 입니다.
+    같은 캐릭터, 같은 motion의 render 결과를 cache_dir에 저장해두고
+    같은 키의 요청이 오면 요청한 workspace의 출력 경로에 hardlink 합니다.
+    cache_dir의 전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 결과부터 삭제합니다.
+    hardlink를 위해 cache_dir는 workspace와 같은 파일 시스템에 있어야 합니다.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_bytes: int,
+    ):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hit_count = 0
+        self.miss_count = 0
+        self.stored_count = 0
+        self.evicted_count = 0
+
+    def _get_cache_path(
+        self,
+        entry: RenderCacheEntry,
+    ) -> Path:
+        return self.cache_dir.joinpath(f"{entry.key}{entry.output_path.suffix}")
+
+    def get_entry(self, mvc_cfg_file_path: str) -> Optional[RenderCacheEntry]:
+        try:
+            mvc_cfg = load_yaml(Path(mvc_cfg_file_path))
+            return RenderCacheEntry(
+                key=compute_render_cache_key(mvc_cfg),
+                output_path=Path(mvc_cfg["controller"]["OUTPUT_VIDEO_PATH"]),
+            )
+        except Exception as e:
+            logging.warning(f"render 캐시 키를 계산하지 못했습니다. {e}")
+            return None
+
+    def restore(self, entry: RenderCacheEntry) -> bool:
+        """캐시에 결과가 있으면 출력 경로에 연결하고 True를 반환합니다."""
+        cache_path = self._get_cache_path(entry)
+        if not cache_path.exists():
+            self.miss_count += 1
+            unlink_shared_output(entry.output_path)
+            return False
+
+        try:
+            entry.output_path.parent.mkdir(parents=True, exist_ok=True)
+            if entry.output_path.exists():
+                entry.output_path.unlink()
+            link_or_copy(cache_path, entry.output_path)
+            # LRU 순서를 위해 사용 시각 갱신
+            os.utime(cache_path.as_posix())
+        except OSError as e:
+            logging.warning(f"render 캐시를 복원하지 못했습니다. {e}")
+            self.miss_count += 1
+            return False
+
+        self.hit_count += 1
+        return True
+
+    def store(self, entry: RenderCacheEntry) -> bool:
+        if not entry.output_path.exists():
+            return False
+
+        cache_path = self._get_cache_path(entry)
+        tmp_path = cache_path.with_name(f".{cache_path.name}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            if tmp_path.exists():
+                tmp_path.unlink()
+            link_or_copy(entry.output_path, tmp_path)
+            os.replace(tmp_path.as_posix(), cache_path.as_posix())
+        except OSError as e:
+            logging.warning(f"render 결과를 캐시에 저장하지 못했습니다. {e}")
+            return False
+
+        self.stored_count += 1
+        self.evict()
+        return True
+
+    def evict(self):
+        cache_files = []
+        for cache_path in self.cache_dir.iterdir():
+            if cache_path.name.startswith("."):
+                continue
+            try:
+                cache_files.append((cache_path, cache_path.stat()))
+            except OSError:
+                continue
+
+        # 오래 사용하지 않은 결과부터 삭제
+        cache_files.sort(key=lambda cache_file: cache_file[1].st_mtime)
+        total_bytes = sum(stat.st_size for _, stat in cache_files)
+        for cache_path, stat in cache_files:
+            if total_bytes <= self.max_bytes:
+                break
+            try:
+                cache_path.unlink()
+            except OSError:
+                continue
+            total_bytes -= stat.st_size
+            self.evicted_count += 1
+
+    def get_metrics(self) -> Dict[str, int]:
+        return {
+            "hit_count": self.hit_count,
+            "miss_count": self.miss_count,
+            "stored_count": self.stored_count,
+            "evicted_count": self.evicted_count,
+        }
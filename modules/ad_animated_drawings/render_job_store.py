@@ -0,0 +1,216 @@
+import sqlite3
+import time
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+
+class RenderJobState(str, Enum):
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    FINISHED = "FINISHED"
+    FAILED = "FAILED"
+    CANCELED = "CANCELED"
+
+
+# 재시작 후 다시 대기열에 넣을 작업 상태
+UNFINISHED_RENDER_JOB_STATES = [RenderJobState.QUEUED, RenderJobState.RUNNING]
+
+CREATE_TABLES_SQL = """
+CREATE TABLE IF NOT EXISTS render_jobs (
+    job_id TEXT PRIMARY KEY,
+    mvc_cfg_file_path TEXT NOT NULL,
+    priority INTEGER NOT NULL,
+    state TEXT NOT NULL,
+    cached INTEGER NOT NULL DEFAULT 0,
+    exit_code INTEGER,
+    error TEXT,
+    peak_rss_bytes INTEGER,
+    enqueued_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS render_jobs_state ON render_jobs (state);
+CREATE INDEX IF NOT EXISTS render_jobs_enqueued_at ON render_jobs (enqueued_at);
+CREATE TABLE IF NOT EXISTS render_job_events (
+    job_id TEXT NOT NULL,
+    state TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS render_job_events_job_id ON render_job_events (job_id);
+"""
+
+
+class RenderJobStore:
+    """
+    render 작업의 상태 변화, exit code, 시작/종료 시각, 최대 RSS를 SQLite에 기록합니다.
+    render 서버가 재시작되어도 대기중이던 작업과 작업 이력이 남습니다.
+    RPC 함수와 render 워커 감시 스레드에서 render_state_lock을 잡은 채로 사용합니다.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        clock=time.time,
+    ):
+        self.db_path = db_path
+        self._clock = clock
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(CREATE_TABLES_SQL)
+
+    def close(self):
+        self._conn.close()
+
+    def _add_event(
+        self,
+        job_id: str,
+        state: RenderJobState,
+        now: float,
+    ):
+        self._conn.execute(
+            "INSERT INTO render_job_events (job_id, state, created_at) VALUES (?, ?, ?)",
+            (job_id, state.value, now),
+        )
+
+    def add_job(
+        self,
+        job_id: str,
+        mvc_cfg_file_path: str,
+        priority: int,
+        state: RenderJobState,
+        cached: bool = False,
+    ):
+        now = self._clock()
+        started_at = now if state != RenderJobState.QUEUED else None
+        finished_at = now if state == RenderJobState.FINISHED else None
+        with self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO render_jobs (
+                    job_id, mvc_cfg_file_path, priority, state, cached,
+                    enqueued_at, started_at, finished_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    job_id,
+                    mvc_cfg_file_path,
+                    int(priority),
+                    state.value,
+                    int(cached),
+                    now,
+                    started_at,
+                    finished_at,
+                ),
+            )
+            self._add_event(job_id, state, now)
+
+    def mark_running(self, job_id: str):
+        now = self._clock()
+        with self._conn:
+            self._conn.execute(
+                "UPDATE render_jobs SET state = ?, started_at = ? WHERE job_id = ?",
+                (RenderJobState.RUNNING.value, now, job_id),
+            )
+            self._add_event(job_id, RenderJobState.RUNNING, now)
+
+    def mark_requeued(self, job_id: str):
+        # 재시작으로 중단된 작업을 다시 대기열에 넣음
+        now = self._clock()
+        with self._conn:
+            self._conn.execute(
+                "UPDATE render_jobs SET state = ?, started_at = NULL WHERE job_id = ?",
+                (RenderJobState.QUEUED.value, job_id),
+            )
+            self._add_event(job_id, RenderJobState.QUEUED, now)
+
+    def mark_ended(
+        self,
+        job_id: str,
+        state: RenderJobState,
+        exit_code: Optional[int] = None,
+        error: Optional[str] = None,
+        peak_rss_bytes: Optional[int] = None,
+    ):
+        now = self._clock()
+        with self._conn:
+            self._conn.execute(
+                """
+                UPDATE render_jobs
+                SET state = ?, exit_code = ?, error = ?, peak_rss_bytes = ?, finished_at = ?
+                WHERE job_id = ?
+                """,
+                (state.value, exit_code, error, peak_rss_bytes, now, job_id),
+            )
+            self._add_event(job_id, state, now)
+
+    def _to_job_dict(self, row: sqlite3.Row) -> Dict[str, Any]:
+        job = dict(row)
+        job["cached"] = bool(job["cached"])
+        job["queue_wait_seconds"] = None
+        job["duration_seconds"] = None
+        if job["started_at"] is not None:
+            job["queue_wait_seconds"] = job["started_at"] - job["enqueued_at"]
+            if job["finished_at"] is not None:
+                job["duration_seconds"] = job["finished_at"] - job["started_at"]
+        return job
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        row = self._conn.execute(
+            "SELECT * FROM render_jobs WHERE job_id = ?",
+            (job_id,),
+        ).fetchone()
+        return self._to_job_dict(row) if row is not None else None
+
+    def get_job_events(self, job_id: str) -> List[Dict[str, Any]]:
+        rows = self._conn.execute(
+            """
+            SELECT state, created_at FROM render_job_events
+            WHERE job_id = ? ORDER BY created_at, rowid
+            """,
+            (job_id,),
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def list_unfinished_jobs(self) -> List[Dict[str, Any]]:
+        rows = self._conn.execute(
+            f"""
+            SELECT * FROM render_jobs
+            WHERE state IN ({", ".join("?" for _ in UNFINISHED_RENDER_JOB_STATES)})
+            ORDER BY enqueued_at
+            """,
+            [state.value for state in UNFINISHED_RENDER_JOB_STATES],
+        ).fetchall()
+        return [self._to_job_dict(row) for row in rows]
+
+    def list_jobs(
+        self,
+        limit: int = 100,
+        since: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """최근에 요청된 작업부터 반환합니다."""
+        rows = self._conn.execute(
+            """
+            SELECT * FROM render_jobs
+            WHERE enqueued_at >= ?
+            ORDER BY enqueued_at DESC
+            LIMIT ?
+            """,
+            (since or 0, limit),
+        ).fetchall()
+        return [self._to_job_dict(row) for row in rows]
+
+    def delete_jobs_before(self, before: float) -> int:
+        with self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM render_jobs WHERE enqueued_at < ? AND state NOT IN (?, ?)",
+                (before, *[state.value for state in UNFINISHED_RENDER_JOB_STATES]),
+            )
+            self._conn.execute(
+                """
+                DELETE FROM render_job_events
+                WHERE job_id NOT IN (SELECT job_id FROM render_jobs)
+                """
+            )
+        return cursor.rowcount
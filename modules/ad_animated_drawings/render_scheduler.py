@@ -0,0 +1,187 @@
+import logging
+import os
+import time
+from enum import IntEnum
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import yaml
+from motion_frame_step import FRAME_STEP_KEY
+
+
+# end_frame_idx가 없는 motion (전체 프레임 사용)의 예상 프레임 수
+DEFAULT_MOTION_FRAME_COUNT = 500
+# 이 크기(픽셀 수)의 캐릭터를 기준으로 캐릭터 크기에 비례해 render 시간이 늘어난다고 가정
+REFERENCE_CHARACTER_PIXELS = 512 * 512
+# 대기 시간이 이 시간만큼 지날 때마다 예상 비용을 절반으로 보아 긴 작업이 계속 밀리지 않도록 함
+AGING_SECONDS = 60
+
+
+class RenderPriority(IntEnum):
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+
+def get_available_cpu_count() -> int:
+    # 컨테이너의 cpu 제한(cpuset)을 반영
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def compute_render_slots(
+    cpu_count: int,
+    threads_per_render: int,
+) -> int:
+    return max(1, cpu_count // max(1, threads_per_render))
+
+
+def load_yaml(file_path: Path) -> Dict[str, Any]:
+    with open(file_path.as_posix(), "r") as f:
+        return yaml.load(f, Loader=yaml.FullLoader) or {}
+
+
+def count_motion_frames(motion_cfg: Dict[str, Any]) -> int:
+    end_frame_idx = motion_cfg.get("end_frame_idx")
+    if end_frame_idx is None:
+        return DEFAULT_MOTION_FRAME_COUNT
+    start_frame_idx = motion_cfg.get("start_frame_idx") or 0
+    return max(1, int(end_frame_idx) - int(start_frame_idx) + 1)
+
+
+def estimate_render_cost(mvc_cfg_file_path: str) -> float:
+    """
+    motion의 프레임 수와 캐릭터 크기로 render 작업의 상대적인 비용을 추정합니다.
+    FRAME_STEP(미리보기)이 있으면 render 하는 프레임 수만 셉니다.
+    설정 파일을 읽지 못하면 기본 프레임 수, 기준 캐릭터 크기로 추정합니다.
+    """
+    frame_count = DEFAULT_MOTION_FRAME_COUNT
+    character_pixels = REFERENCE_CHARACTER_PIXELS
+    try:
+        mvc_cfg = load_yaml(Path(mvc_cfg_file_path))
+        frame_step = int((mvc_cfg.get("controller") or {}).get(FRAME_STEP_KEY) or 1)
+        for character in mvc_cfg["scene"]["ANIMATED_CHARACTERS"]:
+            frame_count = count_motion_frames(
+                load_yaml(Path(character["motion_cfg"])),
+            )
+            frame_count = max(1, frame_count // max(1, frame_step))
+            char_cfg = load_yaml(Path(character["character_cfg"]))
+            character_pixels = int(char_cfg["height"]) * int(char_cfg["width"])
+    except Exception as e:
+        logging.warning(f"render 작업 비용을 추정하지 못했습니다. {e}")
+
+    return frame_count * (1 + character_pixels / REFERENCE_CHARACTER_PIXELS)
+
+
+class ScheduledRenderJob:
+    def __init__(
+        self,
+        job_id: str,
+        mvc_cfg_file_path: str,
+        priority: RenderPriority,
+        estimated_cost: float,
+        enqueued_at: float,
+    ):
+        self.job_id = job_id
+        self.mvc_cfg_file_path = mvc_cfg_file_path
+        self.priority = priority
+        self.estimated_cost = estimated_cost
+        self.enqueued_at = enqueued_at
+
+    def get_sort_key(self, now: float) -> tuple:
+        # 우선순위가 같으면 예상 비용이 작은 작업부터, 오래 기다릴수록 먼저 실행
+        waited_seconds = max(0.0, now - self.enqueued_at)
+        aged_cost = self.estimated_cost / (1 + waited_seconds / AGING_SECONDS)
+        return (self.priority, aged_cost, self.enqueued_at)
+
+
+class RenderScheduler:
+    """
+    render 대기열 입니다.
+    우선순위(RenderPriority)가 높은 작업부터, 같은 우선순위에서는 예상 비용이 작은 작업부터
+    (shortest expected job first) 꺼냅니다.
+    max_queue_length 개를 넘으면 더 이상 작업을 받지 않습니다.
+    """
+
+    def __init__(
+        self,
+        max_queue_length: int,
+        clock=time.time,
+    ):
+        self.max_queue_length = max_queue_length
+        self._clock = clock
+        self._jobs: List[ScheduledRenderJob] = []
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    @property
+    def is_full(self) -> bool:
+        return len(self._jobs) >= self.max_queue_length
+
+    def _sorted_jobs(self) -> List[ScheduledRenderJob]:
+        now = self._clock()
+        return sorted(self._jobs, key=lambda job: job.get_sort_key(now))
+
+    def push(
+        self,
+        job_id: str,
+        mvc_cfg_file_path: str,
+        priority: RenderPriority = RenderPriority.NORMAL,
+        estimated_cost: Optional[float] = None,
+    ) -> bool:
+        if self.is_full:
+            return False
+        if estimated_cost is None:
+            estimated_cost = estimate_render_cost(mvc_cfg_file_path)
+        self._jobs.append(
+            ScheduledRenderJob(
+                job_id=job_id,
+                mvc_cfg_file_path=mvc_cfg_file_path,
+                priority=priority,
+                estimated_cost=estimated_cost,
+                enqueued_at=self._clock(),
+            )
+        )
+        return True
+
+    def pop(self) -> Optional[ScheduledRenderJob]:
+        if not self._jobs:
+            return None
+        job = self._sorted_jobs()[0]
+        self._jobs.remove(job)
+        return job
+
+    def requeue(self, job: ScheduledRenderJob):
+        """pop 했지만 실행하지 못한 작업을 대기 순서를 유지한 채 되돌립니다."""
+        self._jobs.append(job)
+
+    def raise_priority(
+        self,
+        job_id: str,
+        priority: RenderPriority,
+    ) -> bool:
+        """대기중인 작업의 우선순위를 priority로 높입니다. (낮추지는 않음)"""
+        for job in self._jobs:
+            if job.job_id == job_id and priority < job.priority:
+                job.priority = priority
+                return True
+        return False
+
+    def remove(self, job_id: str) -> bool:
+        for job in self._jobs:
+            if job.job_id == job_id:
+                self._jobs.remove(job)
+                return True
+        return False
+
+    def get_position(self, job_id: str) -> Optional[int]:
+        # 1부터 시작하는 대기 순서
+        for position, job in enumerate(self._sorted_jobs(), start=1):
+            if job.job_id == job_id:
+                return position
+        return None
+
+    def clear(self):
+        self._jobs = []
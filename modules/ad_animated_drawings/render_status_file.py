@@ -0,0 +1,59 @@
+import logging
+import os
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, Optional
+import yaml
+
+
+# ad_fast_api의 conf_workspace.get_render_status_file_name과 같아야 함
+RENDER_STATUS_FILE_NAME_FORMAT = "render_status_{job_id}.yaml"
+
+
+class RenderJobStatus(str, Enum):
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    FINISHED = "FINISHED"
+    FAILED = "FAILED"
+    CANCELED = "CANCELED"
+
+
+def get_render_status_file_path(
+    mvc_cfg_file_path: str,
+    job_id: str,
+) -> Path:
+    # mvc_cfg 파일(영상마다 하나, mvc_cfg_{video_file_name}.yaml)은 ad_id 디렉토리에 있으므로
+    # api 서버와 공유하는 workspace에 상태 파일을 씀, 파일 이름은 job_id로 구분
+    return Path(mvc_cfg_file_path).parent.joinpath(
+        RENDER_STATUS_FILE_NAME_FORMAT.format(job_id=job_id)
+    )
+
+
+def write_render_status(
+    file_path: Path,
+    job_id: str,
+    status: RenderJobStatus,
+    progress: Optional[Dict[str, Any]] = None,
+    error: Optional[str] = None,
+    exit_code: Optional[int] = None,
+):
+    """
+    render 작업 상태를 파일에 씁니다.
+    api 서버가 읽는 도중 일부만 쓰인 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체합니다.
+    """
+    tmp_path = file_path.with_name(f".{file_path.name}.tmp")
+    try:
+        with open(tmp_path.as_posix(), "w") as f:
+            yaml.dump(
+                {
+                    "job_id": job_id,
+                    "status": status.value,
+                    "progress": progress or {},
+                    "error": error,
+                    "exit_code": exit_code,
+                },
+                f,
+            )
+        os.replace(tmp_path.as_posix(), file_path.as_posix())
+    except OSError as e:
+        logging.warning(f"render 상태 파일을 쓰지 못했습니다. {file_path}, {e}")
@@ -0,0 +1,603 @@
+import importlib
+import logging
+import os
+import resource
+import threading
+import time
+from multiprocessing import current_process, get_context
+from multiprocessing.connection import Connection, wait
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+import yaml
+from gif_optimizer import is_gif_optimize_enabled, try_optimize_gif
+from motion_frame_step import apply_frame_step, remove_sampled_motion_files
+from render_scheduler import load_yaml
+from rig_cache import create_rig_cache, install_rig_cache_hooks
+
+
+# 워커 시작 시 미리 import 할 animated_drawings 모듈
+# mesa_view는 PYOPENGL_PLATFORM을 osmesa로 설정한 뒤 OpenGL을 import 하므로 가장 먼저 import
+RENDER_WORKER_PRELOAD_MODULES = [
+    "animated_drawings.view.mesa_view",
+    "animated_drawings.render",
+    "animated_drawings.config",
+    "animated_drawings.view.view",
+    "animated_drawings.model.scene",
+    "animated_drawings.controller.controller",
+    "animated_drawings.model.animated_drawing",
+    "animated_drawings.model.arap",
+]
+
+RENDER_PHASE_STARTING = "starting"
+RENDER_PHASE_RENDERING = "rendering"
+RENDER_PHASE_ENCODING = "encoding"
+# 진행 상황 보고 최소 간격, 단계가 바뀌면 바로 보고
+RENDER_PROGRESS_INTERVAL_SECONDS = 0.5
+GIF_SUFFIX = ".gif"
+WEBM_SUFFIX = ".webm"
+# 작업의 최대 RSS를 구하기 위해 render 중 RSS를 확인하는 간격
+RSS_SAMPLE_INTERVAL_SECONDS = 0.1
+# 요청한 코덱의 인코더가 없을 때 사용할 코덱 (pip의 opencv에는 H.264 인코더가 없음)
+FALLBACK_VIDEO_CODECS = {
+    ".mp4": "mp4v",
+    WEBM_SUFFIX: "VP80",
+}
+
+
+class RenderProgressReporter:
+    """render 워커에서 진행중인 작업의 진행 상황을 파이프로 보고합니다."""
+
+    def __init__(
+        self,
+        conn: Connection,
+        job_id: str,
+        interval_seconds: float = RENDER_PROGRESS_INTERVAL_SECONDS,
+    ):
+        self.conn = conn
+        self.job_id = job_id
+        self.interval_seconds = interval_seconds
+        self.phase: Optional[str] = None
+        self.reported_at = 0.0
+
+    def report(
+        self,
+        frames_done: int,
+        total_frames: int,
+        phase: str,
+    ):
+        now = time.time()
+        if phase == self.phase and now - self.reported_at < self.interval_seconds:
+            return
+        self.phase = phase
+        self.reported_at = now
+        self.conn.send(("progress", self.job_id, frames_done, total_frames, phase))
+
+
+# render 워커 프로세스에서 진행중인 작업의 reporter, render_worker_main에서 설정
+progress_reporter: Optional[RenderProgressReporter] = None
+
+
+def report_render_progress(
+    frames_done: int,
+    total_frames: int,
+    phase: str,
+):
+    if progress_reporter is not None:
+        progress_reporter.report(frames_done, total_frames, phase)
+
+
+def install_render_progress_hooks():
+    """animated_drawings의 video render controller가 프레임마다 진행 상황을 보고하도록 합니다."""
+    from animated_drawings.controller.video_render_controller import (  # type: ignore
+        VideoRenderController,
+    )
+
+    finish_run_loop_iteration = VideoRenderController._finish_run_loop_iteration
+    cleanup_after_run_loop = VideoRenderController._cleanup_after_run_loop
+
+    def _finish_run_loop_iteration(self):
+        finish_run_loop_iteration(self)
+        report_render_progress(
+            self.frames_rendered,
+            self.frames_rendered + self.frames_left_to_render,
+            RENDER_PHASE_RENDERING,
+        )
+
+    # 모든 프레임을 render 한 뒤 video writer가 gif, mp4 등으로 인코딩
+    def _cleanup_after_run_loop(self):
+        report_render_progress(
+            self.frames_rendered,
+            self.frames_rendered,
+            RENDER_PHASE_ENCODING,
+        )
+        cleanup_after_run_loop(self)
+
+    VideoRenderController._finish_run_loop_iteration = _finish_run_loop_iteration
+    VideoRenderController._cleanup_after_run_loop = _cleanup_after_run_loop
+
+
+def install_video_format_hooks():
+    """
+    animated_drawings의 video render controller가 mp4, gif 외에 webm도 출력하도록 합니다.
+    mp4, webm은 cv2.VideoWriter가 확장자로 컨테이너를 정하므로 같은 MP4Writer를 사용하며,
+    요청한 코덱으로 열리지 않으면 대체 코덱으로 인코딩합니다.
+    """
+    from animated_drawings.config import ControllerConfig  # type: ignore
+    from animated_drawings.controller.video_render_controller import (  # type: ignore
+        MP4Writer,
+        VideoWriter,
+    )
+
+    set_output_video_path = ControllerConfig.set_output_video_path
+    create_video_writer = VideoWriter.create_video_writer
+
+    def _set_output_video_path(self, path: str):
+        if self.mode != "interactive" and Path(path).suffix == WEBM_SUFFIX:
+            self.output_video_path = path
+            return
+        set_output_video_path(self, path)
+
+    def _create_video_writer(controller):
+        suffix = Path(controller.cfg.output_video_path).suffix
+        if suffix not in FALLBACK_VIDEO_CODECS:
+            return create_video_writer(controller)
+
+        video_writer = MP4Writer(controller)
+        if not video_writer.video_writer.isOpened():
+            fallback_codec = FALLBACK_VIDEO_CODECS[suffix]
+            logging.warning(
+                f"{controller.cfg.output_video_codec} 코덱을 사용할 수 없어 "
+                f"{fallback_codec} 코덱으로 인코딩합니다."
+            )
+            video_writer.video_writer.release()
+            controller.cfg.output_video_codec = fallback_codec
+            video_writer = MP4Writer(controller)
+        return video_writer
+
+    ControllerConfig.set_output_video_path = _set_output_video_path
+    VideoWriter.create_video_writer = staticmethod(_create_video_writer)
+
+
+def preload_render_modules():
+    for module_name in RENDER_WORKER_PRELOAD_MODULES:
+        try:
+            importlib.import_module(module_name)
+        except ImportError as e:
+            logging.warning(f"render 워커에서 {module_name} 모듈을 불러오지 못했습니다. {e}")
+
+    try:
+        install_render_progress_hooks()
+    except (ImportError, AttributeError) as e:
+        logging.warning(f"render 진행 상황 보고를 설정하지 못했습니다. {e}")
+
+    try:
+        install_video_format_hooks()
+    except (ImportError, AttributeError) as e:
+        logging.warning(f"webm 출력과 대체 코덱을 설정하지 못했습니다. {e}")
+
+    # AD_RIG_CACHE_DIR를 지정하면 캐릭터 mesh, ARAP 설정을 워커와 render 작업 사이에서 다시 사용
+    rig_cache = create_rig_cache()
+    if rig_cache is not None:
+        try:
+            install_rig_cache_hooks(rig_cache)
+        except (ImportError, AttributeError) as e:
+            logging.warning(f"character rig 캐시를 설정하지 못했습니다. {e}")
+
+
+def get_rendering_path(file_path: Path) -> Path:
+    # 출력 형식을 확장자로 정하므로 확장자는 유지
+    return file_path.with_name(f".{file_path.stem}.rendering{file_path.suffix}")
+
+
+def run_render(mvc_cfg_file_path: str):
+    """
+    render 결과를 임시 파일에 쓴 뒤 출력 경로로 교체합니다.
+    api 서버가 쓰는 도중의 애니메이션 파일을 완료된 파일로 보지 않도록 합니다.
+    gif는 교체 전에 공유 palette, 프레임 차이로 다시 인코딩하여 크기를 줄입니다. (AD_GIF_OPTIMIZE)
+    controller의 FRAME_STEP(미리보기)은 bvh를 다시 샘플링한 motion 설정으로 바꾸어 render 합니다.
+    """
+    from animated_drawings import render  # type: ignore
+
+    mvc_cfg = load_yaml(Path(mvc_cfg_file_path))
+    output_path = Path(mvc_cfg["controller"]["OUTPUT_VIDEO_PATH"])
+    rendering_output_path = get_rendering_path(output_path)
+    mvc_cfg["controller"]["OUTPUT_VIDEO_PATH"] = rendering_output_path.as_posix()
+    rendering_cfg_path = get_rendering_path(Path(mvc_cfg_file_path))
+
+    try:
+        apply_frame_step(mvc_cfg, rendering_cfg_path)
+        with open(rendering_cfg_path.as_posix(), "w") as f:
+            yaml.dump(mvc_cfg, f)
+        render.start(rendering_cfg_path.as_posix())
+        if output_path.suffix == GIF_SUFFIX and is_gif_optimize_enabled():
+            try_optimize_gif(rendering_output_path)
+        os.replace(rendering_output_path.as_posix(), output_path.as_posix())
+    finally:
+        rendering_cfg_path.unlink(missing_ok=True)
+        rendering_output_path.unlink(missing_ok=True)
+        remove_sampled_motion_files(rendering_cfg_path)
+
+
+def get_rss_bytes() -> int:
+    # 현재 프로세스의 RSS, /proc이 없으면 최대 RSS로 대신함
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return get_peak_rss_bytes()
+
+
+def get_peak_rss_bytes() -> int:
+    # linux의 ru_maxrss 단위는 KB, 워커 프로세스가 시작된 이후의 최대값
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class JobRssSampler:
+    """
+    render 작업 동안 RSS를 주기적으로 확인하여 작업의 최대 RSS를 구합니다.
+    워커는 여러 작업에 재사용되므로 워커 전체의 최대값(ru_maxrss) 대신 사용합니다.
+    확인 간격보다 짧게 늘었다 줄어든 메모리는 놓칠 수 있는 근사값입니다.
+    """
+
+    def __init__(
+        self,
+        interval_seconds: float = RSS_SAMPLE_INTERVAL_SECONDS,
+    ):
+        self.interval_seconds = interval_seconds
+        self.peak_rss_bytes = 0
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def sample(self):
+        self.peak_rss_bytes = max(self.peak_rss_bytes, get_rss_bytes())
+
+    def _run(self):
+        while not self._stopped.wait(self.interval_seconds):
+            self.sample()
+
+    def __enter__(self) -> "JobRssSampler":
+        self.sample()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="render-rss-sampler",
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.sample()
+
+
+def render_worker_main(
+    conn: Connection,
+    preload: Callable[[], None],
+    render: Callable[[str], None],
+    worker_env: Dict[str, str],
+):
+    """
+    render 워커 프로세스에서 실행됩니다.
+    모듈을 미리 불러온 뒤 파이프로 전달받은 작업을 하나씩 render 합니다.
+    None을 받거나 파이프가 닫히면 종료합니다.
+    """
+    global progress_reporter
+
+    os.environ.update(worker_env)
+    preload()
+
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, OSError):
+            break
+        if job is None:
+            break
+
+        job_id, mvc_cfg_file_path = job
+        progress_reporter = RenderProgressReporter(conn, job_id)
+        error = None
+        with JobRssSampler() as rss_sampler:
+            try:
+                render(mvc_cfg_file_path)
+            except BaseException as e:  # render.start의 sys.exit 포함
+                error = repr(e)
+        progress_reporter = None
+
+        conn.send(
+            ("done", job_id, error, get_rss_bytes(), rss_sampler.peak_rss_bytes)
+        )
+
+
+class RenderProgress(NamedTuple):
+    frames_done: int
+    total_frames: int
+    phase: str
+
+
+class RenderResult(NamedTuple):
+    job_id: str
+    # 정상 종료시 None
+    error: Optional[str]
+    # 워커가 비정상 종료된 경우의 exit code
+    exit_code: Optional[int]
+    duration_seconds: float
+    peak_rss_bytes: int
+
+
+class RenderWorker:
+    def __init__(
+        self,
+        process,
+        conn: Connection,
+    ):
+        self.process = process
+        self.conn = conn
+        self.job_id: Optional[str] = None
+        self.job_started_at = 0.0
+        self.progress = RenderProgress(0, 0, RENDER_PHASE_STARTING)
+        self.job_count = 0
+        self.rss_bytes = 0
+
+    @property
+    def is_idle(self) -> bool:
+        return self.job_id is None
+
+
+class RenderWorkerPool:
+    """
+    animated_drawings 모듈을 미리 불러온 render 워커 프로세스 풀 입니다.
+    작업마다 새 프로세스를 만들고 모듈을 불러오는 비용을 없앱니다.
+
+    - size: 워커 프로세스 수
+    - max_jobs_per_worker 개의 작업을 처리했거나
+      RSS가 max_rss_bytes를 넘은 워커는 새 워커로 교체합니다.
+    - 비정상 종료된 워커는 진행중이던 작업을 실패로 처리하고 새 워커로 교체합니다.
+    - 작업 취소시 해당 워커를 종료하고 새 워커로 교체합니다.
+    - worker_env는 워커 프로세스의 환경 변수로 설정됩니다. (LP_NUM_THREADS 등)
+    - 상태는 reap() 호출시 갱신됩니다.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        max_jobs_per_worker: int,
+        max_rss_bytes: int,
+        preload: Callable[[], None] = preload_render_modules,
+        render: Callable[[str], None] = run_render,
+        worker_env: Optional[Dict[str, str]] = None,
+        start_method: str = "fork",
+    ):
+        self.size = size
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.max_rss_bytes = max_rss_bytes
+        self.preload = preload
+        self.render = render
+        self.worker_env = worker_env or {}
+        self._context = get_context(start_method)
+        self.workers: List[RenderWorker] = []
+        self.recycled_count = 0
+        self.crashed_count = 0
+
+    @property
+    def is_started(self) -> bool:
+        return len(self.workers) > 0
+
+    @property
+    def idle_count(self) -> int:
+        # 종료되었지만 아직 reap 되지 않은 워커는 작업을 받을 수 없으므로 제외
+        return len(
+            [
+                worker
+                for worker in self.workers
+                if worker.is_idle and worker.process.is_alive()
+            ]
+        )
+
+    @property
+    def running_job_ids(self) -> List[str]:
+        return [worker.job_id for worker in self.workers if worker.job_id is not None]
+
+    def start(self):
+        while len(self.workers) < self.size:
+            self.workers.append(self._spawn_worker())
+
+    def shutdown(self):
+        for worker in self.workers:
+            self._stop_worker(worker, terminate=not worker.is_idle)
+        self.workers = []
+
+    def _spawn_worker(self) -> RenderWorker:
+        # zero 서버의 워커 프로세스는 daemon 이므로 자식 프로세스를 만들 수 있도록 해제
+        current_process().daemon = False
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=render_worker_main,
+            args=(child_conn, self.preload, self.render, self.worker_env),
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        logging.info(f"render 워커가 시작되었습니다. pid: {process.pid}")
+        return RenderWorker(process=process, conn=parent_conn)
+
+    def _stop_worker(
+        self,
+        worker: RenderWorker,
+        terminate: bool = False,
+    ):
+        if terminate:
+            worker.process.terminate()
+        else:
+            try:
+                worker.conn.send(None)
+            except (BrokenPipeError, OSError):
+                worker.process.terminate()
+        worker.process.join(timeout=5)
+        if worker.process.is_alive():
+            worker.process.kill()
+            worker.process.join()
+        worker.conn.close()
+
+    def _replace_worker(
+        self,
+        worker: RenderWorker,
+        terminate: bool = False,
+    ):
+        self._stop_worker(worker, terminate=terminate)
+        index = self.workers.index(worker)
+        self.workers[index] = self._spawn_worker()
+
+    def _find_worker(self, job_id: str) -> Optional[RenderWorker]:
+        for worker in self.workers:
+            if worker.job_id == job_id:
+                return worker
+        return None
+
+    def is_running(self, job_id: str) -> bool:
+        return self._find_worker(job_id) is not None
+
+    def submit(
+        self,
+        job_id: str,
+        mvc_cfg_file_path: str,
+    ) -> bool:
+        self.start()
+        for worker in self.workers:
+            if worker.is_idle and worker.process.is_alive():
+                worker.conn.send((job_id, mvc_cfg_file_path))
+                worker.job_id = job_id
+                worker.job_started_at = time.time()
+                worker.progress = RenderProgress(0, 0, RENDER_PHASE_STARTING)
+                return True
+        return False
+
+    def get_progress(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """실행중인 작업의 진행 상황과 남은 예상 시간을 반환합니다."""
+        worker = self._find_worker(job_id)
+        if worker is None:
+            return None
+
+        progress = worker.progress
+        elapsed_seconds = time.time() - worker.job_started_at
+        eta_seconds = None
+        if 0 < progress.frames_done < progress.total_frames:
+            eta_seconds = (
+                elapsed_seconds
+                * (progress.total_frames - progress.frames_done)
+                / progress.frames_done
+            )
+        return {
+            **progress._asdict(),
+            "elapsed_seconds": elapsed_seconds,
+            "eta_seconds": eta_seconds,
+        }
+
+    def cancel(self, job_id: str) -> bool:
+        worker = self._find_worker(job_id)
+        if worker is None:
+            return False
+        self._replace_worker(worker, terminate=True)
+        return True
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        워커로부터 메시지가 오거나 워커 프로세스가 종료될 때까지 기다립니다.
+        process sentinel을 함께 기다리므로 비정상 종료도 바로 감지합니다.
+        """
+        wait_objects = []
+        for worker in list(self.workers):
+            wait_objects += [worker.conn, worker.process.sentinel]
+        if not wait_objects:
+            time.sleep(timeout or 0)
+            return False
+        try:
+            return len(wait(wait_objects, timeout=timeout)) > 0
+        except (OSError, ValueError):
+            # 다른 스레드에서 워커가 교체되어 파이프가 닫힌 경우
+            return True
+
+    def _should_recycle(self, worker: RenderWorker) -> bool:
+        return (
+            worker.job_count >= self.max_jobs_per_worker
+            or worker.rss_bytes > self.max_rss_bytes
+        )
+
+    def _receive_result(self, worker: RenderWorker) -> Optional[RenderResult]:
+        # 완료 메시지 전까지의 진행 상황 메시지는 최신 값만 반영
+        try:
+            while worker.conn.poll():
+                message = worker.conn.recv()
+                if message[0] == "progress":
+                    worker.progress = RenderProgress(*message[2:])
+                    continue
+                _, job_id, error, rss_bytes, peak_rss_bytes = message
+                break
+            else:
+                return None
+        except (EOFError, OSError):
+            return None
+
+        worker.job_id = None
+        worker.job_count += 1
+        worker.rss_bytes = rss_bytes
+        return RenderResult(
+            job_id=job_id,
+            error=error,
+            exit_code=None,
+            duration_seconds=time.time() - worker.job_started_at,
+            peak_rss_bytes=peak_rss_bytes,
+        )
+
+    def _has_exited(self, worker: RenderWorker) -> bool:
+        # sentinel은 종료 상태가 반영되기 직전에 준비될 수 있으므로 잠시 join
+        if wait([worker.process.sentinel], timeout=0):
+            worker.process.join(timeout=1)
+        return not worker.process.is_alive()
+
+    def reap(self) -> List[RenderResult]:
+        """
+        완료된 작업의 결과를 모으고, 비정상 종료되었거나 교체 대상인 워커를 새 워커로 교체합니다.
+        """
+        results = []
+        for worker in list(self.workers):
+            result = self._receive_result(worker)
+            if result is not None:
+                results.append(result)
+
+            if self._has_exited(worker):
+                self.crashed_count += 1
+                exit_code = worker.process.exitcode
+                logging.error(
+                    f"render 워커가 비정상 종료되었습니다. "
+                    f"pid: {worker.process.pid}, exit code: {exit_code}"
+                )
+                if worker.job_id is not None:
+                    results.append(
+                        RenderResult(
+                            job_id=worker.job_id,
+                            error=f"render worker exited with code {exit_code}",
+                            exit_code=exit_code,
+                            duration_seconds=time.time() - worker.job_started_at,
+                            peak_rss_bytes=0,
+                        )
+                    )
+                self._replace_worker(worker, terminate=True)
+            elif worker.is_idle and self._should_recycle(worker):
+                self.recycled_count += 1
+                logging.info(
+                    f"render 워커를 교체합니다. pid: {worker.process.pid}, "
+                    f"job count: {worker.job_count}, rss: {worker.rss_bytes}"
+                )
+                self._replace_worker(worker)
+        return results
+
+    def get_metrics(self) -> Dict[str, int]:
+        return {
+            "size": self.size,
+            "idle_count": self.idle_count,
+            "recycled_count": self.recycled_count,
+            "crashed_count": self.crashed_count,
+        }
@@ -0,0 +1,335 @@
+import hashlib
+import json
+import logging
+import os
+import time
+import zipfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+import numpy as np
+
+
+RIG_CACHE_DIR_ENV = "AD_RIG_CACHE_DIR"
+RIG_CACHE_MAX_MB_ENV = "AD_RIG_CACHE_MAX_MB"
+# 키 계산 방식이나 저장하는 값이 바뀌면 올려서 이전 캐시를 무효화
+RIG_CACHE_VERSION = "2"
+RIG_CACHE_SUFFIX = ".npz"
+# 배열 외의 구조(dict, list, scalar)를 json으로 저장하는 npz 항목 이름
+RIG_SCHEMA_NAME = "__schema__"
+# mask로 만든 mesh (외곽선, 내부 점, 삼각형 분할), mask만으로 키를 계산
+MESH_KIND = "mesh"
+# mesh와 기준 자세 관절 위치(pin)로 만든 ARAP 변형 설정
+ARAP_KIND = "arap"
+
+
+def compute_rig_cache_key(*values: Any) -> str:
+    """numpy 배열(또는 배열로 바꿀 수 있는 값)의 dtype, shape, 내용으로 키를 계산합니다."""
+    hasher = hashlib.sha256(RIG_CACHE_VERSION.encode())
+    for value in values:
+        array = np.ascontiguousarray(np.asarray(value))
+        hasher.update(f"{array.dtype.str}{array.shape}".encode())
+        hasher.update(array.tobytes())
+    return hasher.hexdigest()
+
+
+def is_packable_array_list(value: Any) -> bool:
+    # dtype과 첫 축 이외의 shape가 같은 1차원 이상 배열의 목록
+    if len(value) < 2 or not all(isinstance(item, np.ndarray) for item in value):
+        return False
+    first = value[0]
+    return first.ndim > 0 and all(
+        item.dtype == first.dtype and item.shape[1:] == first.shape[1:]
+        for item in value
+    )
+
+
+def encode_rig_value(
+    value: Any,
+    arrays: Dict[str, np.ndarray],
+) -> Any:
+    """
+    rig 속성 값을 json으로 저장할 수 있는 구조로 바꾸고 배열은 arrays에 모읍니다.
+    numpy 배열, scipy sparse 행렬, dict(str 키), list, tuple, scalar만 저장할 수 있으며
+    그 외의 값(객체, object 배열)은 TypeError를 발생시킵니다.
+    """
+    if isinstance(value, np.ndarray) or isinstance(value, np.generic):
+        array = np.asarray(value)
+        if array.dtype.hasobject:
+            raise TypeError(f"object 배열은 저장할 수 없습니다. {array.dtype}")
+        name = f"array_{len(arrays)}"
+        arrays[name] = array
+        return {"array": name}
+    if hasattr(value, "tocsr") and hasattr(value, "format"):
+        # scipy sparse 행렬은 csr 구성 요소로 저장하고 원래 형식으로 복원
+        csr = value.tocsr()
+        return {
+            "sparse": value.format,
+            "is_array": type(value).__name__.endswith("_array"),
+            "shape": list(csr.shape),
+            "data": encode_rig_value(csr.data, arrays),
+            "indices": encode_rig_value(csr.indices, arrays),
+            "indptr": encode_rig_value(csr.indptr, arrays),
+        }
+    if isinstance(value, dict):
+        if not all(isinstance(key, str) for key in value):
+            raise TypeError("str 키의 dict만 저장할 수 있습니다.")
+        return {
+            "dict": {key: encode_rig_value(item, arrays) for key, item in value.items()}
+        }
+    if isinstance(value, (list, tuple)) and is_packable_array_list(value):
+        # 삼각형 목록처럼 작은 배열이 많으면 하나로 이어 붙여 저장 (npz 항목 수를 줄임)
+        return {
+            "array_list": encode_rig_value(np.concatenate(value), arrays),
+            "lengths": encode_rig_value(
+                np.array([len(item) for item in value], dtype=np.int64), arrays
+            ),
+            "is_tuple": isinstance(value, tuple),
+        }
+    if isinstance(value, (list, tuple)):
+        return {
+            "tuple" if isinstance(value, tuple) else "list": [
+                encode_rig_value(item, arrays) for item in value
+            ]
+        }
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return {"value": value}
+    raise TypeError(f"{type(value).__name__} 값은 저장할 수 없습니다.")
+
+
+def decode_rig_value(
+    encoded: Any,
+    arrays: Any,
+) -> Any:
+    if "array" in encoded:
+        return arrays[encoded["array"]]
+    if "sparse" in encoded:
+        from scipy import sparse  # type: ignore
+
+        matrix_type = sparse.csr_array if encoded["is_array"] else sparse.csr_matrix
+        csr = matrix_type(
+            (
+                decode_rig_value(encoded["data"], arrays),
+                decode_rig_value(encoded["indices"], arrays),
+                decode_rig_value(encoded["indptr"], arrays),
+            ),
+            shape=tuple(encoded["shape"]),
+        )
+        return csr.asformat(encoded["sparse"])
+    if "array_list" in encoded:
+        packed = decode_rig_value(encoded["array_list"], arrays)
+        lengths = decode_rig_value(encoded["lengths"], arrays)
+        items = np.split(packed, np.cumsum(lengths)[:-1])
+        return tuple(items) if encoded["is_tuple"] else items
+    if "dict" in encoded:
+        return {
+            key: decode_rig_value(item, arrays)
+            for key, item in encoded["dict"].items()
+        }
+    if "list" in encoded:
+        return [decode_rig_value(item, arrays) for item in encoded["list"]]
+    if "tuple" in encoded:
+        return tuple(decode_rig_value(item, arrays) for item in encoded["tuple"])
+    return encoded["value"]
+
+
+class RigCache:
+    """
+    캐릭터 rig(mesh, ARAP 설정)를 파일로 저장하고 다음 render 에서 다시 사용합니다.
+    render 워커 프로세스마다 새로 만드는 animated_drawings 모델의 준비 비용을 줄입니다.
+    mesh는 mask만으로 키를 계산하므로 관절만 수정하면 mesh는 다시 사용하고 ARAP 설정만 새로 만듭니다.
+    cache_dir의 전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 rig부터 삭제합니다.
+    api 서버와 공유하는 workspace 볼륨에 저장하므로 pickle을 사용하지 않고,
+    배열은 npz(allow_pickle=False)로, 나머지 구조와 scalar는 같은 npz 안의 json으로 저장합니다.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_bytes: int,
+    ):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hit_count = 0
+        self.miss_count = 0
+        self.stored_count = 0
+        self.evicted_count = 0
+
+    def _get_cache_path(
+        self,
+        kind: str,
+        key: str,
+    ) -> Path:
+        return self.cache_dir.joinpath(kind, f"{key}{RIG_CACHE_SUFFIX}")
+
+    def load(
+        self,
+        kind: str,
+        key: str,
+    ) -> Optional[Dict[str, Any]]:
+        cache_path = self._get_cache_path(kind, key)
+        try:
+            with np.load(cache_path.as_posix(), allow_pickle=False) as arrays:
+                schema = json.loads(arrays[RIG_SCHEMA_NAME].tobytes().decode())
+                value = decode_rig_value(schema, arrays)
+            # LRU 순서를 위해 사용 시각 갱신
+            os.utime(cache_path.as_posix())
+        except FileNotFoundError:
+            return None
+        except (
+            OSError,
+            ValueError,
+            KeyError,
+            TypeError,
+            zipfile.BadZipFile,
+        ) as e:
+            logging.warning(f"character rig 캐시를 읽지 못했습니다. {cache_path} {e}")
+            return None
+        return value
+
+    def store(
+        self,
+        kind: str,
+        key: str,
+        value: Dict[str, Any],
+    ) -> bool:
+        cache_path = self._get_cache_path(kind, key)
+        tmp_path = cache_path.with_name(f".{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            arrays: Dict[str, np.ndarray] = {}
+            schema = encode_rig_value(value, arrays)
+            arrays[RIG_SCHEMA_NAME] = np.frombuffer(
+                json.dumps(schema).encode(), dtype=np.uint8
+            )
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path.as_posix(), "wb") as f:
+                np.savez(f, **arrays)
+            # 여러 워커가 같은 rig를 저장해도 완성된 파일만 보이도록 교체
+            os.replace(tmp_path.as_posix(), cache_path.as_posix())
+        except (OSError, TypeError, ValueError) as e:
+            logging.warning(f"character rig를 캐시에 저장하지 못했습니다. {e}")
+            tmp_path.unlink(missing_ok=True)
+            return False
+
+        self.stored_count += 1
+        self.evict()
+        return True
+
+    def get_or_create(
+        self,
+        kind: str,
+        key: str,
+        create: Callable[[], Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """캐시에 있으면 읽고, 없으면 만들어 저장합니다. 걸린 시간을 로그로 남깁니다."""
+        start_time = time.perf_counter()
+        value = self.load(kind, key)
+        if value is not None:
+            self.hit_count += 1
+            logging.info(
+                f"character rig {kind} 캐시를 사용합니다. "
+                f"{time.perf_counter() - start_time:.3f}초"
+            )
+            return value
+
+        self.miss_count += 1
+        value = create()
+        create_seconds = time.perf_counter() - start_time
+        self.store(kind, key, value)
+        logging.info(f"character rig {kind}를 새로 만들었습니다. {create_seconds:.3f}초")
+        return value
+
+    def evict(self):
+        cache_files = []
+        for cache_path in self.cache_dir.glob(f"*/*{RIG_CACHE_SUFFIX}"):
+            try:
+                cache_files.append((cache_path, cache_path.stat()))
+            except OSError:
+                continue
+
+        # 오래 사용하지 않은 rig부터 삭제
+        cache_files.sort(key=lambda cache_file: cache_file[1].st_mtime)
+        total_bytes = sum(stat.st_size for _, stat in cache_files)
+        for cache_path, stat in cache_files:
+            if total_bytes <= self.max_bytes:
+                break
+            try:
+                cache_path.unlink()
+            except OSError:
+                continue
+            total_bytes -= stat.st_size
+            self.evicted_count += 1
+
+    def get_metrics(self) -> Dict[str, int]:
+        return {
+            "hit_count": self.hit_count,
+            "miss_count": self.miss_count,
+            "stored_count": self.stored_count,
+            "evicted_count": self.evicted_count,
+        }
+
+
+def create_rig_cache() -> Optional[RigCache]:
+    # 캐시 디렉토리를 지정하지 않으면 캐시를 사용하지 않음
+    cache_dir = os.environ.get(RIG_CACHE_DIR_ENV)
+    if not cache_dir:
+        return None
+    max_mb = int(os.environ.get(RIG_CACHE_MAX_MB_ENV, "256"))
+    return RigCache(
+        cache_dir=Path(cache_dir),
+        max_bytes=max_mb * 1024 * 1024,
+    )
+
+
+def install_rig_cache_hooks(rig_cache: RigCache):
+    """
+    animated_drawings가 캐릭터를 불러올 때 mesh 생성과 ARAP 설정을 rig 캐시에서 읽도록 합니다.
+    - AnimatedDrawing._generate_mesh: 이미 불러온(정사각형으로 채운) mask로 키를 계산하고,
+      새로 설정한 속성(mesh)을 저장합니다.
+    - ARAP.__init__: 생성자 인자(기준 자세 pin, 삼각형, 정점)로 키를 계산하고, 객체의 속성을 저장합니다.
+    """
+    from animated_drawings.model.animated_drawing import AnimatedDrawing  # type: ignore
+    from animated_drawings.model.arap import ARAP  # type: ignore
+
+    generate_mesh = AnimatedDrawing._generate_mesh
+    arap_init = ARAP.__init__
+
+    def _generate_mesh(self):
+        mask = getattr(self, "mask", None)
+        if mask is None:
+            generate_mesh(self)
+            return
+
+        def create_mesh() -> Dict[str, Any]:
+            attributes = dict(self.__dict__)
+            generate_mesh(self)
+            return {
+                name: value
+                for name, value in self.__dict__.items()
+                if attributes.get(name) is not value
+            }
+
+        self.__dict__.update(
+            rig_cache.get_or_create(
+                MESH_KIND,
+                compute_rig_cache_key(mask),
+                create_mesh,
+            )
+        )
+
+    def _arap_init(self, pins_xy, triangles, vertices, *args, **kwargs):
+        def create_arap() -> Dict[str, Any]:
+            arap_init(self, pins_xy, triangles, vertices, *args, **kwargs)
+            return dict(self.__dict__)
+
+        key = compute_rig_cache_key(
+            pins_xy,
+            triangles,
+            vertices,
+            *args,
+            *[kwargs[name] for name in sorted(kwargs)],
+            sorted(kwargs),
+        )
+        self.__dict__.update(rig_cache.get_or_create(ARAP_KIND, key, create_arap))
+
+    AnimatedDrawing._generate_mesh = _generate_mesh
+    ARAP.__init__ = _arap_init
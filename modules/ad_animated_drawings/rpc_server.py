@@ -1,8 +1,25 @@
 import logging
 import os
-from collections import deque
-from multiprocessing import Process
-from zero import ZeroServer
+import threading
+import time
+from functools import wraps
+from zero import ZeroClient, ZeroServer
+from render_worker_pool import RenderWorkerPool
+from render_cache import RenderCache, RenderCacheEntry
+from render_job_store import RenderJobState, RenderJobStore
+from render_status_file import (
+    RenderJobStatus,
+    get_render_status_file_path,
+    write_render_status,
+)
+from pathlib import Path
+from render_scheduler import (
+    RenderPriority,
+    RenderScheduler,
+    compute_render_slots,
+    get_available_cpu_count,
+    load_yaml,
+)
 from uuid import uuid4
 from enum import Enum
 from typing import TypedDict, Optional, Any, Dict
@@ -34,42 +51,291 @@ def create_rpc_message(
     }
 
 
-active_render_processes = {}  # 실행 중인 render 작업들을 저장합니다.
-MAX_RENDER_PROCESSES = 1
-render_job_queue = deque()  # 대기열을 위한 변수
-MAX_RENDER_QUEUE_LENGTH = 4
+RENDER_WORKERS_ENV = "AD_RENDER_WORKERS"
+RENDER_THREADS_PER_JOB_ENV = "AD_RENDER_THREADS_PER_JOB"
+RENDER_QUEUE_LENGTH_ENV = "AD_RENDER_QUEUE_LENGTH"
+
+# render 1개가 사용하는 스레드 수 (osmesa llvmpipe 스레드 수로도 사용)
+RENDER_THREADS_PER_JOB = int(os.environ.get(RENDER_THREADS_PER_JOB_ENV, "2"))
+# 지정하지 않으면 사용 가능한 cpu 수와 render 1개의 스레드 수로 동시 render 수를 정함
+MAX_RENDER_PROCESSES = int(
+    os.environ.get(RENDER_WORKERS_ENV)
+    or compute_render_slots(get_available_cpu_count(), RENDER_THREADS_PER_JOB)
+)
+MAX_RENDER_QUEUE_LENGTH = int(
+    os.environ.get(RENDER_QUEUE_LENGTH_ENV) or MAX_RENDER_PROCESSES * 4
+)
+render_job_queue = RenderScheduler(max_queue_length=MAX_RENDER_QUEUE_LENGTH)
 on_running_render_job_ids = set()
 
+RENDER_WORKER_MAX_JOBS_ENV = "AD_RENDER_WORKER_MAX_JOBS"
+RENDER_WORKER_MAX_RSS_MB_ENV = "AD_RENDER_WORKER_MAX_RSS_MB"
 
-def process_queue():
-    """대기열에 있는 작업들을 활성화 가능한 슬롯이 있을 때 실행합니다."""
-    from animated_drawings import render  # type: ignore
-
-    while len(active_render_processes) < MAX_RENDER_PROCESSES and render_job_queue:
-        job = render_job_queue.popleft()
-        process = Process(
-            target=render.start,
-            args=(job["mvc_cfg_file_path"],),
-        )
-        process.start()
+RENDER_CACHE_DIR_ENV = "AD_RENDER_CACHE_DIR"
+RENDER_CACHE_MAX_MB_ENV = "AD_RENDER_CACHE_MAX_MB"
+
+RENDER_JOB_DB_PATH_ENV = "AD_RENDER_JOB_DB_PATH"
+RENDER_JOB_RETENTION_DAYS_ENV = "AD_RENDER_JOB_RETENTION_DAYS"
+
+# 진행중인 작업의 상태 파일을 다시 쓰는 최소 간격
+RENDER_STATUS_PUBLISH_SECONDS = 0.5
+
+# lazy init, zero 서버의 워커 프로세스에서 생성되어야 함
+render_worker_pool = None
+render_job_store = None
+# RPC 함수와 render 워커 감시 스레드가 함께 render 상태를 바꾸지 않도록 함
+render_state_lock = threading.RLock()
+render_watcher_thread = None
+
+
+def create_render_worker_pool() -> RenderWorkerPool:
+    max_jobs_per_worker = int(os.environ.get(RENDER_WORKER_MAX_JOBS_ENV, "20"))
+    max_rss_mb = int(os.environ.get(RENDER_WORKER_MAX_RSS_MB_ENV, "2048"))
+    return RenderWorkerPool(
+        size=MAX_RENDER_PROCESSES,
+        max_jobs_per_worker=max_jobs_per_worker,
+        max_rss_bytes=max_rss_mb * 1024 * 1024,
+        worker_env={"LP_NUM_THREADS": str(RENDER_THREADS_PER_JOB)},
+    )
+
+
+def get_render_worker_pool() -> RenderWorkerPool:
+    global render_worker_pool
+    if render_worker_pool is None:
+        render_worker_pool = create_render_worker_pool()
+        # 재시작 전의 작업을 대기열에 복원
+        get_render_job_store()
+        start_render_watcher()
+    # 처음 호출될 때 워커들을 시작하여 미리 모듈을 불러옴
+    render_worker_pool.start()
+    return render_worker_pool
+
+
+def create_render_job_store() -> RenderJobStore:
+    # 경로를 지정하지 않으면 메모리에만 기록 (재시작시 유지되지 않음)
+    db_path = os.environ.get(RENDER_JOB_DB_PATH_ENV) or ":memory:"
+    retention_days = float(os.environ.get(RENDER_JOB_RETENTION_DAYS_ENV, "30"))
+    store = RenderJobStore(db_path)
+    store.delete_jobs_before(time.time() - retention_days * 24 * 60 * 60)
+    return store
+
+
+def get_render_job_store() -> RenderJobStore:
+    global render_job_store
+    if render_job_store is None:
+        render_job_store = create_render_job_store()
+        restore_render_jobs(render_job_store)
+    return render_job_store
+
+
+def restore_render_jobs(store: RenderJobStore):
+    """재시작 전에 대기중이거나 실행중이던 작업을 다시 대기열에 넣습니다."""
+    for job in store.list_unfinished_jobs():
         job_id = job["job_id"]
-        active_render_processes[job_id] = process
+        mvc_cfg_file_path = job["mvc_cfg_file_path"]
+        if not render_job_queue.push(
+            job_id,
+            mvc_cfg_file_path,
+            priority=RenderPriority(job["priority"]),
+        ):
+            store.mark_ended(
+                job_id,
+                RenderJobState.FAILED,
+                error="render queue is full after restart",
+            )
+            continue
+
+        if job["state"] == RenderJobState.RUNNING:
+            store.mark_requeued(job_id)
         on_running_render_job_ids.add(job_id)
+        if render_cache is not None:
+            cache_entry = render_cache.get_entry(mvc_cfg_file_path)
+            if cache_entry is not None:
+                render_cache_entries[job_id] = cache_entry
+        track_job_status(job_id, mvc_cfg_file_path)
+        track_in_flight_job(job_id, mvc_cfg_file_path)
+        logging.info(f"재시작 전의 render 작업을 대기열에 추가하였습니다. job_id: {job_id}")
+
+
+def create_render_cache() -> Optional[RenderCache]:
+    # 캐시 디렉토리를 지정하지 않으면 캐시를 사용하지 않음
+    cache_dir = os.environ.get(RENDER_CACHE_DIR_ENV)
+    if not cache_dir:
+        return None
+    max_mb = int(os.environ.get(RENDER_CACHE_MAX_MB_ENV, "1024"))
+    return RenderCache(
+        cache_dir=Path(cache_dir),
+        max_bytes=max_mb * 1024 * 1024,
+    )
+
+
+render_cache = create_render_cache()
+# 완료되면 캐시에 저장할 render 작업의 캐시 키와 출력 경로
+render_cache_entries: Dict[str, RenderCacheEntry] = {}
+# api 서버가 완료를 기다리는 render 작업의 상태 파일 경로
+render_status_file_paths: Dict[str, Path] = {}
+# 같은 출력 파일을 만드는 요청을 하나의 작업으로 합치기 위함, key: 출력 파일 경로
+in_flight_render_job_ids: Dict[str, str] = {}
+# 작업을 기다리는 요청 수, 마지막 요청이 취소할 때만 작업을 취소함
+render_job_waiter_counts: Dict[str, int] = {}
+
+
+def get_in_flight_key(mvc_cfg_file_path: str) -> str:
+    # mvc_cfg 파일은 영상(애니메이션, 형식, 품질)마다 하나(mvc_cfg_{video_file_name}.yaml)이며,
+    # 같은 영상을 만드는 요청인지는 실제로 쓰는 출력 경로로 구분
+    try:
+        return str(load_yaml(Path(mvc_cfg_file_path))["controller"]["OUTPUT_VIDEO_PATH"])
+    except Exception:
+        return mvc_cfg_file_path
+
+
+def track_in_flight_job(
+    job_id: str,
+    mvc_cfg_file_path: str,
+):
+    in_flight_render_job_ids[get_in_flight_key(mvc_cfg_file_path)] = job_id
+    render_job_waiter_counts[job_id] = 1
+
+
+def forget_in_flight_job(job_id: str):
+    render_job_waiter_counts.pop(job_id, None)
+    for key, in_flight_job_id in list(in_flight_render_job_ids.items()):
+        if in_flight_job_id == job_id:
+            del in_flight_render_job_ids[key]
+
+
+def with_render_state_lock(func):
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with render_state_lock:
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def publish_job_status(job_id: str):
+    file_path = render_status_file_paths.get(job_id)
+    if file_path is None:
+        return
+    progress = get_job_progress(job_id)
+    status = RenderJobStatus.RUNNING
+    if progress.get("phase") == "queued":
+        status = RenderJobStatus.QUEUED
+    write_render_status(file_path, job_id, status, progress=progress)
+
+
+def publish_job_result(
+    job_id: str,
+    error: Optional[str],
+    exit_code: Optional[int] = None,
+):
+    file_path = render_status_file_paths.pop(job_id, None)
+    if file_path is None:
+        return
+    status = RenderJobStatus.FINISHED if error is None else RenderJobStatus.FAILED
+    write_render_status(file_path, job_id, status, error=error, exit_code=exit_code)
+
+
+def publish_job_canceled(job_id: str):
+    # 상태 파일을 기다리는 연결(다시 연결한 세션, 합쳐진 요청)이 종료를 알 수 있도록 기록
+    file_path = render_status_file_paths.pop(job_id, None)
+    if file_path is None:
+        return
+    write_render_status(file_path, job_id, RenderJobStatus.CANCELED)
+
+
+def watch_render_workers():
+    """
+    render 워커의 완료 메시지, 진행 상황, 프로세스 종료(sentinel)를 기다렸다가 바로 반영합니다.
+    완료된 작업은 상태 파일에 기록되어 api 서버가 RPC 호출 없이 알 수 있습니다.
+    """
+    published_at = 0.0
+    while True:
+        pool = render_worker_pool
+        if pool is None:
+            time.sleep(RENDER_STATUS_PUBLISH_SECONDS)
+            continue
+        pool.wait(timeout=RENDER_STATUS_PUBLISH_SECONDS)
+
+        with render_state_lock:
+            if pool is not render_worker_pool:
+                continue
+            clean_finished_jobs()
+            now = time.time()
+            if now - published_at >= RENDER_STATUS_PUBLISH_SECONDS:
+                published_at = now
+                for job_id in pool.running_job_ids:
+                    publish_job_status(job_id)
+
+
+def start_render_watcher():
+    global render_watcher_thread
+    if render_watcher_thread is not None:
+        return
+    render_watcher_thread = threading.Thread(
+        target=watch_render_workers,
+        name="render-watcher",
+        daemon=True,
+    )
+    render_watcher_thread.start()
+
+
+def process_queue():
+    """대기열에 있는 작업들을 쉬고 있는 render 워커가 있을 때 실행합니다."""
+    pool = get_render_worker_pool()
+
+    while pool.idle_count > 0 and len(render_job_queue) > 0:
+        job = render_job_queue.pop()
+        job_id = job.job_id
+        if not pool.submit(job_id, job.mvc_cfg_file_path):
+            # submit 직전에 워커가 종료된 경우, 대기열에 되돌리고
+            # watcher가 종료된 워커를 교체(reap)한 뒤 다시 실행
+            render_job_queue.requeue(job)
+            logging.warning(f"render 워커에 작업을 보내지 못했습니다. job_id: {job_id}")
+            break
+        get_render_job_store().mark_running(job_id)
+        publish_job_status(job_id)
         logging.info(f"대기열에서 render 작업을 시작하였습니다. job_id: {job_id}")
 
 
 def clean_finished_jobs():
-    finished_jobs = [
-        job_id
-        for job_id, proc in active_render_processes.items()
-        if not proc.is_alive()
-    ]
-    for job_id in finished_jobs:
-        del active_render_processes[job_id]
-        on_running_render_job_ids.remove(job_id)
+    for result in get_render_worker_pool().reap():
+        on_running_render_job_ids.discard(result.job_id)
+        forget_in_flight_job(result.job_id)
+        cache_entry = render_cache_entries.pop(result.job_id, None)
+        publish_job_result(result.job_id, result.error, result.exit_code)
+        get_render_job_store().mark_ended(
+            result.job_id,
+            RenderJobState.FINISHED if result.error is None else RenderJobState.FAILED,
+            exit_code=result.exit_code,
+            error=result.error,
+            peak_rss_bytes=result.peak_rss_bytes,
+        )
+        if result.error is None:
+            if render_cache is not None and cache_entry is not None:
+                render_cache.store(cache_entry)
+            logging.info(
+                f"job_id {result.job_id}의 render 작업이 완료되었습니다. "
+                f"{result.duration_seconds:.1f}초"
+            )
+        else:
+            logging.error(
+                f"job_id {result.job_id}의 render 작업이 실패하였습니다. {result.error}"
+            )
     process_queue()
 
 
+def get_job_progress(job_id: str) -> Dict[str, Any]:
+    progress = get_render_worker_pool().get_progress(job_id)
+    if progress is not None:
+        return progress
+
+    queue_position = render_job_queue.get_position(job_id)
+    if queue_position is not None:
+        return {"phase": "queued", "queue_position": queue_position}
+    return {}
+
+
 def get_internal_port():
     internal_port = os.environ.get("INTERNAL_PORT")
     if internal_port is None:
@@ -91,69 +357,136 @@ def ping(n: int) -> Dict[str, Any]:
     )
 
 
-@app.register_rpc
-def start_render(mvc_cfg_file_path: str) -> Dict[str, Any]:
-    """
-    클라이언트의 요청으로 render.start 작업을 별도의 프로세스로 실행합니다.
-    동시에 최대 MAX_RENDER_PROCESSES개의 render 작업을 실행할 수 있습니다.
-    """
+def track_job_status(
+    job_id: str,
+    mvc_cfg_file_path: str,
+):
+    render_status_file_paths[job_id] = get_render_status_file_path(
+        mvc_cfg_file_path,
+        job_id,
+    )
+    publish_job_status(job_id)
 
-    from animated_drawings import render  # type: ignore
 
+def schedule_render(
+    mvc_cfg_file_path: str,
+    priority: RenderPriority,
+) -> Dict[str, Any]:
     clean_finished_jobs()
 
-    if len(active_render_processes) < MAX_RENDER_PROCESSES:
-        from multiprocessing import current_process
+    # 같은 출력 파일을 만드는 작업이 진행중이면 새로 render 하지 않고 같은 job_id를 반환
+    in_flight_job_id = in_flight_render_job_ids.get(get_in_flight_key(mvc_cfg_file_path))
+    if in_flight_job_id in on_running_render_job_ids:
+        render_job_waiter_counts[in_flight_job_id] += 1
+        # 백그라운드(LOW)로 대기중인 작업을 사용자가 요청하면 요청한 우선순위로 실행
+        render_job_queue.raise_priority(in_flight_job_id, priority)
+        message = f"진행중인 render 작업에 합쳐졌습니다. job_id: {in_flight_job_id}"
+        logging.info(message)
+        return create_rpc_message(
+            RPCType.RUNNING,
+            message,
+            {"job_id": in_flight_job_id, "coalesced": True},
+        )
 
-        current_process().daemon = False
-        process = Process(
-            target=render.start,
-            args=(mvc_cfg_file_path,),
+    store = get_render_job_store()
+    job_id = str(uuid4())
+    cache_entry = None
+    if render_cache is not None:
+        cache_entry = render_cache.get_entry(mvc_cfg_file_path)
+    if cache_entry is not None and render_cache.restore(cache_entry):
+        # 같은 입력의 render 결과가 있으면 바로 완료 처리
+        write_render_status(
+            get_render_status_file_path(mvc_cfg_file_path, job_id),
+            job_id,
+            RenderJobStatus.FINISHED,
+        )
+        store.add_job(
+            job_id,
+            mvc_cfg_file_path,
+            priority,
+            RenderJobState.FINISHED,
+            cached=True,
+        )
+        logging.info(f"render 캐시를 사용하였습니다. job_id: {job_id}")
+        return create_rpc_message(
+            RPCType.RUNNING,
+            f"render 캐시를 사용하였습니다. job_id: {job_id}",
+            {"job_id": job_id, "cached": True},
         )
-        process.start()
-        job_id = str(uuid4())
-        active_render_processes[job_id] = process
+
+    pool = get_render_worker_pool()
+    # 워커에 보내지 못하면 대기열에 추가하고, 워커가 교체된 뒤 실행
+    if pool.idle_count > 0 and pool.submit(job_id, mvc_cfg_file_path):
+        store.add_job(job_id, mvc_cfg_file_path, priority, RenderJobState.RUNNING)
         on_running_render_job_ids.add(job_id)
+        if cache_entry is not None:
+            render_cache_entries[job_id] = cache_entry
+        track_job_status(job_id, mvc_cfg_file_path)
+        track_in_flight_job(job_id, mvc_cfg_file_path)
         logging.info(f"render 작업이 시작되었습니다. job_id: {job_id}")
         return create_rpc_message(
             RPCType.RUNNING,
             f"render 작업이 시작되었습니다. job_id: {job_id}",
             {"job_id": job_id},
         )
-    else:
-        if len(render_job_queue) < MAX_RENDER_QUEUE_LENGTH:
-            job_id = str(uuid4())
-            render_job_queue.append(
-                {
-                    "job_id": job_id,
-                    "mvc_cfg_file_path": mvc_cfg_file_path,
-                }
-            )
-            on_running_render_job_ids.add(job_id)
-            message = f"모든 render 작업이 사용중입니다. 작업이 대기열에 추가되었습니다. 현재 대기열 길이: {len(render_job_queue)}"
-            logging.info(message)
-            return create_rpc_message(
-                RPCType.RUNNING,
-                message,
-                {
-                    "job_id": job_id,
-                    "queue_position": len(render_job_queue),
-                },
-            )
-        else:
-            message = f"대기열이 가득 찼습니다. 최대 {MAX_RENDER_QUEUE_LENGTH}개의 대기열만 허용됩니다."
-            logging.info(message)
-            return create_rpc_message(
-                RPCType.FULL_JOB,
-                message,
-            )
+
+    if not render_job_queue.push(job_id, mvc_cfg_file_path, priority=priority):
+        message = f"대기열이 가득 찼습니다. 최대 {MAX_RENDER_QUEUE_LENGTH}개의 대기열만 허용됩니다."
+        logging.info(message)
+        return create_rpc_message(
+            RPCType.FULL_JOB,
+            message,
+        )
+
+    store.add_job(job_id, mvc_cfg_file_path, priority, RenderJobState.QUEUED)
+    on_running_render_job_ids.add(job_id)
+    if cache_entry is not None:
+        render_cache_entries[job_id] = cache_entry
+    track_job_status(job_id, mvc_cfg_file_path)
+    track_in_flight_job(job_id, mvc_cfg_file_path)
+    message = f"모든 render 작업이 사용중입니다. 작업이 대기열에 추가되었습니다. 현재 대기열 길이: {len(render_job_queue)}"
+    logging.info(message)
+    return create_rpc_message(
+        RPCType.RUNNING,
+        message,
+        {
+            "job_id": job_id,
+            "queue_position": render_job_queue.get_position(job_id),
+        },
+    )
 
 
 @app.register_rpc
+@with_render_state_lock
+def start_render(mvc_cfg_file_path: str) -> Dict[str, Any]:
+    """
+    클라이언트의 요청으로 render.start 작업을 render 워커 프로세스에서 실행합니다.
+    동시에 최대 MAX_RENDER_PROCESSES개의 render 작업을 실행할 수 있습니다.
+    """
+    return schedule_render(mvc_cfg_file_path, RenderPriority.NORMAL)
+
+
+@app.register_rpc
+@with_render_state_lock
+def start_render_with_priority(request: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    start_render와 같지만 우선순위를 지정할 수 있습니다.
+    request: {"mvc_cfg_file_path": str, "priority": "HIGH" | "NORMAL" | "LOW"}
+    대기열에서는 우선순위가 높은 작업, 예상 render 시간이 짧은 작업부터 실행합니다.
+    """
+    priority_name = str(request.get("priority") or "").upper()
+    # 알 수 없는 우선순위는 NORMAL로 처리
+    priority = RenderPriority.__members__.get(priority_name, RenderPriority.NORMAL)
+
+    return schedule_render(request["mvc_cfg_file_path"], priority)
+
+
+@app.register_rpc
+@with_render_state_lock
 def cancel_render(job_id: str) -> Dict[str, Any]:
     """
     클라이언트가 작업 중단 요청 시 호출되는 RPC 함수입니다.
-    전달된 job_id에 해당하는 render 작업 프로세스를 종료합니다.
+    전달된 job_id에 해당하는 render 작업을 실행중인 워커를 종료하고 새 워커로 교체합니다.
     """
     if job_id not in on_running_render_job_ids:
         message = f"해당 {job_id}의 실행 중인 작업이 없습니다."
@@ -163,18 +496,25 @@ def cancel_render(job_id: str) -> Dict[str, Any]:
             message,
         )
 
-    if job_id in active_render_processes:
-        process = active_render_processes[job_id]
-        process.terminate()
-        process.join()
-        del active_render_processes[job_id]
-    else:
-        for idx in range(len(render_job_queue)):
-            if render_job_queue[idx]["job_id"] == job_id:
-                del render_job_queue[idx]
-                break
+    # 같은 작업을 기다리는 다른 요청이 있으면 취소하지 않음
+    waiter_count = render_job_waiter_counts.get(job_id, 1)
+    if waiter_count > 1:
+        render_job_waiter_counts[job_id] = waiter_count - 1
+        message = f"job_id {job_id}의 render 작업을 기다리는 다른 요청이 있어 취소하지 않았습니다."
+        logging.info(message)
+        return create_rpc_message(
+            RPCType.TERMINATE,
+            message,
+        )
+
+    if not get_render_worker_pool().cancel(job_id):
+        render_job_queue.remove(job_id)
 
     on_running_render_job_ids.remove(job_id)
+    forget_in_flight_job(job_id)
+    render_cache_entries.pop(job_id, None)
+    publish_job_canceled(job_id)
+    get_render_job_store().mark_ended(job_id, RenderJobState.CANCELED)
     logging.info(f"job_id {job_id}의 render 프로세스가 종료되었습니다.")
     process_queue()
     return create_rpc_message(
@@ -184,20 +524,31 @@ def cancel_render(job_id: str) -> Dict[str, Any]:
 
 
 @app.register_rpc
+@with_render_state_lock
 def is_finish_render(job_id: str) -> Dict[str, Any]:
     """
     클라이언트가 작업 완료 여부를 확인하기 위해 호출되는 RPC 함수입니다.
     전달된 job_id에 해당하는 render 작업 프로세스가 종료되었는지 확인합니다.
+    진행중이면 data.progress로 진행 상황을 반환합니다.
+    - 대기중: {"phase": "queued", "queue_position"}
+    - 실행중: {"phase", "frames_done", "total_frames", "elapsed_seconds", "eta_seconds"}
+    종료되었으면 data로 작업 기록의 state(FINISHED, FAILED, CANCELED), exit_code, error를 반환합니다.
     """
 
     clean_finished_jobs()
 
     if job_id not in on_running_render_job_ids:
+        job = get_render_job_store().get_job(job_id) or {}
         msg = f"job_id {job_id}의 render 작업이 완료되었습니다"
         logging.info(msg)
         return create_rpc_message(
             RPCType.TERMINATE,
             msg,
+            {
+                "state": job.get("state"),
+                "exit_code": job.get("exit_code"),
+                "error": job.get("error"),
+            },
         )
     else:
         msg = f"job_id {job_id}의 render 작업이 진행중입니다"
@@ -205,12 +556,72 @@ def is_finish_render(job_id: str) -> Dict[str, Any]:
         return create_rpc_message(
             RPCType.RUNNING,
             msg,
+            {"progress": get_job_progress(job_id)},
         )
 
 
+@app.register_rpc
+@with_render_state_lock
+def render_job_history(request: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    render 작업 기록을 반환합니다.
+    request: {"job_id": str} 이면 해당 작업과 상태 변화 이력,
+             {"limit": int, "since": float(unix time)} 이면 최근 작업 목록
+    각 작업은 state, exit_code, error, enqueued_at, started_at, finished_at,
+    queue_wait_seconds, duration_seconds, peak_rss_bytes를 포함합니다.
+    """
+    store = get_render_job_store()
+    job_id = request.get("job_id")
+    if job_id is not None:
+        job = store.get_job(job_id)
+        if job is not None:
+            job["events"] = store.get_job_events(job_id)
+        return create_rpc_message(RPCType.RUNNING, data={"jobs": [job] if job else []})
+
+    jobs = store.list_jobs(
+        limit=int(request.get("limit") or 100),
+        since=request.get("since"),
+    )
+    return create_rpc_message(RPCType.RUNNING, data={"jobs": jobs})
+
+
+@app.register_rpc
+@with_render_state_lock
+def render_metrics() -> Dict[str, Any]:
+    """render 워커 풀과 대기열 상태를 반환합니다."""
+    clean_finished_jobs()
+
+    return create_rpc_message(
+        RPCType.RUNNING,
+        data={
+            **get_render_worker_pool().get_metrics(),
+            "queue_length": len(render_job_queue),
+            "max_queue_length": MAX_RENDER_QUEUE_LENGTH,
+            "cache": render_cache.get_metrics() if render_cache is not None else {},
+        },
+    )
+
+
+def warm_up_render_server():
+    """
+    서버가 시작되면 render_metrics를 호출하여 zero 워커 프로세스에서
+    render 워커를 미리 시작하고 재시작 전의 대기열을 복원합니다.
+    """
+    client = ZeroClient("localhost", int(internal_port), default_timeout=10000)
+    for _ in range(30):
+        try:
+            client.call("render_metrics", None)
+            logging.info("render 서버 준비가 완료되었습니다.")
+            return
+        except Exception as e:
+            logging.info(f"render 서버 준비를 기다립니다. {e}")
+            time.sleep(1)
+
+
 if __name__ == "__main__":
     logging.basicConfig(
         level=logging.INFO, format="%(asctime)s %(levelname)s: %(message)s"
     )
     logging.info(f"ZeroRPC server started, listening on port : {internal_port}")
+    threading.Thread(target=warm_up_render_server, daemon=True).start()
     app.run(workers=1)
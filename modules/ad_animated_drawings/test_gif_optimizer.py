@@ -0,0 +1,101 @@
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import numpy as np
+from PIL import Image
+from gif_optimizer import (
+    DISPOSAL_BACKGROUND,
+    DISPOSAL_NONE,
+    TRANSPARENT_INDEX,
+    optimize_gif,
+    plan_gif_frames,
+    read_gif_frames,
+    try_optimize_gif,
+)
+
+
+def write_gif(file_path: Path, background_alpha: int, num_frames: int = 20):
+    """배경 위에서 사각형 하나가 움직이고 하나는 멈춰 있는 gif를 만듭니다."""
+    frames = []
+    for i in range(num_frames):
+        frame = np.zeros((64, 64, 4), dtype=np.uint8)
+        frame[..., :3] = 255
+        frame[..., 3] = background_alpha
+        frame[10:30, 5 + i : 20 + i] = (200, 30, 30, 255)
+        frame[40:60, 20:44] = (30, 30, 200, 255)
+        frames.append(Image.fromarray(frame, "RGBA"))
+    frames[0].save(
+        file_path.as_posix(),
+        save_all=True,
+        append_images=frames[1:],
+        duration=50,
+        disposal=2,
+        loop=0,
+    )
+
+
+def visible_pixels(frame: np.ndarray) -> np.ndarray:
+    # 투명 픽셀은 색과 관계없이 같은 픽셀로 봄
+    frame = frame.copy()
+    frame[frame[..., 3] < 128] = 0
+    return frame
+
+
+def test_optimized_gif_shows_same_frames(tmp_path):
+    for background_alpha in [0, 255]:
+        # given
+        file_path = tmp_path / f"dab_{background_alpha}.gif"
+        write_gif(file_path, background_alpha)
+        frames, durations, loop = read_gif_frames(file_path)
+
+        # when
+        original_size, optimized_size = optimize_gif(file_path)
+
+        # then
+        optimized_frames, optimized_durations, optimized_loop = read_gif_frames(
+            file_path
+        )
+        assert optimized_size <= original_size
+        assert file_path.stat().st_size == optimized_size
+        assert len(optimized_frames) == len(frames)
+        for frame, optimized_frame in zip(frames, optimized_frames):
+            assert np.array_equal(
+                visible_pixels(frame),
+                visible_pixels(optimized_frame),
+            )
+        assert optimized_durations == durations
+        assert optimized_loop == loop
+        assert [path.name for path in tmp_path.iterdir() if path.name.startswith(".")] == []
+
+
+def test_plan_clears_pixels_that_become_transparent():
+    # given: 두 번째 프레임에서 왼쪽 픽셀이 투명으로 바뀜
+    first = np.full((4, 4), TRANSPARENT_INDEX, dtype=np.uint8)
+    first[0, 0] = 1
+    second = np.full((4, 4), TRANSPARENT_INDEX, dtype=np.uint8)
+    second[3, 3] = 1
+    third = second.copy()
+    third[3, 2] = 2
+
+    # when
+    gif_frames = plan_gif_frames([first, second, third])
+
+    # then
+    assert gif_frames[0].disposal == DISPOSAL_BACKGROUND
+    assert gif_frames[1].box == (3, 3, 4, 4)
+    assert gif_frames[1].disposal == DISPOSAL_NONE
+    assert gif_frames[2].box == (2, 3, 3, 4)
+
+
+def test_invalid_gif_is_kept(tmp_path):
+    # given
+    file_path = tmp_path / "dab.gif"
+    file_path.write_bytes(b"GIF89a")
+
+    # when
+    try_optimize_gif(file_path)
+
+    # then
+    assert file_path.read_bytes() == b"GIF89a"
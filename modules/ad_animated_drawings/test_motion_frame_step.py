@@ -0,0 +1,100 @@
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import yaml
+from motion_frame_step import (
+    FRAME_STEP_KEY,
+    apply_frame_step,
+    downsample_bvh,
+    remove_sampled_motion_files,
+)
+
+
+BVH_TEXT = """HIERARCHY
+ROOT Hips
+{
+  OFFSET 0 0 0
+  CHANNELS 3 Xposition Yposition Zposition
+  End Site
+  {
+    OFFSET 0 1 0
+  }
+}
+MOTION
+Frames: 5
+Frame Time: 0.033333
+0 0 0
+1 0 0
+2 0 0
+3 0 0
+4 0 0
+"""
+
+
+def test_downsample_bvh():
+    # when
+    result = downsample_bvh(BVH_TEXT, 2)
+
+    # then
+    lines = result.splitlines()
+    motion_index = lines.index("MOTION")
+    assert lines[:motion_index] == BVH_TEXT.splitlines()[:motion_index]
+    assert lines[motion_index + 1 :] == [
+        "Frames: 3",
+        "Frame Time: 0.066666",
+        "0 0 0",
+        "2 0 0",
+        "4 0 0",
+    ]
+
+
+def test_apply_frame_step(tmp_path):
+    # given
+    bvh_path = tmp_path / "dab.bvh"
+    bvh_path.write_text(BVH_TEXT)
+    motion_cfg_path = tmp_path / "dab_preview.yaml"
+    motion_cfg_path.write_text(
+        yaml.dump(
+            {
+                "filepath": bvh_path.as_posix(),
+                "start_frame_idx": 1,
+                "end_frame_idx": 4,
+                "scale": 0.025,
+            }
+        )
+    )
+    mvc_cfg = {
+        "scene": {"ANIMATED_CHARACTERS": [{"motion_cfg": motion_cfg_path.as_posix()}]},
+        "controller": {"MODE": "video_render", FRAME_STEP_KEY: 2},
+    }
+    rendering_cfg_path = tmp_path / ".mvc_cfg.rendering.yaml"
+
+    # when
+    frame_step = apply_frame_step(mvc_cfg, rendering_cfg_path)
+
+    # then: animated_drawings에 없는 FRAME_STEP은 제거하고 샘플링한 motion을 사용
+    assert frame_step == 2
+    assert FRAME_STEP_KEY not in mvc_cfg["controller"]
+    sampled_motion_cfg = yaml.safe_load(
+        Path(mvc_cfg["scene"]["ANIMATED_CHARACTERS"][0]["motion_cfg"]).read_text()
+    )
+    assert sampled_motion_cfg["start_frame_idx"] == 1
+    assert sampled_motion_cfg["end_frame_idx"] == 2
+    assert sampled_motion_cfg["scale"] == 0.025
+    assert "Frames: 3" in Path(sampled_motion_cfg["filepath"]).read_text()
+
+    remove_sampled_motion_files(rendering_cfg_path)
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "dab.bvh",
+        "dab_preview.yaml",
+    ]
+
+
+def test_apply_frame_step_without_frame_step():
+    # given
+    mvc_cfg = {"scene": {"ANIMATED_CHARACTERS": []}, "controller": {}}
+
+    # when, then
+    assert apply_frame_step(mvc_cfg, Path("mvc_cfg.yaml")) == 1
@@ -0,0 +1,152 @@
+from pathlib import Path
+import os
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import yaml
+from render_cache import RenderCache, RenderCacheEntry
+
+
+def write_workspace(
+    tmp_path: Path,
+    ad_id: str,
+    texture: bytes = b"texture",
+    camera_pos=(0.0, 0.9, 2.0),
+) -> str:
+    """animated_drawings workspace와 같은 구조의 mvc_cfg.yaml을 만들고 경로를 반환"""
+    config_path = tmp_path.joinpath("config")
+    config_path.mkdir(exist_ok=True)
+    motion_cfg_path = config_path.joinpath("dab.yaml")
+    motion_cfg_path.write_text("filepath: dab.bvh\nend_frame_idx: null\n")
+    retarget_cfg_path = config_path.joinpath("fair1_ppf.yaml")
+    retarget_cfg_path.write_text("char_starting_location: [0.0, 0.0, -0.5]\n")
+
+    base_path = tmp_path.joinpath("files", ad_id)
+    base_path.mkdir(parents=True)
+    base_path.joinpath("char_cfg.yaml").write_text("height: 30\nwidth: 20\n")
+    base_path.joinpath("texture.png").write_bytes(texture)
+    base_path.joinpath("mask.png").write_bytes(b"mask")
+
+    mvc_cfg = {
+        "scene": {
+            "ANIMATED_CHARACTERS": [
+                {
+                    "character_cfg": base_path.joinpath("char_cfg.yaml").as_posix(),
+                    "motion_cfg": motion_cfg_path.as_posix(),
+                    "retarget_cfg": retarget_cfg_path.as_posix(),
+                }
+            ]
+        },
+        "view": {"USE_MESA": True, "CAMERA_POS": list(camera_pos)},
+        "controller": {
+            "MODE": "video_render",
+            "OUTPUT_VIDEO_PATH": base_path.joinpath("video/dab.gif").as_posix(),
+        },
+    }
+    mvc_cfg_path = base_path.joinpath("mvc_cfg.yaml")
+    mvc_cfg_path.write_text(yaml.dump(mvc_cfg))
+    return mvc_cfg_path.as_posix()
+
+
+def write_output(entry: RenderCacheEntry, content: bytes = b"gif"):
+    entry.output_path.parent.mkdir(parents=True, exist_ok=True)
+    entry.output_path.write_bytes(content)
+
+
+def create_cache(tmp_path: Path, max_bytes: int = 1024) -> RenderCache:
+    return RenderCache(
+        cache_dir=tmp_path.joinpath("files", ".render_cache"),
+        max_bytes=max_bytes,
+    )
+
+
+def test_same_inputs_have_same_key(tmp_path):
+    # given
+    cache = create_cache(tmp_path)
+
+    # when
+    entry_1 = cache.get_entry(write_workspace(tmp_path, "ad_1"))
+    entry_2 = cache.get_entry(write_workspace(tmp_path, "ad_2"))
+    other_texture = cache.get_entry(write_workspace(tmp_path, "ad_3", texture=b"x"))
+    other_camera = cache.get_entry(
+        write_workspace(tmp_path, "ad_4", camera_pos=(1.0, 0.7, 4.0))
+    )
+
+    # then: 출력 경로가 달라도 입력이 같으면 같은 키
+    assert entry_1.output_path != entry_2.output_path
+    assert entry_1.key == entry_2.key
+    assert entry_1.key != other_texture.key
+    assert entry_1.key != other_camera.key
+
+
+def test_get_entry_without_config(tmp_path):
+    # when
+    entry = create_cache(tmp_path).get_entry("not_exist_mvc_cfg.yaml")
+
+    # then
+    assert entry is None
+
+
+def test_store_and_restore_with_hardlink(tmp_path):
+    # given
+    cache = create_cache(tmp_path)
+    entry_1 = cache.get_entry(write_workspace(tmp_path, "ad_1"))
+    entry_2 = cache.get_entry(write_workspace(tmp_path, "ad_2"))
+    assert not cache.restore(entry_1)
+    write_output(entry_1)
+
+    # when
+    assert cache.store(entry_1)
+    is_restored = cache.restore(entry_2)
+
+    # then
+    assert is_restored
+    assert entry_2.output_path.read_bytes() == b"gif"
+    assert entry_2.output_path.stat().st_ino == entry_1.output_path.stat().st_ino
+    assert cache.get_metrics()["hit_count"] == 1
+    assert cache.get_metrics()["miss_count"] == 1
+
+
+def test_miss_unlinks_output_shared_with_cache(tmp_path):
+    # given
+    cache = create_cache(tmp_path)
+    entry = cache.get_entry(write_workspace(tmp_path, "ad_1"))
+    write_output(entry)
+    cache.store(entry)
+    cache.cache_dir.joinpath(f"{entry.key}.gif").rename(
+        cache.cache_dir.joinpath("other.gif")
+    )
+
+    # when: 캐시에 없는 키로 다시 render
+    assert not cache.restore(entry)
+
+    # then: 다시 render 해도 다른 캐시 파일이 바뀌지 않음
+    assert not entry.output_path.exists()
+    assert cache.cache_dir.joinpath("other.gif").read_bytes() == b"gif"
+
+
+def test_evict_least_recently_used(tmp_path):
+    # given
+    cache = create_cache(tmp_path, max_bytes=10)
+    entries = []
+    for i, texture in enumerate([b"a", b"b", b"c"]):
+        entry = cache.get_entry(write_workspace(tmp_path, f"ad_{i}", texture=texture))
+        write_output(entry, b"12345")
+        entries.append(entry)
+    cache.store(entries[0])
+    cache.store(entries[1])
+    os.utime(cache.cache_dir.joinpath(f"{entries[0].key}.gif"), (1, 1))
+    os.utime(cache.cache_dir.joinpath(f"{entries[1].key}.gif"), (2, 2))
+    # entries[0]을 최근에 사용
+    cache.restore(entries[0]._replace(output_path=tmp_path.joinpath("restored.gif")))
+
+    # when
+    cache.store(entries[2])
+
+    # then
+    cached_names = sorted(path.name for path in cache.cache_dir.iterdir())
+    assert cached_names == sorted([f"{entries[0].key}.gif", f"{entries[2].key}.gif"])
+    assert cache.get_metrics()["evicted_count"] == 1
+    # workspace의 결과는 삭제되지 않음
+    assert entries[1].output_path.exists()
@@ -0,0 +1,85 @@
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from render_job_store import RenderJobState, RenderJobStore
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_job_state_transitions():
+    # given
+    clock = FakeClock()
+    store = RenderJobStore(":memory:", clock=clock)
+
+    # when
+    store.add_job("job_1", "mvc_cfg.yaml", 1, RenderJobState.QUEUED)
+    clock.now += 3
+    store.mark_running("job_1")
+    clock.now += 10
+    store.mark_ended(
+        "job_1",
+        RenderJobState.FAILED,
+        exit_code=-9,
+        error="render worker exited with code -9",
+        peak_rss_bytes=1024,
+    )
+
+    # then
+    job = store.get_job("job_1")
+    assert job["state"] == "FAILED"
+    assert job["exit_code"] == -9
+    assert job["queue_wait_seconds"] == 3
+    assert job["duration_seconds"] == 10
+    assert job["peak_rss_bytes"] == 1024
+    assert [event["state"] for event in store.get_job_events("job_1")] == [
+        "QUEUED",
+        "RUNNING",
+        "FAILED",
+    ]
+    assert store.get_job("not_exist_job") is None
+
+
+def test_unfinished_jobs_survive_restart(tmp_path):
+    # given
+    db_path = (tmp_path / "render_jobs.sqlite3").as_posix()
+    store = RenderJobStore(db_path)
+    store.add_job("queued", "queued.yaml", 0, RenderJobState.QUEUED)
+    store.add_job("running", "running.yaml", 1, RenderJobState.RUNNING)
+    store.add_job("cached", "cached.yaml", 1, RenderJobState.FINISHED, cached=True)
+    store.close()
+
+    # when
+    restarted_store = RenderJobStore(db_path)
+
+    # then
+    jobs = restarted_store.list_unfinished_jobs()
+    assert [job["job_id"] for job in jobs] == ["queued", "running"]
+    assert restarted_store.get_job("cached")["cached"]
+
+
+def test_list_jobs_and_retention():
+    # given
+    clock = FakeClock()
+    store = RenderJobStore(":memory:", clock=clock)
+    for i in range(3):
+        store.add_job(f"job_{i}", "mvc_cfg.yaml", 1, RenderJobState.QUEUED)
+        store.mark_ended(f"job_{i}", RenderJobState.FINISHED)
+        clock.now += 10
+    store.add_job("queued", "mvc_cfg.yaml", 1, RenderJobState.QUEUED)
+
+    # when
+    deleted_count = store.delete_jobs_before(1015)
+
+    # then: 대기중인 작업은 삭제하지 않음
+    assert deleted_count == 2
+    assert [job["job_id"] for job in store.list_jobs()] == ["queued", "job_2"]
+    assert [job["job_id"] for job in store.list_jobs(limit=1)] == ["queued"]
+    assert store.list_jobs(since=1025) == [store.get_job("queued")]
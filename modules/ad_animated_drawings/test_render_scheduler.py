@@ -0,0 +1,169 @@
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import yaml
+from render_scheduler import (
+    DEFAULT_MOTION_FRAME_COUNT,
+    RenderPriority,
+    RenderScheduler,
+    compute_render_slots,
+    estimate_render_cost,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def write_yaml(file_path: Path, content: dict) -> Path:
+    file_path.write_text(yaml.dump(content))
+    return file_path
+
+
+def write_mvc_cfg(tmp_path: Path, end_frame_idx, height: int, width: int) -> str:
+    motion_cfg_path = write_yaml(
+        tmp_path / f"motion_{end_frame_idx}_{height}.yaml",
+        {"start_frame_idx": 0, "end_frame_idx": end_frame_idx},
+    )
+    char_cfg_path = write_yaml(
+        tmp_path / f"char_cfg_{end_frame_idx}_{height}.yaml",
+        {"height": height, "width": width, "skeleton": []},
+    )
+    mvc_cfg_path = write_yaml(
+        tmp_path / f"mvc_cfg_{end_frame_idx}_{height}.yaml",
+        {
+            "scene": {
+                "ANIMATED_CHARACTERS": [
+                    {
+                        "character_cfg": char_cfg_path.as_posix(),
+                        "motion_cfg": motion_cfg_path.as_posix(),
+                    }
+                ]
+            }
+        },
+    )
+    return mvc_cfg_path.as_posix()
+
+
+def test_compute_render_slots():
+    assert compute_render_slots(cpu_count=32, threads_per_render=2) == 16
+    assert compute_render_slots(cpu_count=1, threads_per_render=4) == 1
+
+
+def test_estimate_render_cost(tmp_path):
+    # given
+    short_small = write_mvc_cfg(tmp_path, end_frame_idx=125, height=256, width=256)
+    long_small = write_mvc_cfg(tmp_path, end_frame_idx=839, height=256, width=256)
+    long_large = write_mvc_cfg(tmp_path, end_frame_idx=839, height=1024, width=1024)
+
+    # then: 프레임 수, 캐릭터 크기에 비례
+    assert estimate_render_cost(short_small) < estimate_render_cost(long_small)
+    assert estimate_render_cost(long_small) < estimate_render_cost(long_large)
+
+
+def test_estimate_render_cost_with_frame_step(tmp_path):
+    # given
+    mvc_cfg_path = Path(
+        write_mvc_cfg(tmp_path, end_frame_idx=839, height=256, width=256)
+    )
+    cost = estimate_render_cost(mvc_cfg_path.as_posix())
+    mvc_cfg = yaml.safe_load(mvc_cfg_path.read_text())
+    mvc_cfg["controller"] = {"FRAME_STEP": 2}
+    write_yaml(mvc_cfg_path, mvc_cfg)
+
+    # then: 2 프레임마다 한 프레임만 render
+    assert estimate_render_cost(mvc_cfg_path.as_posix()) == cost / 2
+
+
+def test_estimate_render_cost_without_config():
+    # when
+    cost = estimate_render_cost("not_exist_mvc_cfg.yaml")
+
+    # then
+    assert cost == DEFAULT_MOTION_FRAME_COUNT * 2
+
+
+def test_pop_priority_then_shortest_job_first():
+    # given
+    scheduler = RenderScheduler(max_queue_length=4, clock=FakeClock())
+    scheduler.push("long", "long.yaml", estimated_cost=800)
+    scheduler.push("short", "short.yaml", estimated_cost=100)
+    scheduler.push("low", "low.yaml", RenderPriority.LOW, estimated_cost=10)
+    scheduler.push("high", "high.yaml", RenderPriority.HIGH, estimated_cost=900)
+
+    # then
+    assert scheduler.get_position("short") == 2
+    assert [scheduler.pop().job_id for _ in range(4)] == [
+        "high",
+        "short",
+        "long",
+        "low",
+    ]
+    assert scheduler.pop() is None
+
+
+def test_long_waiting_job_is_not_starved():
+    # given
+    clock = FakeClock()
+    scheduler = RenderScheduler(max_queue_length=4, clock=clock)
+    scheduler.push("long", "long.yaml", estimated_cost=800)
+
+    # when: 오래 기다린 긴 작업은 새로 들어온 짧은 작업보다 먼저 실행
+    clock.now += 10 * 60
+    scheduler.push("short", "short.yaml", estimated_cost=100)
+
+    # then
+    assert scheduler.pop().job_id == "long"
+
+
+def test_push_full_and_remove():
+    # given
+    scheduler = RenderScheduler(max_queue_length=1, clock=FakeClock())
+    assert scheduler.push("job_1", "job_1.yaml", estimated_cost=1)
+
+    # when
+    is_pushed = scheduler.push("job_2", "job_2.yaml", estimated_cost=1)
+
+    # then
+    assert not is_pushed
+    assert scheduler.remove("job_1")
+    assert not scheduler.remove("job_1")
+    assert len(scheduler) == 0
+
+
+def test_requeue_keeps_queue_order():
+    # given
+    clock = FakeClock()
+    scheduler = RenderScheduler(max_queue_length=4, clock=clock)
+    scheduler.push("job_1", "job_1.yaml", estimated_cost=1)
+    job = scheduler.pop()
+
+    # when: 늦게 추가된 같은 비용의 작업보다 먼저 실행
+    clock.now += 1
+    scheduler.push("job_2", "job_2.yaml", estimated_cost=1)
+    scheduler.requeue(job)
+
+    # then
+    assert len(scheduler) == 2
+    assert scheduler.pop().job_id == "job_1"
+
+
+def test_raise_priority():
+    # given
+    scheduler = RenderScheduler(max_queue_length=4, clock=FakeClock())
+    scheduler.push("background", "background.yaml", RenderPriority.LOW, estimated_cost=1)
+    scheduler.push("normal", "normal.yaml", estimated_cost=100)
+
+    # when
+    is_raised = scheduler.raise_priority("background", RenderPriority.NORMAL)
+
+    # then: 높이기만 하고 낮추지는 않음
+    assert is_raised
+    assert not scheduler.raise_priority("background", RenderPriority.LOW)
+    assert scheduler.pop().job_id == "background"
@@ -0,0 +1,352 @@
+from pathlib import Path
+import os
+import sys
+import time
+import types
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import yaml
+from render_worker_pool import RenderWorkerPool, run_render
+
+
+def wait_for_results(pool: RenderWorkerPool, count: int, timeout: float = 5):
+    results = []
+    deadline = time.time() + timeout
+    while len(results) < count and time.time() < deadline:
+        results.extend(pool.reap())
+        time.sleep(0.01)
+    return results
+
+
+def create_pool(render, size: int = 1, max_jobs_per_worker: int = 10):
+    return RenderWorkerPool(
+        size=size,
+        max_jobs_per_worker=max_jobs_per_worker,
+        max_rss_bytes=1024 * 1024 * 1024 * 1024,
+        preload=lambda: None,
+        render=render,
+    )
+
+
+def dummy_render(mvc_cfg_file_path):
+    time.sleep(0.05)
+
+
+def failing_render(mvc_cfg_file_path):
+    raise ValueError(mvc_cfg_file_path)
+
+
+def crashing_render(mvc_cfg_file_path):
+    os._exit(3)
+
+
+def sleeping_render(mvc_cfg_file_path):
+    time.sleep(5)
+
+
+def test_worker_is_reused_across_jobs():
+    # given
+    pool = create_pool(dummy_render)
+    pool.start()
+    pid = pool.workers[0].process.pid
+
+    try:
+        # when
+        for job_id in ["job_1", "job_2"]:
+            assert pool.submit(job_id, "dummy_path")
+            assert not pool.submit("overflow", "dummy_path")
+            results = wait_for_results(pool, 1)
+
+            # then
+            assert [result.job_id for result in results] == [job_id]
+            assert results[0].error is None
+            assert results[0].peak_rss_bytes > 0
+        assert pool.workers[0].process.pid == pid
+        assert pool.workers[0].job_count == 2
+    finally:
+        pool.shutdown()
+
+
+def memory_heavy_render(mvc_cfg_file_path):
+    # 페이지를 실제로 쓰도록 채운 메모리를 잠시 유지한 뒤 해제
+    data = b"x" * (256 * 1024 * 1024)
+    time.sleep(0.5)
+    del data
+
+
+def test_peak_rss_is_measured_per_job():
+    # given: 같은 워커에서 메모리를 많이 쓰는 작업 다음에 가벼운 작업을 실행
+    pool = create_pool(
+        lambda mvc_cfg_file_path: (
+            memory_heavy_render(mvc_cfg_file_path)
+            if mvc_cfg_file_path == "heavy_path"
+            else dummy_render(mvc_cfg_file_path)
+        )
+    )
+
+    try:
+        # when
+        pool.submit("heavy_job", "heavy_path")
+        heavy_result = wait_for_results(pool, 1)[0]
+        pool.submit("light_job", "light_path")
+        light_result = wait_for_results(pool, 1)[0]
+
+        # then: 이전 작업의 최대 RSS가 다음 작업에 남지 않음
+        assert heavy_result.peak_rss_bytes > 256 * 1024 * 1024
+        assert (
+            light_result.peak_rss_bytes
+            < heavy_result.peak_rss_bytes - 128 * 1024 * 1024
+        )
+    finally:
+        pool.shutdown()
+
+
+def test_render_error_is_reported():
+    # given
+    pool = create_pool(failing_render)
+
+    try:
+        # when
+        pool.submit("job_1", "dummy_path")
+        results = wait_for_results(pool, 1)
+
+        # then
+        assert "ValueError" in results[0].error
+        assert pool.idle_count == 1
+    finally:
+        pool.shutdown()
+
+
+def test_crashed_worker_is_replaced():
+    # given
+    pool = create_pool(crashing_render)
+    pool.start()
+    pid = pool.workers[0].process.pid
+
+    try:
+        # when
+        pool.submit("job_1", "dummy_path")
+        results = wait_for_results(pool, 1)
+
+        # then
+        assert results[0].job_id == "job_1"
+        assert results[0].exit_code == 3
+        assert pool.workers[0].process.pid != pid
+        assert pool.workers[0].process.is_alive()
+        assert pool.get_metrics()["crashed_count"] == 1
+    finally:
+        pool.shutdown()
+
+
+def test_exited_worker_is_not_idle():
+    # given
+    pool = create_pool(dummy_render)
+    pool.start()
+    assert pool.idle_count == 1
+
+    try:
+        # when: reap 되기 전에 워커가 종료됨
+        pool.workers[0].process.kill()
+        pool.workers[0].process.join()
+
+        # then
+        assert pool.idle_count == 0
+        assert not pool.submit("job_1", "dummy_path")
+        pool.reap()
+        assert pool.idle_count == 1
+    finally:
+        pool.shutdown()
+
+
+def test_worker_recycled_after_max_jobs():
+    # given
+    pool = create_pool(dummy_render, max_jobs_per_worker=1)
+    pool.start()
+    pid = pool.workers[0].process.pid
+
+    try:
+        # when
+        pool.submit("job_1", "dummy_path")
+        wait_for_results(pool, 1)
+
+        # then
+        assert pool.workers[0].process.pid != pid
+        assert pool.get_metrics()["recycled_count"] == 1
+    finally:
+        pool.shutdown()
+
+
+def test_cancel_replaces_worker():
+    # given
+    pool = create_pool(sleeping_render, size=2)
+    pool.submit("job_1", "dummy_path")
+    pid = pool.workers[0].process.pid
+
+    try:
+        # when
+        is_canceled = pool.cancel("job_1")
+
+        # then
+        assert is_canceled
+        assert not pool.is_running("job_1")
+        assert pool.workers[0].process.pid != pid
+        assert pool.idle_count == 2
+        assert not pool.cancel("job_1")
+    finally:
+        pool.shutdown()
+
+
+def progress_render(mvc_cfg_file_path):
+    from render_worker_pool import (
+        RENDER_PHASE_ENCODING,
+        RENDER_PHASE_RENDERING,
+        report_render_progress,
+    )
+
+    report_render_progress(5, 10, RENDER_PHASE_RENDERING)
+    report_render_progress(10, 10, RENDER_PHASE_ENCODING)
+    time.sleep(5)
+
+
+def test_render_progress_is_reported():
+    # given
+    pool = create_pool(progress_render)
+
+    try:
+        # when
+        pool.submit("job_1", "dummy_path")
+        deadline = time.time() + 5
+        while time.time() < deadline:
+            pool.reap()
+            if pool.get_progress("job_1")["phase"] == "encoding":
+                break
+            time.sleep(0.01)
+        progress = pool.get_progress("job_1")
+
+        # then
+        assert progress["frames_done"] == 10
+        assert progress["total_frames"] == 10
+        assert progress["phase"] == "encoding"
+        assert pool.get_progress("job_2") is None
+    finally:
+        pool.shutdown()
+
+
+def test_wait_returns_when_worker_exits():
+    # given
+    pool = create_pool(crashing_render)
+    pool.start()
+
+    try:
+        # when
+        pool.submit("job_1", "dummy_path")
+        started_at = time.time()
+        is_ready = pool.wait(timeout=5)
+
+        # then: process sentinel로 바로 깨어남
+        assert is_ready
+        assert time.time() - started_at < 5
+        assert pool.reap()[0].exit_code == 3
+    finally:
+        pool.shutdown()
+
+
+def test_run_render_replaces_output_after_render(tmp_path, monkeypatch):
+    # given
+    output_path = tmp_path / "video" / "dab.gif"
+    output_path.parent.mkdir()
+    mvc_cfg_path = tmp_path / "mvc_cfg.yaml"
+    mvc_cfg_path.write_text(
+        yaml.dump({"controller": {"OUTPUT_VIDEO_PATH": output_path.as_posix()}})
+    )
+    rendered_output_paths = []
+
+    def start(mvc_cfg_file_path):
+        with open(mvc_cfg_file_path) as f:
+            rendering_output_path = Path(
+                yaml.safe_load(f)["controller"]["OUTPUT_VIDEO_PATH"]
+            )
+        rendering_output_path.write_bytes(b"GIF89a")
+        # render 도중에는 출력 경로에 파일이 없음
+        assert not output_path.exists()
+        rendered_output_paths.append(rendering_output_path)
+
+    fake_animated_drawings = types.ModuleType("animated_drawings")
+    fake_animated_drawings.render = types.SimpleNamespace(start=start)  # type: ignore
+    monkeypatch.setitem(sys.modules, "animated_drawings", fake_animated_drawings)
+
+    # when
+    run_render(mvc_cfg_path.as_posix())
+
+    # then
+    assert rendered_output_paths[0].suffix == ".gif"
+    assert output_path.read_bytes() == b"GIF89a"
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "mvc_cfg.yaml",
+        "video",
+    ]
+    assert [path.name for path in output_path.parent.iterdir()] == ["dab.gif"]
+
+
+def test_video_format_hooks_write_webm_with_fallback_codec(monkeypatch):
+    from render_worker_pool import install_video_format_hooks
+
+    # given: mp4, gif만 허용하는 animated_drawings config와 video writer
+    class ControllerConfig:
+        def __init__(self, path, codec):
+            self.mode = "video_render"
+            self.set_output_video_path(path)
+            self.output_video_codec = codec
+
+        def set_output_video_path(self, path):
+            assert Path(path).suffix in (".gif", ".mp4")
+            self.output_video_path = path
+
+    class OpenCVWriter:
+        def __init__(self, codec):
+            self.codec = codec
+
+        def isOpened(self):
+            return self.codec != "avc1"
+
+        def release(self):
+            pass
+
+    class VideoWriter:
+        @staticmethod
+        def create_video_writer(controller):
+            return "gif_writer"
+
+    class MP4Writer(VideoWriter):
+        def __init__(self, controller):
+            self.video_writer = OpenCVWriter(controller.cfg.output_video_codec)
+
+    fake_config = types.ModuleType("animated_drawings.config")
+    fake_config.ControllerConfig = ControllerConfig  # type: ignore
+    fake_video_render_controller = types.ModuleType(
+        "animated_drawings.controller.video_render_controller"
+    )
+    fake_video_render_controller.VideoWriter = VideoWriter  # type: ignore
+    fake_video_render_controller.MP4Writer = MP4Writer  # type: ignore
+    monkeypatch.setitem(sys.modules, "animated_drawings", types.ModuleType("x"))
+    monkeypatch.setitem(sys.modules, "animated_drawings.config", fake_config)
+    monkeypatch.setitem(
+        sys.modules, "animated_drawings.controller", types.ModuleType("x")
+    )
+    monkeypatch.setitem(
+        sys.modules,
+        "animated_drawings.controller.video_render_controller",
+        fake_video_render_controller,
+    )
+
+    # when
+    install_video_format_hooks()
+    webm_controller = types.SimpleNamespace(cfg=ControllerConfig("dab.webm", "VP90"))
+    mp4_controller = types.SimpleNamespace(cfg=ControllerConfig("dab.mp4", "avc1"))
+    gif_controller = types.SimpleNamespace(cfg=ControllerConfig("dab.gif", None))
+
+    # then: H.264 인코더가 없으면 mp4v로 인코딩
+    assert VideoWriter.create_video_writer(webm_controller).video_writer.codec == "VP90"
+    assert VideoWriter.create_video_writer(mp4_controller).video_writer.codec == "mp4v"
+    assert VideoWriter.create_video_writer(gif_controller) == "gif_writer"
@@ -0,0 +1,278 @@
+from pathlib import Path
+import os
+import sys
+import time
+import types
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import numpy as np
+import pytest
+import yaml
+from render_worker_pool import RenderResult, RenderWorkerPool
+from rig_cache import (
+    ARAP_KIND,
+    MESH_KIND,
+    RIG_CACHE_DIR_ENV,
+    RigCache,
+    compute_rig_cache_key,
+    install_rig_cache_hooks,
+)
+
+
+# animated_drawings 저장소의 예제 캐릭터, motion, retarget 설정
+EXAMPLE_CHARACTER_CFG = "examples/characters/char1/char_cfg.yaml"
+EXAMPLE_MOTION_CFG = "examples/config/motion/dab.yaml"
+EXAMPLE_RETARGET_CFG = "examples/config/retarget/fair1_ppf.yaml"
+EXAMPLE_FRAME_COUNT = 10
+
+
+def write_example_mvc_cfg(base_path: Path) -> Path:
+    """animated_drawings 예제 캐릭터를 앞부분 프레임만 gif로 render 하는 설정을 씁니다."""
+    import animated_drawings  # type: ignore
+
+    repository_path = Path(animated_drawings.__file__).parents[1]
+    with open(repository_path.joinpath(EXAMPLE_MOTION_CFG).as_posix()) as f:
+        motion_cfg = yaml.safe_load(f)
+    motion_cfg["start_frame_idx"] = 0
+    motion_cfg["end_frame_idx"] = EXAMPLE_FRAME_COUNT
+    motion_cfg_path = base_path.joinpath("motion_cfg.yaml")
+    motion_cfg_path.write_text(yaml.dump(motion_cfg))
+
+    mvc_cfg_path = base_path.joinpath("mvc_cfg.yaml")
+    mvc_cfg_path.write_text(
+        yaml.dump(
+            {
+                "scene": {
+                    "ANIMATED_CHARACTERS": [
+                        {
+                            "character_cfg": repository_path.joinpath(
+                                EXAMPLE_CHARACTER_CFG
+                            ).as_posix(),
+                            "motion_cfg": motion_cfg_path.as_posix(),
+                            "retarget_cfg": repository_path.joinpath(
+                                EXAMPLE_RETARGET_CFG
+                            ).as_posix(),
+                        }
+                    ]
+                },
+                "view": {"USE_MESA": True},
+                "controller": {
+                    "MODE": "video_render",
+                    "OUTPUT_VIDEO_PATH": base_path.joinpath("video.gif").as_posix(),
+                },
+            }
+        )
+    )
+    return mvc_cfg_path
+
+
+def render_example(
+    mvc_cfg_path: Path,
+    worker_env: dict,
+) -> RenderResult:
+    """실제 render 워커(모듈 preload, hook 설치, run_render)로 새 프로세스에서 render 합니다."""
+    pool = RenderWorkerPool(
+        size=1,
+        max_jobs_per_worker=1,
+        max_rss_bytes=1024 * 1024 * 1024 * 1024,
+        worker_env=worker_env,
+    )
+    results = []
+    try:
+        pool.submit("job", mvc_cfg_path.as_posix())
+        deadline = time.time() + 300
+        while not results and time.time() < deadline:
+            pool.wait(timeout=1)
+            results = pool.reap()
+    finally:
+        pool.shutdown()
+    assert results and results[0].error is None, results
+    return results[0]
+
+
+def test_compute_rig_cache_key():
+    # given
+    mask = np.zeros((4, 4), dtype=np.uint8)
+    changed_mask = mask.copy()
+    changed_mask[1, 1] = 255
+
+    # when, then: 내용, dtype, shape가 같아야 같은 키
+    assert compute_rig_cache_key(mask) == compute_rig_cache_key(mask.copy())
+    assert compute_rig_cache_key(mask) != compute_rig_cache_key(changed_mask)
+    assert compute_rig_cache_key(mask) != compute_rig_cache_key(mask.astype(np.int32))
+    assert compute_rig_cache_key(mask) != compute_rig_cache_key(mask.reshape(2, 8))
+
+
+def test_get_or_create_stores_and_loads(tmp_path):
+    # given
+    rig_cache = RigCache(cache_dir=tmp_path, max_bytes=1024 * 1024)
+    created = []
+
+    def create():
+        created.append(1)
+        return {"vertices": np.arange(6.0).reshape(3, 2)}
+
+    # when
+    value = rig_cache.get_or_create(MESH_KIND, "key", create)
+    # 다른 워커(새 RigCache)에서도 저장한 rig를 사용
+    cached_value = RigCache(cache_dir=tmp_path, max_bytes=1024 * 1024).get_or_create(
+        MESH_KIND, "key", create
+    )
+
+    # then
+    assert len(created) == 1
+    np.testing.assert_array_equal(value["vertices"], cached_value["vertices"])
+    assert rig_cache.get_metrics()["miss_count"] == 1
+    assert rig_cache.get_metrics()["stored_count"] == 1
+
+
+def test_store_and_load_rig_values(tmp_path):
+    # given: ARAP 설정과 같이 sparse 행렬, 배열 목록, scalar가 섞인 값
+    sparse = pytest.importorskip("scipy.sparse")
+    rig_cache = RigCache(cache_dir=tmp_path, max_bytes=1024 * 1024)
+    gram = sparse.csc_matrix(np.array([[2.0, -1.0], [-1.0, 2.0]]))
+    value = {
+        "gram": gram,
+        "triangles": [np.array([0, 1, 2]), np.array([1, 2, 3])],
+        "shape": (4, 2),
+        "w": 1000,
+        "name": "arap",
+        "mesh": {"vertices": np.arange(6.0).reshape(3, 2)},
+        "solver": None,
+    }
+
+    # when
+    rig_cache.store(ARAP_KIND, "key", value)
+    loaded = rig_cache.load(ARAP_KIND, "key")
+
+    # then
+    assert loaded is not None
+    assert loaded["gram"].format == "csc"
+    np.testing.assert_array_equal(loaded["gram"].toarray(), gram.toarray())
+    np.testing.assert_array_equal(loaded["triangles"][1], value["triangles"][1])
+    assert loaded["shape"] == (4, 2)
+    assert (loaded["w"], loaded["name"], loaded["solver"]) == (1000, "arap", None)
+    np.testing.assert_array_equal(
+        loaded["mesh"]["vertices"], value["mesh"]["vertices"]
+    )
+
+
+def test_load_does_not_unpickle(tmp_path):
+    # given: 공유 workspace에 pickle이 필요한 object 배열이 들어있는 파일
+    cache_path = tmp_path.joinpath(MESH_KIND, "key.npz")
+    cache_path.parent.mkdir()
+    np.savez(
+        cache_path.as_posix(),
+        __schema__=np.frombuffer(b'{"array": "array_0"}', dtype=np.uint8),
+        array_0=np.array([object()], dtype=object),
+    )
+
+    # when, then
+    assert RigCache(cache_dir=tmp_path, max_bytes=1024 * 1024).load(
+        MESH_KIND, "key"
+    ) is None
+
+
+def test_unpicklable_rig_is_not_stored(tmp_path):
+    # given
+    rig_cache = RigCache(cache_dir=tmp_path, max_bytes=1024 * 1024)
+
+    # when
+    value = rig_cache.get_or_create(ARAP_KIND, "key", lambda: {"solve": lambda: 1})
+
+    # then: 만든 값은 그대로 사용하고 캐시에는 남기지 않음
+    assert value["solve"]() == 1
+    assert rig_cache.get_metrics()["stored_count"] == 0
+    assert not list(tmp_path.rglob("*.npz"))
+
+
+def test_evict_removes_least_recently_used(tmp_path):
+    # given
+    rig_cache = RigCache(cache_dir=tmp_path, max_bytes=2000)
+    rig_cache.store(MESH_KIND, "old", {"data": np.zeros(1000, dtype=np.uint8)})
+    old_path = tmp_path.joinpath(MESH_KIND, "old.npz")
+    old_mtime = old_path.stat().st_mtime - 60
+    os.utime(old_path.as_posix(), (old_mtime, old_mtime))
+
+    # when
+    rig_cache.store(ARAP_KIND, "new", {"data": np.ones(1000, dtype=np.uint8)})
+
+    # then
+    assert not old_path.exists()
+    assert tmp_path.joinpath(ARAP_KIND, "new.npz").exists()
+    assert rig_cache.get_metrics()["evicted_count"] == 1
+
+
+def test_rig_cache_hooks_reuse_mesh_for_joint_only_edits(tmp_path, monkeypatch):
+    # given: mask로 mesh를 만들고 mesh와 관절 위치로 ARAP을 설정하는 animated_drawings 모델
+    calls = {"mesh": 0, "arap": 0}
+
+    class ARAP:
+        def __init__(self, pins_xy, triangles, vertices, w=1000):
+            calls["arap"] += 1
+            self.pins_xy = pins_xy
+            self.system = vertices.sum() * w
+
+    class AnimatedDrawing:
+        def __init__(self, mask, joints):
+            self.mask = mask
+            self._generate_mesh()
+            self.arap = ARAP(joints, self.mesh["triangles"], self.mesh["vertices"])
+
+        def _generate_mesh(self):
+            calls["mesh"] += 1
+            vertices = np.argwhere(self.mask > 0).astype(np.float32)
+            self.mesh = {"vertices": vertices, "triangles": [np.array([0, 1, 2])]}
+
+    fake_animated_drawing = types.ModuleType("animated_drawings.model.animated_drawing")
+    fake_animated_drawing.AnimatedDrawing = AnimatedDrawing  # type: ignore
+    fake_arap = types.ModuleType("animated_drawings.model.arap")
+    fake_arap.ARAP = ARAP  # type: ignore
+    monkeypatch.setitem(sys.modules, "animated_drawings", types.ModuleType("x"))
+    monkeypatch.setitem(sys.modules, "animated_drawings.model", types.ModuleType("x"))
+    monkeypatch.setitem(
+        sys.modules, "animated_drawings.model.animated_drawing", fake_animated_drawing
+    )
+    monkeypatch.setitem(sys.modules, "animated_drawings.model.arap", fake_arap)
+    mask = np.zeros((8, 8), dtype=np.uint8)
+    mask[2:6, 2:6] = 255
+    joints = np.array([[2.0, 2.0], [5.0, 5.0]])
+    moved_joints = np.array([[2.0, 2.0], [4.0, 5.0]])
+
+    # when
+    install_rig_cache_hooks(RigCache(cache_dir=tmp_path, max_bytes=1024 * 1024))
+    first = AnimatedDrawing(mask, joints)
+    second = AnimatedDrawing(mask, joints)
+    moved = AnimatedDrawing(mask, moved_joints)
+
+    # then: 같은 캐릭터는 다시 만들지 않고, 관절만 바뀌면 ARAP만 새로 설정
+    assert calls == {"mesh": 1, "arap": 2}
+    np.testing.assert_array_equal(first.mesh["vertices"], second.mesh["vertices"])
+    assert second.arap.system == first.arap.system
+    np.testing.assert_array_equal(moved.arap.pins_xy, moved_joints)
+
+
+def test_rig_cache_hooks_with_animated_drawings(tmp_path, monkeypatch):
+    # given: 실제 animated_drawings (render 이미지에서 고정한 커밋)
+    pytest.importorskip("animated_drawings")
+    monkeypatch.delenv(RIG_CACHE_DIR_ENV, raising=False)
+    mvc_cfg_path = write_example_mvc_cfg(tmp_path)
+    video_path = tmp_path.joinpath("video.gif")
+    cache_dir = tmp_path.joinpath("rig_cache")
+    worker_env = {RIG_CACHE_DIR_ENV: cache_dir.as_posix()}
+
+    # when: 캐시 없이, 캐시를 만들면서, 캐시를 읽어서 render
+    render_example(mvc_cfg_path, worker_env={})
+    uncached_video = video_path.read_bytes()
+    render_example(mvc_cfg_path, worker_env=worker_env)
+    cache_paths = sorted(cache_dir.glob("*/*.npz"))
+    render_example(mvc_cfg_path, worker_env=worker_env)
+
+    # then: mesh와 ARAP 설정이 저장되고, 캐시를 읽은 rig로 같은 애니메이션을 render
+    assert {cache_path.parent.name for cache_path in cache_paths} == {
+        MESH_KIND,
+        ARAP_KIND,
+    }
+    assert sorted(cache_dir.glob("*/*.npz")) == cache_paths
+    assert video_path.read_bytes() == uncached_video
@@ -1,6 +1,7 @@
 import os
 
 os.environ["INTERNAL_PORT"] = "8000"
+os.environ.setdefault("AD_RENDER_WORKERS", "1")
 
 from pathlib import Path
 import sys
@@ -18,185 +19,371 @@ from ad_animated_drawings.rpc_server import (
     start_render,
 )
 from ad_animated_drawings import rpc_server
-from unittest.mock import MagicMock
-from unittest.mock import patch
-
-
-def test_render_start_active_render_processes_is_full():
-    # given
-    rpc_server.active_render_processes = {
-        f"dummy_id_{i}": MagicMock(
-            target=lambda: None,  # 테스트용 더미 함수
-            name=f"dummy_id_{i}",
-        )
+import time
+import pytest
+from render_worker_pool import RenderWorkerPool
+from render_cache import RenderCache
+from render_job_store import RenderJobState, RenderJobStore
+from render_scheduler import RenderPriority
+from test_render_cache import write_workspace
+import yaml
+
+
+def sleeping_render(mvc_cfg_file_path):
+    time.sleep(5)
+
+
+def quick_render(mvc_cfg_file_path):
+    time.sleep(0.05)
+
+
+def output_writing_render(mvc_cfg_file_path):
+    with open(mvc_cfg_file_path) as f:
+        output_path = Path(yaml.safe_load(f)["controller"]["OUTPUT_VIDEO_PATH"])
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_bytes(b"gif")
+
+
+def wait_for_finish_render(job_id):
+    deadline = time.time() + 5
+    while time.time() < deadline:
+        result = rpc_server.is_finish_render(job_id)
+        if result["type"] == RPCType.TERMINATE:  # type: ignore
+            break
+        time.sleep(0.05)
+    return result
+
+
+def set_render_worker_pool(render):
+    rpc_server.render_worker_pool = RenderWorkerPool(
+        size=rpc_server.MAX_RENDER_PROCESSES,
+        max_jobs_per_worker=10,
+        max_rss_bytes=1024 * 1024 * 1024 * 1024,
+        preload=lambda: None,
+        render=render,
+    )
+
+
+@pytest.fixture(autouse=True)
+def reset_render_state(tmp_path, monkeypatch):
+    # 상대 경로로 요청한 작업의 render 상태 파일이 임시 디렉토리에 쓰이도록 함
+    monkeypatch.chdir(tmp_path)
+    rpc_server.render_job_store = RenderJobStore(":memory:")
+    rpc_server.render_job_queue.clear()
+    rpc_server.on_running_render_job_ids.clear()
+    set_render_worker_pool(sleeping_render)
+    yield
+    with rpc_server.render_state_lock:
+        rpc_server.render_worker_pool.shutdown()
+        rpc_server.render_worker_pool = None
+        rpc_server.render_cache = None
+        rpc_server.render_cache_entries.clear()
+        rpc_server.render_status_file_paths.clear()
+        rpc_server.in_flight_render_job_ids.clear()
+        rpc_server.render_job_waiter_counts.clear()
+        rpc_server.render_job_store = None
+
+
+def fill_render_workers():
+    return [
+        rpc_server.start_render(f"dummy_path_{i}")["data"]["job_id"]
         for i in range(rpc_server.MAX_RENDER_PROCESSES)
-    }
+    ]
+
 
+def test_render_start_runs_on_idle_worker():
     # when
     result = start_render("dummy_path")
 
     # then
-    assert result["type"] == RPCType.FULL_JOB  # type: ignore
+    assert result["type"] == RPCType.RUNNING  # type: ignore
+    job_id = result["data"]["job_id"]
+    assert rpc_server.render_worker_pool.is_running(job_id)
+
+
+def test_render_start_queue_and_full_job():
+    # given
+    fill_render_workers()
+
+    # when: 모든 워커가 사용중이면 대기열에 추가
+    for i in range(rpc_server.MAX_RENDER_QUEUE_LENGTH):
+        result = start_render(f"queued_path_{i}")
+        assert result["type"] == RPCType.RUNNING  # type: ignore
+        assert result["data"]["queue_position"] == i + 1
 
+    # then: 대기열이 가득 차면 FULL_JOB
+    result = start_render("overflow_path")
+    assert result["type"] == RPCType.FULL_JOB  # type: ignore
 
-@patch("animated_drawings.render.start")
-def test_render_start_active_render_processes_is_not_alive(mock_render_start):
-    mock_render_start.return_value = None
 
+def test_start_render_with_priority_runs_first_in_queue():
     # given
-    rpc_server.active_render_processes = {
-        f"dummy_id_{i}": MagicMock(
-            target=lambda: None,  # 테스트용 더미 함수
-            name=f"dummy_id_{i}",
-            is_alive=lambda: False,
-        )
-        for i in range(rpc_server.MAX_RENDER_PROCESSES)
-    }
+    fill_render_workers()
+    start_render("queued_path")
 
     # when
-    result = rpc_server.start_render("dummy_path")
+    result = rpc_server.start_render_with_priority(
+        {"mvc_cfg_file_path": "preview_path", "priority": "high"}
+    )
+
+    # then
     assert result["type"] == RPCType.RUNNING  # type: ignore
+    assert result["data"]["queue_position"] == 1
+    assert rpc_server.render_job_queue.pop().mvc_cfg_file_path == "preview_path"
+
+
+def test_is_finish_render_reports_progress():
+    # given
+    job_id = fill_render_workers()[0]
+    queued_job_id = start_render("queued_path")["data"]["job_id"]
+
+    # when
+    running_result = rpc_server.is_finish_render(job_id)
+    queued_result = rpc_server.is_finish_render(queued_job_id)
+
+    # then
+    assert running_result["data"]["progress"]["phase"] == "starting"
+    assert queued_result["data"]["progress"] == {
+        "phase": "queued",
+        "queue_position": 1,
+    }
 
 
 def test_cancel_render_job_not_exists():
+    # when
+    result = rpc_server.cancel_render("test_job_id")
+
+    # then
+    assert result["type"] == RPCType.TERMINATE  # type: ignore
+
+
+def test_cancel_render_running_job():
     # given
-    job_id = "test_job_id"
-    rpc_server.active_render_processes = {}
+    job_id = start_render("dummy_path")["data"]["job_id"]
 
     # when
     result = rpc_server.cancel_render(job_id)
 
     # then
     assert result["type"] == RPCType.TERMINATE  # type: ignore
+    assert not rpc_server.render_worker_pool.is_running(job_id)
+    assert job_id not in rpc_server.on_running_render_job_ids
 
 
-def test_cancel_render_job_not_alive():
+def test_cancel_render_queued_job():
     # given
-    job_id = "dummy_id_1"
-    mock_process = MagicMock()
-    mock_process.is_alive.return_value = False
-    rpc_server.active_render_processes = {job_id: mock_process}
+    fill_render_workers()
+    job_id = start_render("queued_path")["data"]["job_id"]
 
     # when
     result = rpc_server.cancel_render(job_id)
 
     # then
     assert result["type"] == RPCType.TERMINATE  # type: ignore
+    assert len(rpc_server.render_job_queue) == 0
 
 
-def test_cancel_render_success():
+def test_is_finish_render_after_queued_job_runs():
     # given
-    job_id = "dummy_id_1"
-    mock_process = MagicMock()
-    mock_process.is_alive.return_value = True
-    rpc_server.active_render_processes = {job_id: mock_process}
+    set_render_worker_pool(quick_render)
+    fill_render_workers()
+    job_id = start_render("queued_path")["data"]["job_id"]
 
     # when
-    result = rpc_server.cancel_render(job_id)
+    result = wait_for_finish_render(job_id)
 
     # then
-    mock_process.terminate.assert_called_once()
-    mock_process.join.assert_called_once()
-    assert job_id not in rpc_server.active_render_processes
     assert result["type"] == RPCType.TERMINATE  # type: ignore
+    assert rpc_server.render_worker_pool.get_metrics()["idle_count"] == (
+        rpc_server.MAX_RENDER_PROCESSES
+    )
+
+
+def test_render_cache_hit_skips_render(tmp_path):
+    # given
+    set_render_worker_pool(output_writing_render)
+    rpc_server.render_cache = RenderCache(
+        cache_dir=tmp_path.joinpath("files", ".render_cache"),
+        max_bytes=1024,
+    )
+    job_id = start_render(write_workspace(tmp_path, "ad_1"))["data"]["job_id"]
+    wait_for_finish_render(job_id)
+
+    # when: 같은 캐릭터, 같은 motion을 다른 ad_id로 요청
+    result = start_render(write_workspace(tmp_path, "ad_2"))
+
+    # then
+    assert result["type"] == RPCType.RUNNING  # type: ignore
+    assert result["data"]["cached"]
+    assert tmp_path.joinpath("files/ad_2/video/dab.gif").read_bytes() == b"gif"
+    assert rpc_server.render_worker_pool.idle_count == rpc_server.MAX_RENDER_PROCESSES
+    finish_result = rpc_server.is_finish_render(result["data"]["job_id"])
+    assert finish_result["type"] == RPCType.TERMINATE  # type: ignore
 
 
-def test_start_render_real_process():
-    """
-    실제로 프로세스를 생성하여 start_render 기능을 테스트하는 통합 테스트입니다.
-    dummy_render_start 함수는 단순히 일정 시간 sleep 하도록 구현되어,
-    실제 render 작업 프로세스 생성 및 등록을 확인할 수 있습니다.
-    """
-    from ad_animated_drawings import rpc_server
-    import sys
-    import types
-    import time
+def read_render_status(file_path):
+    if not file_path.exists():
+        return None
+    with open(file_path) as f:
+        return yaml.safe_load(f)
 
-    # dummy render 모듈 생성: 실제 render.start 함수 역할을 대신함
-    dummy_render = types.ModuleType("render")
 
-    def dummy_render_start(mvc_cfg_file_path):
-        # render.start와 같이 동작: 여기서는 단순히 2초 대기
-        time.sleep(2)
+def test_render_watcher_publishes_finished_status(tmp_path):
+    # given
+    set_render_worker_pool(output_writing_render)
+    rpc_server.start_render_watcher()
+    mvc_cfg_file_path = write_workspace(tmp_path, "ad_1")
+    job_id = start_render(mvc_cfg_file_path)["data"]["job_id"]
+    status_file_path = tmp_path.joinpath(
+        "files", "ad_1", f"render_status_{job_id}.yaml"
+    )
+    assert read_render_status(status_file_path)["status"] == "RUNNING"
+
+    # when: is_finish_render를 호출하지 않아도 감시 스레드가 완료를 기록
+    deadline = time.time() + 5
+    while time.time() < deadline:
+        render_status = read_render_status(status_file_path)
+        if render_status["status"] == "FINISHED":
+            break
+        time.sleep(0.01)
+
+    # then
+    assert render_status["status"] == "FINISHED"
+    assert render_status["error"] is None
+    assert render_status["exit_code"] is None
+    assert job_id not in rpc_server.on_running_render_job_ids
+
+
+def crashing_render(mvc_cfg_file_path):
+    os._exit(3)
+
+
+def test_failed_render_is_recorded(tmp_path):
+    # given
+    set_render_worker_pool(crashing_render)
+    job_id = start_render("dummy_path")["data"]["job_id"]
+
+    # when
+    result = wait_for_finish_render(job_id)
+
+    # then: 비정상 종료는 완료와 구분되며, 상태 파일에도 실패 이유를 기록
+    assert result["data"]["state"] == RenderJobState.FAILED
+    assert result["data"]["exit_code"] == 3
+    render_status = read_render_status(tmp_path / f"render_status_{job_id}.yaml")
+    assert render_status["status"] == "FAILED"
+    assert render_status["exit_code"] == 3
+    assert "exited with code 3" in render_status["error"]
+    history = rpc_server.render_job_history({"job_id": job_id})["data"]["jobs"]
+    assert [event["state"] for event in history[0]["events"]] == [
+        "RUNNING",
+        "FAILED",
+    ]
+
+
+def test_cancel_render_is_recorded(tmp_path):
+    # given
+    job_id = start_render("dummy_path")["data"]["job_id"]
+
+    # when
+    rpc_server.cancel_render(job_id)
+
+    # then: 상태 파일을 기다리는 연결도 취소를 알 수 있음
+    jobs = rpc_server.render_job_history({"limit": 10})["data"]["jobs"]
+    assert jobs[0]["job_id"] == job_id
+    assert jobs[0]["state"] == RenderJobState.CANCELED
+    render_status = read_render_status(tmp_path / f"render_status_{job_id}.yaml")
+    assert render_status["status"] == "CANCELED"
+
+
+def test_unfinished_jobs_are_restored_after_restart(tmp_path, monkeypatch):
+    # given: 재시작 전의 작업 기록
+    db_path = (tmp_path / "render_jobs.sqlite3").as_posix()
+    store = RenderJobStore(db_path)
+    store.add_job("queued_job", "queued_path", 1, RenderJobState.QUEUED)
+    store.add_job("running_job", "running_path", 1, RenderJobState.RUNNING)
+    store.close()
+    monkeypatch.setenv(rpc_server.RENDER_JOB_DB_PATH_ENV, db_path)
+    rpc_server.render_job_store = None
+
+    # when
+    restored_store = rpc_server.get_render_job_store()
 
-    dummy_render.start = dummy_render_start
+    # then
+    assert len(rpc_server.render_job_queue) == 2
+    assert "running_job" in rpc_server.on_running_render_job_ids
+    assert restored_store.get_job("running_job")["state"] == RenderJobState.QUEUED
+    result = rpc_server.is_finish_render("queued_job")
+    assert result["type"] == RPCType.RUNNING  # type: ignore
 
-    # animated_drawings.render 모듈을 dummy_render로 설정하여 실제 프로세스 생성 시 사용되도록 함
-    sys.modules["animated_drawings.render"] = dummy_render
 
-    # 활성 렌더 프로세스 초기화
-    rpc_server.active_render_processes.clear()
+def test_same_output_requests_share_one_job(tmp_path):
+    # given
+    mvc_cfg_file_path = write_workspace(tmp_path, "ad_1")
+    job_id = start_render(mvc_cfg_file_path)["data"]["job_id"]
 
-    # when: start_render 호출 시 실제 프로세스 생성
-    result = rpc_server.start_render("real_dummy_config_path")
+    # when: 같은 애니메이션을 다시 요청
+    result = start_render(mvc_cfg_file_path)
+    other_result = start_render(write_workspace(tmp_path, "ad_2"))
+
+    # then
+    assert result["data"] == {"job_id": job_id, "coalesced": True}
+    assert other_result["data"]["job_id"] != job_id
+    assert rpc_server.render_worker_pool.is_running(job_id)
 
-    # then: 반환 결과가 RUNNING 타입이며, job_id가 active_render_processes에 추가되었는지 확인
-    assert result["type"] == rpc_server.RPCType.RUNNING
-    assert "job_id" in result["data"]
+    # 마지막으로 기다리는 요청이 취소할 때만 작업을 취소
+    rpc_server.cancel_render(job_id)
+    assert rpc_server.render_worker_pool.is_running(job_id)
+    rpc_server.cancel_render(job_id)
+    assert not rpc_server.render_worker_pool.is_running(job_id)
+    assert job_id not in rpc_server.in_flight_render_job_ids.values()
+
+
+def test_coalesced_request_raises_background_job_priority(tmp_path):
+    # given: 백그라운드(LOW)로 대기중인 작업
+    fill_render_workers()
+    mvc_cfg_file_path = write_workspace(tmp_path, "ad_1")
+    job_id = rpc_server.start_render_with_priority(
+        {"mvc_cfg_file_path": mvc_cfg_file_path, "priority": "low"}
+    )["data"]["job_id"]
+
+    # when: 사용자가 같은 애니메이션을 요청
+    result = start_render(mvc_cfg_file_path)
+
+    # then
+    assert result["data"] == {"job_id": job_id, "coalesced": True}
+    assert rpc_server.render_job_queue.pop().priority == RenderPriority.NORMAL
+
+
+def test_render_start_is_queued_when_submit_fails(monkeypatch):
+    # given: idle_count 확인 후 워커가 종료되어 submit이 실패
+    pool = rpc_server.render_worker_pool
+    pool.start()
+    monkeypatch.setattr(pool, "submit", lambda job_id, mvc_cfg_file_path: False)
+
+    # when
+    result = start_render("dummy_path")
+
+    # then: 작업을 잃지 않고 대기열에 추가한 뒤, 워커가 교체되면 실행
+    assert result["type"] == RPCType.RUNNING  # type: ignore
     job_id = result["data"]["job_id"]
-    assert job_id in rpc_server.active_render_processes
-    process = rpc_server.active_render_processes[job_id]
-    assert process.is_alive()
-
-    # 테스트 완료 후 생성된 프로세스 정리
-    process.terminate()
-    process.join()
-
-    # dummy 모듈 제거
-    del sys.modules["animated_drawings.render"]
-
-
-def test_start_render_multiple_processes():
-    """
-    실제로 여러 render 프로세스를 생성하여 최대 프로세스 제한과 초과 시의 동작을 확인하는 통합 테스트입니다.
-    MAX_RENDER_PROCESSES 개수까지는 프로세스 생성이 정상적으로 이뤄지고,
-    그 이후 추가 생성 요청 시 FULL_JOB 타입의 메시지가 반환되는지 확인합니다.
-    """
-    from ad_animated_drawings import rpc_server
-    import sys
-    import types
-    import time
-
-    # dummy render 모듈 생성: 실제 render.start 함수 역할을 대신함
-    dummy_render = types.ModuleType("render")
-
-    def dummy_render_start(mvc_cfg_file_path):
-        # render.start와 같이 동작: 여기서는 단순히 5초 대기하여 프로세스가 살아있음을 유지
-        time.sleep(5)
-
-    dummy_render.start = dummy_render_start
-
-    # animated_drawings.render 모듈을 dummy_render로 설정 (테스트 동안 사용)
-    sys.modules["animated_drawings.render"] = dummy_render
-
-    # 활성 render 프로세스 초기화
-    rpc_server.active_render_processes.clear()
-
-    running_job_ids = []
-    # 최대 개수까지 프로세스를 생성합니다.
-    for i in range(rpc_server.MAX_RENDER_PROCESSES):
-        result = rpc_server.start_render(f"dummy_config_path_{i}")
-        assert result["type"] == rpc_server.RPCType.RUNNING
-        assert "job_id" in result["data"]
-        job_id = result["data"]["job_id"]
-        running_job_ids.append(job_id)
-        assert job_id in rpc_server.active_render_processes
-        process = rpc_server.active_render_processes[job_id]
-        assert process.is_alive()
-
-    # 현재 활성화된 프로세스 수가 MAX_RENDER_PROCESSES와 동일해야 합니다.
-    assert len(rpc_server.active_render_processes) == rpc_server.MAX_RENDER_PROCESSES
-
-    # 추가로 render 프로세스 생성 요청 시, MAX_RENDER_PROCESSES 초과로 FULL_JOB 메시지가 반환되어야 함.
-    result = rpc_server.start_render("dummy_config_path_overflow")
-    assert result["type"] == rpc_server.RPCType.FULL_JOB
-
-    # 테스트 완료 후 생성된 프로세스 정리
-    for job_id in running_job_ids:
-        if job_id in rpc_server.active_render_processes:
-            process = rpc_server.active_render_processes[job_id]
-            process.terminate()
-            process.join()
-
-    # dummy 모듈 제거
-    del sys.modules["animated_drawings.render"]
+    assert result["data"]["queue_position"] == 1
+    monkeypatch.delattr(pool, "submit")
+    with rpc_server.render_state_lock:
+        rpc_server.process_queue()
+    assert pool.is_running(job_id)
+    assert len(rpc_server.render_job_queue) == 0
+
+
+def test_process_queue_requeues_job_when_submit_fails(monkeypatch):
+    # given
+    pool = rpc_server.render_worker_pool
+    pool.start()
+    rpc_server.render_job_queue.push("job_1", "dummy_path", estimated_cost=1)
+    monkeypatch.setattr(pool, "submit", lambda job_id, mvc_cfg_file_path: False)
+
+    # when
+    rpc_server.process_queue()
+
+    # then
+    assert len(rpc_server.render_job_queue) == 1
+    assert rpc_server.render_job_queue.get_position("job_1") == 1
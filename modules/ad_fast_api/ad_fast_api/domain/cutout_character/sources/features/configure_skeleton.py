@@ -1,7 +1,6 @@
 import cv2
 import numpy as np
 from cv2.typing import MatLike
-import httpx
 from typing import Optional
 from ad_fast_api.domain.cutout_character.sources.errors import (
     cutout_character_500_status as cc5s,
@@ -13,11 +12,15 @@ from pathlib import Path
 from ad_fast_api.workspace.sources.conf_workspace import CHAR_CFG_FILE_NAME
 from ad_fast_api.snippets.sources.save_dict import dict_to_file
 from fastapi import HTTPException
+from ad_fast_api.snippets.sources.ad_torchserve_client import (
+    DRAWN_HUMANOID_POSE_ESTIMATOR,
+    get_prediction_url,
+    get_torchserve_client,
+)
+from ad_fast_api.snippets.sources.ad_torchserve_batcher import get_torchserve_batcher
 
 
-GET_SKELETON_TORCHSERVE_URL = (
-    "http://ad_torchserve:8080/predictions/drawn_humanoid_pose_estimator"
-)
+GET_SKELETON_TORCHSERVE_URL = get_prediction_url(DRAWN_HUMANOID_POSE_ESTIMATOR)
 
 
 def get_cropped_image(
@@ -40,37 +43,56 @@ async def get_pose_result_async(
     url: Optional[str] = None,
 ) -> list[dict] | dict:
     img_b = cv2.imencode(".png", cropped_image)[1].tobytes()
+    return await get_pose_result_from_bytes_async(
+        img_b=img_b,
+        logger=logger,
+        url=url,
+    )
+
+
+async def get_pose_result_from_bytes_async(
+    img_b: bytes,
+    logger: Logger,
+    url: Optional[str] = None,
+) -> list[dict] | dict:
     request_data = {"data": img_b}
 
-    timeout = httpx.Timeout(25)
-    async with httpx.AsyncClient(verify=False, timeout=timeout) as client:
-        try:
-            resp = await client.post(
-                url or GET_SKELETON_TORCHSERVE_URL,
-                files=request_data,
-            )
-        except Exception as e:
-            msg = cc5s.GET_SKELETON_TORCHSERVE_ERROR.format(resp=str(e))
-            logger.critical(msg)
-            raise Exception(msg)
-
-        if resp.status_code == 503:
-            msg = cc5s.GET_SKELETON_TORCHSERVE_ERROR.format(resp=resp)
-            logger.critical(
-                f"{msg}, work load is too high, status code: {resp.status_code}"
-            )
-            raise HTTPException(
-                status_code=503,
-                detail=msg,
-            )
-
-        if resp is None or resp.status_code >= 300:
-            msg = cc5s.GET_SKELETON_TORCHSERVE_ERROR.format(resp=resp)
-            logger.critical(msg)
-            raise Exception(msg)
-
-        pose_results = json.loads(resp.content)
-        return pose_results
+    try:
+        resp = await get_torchserve_batcher().post_prediction(
+            model_name=DRAWN_HUMANOID_POSE_ESTIMATOR,
+            files=request_data,
+            url=url or GET_SKELETON_TORCHSERVE_URL,
+        )
+    except HTTPException as he:
+        # limiter가 과부하로 거절한 경우 Retry-After 헤더와 함께 그대로 전달
+        logger.critical(f"{he.detail}, status code: {he.status_code}")
+        raise he
+    except Exception as e:
+        msg = cc5s.GET_SKELETON_TORCHSERVE_ERROR.format(resp=str(e))
+        logger.critical(msg)
+        raise Exception(msg)
+
+    if resp.status_code == 503:
+        msg = cc5s.GET_SKELETON_TORCHSERVE_ERROR.format(resp=resp)
+        logger.critical(
+            f"{msg}, work load is too high, status code: {resp.status_code}"
+        )
+        retry_after_seconds = get_torchserve_client().get_retry_after_seconds(
+            DRAWN_HUMANOID_POSE_ESTIMATOR,
+        )
+        raise HTTPException(
+            status_code=503,
+            detail=msg,
+            headers={"Retry-After": str(retry_after_seconds)},
+        )
+
+    if resp is None or resp.status_code >= 300:
+        msg = cc5s.GET_SKELETON_TORCHSERVE_ERROR.format(resp=resp)
+        logger.critical(msg)
+        raise Exception(msg)
+
+    pose_results = json.loads(resp.content)
+    return pose_results
 
 
 def check_pose_results(
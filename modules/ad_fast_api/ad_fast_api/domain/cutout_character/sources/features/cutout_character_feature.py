@@ -13,10 +13,15 @@ from ad_fast_api.domain.cutout_character.sources.features.configure_skeleton imp
     save_char_cfg,
     get_cropped_image,
 )
+from ad_fast_api.domain.cutout_character.sources.features.speculative_pose import (
+    get_speculative_pose,
+)
 from ad_fast_api.domain.cutout_character.sources.cutout_character_schema import (
     CutoutCharacterResponse,
 )
 from ad_fast_api.domain.schema.sources.schemas import Joints
+from ad_fast_api.snippets.sources.save_dict import dict_to_file
+from ad_fast_api.workspace.sources.conf_workspace import CHAR_CFG_FILE_NAME
 
 
 async def save_cutout_image_async(
@@ -44,6 +49,16 @@ async def configure_skeleton_async(
     base_path: Path,
     logger: Logger,
 ) -> dict:
+    # find_character에서 미리 추정한 pose가 있으면 torchserve 요청 없이 사용
+    char_cfg_dict = await get_speculative_pose().take(base_path=base_path)
+    if char_cfg_dict is not None:
+        logger.info("Reuse speculative pose estimation result")
+        dict_to_file(
+            to_save_dict=char_cfg_dict,
+            file_path=base_path.joinpath(CHAR_CFG_FILE_NAME),
+        )
+        return char_cfg_dict
+
     cropped_image = get_cropped_image(
         base_path=base_path,
         logger=logger,
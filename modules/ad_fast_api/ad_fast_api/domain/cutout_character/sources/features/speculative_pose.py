@@ -0,0 +1,255 @@
+import asyncio
+import hashlib
+from functools import partial
+from logging import Logger
+from pathlib import Path
+from typing import Optional, Self
+import anyio.from_thread
+import numpy as np
+from ad_fast_api.domain.cutout_character.sources.features.configure_skeleton import (
+    get_pose_result_from_bytes_async,
+    check_pose_results,
+    make_skeleton,
+)
+from ad_fast_api.snippets.sources.ad_adaptive_limiter import CircuitState
+from ad_fast_api.snippets.sources.ad_env import fetch_env_from_os_or_default
+from ad_fast_api.snippets.sources.ad_torchserve_client import (
+    DRAWN_HUMANOID_POSE_ESTIMATOR,
+    get_torchserve_client,
+)
+from ad_fast_api.snippets.sources.save_dict import dict_to_file, file_to_dict
+from ad_fast_api.workspace.sources import conf_workspace as cw
+
+
+SPECULATIVE_POSE_WAIT_SECONDS_ENV = "AD_SPECULATIVE_POSE_WAIT_SECONDS"
+
+
+def hash_cropped_image_bytes(cropped_image_bytes: bytes) -> str:
+    return hashlib.sha256(cropped_image_bytes).hexdigest()
+
+
+class SpeculativePose:
+    """
+    find_character에서 잘라낸 이미지(texture.png)로 pose 추정을 미리 요청하고
+    결과를 임시 char_cfg(provisional_char_cfg.yaml)로 저장합니다.
+
+    - cutout_character는 texture.png가 그대로면 임시 char_cfg를 사용하여
+      이미지 인코딩과 torchserve 요청을 건너뜁니다.
+    - 요청이 아직 진행중이면 wait_seconds 동안 기다립니다.
+    - pose 모델 limiter가 가득 찼거나 circuit이 열려 있으면 미리 요청하지 않습니다.
+    """
+
+    wait_seconds: float
+
+    def __init__(self, wait_seconds: float):
+        self.wait_seconds = wait_seconds
+        self._tasks: dict[Path, asyncio.Task] = {}
+
+        self.started_count = 0
+        self.skipped_count = 0
+        self.stored_count = 0
+        self.failed_count = 0
+        self.hit_count = 0
+        self.miss_count = 0
+
+    @classmethod
+    def mock(cls) -> Self:
+        return cls(wait_seconds=1)
+
+    def _has_budget(self) -> bool:
+        limiter = get_torchserve_client().get_limiter(DRAWN_HUMANOID_POSE_ESTIMATOR)
+        if limiter is None:
+            return True
+        return (
+            limiter.circuit_state == CircuitState.CLOSED
+            and limiter.in_flight < int(limiter.limit)
+        )
+
+    def start(
+        self,
+        base_path: Path,
+        cropped_image_bytes: bytes,
+        height: int,
+        width: int,
+        logger: Logger,
+    ) -> bool:
+        # 이벤트 루프에서 호출
+        if not self._has_budget():
+            self.skipped_count += 1
+            return False
+
+        previous_task = self._tasks.get(base_path)
+        if previous_task is not None:
+            previous_task.cancel()
+
+        task = asyncio.create_task(
+            self._estimate_async(
+                base_path=base_path,
+                cropped_image_bytes=cropped_image_bytes,
+                height=height,
+                width=width,
+                logger=logger,
+            )
+        )
+        self._tasks[base_path] = task
+        task.add_done_callback(partial(self._remove_task, base_path))
+        self.started_count += 1
+        return True
+
+    def _remove_task(
+        self,
+        base_path: Path,
+        task: asyncio.Task,
+    ):
+        if self._tasks.get(base_path) is task:
+            del self._tasks[base_path]
+
+    async def _estimate_async(
+        self,
+        base_path: Path,
+        cropped_image_bytes: bytes,
+        height: int,
+        width: int,
+        logger: Logger,
+    ):
+        try:
+            pose_results = await get_pose_result_from_bytes_async(
+                img_b=cropped_image_bytes,
+                logger=logger,
+            )
+            kpts = check_pose_results(
+                pose_results=pose_results,
+                logger=logger,
+            )
+            skeleton = make_skeleton(kpts=kpts)
+        except Exception as e:
+            # 실패하면 cutout_character에서 다시 요청
+            self.failed_count += 1
+            logger.warning(f"Failed to estimate pose speculatively: {e}")
+            return
+
+        # hash 계산과 파일 쓰기는 이벤트 루프를 막지 않도록 스레드에서 실행
+        await asyncio.to_thread(
+            self._store_provisional_char_cfg,
+            base_path=base_path,
+            cropped_image_bytes=cropped_image_bytes,
+            char_cfg={
+                "skeleton": skeleton,
+                "height": height,
+                "width": width,
+            },
+        )
+        self.stored_count += 1
+
+    @staticmethod
+    def _store_provisional_char_cfg(
+        base_path: Path,
+        cropped_image_bytes: bytes,
+        char_cfg: dict,
+    ):
+        dict_to_file(
+            to_save_dict={
+                "cropped_image_hash": hash_cropped_image_bytes(cropped_image_bytes),
+                "char_cfg": char_cfg,
+            },
+            file_path=base_path.joinpath(cw.PROVISIONAL_CHAR_CFG_FILE_NAME),
+        )
+
+    @staticmethod
+    def _load_provisional_char_cfg(base_path: Path) -> Optional[dict]:
+        provisional_char_cfg_path = base_path / cw.PROVISIONAL_CHAR_CFG_FILE_NAME
+        cropped_image_path = base_path / cw.CROPPED_IMAGE_NAME
+        if not provisional_char_cfg_path.exists() or not cropped_image_path.exists():
+            return None
+
+        # find_character가 다른 bbox로 다시 호출되었으면 사용하지 않음
+        provisional_char_cfg = file_to_dict(provisional_char_cfg_path)
+        cropped_image_hash = hash_cropped_image_bytes(cropped_image_path.read_bytes())
+        if provisional_char_cfg.get("cropped_image_hash") != cropped_image_hash:
+            return None
+        return provisional_char_cfg["char_cfg"]
+
+    async def take(
+        self,
+        base_path: Path,
+    ) -> Optional[dict]:
+        task = self._tasks.get(base_path)
+        if task is not None:
+            try:
+                await asyncio.wait_for(asyncio.shield(task), self.wait_seconds)
+            except asyncio.TimeoutError:
+                pass
+            except asyncio.CancelledError:
+                # 추정 요청이 취소된 경우만 넘어가고, 호출한 요청의 취소는 그대로 전달
+                current_task = asyncio.current_task()
+                if not task.cancelled() or (
+                    current_task is not None and current_task.cancelling()
+                ):
+                    raise
+
+        # 파일 읽기와 hash 계산은 이벤트 루프를 막지 않도록 스레드에서 실행
+        char_cfg = await asyncio.to_thread(self._load_provisional_char_cfg, base_path)
+        if char_cfg is None:
+            self.miss_count += 1
+            return None
+
+        self.hit_count += 1
+        return char_cfg
+
+    def get_metrics(self) -> dict:
+        taken_count = self.hit_count + self.miss_count
+        return {
+            "running": len(self._tasks),
+            "started_count": self.started_count,
+            "skipped_count": self.skipped_count,
+            "stored_count": self.stored_count,
+            "failed_count": self.failed_count,
+            "hit_count": self.hit_count,
+            "miss_count": self.miss_count,
+            "hit_rate": self.hit_count / taken_count if taken_count else 0.0,
+        }
+
+
+# lazy init
+_speculative_pose = None
+
+
+def create_speculative_pose_instance() -> SpeculativePose:
+    return SpeculativePose(
+        wait_seconds=float(
+            fetch_env_from_os_or_default(
+                SPECULATIVE_POSE_WAIT_SECONDS_ENV,
+                "10",
+            )
+        ),
+    )
+
+
+def get_speculative_pose() -> SpeculativePose:
+    global _speculative_pose
+    if _speculative_pose is None:
+        _speculative_pose = create_speculative_pose_instance()
+    return _speculative_pose
+
+
+def start_speculative_pose_from_thread(
+    base_path: Path,
+    cropped_image: np.ndarray,
+    logger: Logger,
+) -> bool:
+    # find_character는 threadpool에서 실행되므로 이벤트 루프에 pose 요청을 생성
+    try:
+        cropped_image_bytes = base_path.joinpath(cw.CROPPED_IMAGE_NAME).read_bytes()
+        return anyio.from_thread.run_sync(
+            partial(
+                get_speculative_pose().start,
+                base_path=base_path,
+                cropped_image_bytes=cropped_image_bytes,
+                height=cropped_image.shape[0],
+                width=cropped_image.shape[1],
+                logger=logger,
+            )
+        )
+    except (OSError, RuntimeError):
+        # 이벤트 루프 밖(case 스크립트 등)에서는 미리 요청하지 않음
+        return False
@@ -2,6 +2,7 @@ import cv2
 import numpy as np
 import pytest
 from io import BytesIO
+from unittest.mock import patch, AsyncMock, Mock
 from fastapi import UploadFile
 from ad_fast_api.domain.cutout_character.sources.features import (
     cutout_character_feature as ccf,
@@ -128,3 +129,35 @@ async def test_configure_skeleton_async(monkeypatch, mock_logger, tmp_path):
     assert call_args.get("skeleton") == expected_skeleton
     assert call_args.get("cropped_image") == dummy_cropped_image
     assert call_args.get("base_path") == base_path
+
+
+@pytest.mark.asyncio
+async def test_configure_skeleton_async_reuses_speculative_pose(
+    mock_logger,
+    tmp_path,
+):
+    # given
+    char_cfg_dict = {"skeleton": [], "height": 30, "width": 20}
+    speculative_pose = Mock()
+    speculative_pose.take = AsyncMock(return_value=char_cfg_dict)
+
+    # when
+    with patch.object(
+        ccf,
+        "get_speculative_pose",
+        new=Mock(return_value=speculative_pose),
+    ), patch.object(
+        ccf,
+        "get_pose_result_async",
+        new=AsyncMock(),
+    ) as mock_get_pose_result:
+        result = await ccf.configure_skeleton_async(
+            base_path=tmp_path,
+            logger=mock_logger,
+        )
+
+    # then: torchserve 요청 없이 char_cfg 저장
+    assert result == char_cfg_dict
+    assert tmp_path.joinpath(cw.CHAR_CFG_FILE_NAME).exists()
+    speculative_pose.take.assert_awaited_once_with(base_path=tmp_path)
+    mock_get_pose_result.assert_not_awaited()
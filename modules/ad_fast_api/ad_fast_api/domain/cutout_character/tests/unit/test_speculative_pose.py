@@ -0,0 +1,266 @@
+import asyncio
+import anyio.to_thread
+import numpy as np
+import pytest
+from unittest.mock import patch, AsyncMock, Mock
+from ad_fast_api.domain.cutout_character.sources.features import (
+    speculative_pose as sp,
+)
+from ad_fast_api.snippets.sources.ad_adaptive_limiter import ADAdaptiveLimiter
+from ad_fast_api.snippets.sources.ad_torchserve_client import ADTorchServeClient
+from ad_fast_api.workspace.sources import conf_workspace as cw
+from ad_fast_api.snippets.testings.mock_logger import mock_logger
+
+
+POSE_RESULTS = [{"keypoints": [[float(i), float(i), 0.9] for i in range(17)]}]
+CROPPED_IMAGE_BYTES = b"cropped image"
+
+
+def write_cropped_image(base_path, cropped_image_bytes=CROPPED_IMAGE_BYTES):
+    base_path.joinpath(cw.CROPPED_IMAGE_NAME).write_bytes(cropped_image_bytes)
+
+
+async def start_and_wait(speculative_pose, base_path, logger):
+    is_started = speculative_pose.start(
+        base_path=base_path,
+        cropped_image_bytes=CROPPED_IMAGE_BYTES,
+        height=30,
+        width=20,
+        logger=logger,
+    )
+    task = speculative_pose._tasks.get(base_path)
+    if task is not None:
+        await task
+    return is_started
+
+
+@pytest.mark.asyncio
+async def test_take_hit(tmp_path, mock_logger):
+    # given
+    speculative_pose = sp.SpeculativePose.mock()
+    write_cropped_image(tmp_path)
+
+    # when
+    with patch.object(
+        sp,
+        "get_pose_result_from_bytes_async",
+        new=AsyncMock(return_value=POSE_RESULTS),
+    ) as mock_get_pose_result, patch.object(
+        sp,
+        "get_torchserve_client",
+        new=Mock(return_value=ADTorchServeClient.mock()),
+    ):
+        assert await start_and_wait(speculative_pose, tmp_path, mock_logger)
+    char_cfg = await speculative_pose.take(base_path=tmp_path)
+
+    # then
+    mock_get_pose_result.assert_awaited_once_with(
+        img_b=CROPPED_IMAGE_BYTES,
+        logger=mock_logger,
+    )
+    assert char_cfg["height"] == 30
+    assert char_cfg["width"] == 20
+    assert len(char_cfg["skeleton"]) == 16
+    assert speculative_pose.get_metrics()["hit_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_store_and_take_off_event_loop(tmp_path, mock_logger):
+    # given
+    speculative_pose = sp.SpeculativePose.mock()
+    write_cropped_image(tmp_path)
+    event_loop_thread_calls = []
+
+    def record_event_loop_thread(func):
+        def wrapper(*args, **kwargs):
+            try:
+                asyncio.get_running_loop()
+                event_loop_thread_calls.append(func.__name__)
+            except RuntimeError:
+                pass
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    # when
+    with patch.object(
+        sp,
+        "get_pose_result_from_bytes_async",
+        new=AsyncMock(return_value=POSE_RESULTS),
+    ), patch.object(
+        sp,
+        "get_torchserve_client",
+        new=Mock(return_value=ADTorchServeClient.mock()),
+    ), patch.object(
+        sp, "dict_to_file", new=record_event_loop_thread(sp.dict_to_file)
+    ), patch.object(
+        sp, "file_to_dict", new=record_event_loop_thread(sp.file_to_dict)
+    ), patch.object(
+        sp,
+        "hash_cropped_image_bytes",
+        new=record_event_loop_thread(sp.hash_cropped_image_bytes),
+    ):
+        assert await start_and_wait(speculative_pose, tmp_path, mock_logger)
+        char_cfg = await speculative_pose.take(base_path=tmp_path)
+
+    # then: 파일 읽기, 쓰기와 hash 계산은 이벤트 루프가 아닌 스레드에서 실행
+    assert char_cfg is not None
+    assert event_loop_thread_calls == []
+
+
+@pytest.mark.asyncio
+async def test_take_miss_when_cropped_image_changed(tmp_path, mock_logger):
+    # given
+    speculative_pose = sp.SpeculativePose.mock()
+    write_cropped_image(tmp_path)
+    with patch.object(
+        sp,
+        "get_pose_result_from_bytes_async",
+        new=AsyncMock(return_value=POSE_RESULTS),
+    ), patch.object(
+        sp,
+        "get_torchserve_client",
+        new=Mock(return_value=ADTorchServeClient.mock()),
+    ):
+        await start_and_wait(speculative_pose, tmp_path, mock_logger)
+
+    # when: 다른 bbox로 find_character가 다시 호출됨
+    write_cropped_image(tmp_path, b"other cropped image")
+    char_cfg = await speculative_pose.take(base_path=tmp_path)
+
+    # then
+    assert char_cfg is None
+    assert speculative_pose.get_metrics()["miss_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_take_miss_when_estimate_cancelled(tmp_path):
+    # given: 진행중인 추정 요청이 취소됨 (find_character 재호출 등)
+    speculative_pose = sp.SpeculativePose.mock()
+    task = asyncio.create_task(asyncio.sleep(10))
+    speculative_pose._tasks[tmp_path] = task
+    asyncio.get_running_loop().call_soon(task.cancel)
+
+    # when
+    char_cfg = await speculative_pose.take(base_path=tmp_path)
+
+    # then
+    assert char_cfg is None
+    assert speculative_pose.get_metrics()["miss_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_take_propagates_caller_cancellation(tmp_path):
+    # given: 추정 요청을 기다리는 중
+    speculative_pose = sp.SpeculativePose.mock()
+    estimate_task = asyncio.create_task(asyncio.sleep(10))
+    speculative_pose._tasks[tmp_path] = estimate_task
+    take_task = asyncio.create_task(speculative_pose.take(base_path=tmp_path))
+    await asyncio.sleep(0)
+
+    # when: 호출한 요청이 취소됨 (클라이언트 연결 종료 등)
+    take_task.cancel()
+
+    # then: 취소가 전달되고 추정 요청은 계속 진행
+    with pytest.raises(asyncio.CancelledError):
+        await take_task
+    assert not estimate_task.done()
+    estimate_task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_start_skipped_when_circuit_open(tmp_path, mock_logger):
+    # given
+    speculative_pose = sp.SpeculativePose.mock()
+    torchserve_client = ADTorchServeClient.mock()
+    limiter = ADAdaptiveLimiter.mock()
+    limiter.circuit_state = sp.CircuitState.OPEN
+    torchserve_client.create_limiter = lambda model_name: limiter
+
+    # when
+    with patch.object(
+        sp,
+        "get_torchserve_client",
+        new=Mock(return_value=torchserve_client),
+    ):
+        is_started = await start_and_wait(speculative_pose, tmp_path, mock_logger)
+
+    # then
+    assert not is_started
+    assert speculative_pose.get_metrics()["skipped_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_estimate_failure_not_stored(tmp_path, mock_logger):
+    # given
+    speculative_pose = sp.SpeculativePose.mock()
+    write_cropped_image(tmp_path)
+
+    # when
+    with patch.object(
+        sp,
+        "get_pose_result_from_bytes_async",
+        new=AsyncMock(return_value=[]),
+    ), patch.object(
+        sp,
+        "get_torchserve_client",
+        new=Mock(return_value=ADTorchServeClient.mock()),
+    ):
+        await start_and_wait(speculative_pose, tmp_path, mock_logger)
+
+    # then
+    assert not tmp_path.joinpath(cw.PROVISIONAL_CHAR_CFG_FILE_NAME).exists()
+    assert await speculative_pose.take(base_path=tmp_path) is None
+    assert speculative_pose.get_metrics()["failed_count"] == 1
+    mock_logger.warning.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_start_speculative_pose_from_thread(tmp_path, mock_logger):
+    # given
+    speculative_pose = sp.SpeculativePose.mock()
+    write_cropped_image(tmp_path)
+    cropped_image = np.zeros((30, 20, 3), dtype=np.uint8)
+
+    with patch.object(
+        sp,
+        "get_speculative_pose",
+        new=Mock(return_value=speculative_pose),
+    ), patch.object(
+        sp,
+        "get_pose_result_from_bytes_async",
+        new=AsyncMock(return_value=POSE_RESULTS),
+    ), patch.object(
+        sp,
+        "get_torchserve_client",
+        new=Mock(return_value=ADTorchServeClient.mock()),
+    ):
+        # when: find_character 처럼 threadpool에서 호출
+        is_started = await anyio.to_thread.run_sync(
+            lambda: sp.start_speculative_pose_from_thread(
+                base_path=tmp_path,
+                cropped_image=cropped_image,
+                logger=mock_logger,
+            )
+        )
+        char_cfg = await speculative_pose.take(base_path=tmp_path)
+
+    # then
+    assert is_started
+    assert char_cfg["height"] == 30
+    assert char_cfg["width"] == 20
+
+
+def test_start_speculative_pose_outside_event_loop(tmp_path, mock_logger):
+    # given
+    write_cropped_image(tmp_path)
+
+    # when
+    is_started = sp.start_speculative_pose_from_thread(
+        base_path=tmp_path,
+        cropped_image=np.zeros((30, 20, 3), dtype=np.uint8),
+        logger=mock_logger,
+    )
+
+    # then
+    assert not is_started
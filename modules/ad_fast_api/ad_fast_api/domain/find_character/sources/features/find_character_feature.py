@@ -3,7 +3,7 @@ from pathlib import Path
 from ad_fast_api.domain.schema.sources.schemas import BoundingBox
 from ad_fast_api.workspace.sources import conf_workspace as cw
 import numpy as np
-from logging import Logger
+from logging import Logger, getLogger
 from ad_fast_api.domain.find_character.sources.features.segment_character import (
     segment_character,
 )
@@ -13,8 +13,13 @@ from ad_fast_api.domain.find_character.sources.features.crop_image import (
 from ad_fast_api.domain.find_character.sources.features.remove_background import (
     remove_background,
 )
-from typing import Optional
+from typing import Optional, Tuple
 from ad_fast_api.snippets.sources.save_dict import dict_to_file
+from ad_fast_api.snippets.sources.save_image import encode_image, save_image
+from ad_fast_api.snippets.sources.ad_process_pool import run_image_task
+from ad_fast_api.domain.cutout_character.sources.features.speculative_pose import (
+    start_speculative_pose_from_thread,
+)
 
 
 def save_bounding_box(
@@ -40,11 +45,28 @@ def cv2_save_image(
     cv2.imwrite(image_path.as_posix(), image)
 
 
+# image process pool 워커에서 실행되므로 전달받은 이미지를 참조하지 않는 bytes를 반환
+# 요청의 logger는 워커에 전달하지 않으며, 에러는 호출한 프로세스에서 요청의 로그에 남김
+def segment_and_remove_background(cropped_image: np.ndarray) -> Tuple[bytes, bytes]:
+    mask_image = segment_character(
+        img=cropped_image,
+        logger=getLogger(__name__),
+    )
+
+    removed_bg_image = remove_background(
+        cropped_image=cropped_image,
+        mask_image=mask_image,
+    )
+
+    return encode_image(mask_image), encode_image(removed_bg_image)
+
+
 def crop_and_segment_character(
     ad_id: str,
     bounding_box: BoundingBox,
     logger: Logger,
     base_path: Optional[Path] = None,
+    segmentation_result: Optional[Tuple[bytes, bytes]] = None,
 ):
     base_path = base_path or cw.get_base_path(ad_id=ad_id)
 
@@ -59,24 +81,34 @@ def crop_and_segment_character(
         base_path=base_path,
     )
 
-    mask_image = segment_character(
-        img=cropped_image,
+    # cutout_character에서 사용할 pose 추정을 세그멘테이션과 동시에 요청
+    start_speculative_pose_from_thread(
+        base_path=base_path,
+        cropped_image=cropped_image,
         logger=logger,
     )
 
-    cv2_save_image(
-        image=mask_image,
+    # 세그멘테이션, 배경 제거, 인코딩은 image process pool에서 실행
+    # (upload_drawing 후 미리 계산된 결과가 있으면 그대로 사용)
+    if segmentation_result is None:
+        try:
+            segmentation_result = run_image_task(
+                segment_and_remove_background,
+                cropped_image,
+            )
+        except Exception as e:
+            logger.critical(str(e))
+            raise
+    mask_image_bytes, removed_bg_image_bytes = segmentation_result
+
+    save_image(
+        image_bytes=mask_image_bytes,
         image_name=cw.MASK_IMAGE_NAME,
         base_path=base_path,
     )
 
-    removed_bg_image = remove_background(
-        cropped_image=cropped_image,
-        mask_image=mask_image,
-    )
-
-    cv2_save_image(
-        image=removed_bg_image,
+    save_image(
+        image_bytes=removed_bg_image_bytes,
         image_name=cw.CUTOUT_CHARACTER_IMAGE_NAME,
         base_path=base_path,
     )
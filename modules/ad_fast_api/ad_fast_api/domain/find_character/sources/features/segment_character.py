@@ -1,5 +1,6 @@
 import cv2
 import numpy as np
+from enum import Enum
 from skimage import measure
 from logging import Logger
 from scipy import ndimage
@@ -8,6 +9,18 @@ from ad_fast_api.domain.find_character.sources.errors import (
 )
 
 
+# skimage.measure.find_contours 기반 경로와 동일한 결과를 내기 위해 4방향 연결을 사용
+# (8방향 연결 시 대각선으로만 맞닿은 영역까지 하나로 합쳐져 결과가 달라짐)
+LARGEST_REGION_CONNECTIVITY = 4
+
+
+class BackgroundRemovalMode(str, Enum):
+    # 가장자리 10픽셀 간격 시드에서 floodFill 반복 (기존 방식)
+    STRIDED_FLOODFILL = "strided_floodfill"
+    # 가장자리에 닿은 모든 배경 영역을 한 번에 제거
+    BORDER_CONNECTED = "border_connected"
+
+
 def apply_threshold(img: np.ndarray) -> np.ndarray:
     """
     이미지의 각 픽셀에 대해 RGB 채널의 최솟값을 취해 그레이스케일 이미지로 변환한 후,
@@ -118,6 +131,47 @@ def apply_floodfill(processed_img: np.ndarray) -> np.ndarray:
     return im_floodfill
 
 
+def apply_border_background_removal(processed_img: np.ndarray) -> np.ndarray:
+    """
+    이미지 가장자리에 닿아 있는 모든 배경 영역을 한 번의 floodFill로 제거합니다.
+    이미지 바깥에 1픽셀 두께의 배경 테두리를 덧대면 가장자리에 닿은 배경 영역이
+    모두 이 테두리와 연결되므로, 테두리의 한 점에서 시작하는 floodFill 한 번으로
+    apply_floodfill과 같은 결과를 얻습니다.
+    시드 사이에 끼어 apply_floodfill이 놓치던 배경 영역도 함께 제거됩니다.
+    """
+    h, w = processed_img.shape[:2]
+
+    # 테두리를 덧댄 이미지보다 2픽셀 큰 마스크, 객체(255) 픽셀은 채우기를 막음
+    flood_mask = np.zeros([h + 4, w + 4], np.uint8)
+    flood_mask[2:-2, 2:-2] = processed_img
+
+    # 테두리를 덧댄 floodfill 결과 이미지. 처음에는 모두 흰색(255)로 초기화
+    padded_floodfill = np.full([h + 2, w + 2], 255, np.uint8)
+    cv2.floodFill(padded_floodfill, flood_mask, (0, 0), (0,))
+
+    im_floodfill = padded_floodfill[1:-1, 1:-1]
+
+    # apply_floodfill과 동일하게 가장자리 전체를 배경으로 처리
+    im_floodfill[0, :] = 0
+    im_floodfill[-1, :] = 0
+    im_floodfill[:, 0] = 0
+    im_floodfill[:, -1] = 0
+
+    return im_floodfill
+
+
+def remove_border_background(
+    processed_img: np.ndarray,
+    mode: BackgroundRemovalMode = BackgroundRemovalMode.BORDER_CONNECTED,
+) -> np.ndarray:
+    if mode == BackgroundRemovalMode.STRIDED_FLOODFILL:
+        return apply_floodfill(processed_img)
+    elif mode == BackgroundRemovalMode.BORDER_CONNECTED:
+        return apply_border_background_removal(processed_img)
+    else:
+        raise ValueError(f"Invalid background removal mode: {mode}")
+
+
 def extract_largest_contour(im_floodfill: np.ndarray, logger: Logger) -> np.ndarray:
     """
     플러드 필 결과에서 컨투어를 추출하여 가장 큰 컨투어만 남깁니다.
@@ -156,9 +210,42 @@ def extract_largest_contour(im_floodfill: np.ndarray, logger: Logger) -> np.ndar
     return final_mask.T
 
 
+def extract_largest_region(im_floodfill: np.ndarray, logger: Logger) -> np.ndarray:
+    """
+    플러드 필 결과에서 연결 요소 레이블링을 한 번만 수행하여 가장 큰 영역만 남깁니다.
+    extract_largest_contour와 동일한 마스크를 생성하지만,
+    컨투어마다 전체 크기 마스크를 만들어 fillPoly 하는 대신
+    레이블별 면적 통계로 최대 영역을 고르고 홀 채우기는 한 번만 수행합니다.
+    """
+    # floodFill 결과에서 배경이 아닌 영역(255)을 객체 후보로 사용
+    foreground = (im_floodfill == 255).astype(np.uint8)
+
+    # 한 번의 레이블링으로 레이블 이미지와 레이블별 면적을 함께 구함 (0번 레이블은 배경)
+    num_labels, labels, stats, _ = cv2.connectedComponentsWithStats(
+        foreground,
+        connectivity=LARGEST_REGION_CONNECTIVITY,
+    )
+
+    if num_labels <= 1:
+        msg = fcs.FOUND_NO_CONTOURS_WITHIN_IMAGE
+        logger.critical(msg)
+        raise Exception(msg)
+
+    largest_label = 1 + int(np.argmax(stats[1:, cv2.CC_STAT_AREA]))
+
+    # 내부 홀 채우기: 최대 영역에 대해서만 한 번 수행
+    filled_mask = ndimage.binary_fill_holes(labels == largest_label)
+
+    # 최종 마스크를 0~255 범위의 uint8 이미지로 변환
+    final_mask = 255 * filled_mask.astype(np.uint8)  # type: ignore
+
+    return final_mask
+
+
 def segment_character(
     img: np.ndarray,
     logger: Logger,
+    background_removal_mode: BackgroundRemovalMode = BackgroundRemovalMode.BORDER_CONNECTED,
 ):
     """
     입력 이미지로부터 문자(객체)를 추출하여 이진 마스크 형태로 반환합니다.
@@ -166,8 +253,8 @@ def segment_character(
     전체 처리 과정:
       1. 임계값 처리 (적응형 이진화 + 반전)
       2. 형태학적 변환 (closing, dilation)
-      3. 플러드 필을 통한 배경 제거
-      4. 최대 컨투어 추출 및 내부 홀 채우기
+      3. 플러드 필을 통한 배경 제거 (background_removal_mode로 방식 선택)
+      4. 최대 영역 추출 및 내부 홀 채우기
     """
     # 1. 임계값 처리
     binary_img = apply_threshold(img)
@@ -176,9 +263,12 @@ def segment_character(
     morph_img = apply_morphology(binary_img)
 
     # 3. 플러드 필을 통한 배경 제거
-    floodfill_img = apply_floodfill(morph_img)
+    floodfill_img = remove_border_background(
+        processed_img=morph_img,
+        mode=background_removal_mode,
+    )
 
-    # 4. 최대 컨투어 추출 및 내부 홀 채우기
-    final_mask = extract_largest_contour(floodfill_img, logger)
+    # 4. 최대 영역 추출 및 내부 홀 채우기
+    final_mask = extract_largest_region(floodfill_img, logger)
 
     return final_mask
@@ -0,0 +1,228 @@
+import threading
+from collections import OrderedDict
+from logging import Logger
+from typing import Optional, Self, Tuple
+from ad_fast_api.domain.schema.sources.schemas import BoundingBox
+from ad_fast_api.domain.find_character.sources.features.crop_image import crop_image
+from ad_fast_api.domain.find_character.sources.features.find_character_feature import (
+    segment_and_remove_background,
+)
+from ad_fast_api.snippets.sources.ad_env import fetch_env_from_os_or_default
+from ad_fast_api.snippets.sources.ad_logger import setup_logger
+from ad_fast_api.snippets.sources.ad_process_pool import (
+    get_image_process_pool,
+    run_image_task,
+)
+from ad_fast_api.workspace.sources import conf_workspace as cw
+
+
+SPECULATIVE_SEGMENTATION_MAX_CONCURRENCY_ENV = (
+    "AD_SPECULATIVE_SEGMENTATION_MAX_CONCURRENCY"
+)
+SPECULATIVE_SEGMENTATION_MAX_ENTRIES_ENV = "AD_SPECULATIVE_SEGMENTATION_MAX_ENTRIES"
+SPECULATIVE_SEGMENTATION_WAIT_SECONDS_ENV = "AD_SPECULATIVE_SEGMENTATION_WAIT_SECONDS"
+
+
+def make_bounding_box_key(bounding_box: BoundingBox) -> tuple:
+    return (
+        bounding_box.left,
+        bounding_box.top,
+        bounding_box.right,
+        bounding_box.bottom,
+    )
+
+
+class SpeculativeEntry:
+    def __init__(self, bounding_box_key: tuple):
+        self.bounding_box_key = bounding_box_key
+        self.done_event = threading.Event()
+        self.result: Optional[Tuple[bytes, bytes]] = None
+
+
+class SpeculativeSegmentation:
+    """
+    upload_drawing 응답 후, 검출된 bbox 그대로 find_character가 호출될 것으로 보고
+    세그멘테이션(mask, cutout 이미지)을 미리 계산해 메모리에 보관합니다.
+
+    - 같은 bbox로 find_character가 호출되면 미리 계산한 결과를 사용합니다.
+      아직 계산중이면 wait_seconds 동안 기다립니다.
+    - 다른 bbox로 호출되면 미리 계산한 결과는 버립니다.
+      (이미 워커에서 실행중인 작업은 취소할 수 없으므로 결과만 무시)
+    - 실제 요청을 방해하지 않도록 동시에 max_concurrency 개까지만 계산하고,
+      image process pool에 쉬는 워커가 없으면 계산하지 않습니다.
+    - 사용되지 않은 결과는 max_entries 개를 넘으면 오래된 것부터 버립니다.
+    """
+
+    max_concurrency: int
+    max_entries: int
+    wait_seconds: float
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        max_entries: int,
+        wait_seconds: float,
+    ):
+        self.max_concurrency = max_concurrency
+        self.max_entries = max_entries
+        self.wait_seconds = wait_seconds
+        self.running = 0
+        self._entries: OrderedDict[str, SpeculativeEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.scheduled_count = 0
+        self.skipped_count = 0
+        self.hit_count = 0
+        self.miss_count = 0
+        self.bbox_changed_count = 0
+        self.failed_count = 0
+        self.wasted_count = 0
+
+    @classmethod
+    def mock(cls) -> Self:
+        return cls(
+            max_concurrency=1,
+            max_entries=2,
+            wait_seconds=1,
+        )
+
+    def _has_budget(self) -> bool:
+        if self.running >= self.max_concurrency:
+            return False
+        image_process_pool = get_image_process_pool()
+        return image_process_pool.pending < image_process_pool.max_workers
+
+    def _reserve(
+        self,
+        ad_id: str,
+        bounding_box: BoundingBox,
+    ) -> Optional[SpeculativeEntry]:
+        with self._lock:
+            if not self._has_budget():
+                self.skipped_count += 1
+                return None
+
+            self.running += 1
+            self.scheduled_count += 1
+            entry = SpeculativeEntry(make_bounding_box_key(bounding_box))
+            self._entries[ad_id] = entry
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.wasted_count += 1
+            return entry
+
+    def run(
+        self,
+        ad_id: str,
+        bounding_box: BoundingBox,
+        logger: Logger,
+    ) -> bool:
+        entry = self._reserve(ad_id=ad_id, bounding_box=bounding_box)
+        if entry is None:
+            return False
+
+        try:
+            cropped_image = crop_image(
+                base_path=cw.get_base_path(ad_id=ad_id),
+                bounding_box=bounding_box,
+            )
+            entry.result = run_image_task(
+                segment_and_remove_background,
+                cropped_image,
+            )
+        except Exception as e:
+            # 미리 계산하지 못하면 find_character에서 다시 계산
+            logger.warning(f"Failed to segment character speculatively: {e}")
+        finally:
+            with self._lock:
+                self.running -= 1
+            entry.done_event.set()
+        return entry.result is not None
+
+    def take(
+        self,
+        ad_id: str,
+        bounding_box: BoundingBox,
+    ) -> Optional[Tuple[bytes, bytes]]:
+        with self._lock:
+            entry = self._entries.pop(ad_id, None)
+            if entry is None:
+                self.miss_count += 1
+                return None
+            if entry.bounding_box_key != make_bounding_box_key(bounding_box):
+                self.miss_count += 1
+                self.bbox_changed_count += 1
+                self.wasted_count += 1
+                return None
+
+        entry.done_event.wait(self.wait_seconds)
+        with self._lock:
+            if entry.result is None:
+                self.miss_count += 1
+                self.failed_count += 1
+                return None
+            self.hit_count += 1
+            return entry.result
+
+    def get_metrics(self) -> dict:
+        taken_count = self.hit_count + self.miss_count
+        return {
+            "running": self.running,
+            "stored_count": len(self._entries),
+            "scheduled_count": self.scheduled_count,
+            "skipped_count": self.skipped_count,
+            "hit_count": self.hit_count,
+            "miss_count": self.miss_count,
+            "bbox_changed_count": self.bbox_changed_count,
+            "failed_count": self.failed_count,
+            "wasted_count": self.wasted_count,
+            "hit_rate": self.hit_count / taken_count if taken_count else 0.0,
+        }
+
+
+# lazy init
+_speculative_segmentation = None
+
+
+def create_speculative_segmentation_instance() -> SpeculativeSegmentation:
+    return SpeculativeSegmentation(
+        max_concurrency=int(
+            fetch_env_from_os_or_default(
+                SPECULATIVE_SEGMENTATION_MAX_CONCURRENCY_ENV,
+                "1",
+            )
+        ),
+        max_entries=int(
+            fetch_env_from_os_or_default(
+                SPECULATIVE_SEGMENTATION_MAX_ENTRIES_ENV,
+                "64",
+            )
+        ),
+        wait_seconds=float(
+            fetch_env_from_os_or_default(
+                SPECULATIVE_SEGMENTATION_WAIT_SECONDS_ENV,
+                "10",
+            )
+        ),
+    )
+
+
+def get_speculative_segmentation() -> SpeculativeSegmentation:
+    global _speculative_segmentation
+    if _speculative_segmentation is None:
+        _speculative_segmentation = create_speculative_segmentation_instance()
+    return _speculative_segmentation
+
+
+def segment_character_speculatively(
+    ad_id: str,
+    bounding_box: BoundingBox,
+):
+    # upload_drawing 응답 후 BackgroundTasks에서 실행
+    logger = setup_logger(ad_id=ad_id)
+    get_speculative_segmentation().run(
+        ad_id=ad_id,
+        bounding_box=bounding_box,
+        logger=logger,
+    )
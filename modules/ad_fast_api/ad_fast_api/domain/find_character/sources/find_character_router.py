@@ -5,6 +5,9 @@ from ad_fast_api.domain.find_character.sources.features.find_character_feature i
     crop_and_segment_character,
     save_bounding_box,
 )
+from ad_fast_api.domain.find_character.sources.features.speculative_segmentation import (
+    get_speculative_segmentation,
+)
 from ad_fast_api.workspace.sources import conf_workspace as cw
 from ad_fast_api.snippets.sources.ad_logger import setup_logger
 from ad_fast_api.snippets.sources.ad_http_exception import handle_operation
@@ -36,12 +39,18 @@ def find_character(
     )
 
     logger = setup_logger(ad_id=ad_id)
+    # upload_drawing 후 같은 bbox로 미리 계산된 결과가 있으면 사용
+    segmentation_result = get_speculative_segmentation().take(
+        ad_id=ad_id,
+        bounding_box=bounding_box,
+    )
     handle_operation(
         crop_and_segment_character,
         ad_id=ad_id,
         bounding_box=bounding_box,
         base_path=base_path,
         logger=logger,
+        segmentation_result=segmentation_result,
         status_code=501,
     )
 
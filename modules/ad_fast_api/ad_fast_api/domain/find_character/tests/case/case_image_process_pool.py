@@ -0,0 +1,86 @@
+import cv2
+import os
+import time
+from ad_fast_api.snippets.sources.ad_process_pool import ADImageProcessPool
+from ad_fast_api.domain.find_character.sources.features.find_character_feature import (
+    segment_and_remove_background,
+)
+from ad_fast_api.workspace.sources import reqeust_files as rf
+from ad_fast_api.workspace.sources import conf_workspace as cw
+from ad_fast_api.main import IMAGE_PROCESS_PRELOAD_MODULES
+
+
+REQUESTS_PER_WORKER = 8
+
+
+def get_worker_counts() -> list[int]:
+    cpu_count = os.cpu_count() or 1
+    worker_counts = [1]
+    while worker_counts[-1] * 2 <= cpu_count:
+        worker_counts.append(worker_counts[-1] * 2)
+    if worker_counts[-1] != cpu_count:
+        worker_counts.append(cpu_count)
+    return worker_counts
+
+
+def measure_throughput(
+    max_workers: int,
+    cropped_image,
+) -> float:
+    """
+    max_workers개의 워커로 풀을 띄운 뒤,
+    워커당 REQUESTS_PER_WORKER개의 세그멘테이션 작업을 동시에 넣어 초당 처리량을 측정합니다.
+    """
+    num_requests = max_workers * REQUESTS_PER_WORKER
+    pool = ADImageProcessPool(
+        max_workers=max_workers,
+        max_queue_depth=num_requests,
+    )
+    pool.start(preload_modules=IMAGE_PROCESS_PRELOAD_MODULES)
+
+    try:
+        # 워커 프로세스 기동, 모듈 import 시간은 제외
+        warm_up_futures = [
+            pool.submit(segment_and_remove_background, cropped_image)
+            for _ in range(max_workers)
+        ]
+        for future in warm_up_futures:
+            future.result()
+
+        start_time = time.perf_counter()
+        futures = [
+            pool.submit(segment_and_remove_background, cropped_image)
+            for _ in range(num_requests)
+        ]
+        for future in futures:
+            future.result()
+        elapsed = time.perf_counter() - start_time
+    finally:
+        pool.shutdown()
+
+    return num_requests / elapsed
+
+
+def case_benchmark_image_process_pool():
+    cropped_image_path = cw.get_base_path(ad_id=rf.GARLIC_AD_ID) / cw.CROPPED_IMAGE_NAME
+    cropped_image = cv2.imread(cropped_image_path.as_posix())
+
+    print(f"cpu count: {os.cpu_count()}, image: {cropped_image.shape}")
+    base_throughput = None
+    for max_workers in get_worker_counts():
+        throughput = measure_throughput(
+            max_workers=max_workers,
+            cropped_image=cropped_image,
+        )
+        base_throughput = base_throughput or throughput
+        print(
+            f"workers {max_workers}: {throughput:.2f} req/s "
+            f"(x{throughput / base_throughput:.2f})"
+        )
+
+
+if __name__ == "__main__":
+    case_benchmark_image_process_pool()
+
+
+# python -m ad_fast_api.domain.find_character.tests.case.case_image_process_pool
@@ -0,0 +1,111 @@
+import cv2
+import time
+import numpy as np
+from logging import getLogger
+from typing import Callable
+from ad_fast_api.domain.find_character.sources.features import (
+    segment_character as sc,
+)
+from ad_fast_api.workspace.sources import reqeust_files as rf
+from ad_fast_api.workspace.sources import conf_workspace as cw
+
+
+BENCHMARK_REPEAT = 5
+BACKGROUND_REMOVAL_BENCHMARK_SIZE = (1000, 1000)
+
+
+def get_benchmark_image_paths():
+    return [
+        rf.EXAMPLE1_DIR_PATH / rf.CROPPED_IMAGE_FILE_NAME,
+        rf.EXAMPLE1_DIR_PATH / rf.UPLOAD_IMAGE_FILE_NAME,
+        cw.get_base_path(ad_id=rf.GARLIC_AD_ID) / cw.CROPPED_IMAGE_NAME,
+    ]
+
+
+def get_floodfill_image(image_path) -> np.ndarray:
+    img = cv2.imread(image_path.as_posix())
+    return sc.apply_floodfill(
+        sc.apply_morphology(
+            sc.apply_threshold(img),
+        )
+    )
+
+
+def measure_average_ms(
+    extract: Callable,
+    floodfill_img: np.ndarray,
+    repeat: int = BENCHMARK_REPEAT,
+) -> tuple[float, np.ndarray]:
+    logger = getLogger(__name__)
+    mask = extract(floodfill_img, logger)
+
+    start_time = time.perf_counter()
+    for _ in range(repeat):
+        extract(floodfill_img, logger)
+    elapsed_ms = (time.perf_counter() - start_time) * 1000 / repeat
+
+    return elapsed_ms, mask
+
+
+def case_benchmark_extract_largest_region():
+    """
+    extract_largest_contour(컨투어별 fillPoly)와
+    extract_largest_region(연결 요소 레이블링)의 실행 시간과 결과 일치 여부를 비교합니다.
+    """
+    for image_path in get_benchmark_image_paths():
+        floodfill_img = get_floodfill_image(image_path)
+
+        contour_ms, contour_mask = measure_average_ms(
+            sc.extract_largest_contour,
+            floodfill_img,
+        )
+        region_ms, region_mask = measure_average_ms(
+            sc.extract_largest_region,
+            floodfill_img,
+        )
+
+        print(
+            f"{image_path.parent.name}/{image_path.name} {floodfill_img.shape}: "
+            f"contour {contour_ms:.2f} ms, region {region_ms:.2f} ms, "
+            f"speedup x{contour_ms / region_ms:.1f}, "
+            f"identical: {np.array_equal(contour_mask, region_mask)}"
+        )
+
+
+def case_benchmark_background_removal():
+    """
+    1000×1000 크기로 맞춘 예제 이미지에 대해 apply_floodfill(10픽셀 간격 시드)과
+    apply_border_background_removal(테두리 floodFill 1회)의 실행 시간과 결과 일치 여부를 비교합니다.
+    """
+    for image_path in get_benchmark_image_paths():
+        img = cv2.resize(
+            cv2.imread(image_path.as_posix()),
+            BACKGROUND_REMOVAL_BENCHMARK_SIZE,
+        )
+        morph_img = sc.apply_morphology(sc.apply_threshold(img))
+
+        results = {}
+        for name, remove in [
+            ("strided", sc.apply_floodfill),
+            ("border", sc.apply_border_background_removal),
+        ]:
+            start_time = time.perf_counter()
+            for _ in range(BENCHMARK_REPEAT):
+                results[name] = remove(morph_img)
+            results[f"{name}_ms"] = (
+                (time.perf_counter() - start_time) * 1000 / BENCHMARK_REPEAT
+            )
+
+        print(
+            f"{image_path.parent.name}/{image_path.name} {morph_img.shape}: "
+            f"strided {results['strided_ms']:.2f} ms, "
+            f"border {results['border_ms']:.2f} ms, "
+            f"identical: {np.array_equal(results['strided'], results['border'])}"
+        )
+
+
+if __name__ == "__main__":
+    case_benchmark_extract_largest_region()
+    case_benchmark_background_removal()
+
+# python -m ad_fast_api.domain.find_character.tests.case.case_segment_character
@@ -58,12 +58,16 @@ def test_crop_and_segment_character_with_patch_object(tmp_path, mock_logger):
     ) as mock_crop_image, patch.object(
         fcf, "cv2_save_image"
     ) as mock_cv2_save_image, patch.object(
+        fcf, "save_image"
+    ) as mock_save_image, patch.object(
         fcf, "segment_character", return_value=mask_image
     ) as mock_segment_character, patch.object(
         fcf, "remove_background", return_value=removed_bg_image
     ) as mock_remove_background, patch.object(
         fcf.cw, "get_base_path", return_value=base_path
-    ) as mock_get_base_path:
+    ) as mock_get_base_path, patch.object(
+        fcf, "start_speculative_pose_from_thread"
+    ) as mock_start_speculative_pose:
 
         # 함수를 실행
         fcf.crop_and_segment_character(
@@ -73,25 +77,26 @@ def test_crop_and_segment_character_with_patch_object(tmp_path, mock_logger):
             base_path=base_path,  # base_path 가 전달되면 cw.get_base_path 는 사용되지 않습니다.
         )
 
-        # cv2_save_image 가 세 번 호출되었는지 검증
-        calls = mock_cv2_save_image.call_args_list
-        assert len(calls) == 3, "cv2_save_image 함수는 세 번 호출되어야 합니다."
+        # cv2_save_image 는 cropped_image 저장에만 호출되었는지 검증
+        mock_cv2_save_image.assert_called_once_with(
+            image=cropped_image,
+            image_name=fcf.cw.CROPPED_IMAGE_NAME,
+            base_path=base_path,
+        )
 
-        # 첫 번째 호출: cropped_image, CROPPED_IMAGE_NAME, base_path
-        args, kwargs = calls[0]
-        assert kwargs["image"] is cropped_image
-        assert kwargs["image_name"] == fcf.cw.CROPPED_IMAGE_NAME
-        assert kwargs["base_path"] == base_path
+        # save_image 가 두 번 호출되었는지 검증
+        calls = mock_save_image.call_args_list
+        assert len(calls) == 2, "save_image 함수는 두 번 호출되어야 합니다."
 
-        # 두 번째 호출: mask_image, MASK_IMAGE_NAME, base_path
-        args, kwargs = calls[1]
-        assert kwargs["image"] is mask_image
+        # 첫 번째 호출: 인코딩된 mask_image, MASK_IMAGE_NAME, base_path
+        args, kwargs = calls[0]
+        assert kwargs["image_bytes"] == fcf.encode_image(mask_image)
         assert kwargs["image_name"] == fcf.cw.MASK_IMAGE_NAME
         assert kwargs["base_path"] == base_path
 
-        # 세 번째 호출: removed_bg_image, CUTOUT_CHARACTER_IMAGE_NAME, base_path
-        args, kwargs = calls[2]
-        assert kwargs["image"] is removed_bg_image
+        # 두 번째 호출: 인코딩된 removed_bg_image, CUTOUT_CHARACTER_IMAGE_NAME, base_path
+        args, kwargs = calls[1]
+        assert kwargs["image_bytes"] == fcf.encode_image(removed_bg_image)
         assert kwargs["image_name"] == fcf.cw.CUTOUT_CHARACTER_IMAGE_NAME
         assert kwargs["base_path"] == base_path
 
@@ -102,11 +107,18 @@ def test_crop_and_segment_character_with_patch_object(tmp_path, mock_logger):
             bounding_box=bounding_box,
         )
 
-        mock_segment_character.assert_called_once_with(
-            img=cropped_image,
-            logger=mock_logger,
-        )
+        # 요청의 logger는 image process pool 워커에 전달하지 않음
+        mock_segment_character.assert_called_once()
+        assert mock_segment_character.call_args.kwargs["img"] is cropped_image
+        assert mock_segment_character.call_args.kwargs["logger"] is not mock_logger
         mock_remove_background.assert_called_once_with(
             cropped_image=cropped_image,
             mask_image=mask_image,
         )
+
+        # 세그멘테이션 전에 pose 추정을 미리 요청했는지 검증
+        mock_start_speculative_pose.assert_called_once_with(
+            base_path=base_path,
+            cropped_image=cropped_image,
+            logger=mock_logger,
+        )
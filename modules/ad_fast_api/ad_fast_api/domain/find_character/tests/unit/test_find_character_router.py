@@ -59,6 +59,7 @@ def test_find_character_success(mock_logger):
         bounding_box=bounding_box,
         base_path=base_path,
         logger=mock_logger,
+        segmentation_result=None,
     )
     mock_file_response.assert_called_once_with(
         base_path.joinpath(cw.CUTOUT_CHARACTER_IMAGE_NAME).as_posix(),
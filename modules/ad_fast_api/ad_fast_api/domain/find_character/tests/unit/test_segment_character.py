@@ -1,6 +1,7 @@
 import numpy as np
 import pytest
 import cv2
+from unittest.mock import patch
 from ad_fast_api.domain.find_character.sources.features import (
     segment_character as sc,
 )
@@ -9,6 +10,8 @@ from ad_fast_api.domain.find_character.sources.features import segment_character
 from ad_fast_api.domain.find_character.sources.errors import (
     find_character_500_status as fcs,
 )
+from ad_fast_api.workspace.sources import reqeust_files as rf
+from ad_fast_api.workspace.sources import conf_workspace as cw
 
 
 def test_apply_threshold():
@@ -62,6 +65,67 @@ def test_apply_floodfill():
     assert np.all(flood_img[:, -1] == 0)
 
 
+@pytest.mark.parametrize(
+    "image_path",
+    [
+        rf.EXAMPLE1_DIR_PATH / rf.CROPPED_IMAGE_FILE_NAME,
+        rf.EXAMPLE1_DIR_PATH / rf.UPLOAD_IMAGE_FILE_NAME,
+        cw.get_base_path(ad_id=rf.GARLIC_AD_ID) / cw.CROPPED_IMAGE_NAME,
+    ],
+)
+def test_apply_border_background_removal_equals_apply_floodfill(image_path):
+    """
+    1000×1000 크기로 맞춘 예제 이미지에 대해 apply_border_background_removal이
+    기존 apply_floodfill과 동일한 결과를 생성하는지 확인합니다.
+    """
+    img = cv2.resize(cv2.imread(image_path.as_posix()), (1000, 1000))
+    morph_img = sc.apply_morphology(sc.apply_threshold(img))
+
+    expected_img = sc.apply_floodfill(morph_img)
+    result_img = sc.apply_border_background_removal(morph_img)
+
+    assert np.array_equal(result_img, expected_img)
+
+
+def test_apply_border_background_removal_removes_pocket_between_seeds():
+    """
+    가장자리 시드(10픽셀 간격) 사이에만 닿아 있는 배경 영역을
+    apply_floodfill은 놓치지만 apply_border_background_removal은 제거하는지 확인합니다.
+    """
+    img = np.zeros((100, 100), dtype=np.uint8)
+    cv2.rectangle(img, (10, 20), (80, 80), 255, -1)
+    # 상단 가장자리에만 닿는 13~17열 배경 영역을 벽으로 둘러쌈 (시드는 10, 20열)
+    img[0:20, 12] = 255
+    img[0:20, 18] = 255
+
+    flood_img = sc.apply_floodfill(img)
+    border_img = sc.apply_border_background_removal(img)
+
+    assert np.all(flood_img[1:20, 13:18] == 255)
+    assert np.all(border_img[1:20, 13:18] == 0)
+    assert np.all(border_img[0, :] == 0)
+    assert np.all(border_img[:, -1] == 0)
+
+
+def test_remove_border_background_mode():
+    img = np.zeros((100, 100), dtype=np.uint8)
+    cv2.rectangle(img, (20, 20), (80, 80), 255, -1)
+
+    with patch.object(
+        sc, "apply_floodfill", return_value=img
+    ) as mock_apply_floodfill, patch.object(
+        sc, "apply_border_background_removal", return_value=img
+    ) as mock_apply_border_background_removal:
+        sc.remove_border_background(img, sc.BackgroundRemovalMode.STRIDED_FLOODFILL)
+        sc.remove_border_background(img, sc.BackgroundRemovalMode.BORDER_CONNECTED)
+
+    mock_apply_floodfill.assert_called_once_with(img)
+    mock_apply_border_background_removal.assert_called_once_with(img)
+
+    with pytest.raises(ValueError):
+        sc.remove_border_background(img, "invalid_mode")  # type: ignore
+
+
 def test_extract_largest_contour(mock_logger):
     """
     100×100 크기의 원(원형 객체)이 포함된 이미지를 통해 최대 컨투어가 추출되고,
@@ -115,3 +179,64 @@ def test_segment_character(mock_logger):
 
     # 추출된 마스크에 'A' 영역(255인 영역)이 존재해야 함
     assert np.count_nonzero(mask) > 0
+
+
+def test_extract_largest_region(mock_logger):
+    """
+    크기가 다른 두 원이 포함된 이미지에서 가장 큰 영역만 남고,
+    내부 홀이 채워진 0과 255의 이진 마스크가 반환되는지 확인합니다.
+    """
+    img = np.zeros((200, 200), dtype=np.uint8)
+    cv2.circle(img, (60, 60), 40, (255,), -1)
+    cv2.circle(img, (160, 160), 20, (255,), -1)
+    # 큰 원 내부에 홀 추가
+    img[55:65, 55:65] = 0
+
+    mask = sc.extract_largest_region(img, mock_logger)
+
+    assert mask.shape == img.shape
+    assert set(np.unique(mask)) <= {0, 255}
+    assert mask[60, 60] == 255  # 홀이 채워짐
+    assert mask[160, 160] == 0  # 작은 원은 제거됨
+
+
+def test_extract_largest_region_no_regions(mock_logger):
+    """
+    객체 영역이 없는 경우 extract_largest_region 함수가 Exception을 발생시키는지 확인합니다.
+    """
+    im_floodfill = np.zeros((100, 100), dtype=np.uint8)
+
+    with pytest.raises(Exception) as excinfo:
+        sc.extract_largest_region(im_floodfill, mock_logger)
+    assert fcs.FOUND_NO_CONTOURS_WITHIN_IMAGE in str(excinfo.value)
+    mock_logger.critical.assert_called_once_with(fcs.FOUND_NO_CONTOURS_WITHIN_IMAGE)
+
+
+@pytest.mark.parametrize(
+    "image_path",
+    [
+        rf.EXAMPLE1_DIR_PATH / rf.CROPPED_IMAGE_FILE_NAME,
+        rf.EXAMPLE1_DIR_PATH / rf.UPLOAD_IMAGE_FILE_NAME,
+        cw.get_base_path(ad_id=rf.GARLIC_AD_ID) / cw.CROPPED_IMAGE_NAME,
+    ],
+)
+def test_extract_largest_region_equals_extract_largest_contour(
+    image_path,
+    mock_logger,
+):
+    """
+    예제 이미지에 대해 extract_largest_region이
+    기존 extract_largest_contour와 픽셀 단위로 동일한 마스크를 생성하는지 확인합니다.
+    """
+    img = cv2.imread(image_path.as_posix())
+    floodfill_img = sc.apply_floodfill(
+        sc.apply_morphology(
+            sc.apply_threshold(img),
+        )
+    )
+
+    expected_mask = sc.extract_largest_contour(floodfill_img, mock_logger)
+    mask = sc.extract_largest_region(floodfill_img, mock_logger)
+
+    assert mask.dtype == expected_mask.dtype
+    assert np.array_equal(mask, expected_mask)
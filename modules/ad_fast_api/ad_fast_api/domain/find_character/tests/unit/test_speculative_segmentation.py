@@ -0,0 +1,159 @@
+import threading
+from unittest.mock import patch, Mock
+from ad_fast_api.domain.find_character.sources.features import (
+    speculative_segmentation as ss,
+)
+from ad_fast_api.domain.schema.sources.schemas import BoundingBox
+from ad_fast_api.snippets.sources.ad_process_pool import ADImageProcessPool
+from ad_fast_api.snippets.testings.mock_logger import mock_logger
+
+
+SEGMENTATION_RESULT = (b"mask", b"cutout")
+
+
+def run_speculation(
+    speculative_segmentation: ss.SpeculativeSegmentation,
+    ad_id: str,
+    logger,
+    bounding_box: BoundingBox = BoundingBox.mock(),
+) -> bool:
+    with patch.object(ss, "crop_image", new=Mock()), patch.object(
+        ss,
+        "run_image_task",
+        new=Mock(return_value=SEGMENTATION_RESULT),
+    ):
+        return speculative_segmentation.run(
+            ad_id=ad_id,
+            bounding_box=bounding_box,
+            logger=logger,
+        )
+
+
+def test_take_same_bounding_box_hit(mock_logger):
+    # given
+    speculative_segmentation = ss.SpeculativeSegmentation.mock()
+    assert run_speculation(speculative_segmentation, "ad_1", mock_logger)
+
+    # when
+    result = speculative_segmentation.take(
+        ad_id="ad_1",
+        bounding_box=BoundingBox.mock(),
+    )
+
+    # then: 결과는 한 번만 사용
+    assert result == SEGMENTATION_RESULT
+    assert speculative_segmentation.take("ad_1", BoundingBox.mock()) is None
+    metrics = speculative_segmentation.get_metrics()
+    assert metrics["hit_count"] == 1
+    assert metrics["miss_count"] == 1
+    assert metrics["hit_rate"] == 0.5
+
+
+def test_take_different_bounding_box_miss(mock_logger):
+    # given
+    speculative_segmentation = ss.SpeculativeSegmentation.mock()
+    run_speculation(speculative_segmentation, "ad_1", mock_logger)
+    bounding_box = BoundingBox(left=1, top=2, right=30, bottom=40)
+
+    # when
+    result = speculative_segmentation.take(
+        ad_id="ad_1",
+        bounding_box=bounding_box,
+    )
+
+    # then
+    assert result is None
+    metrics = speculative_segmentation.get_metrics()
+    assert metrics["bbox_changed_count"] == 1
+    assert metrics["wasted_count"] == 1
+    assert metrics["stored_count"] == 0
+
+
+def test_take_waits_for_running_speculation(mock_logger):
+    # given
+    speculative_segmentation = ss.SpeculativeSegmentation.mock()
+    started_event = threading.Event()
+    release_event = threading.Event()
+
+    def slow_segmentation(*args, **kwargs):
+        started_event.set()
+        release_event.wait(1)
+        return SEGMENTATION_RESULT
+
+    with patch.object(ss, "crop_image", new=Mock()), patch.object(
+        ss,
+        "run_image_task",
+        new=Mock(side_effect=slow_segmentation),
+    ):
+        thread = threading.Thread(
+            target=speculative_segmentation.run,
+            kwargs={
+                "ad_id": "ad_1",
+                "bounding_box": BoundingBox.mock(),
+                "logger": mock_logger,
+            },
+        )
+        thread.start()
+        started_event.wait(1)
+
+        # when
+        threading.Timer(0.05, release_event.set).start()
+        result = speculative_segmentation.take("ad_1", BoundingBox.mock())
+        thread.join()
+
+    # then
+    assert result == SEGMENTATION_RESULT
+
+
+def test_run_skipped_without_budget(mock_logger):
+    # given: image process pool의 워커가 모두 사용중
+    speculative_segmentation = ss.SpeculativeSegmentation.mock()
+    image_process_pool = ADImageProcessPool.mock()
+    image_process_pool._pending = image_process_pool.max_workers
+
+    # when
+    with patch.object(
+        ss,
+        "get_image_process_pool",
+        new=Mock(return_value=image_process_pool),
+    ):
+        is_scheduled = run_speculation(speculative_segmentation, "ad_1", mock_logger)
+
+    # then
+    assert not is_scheduled
+    assert speculative_segmentation.get_metrics()["skipped_count"] == 1
+    assert speculative_segmentation.take("ad_1", BoundingBox.mock()) is None
+
+
+def test_run_failure_falls_back(mock_logger):
+    # given
+    speculative_segmentation = ss.SpeculativeSegmentation.mock()
+
+    # when
+    with patch.object(ss, "crop_image", new=Mock(side_effect=TypeError("no image"))):
+        is_segmented = speculative_segmentation.run(
+            ad_id="ad_1",
+            bounding_box=BoundingBox.mock(),
+            logger=mock_logger,
+        )
+
+    # then
+    assert not is_segmented
+    assert speculative_segmentation.running == 0
+    assert speculative_segmentation.take("ad_1", BoundingBox.mock()) is None
+    assert speculative_segmentation.get_metrics()["failed_count"] == 1
+    mock_logger.warning.assert_called_once()
+
+
+def test_unused_entries_evicted(mock_logger):
+    # given
+    speculative_segmentation = ss.SpeculativeSegmentation.mock()
+
+    # when
+    for ad_id in ["ad_1", "ad_2", "ad_3"]:
+        run_speculation(speculative_segmentation, ad_id, mock_logger)
+
+    # then: max_entries(2)를 넘으면 가장 오래된 결과부터 버림
+    assert speculative_segmentation.take("ad_1", BoundingBox.mock()) is None
+    assert speculative_segmentation.take("ad_3", BoundingBox.mock()) is not None
+    assert speculative_segmentation.get_metrics()["wasted_count"] == 1
@@ -1,5 +1,7 @@
 from ad_fast_api.domain.make_animation.sources.make_animation_schema import (
     ADAnimation,
+    ADRenderQuality,
+    ADVideoFormat,
 )
 from ad_fast_api.workspace.sources.conf_workspace import (
     get_video_dir_path,
@@ -17,16 +19,36 @@ def check_available_animation(ad_animation: str, logger: Logger):
         raise Exception(msg)
 
 
+def check_available_video_format(video_format: str, logger: Logger):
+    try:
+        ADVideoFormat(video_format)
+    except ValueError:
+        msg = "Invalid video format. Please check the video format."
+        logger.error(msg)
+        raise Exception(msg)
+
+
+def check_available_quality(quality: str, logger: Logger):
+    try:
+        ADRenderQuality(quality)
+    except ValueError:
+        msg = "Invalid quality. Please check the quality."
+        logger.error(msg)
+        raise Exception(msg)
+
+
 def get_video_file_path(
     base_path: Path,
     ad_animation: str,
     logger: Logger,
+    video_format: str = ADVideoFormat.gif.value,
+    quality: str = ADRenderQuality.full.value,
 ) -> Tuple[Path, Path]:
     video_dir_path = get_video_dir_path(
         base_path=base_path,
     )
     video_dir_path.mkdir(exist_ok=True)
-    video_file_name = get_video_file_name(ad_animation)
+    video_file_name = get_video_file_name(ad_animation, video_format, quality)
     video_file_path = video_dir_path.joinpath(video_file_name)
     # /video/dab.gif
     relative_video_file_path = video_file_path.relative_to(base_path)
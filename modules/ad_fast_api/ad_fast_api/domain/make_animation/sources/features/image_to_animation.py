@@ -1,40 +1,44 @@
 from pathlib import Path
-from zero import AsyncZeroClient
 from typing import Optional
 from logging import Logger
 from ad_fast_api.domain.make_animation.sources.make_animation_schema import (
+    RenderPriority,
+    RenderStatus,
+    create_render_status,
     WebSocketMessage,
     WebSocketType,
     create_websocket_message,
 )
 from ad_fast_api.snippets.sources.ad_dictionary import get_value_from_dict
-
-
-# internal port env 사용하기
-def get_zero_client(
-    host: str = "animated_drawings",
-    port: int = 8001,
-    timeout_seconds: Optional[float] = None,
-) -> AsyncZeroClient:
-    timeout = int(timeout_seconds * 1000) if timeout_seconds != None else 3000
-
-    return AsyncZeroClient(
-        host,
-        port,
-        default_timeout=timeout,
-    )
+from ad_fast_api.snippets.sources.ad_zero_client import get_zero_client
 
 
 async def start_render_async(
     animated_drawings_mvc_cfg_path: Path,
     logger: Logger,
     timeout_seconds: Optional[float] = None,
+    priority: Optional[RenderPriority] = None,
 ) -> WebSocketMessage:
+    """
+    렌더링 시작을 요청합니다.
+    priority가 있으면 대기열에서 우선순위가 높은 작업부터 실행합니다. (미리보기 HIGH, 백그라운드 LOW)
+    """
     try:
-        response = await get_zero_client(timeout_seconds=timeout_seconds).call(
-            "start_render",
-            animated_drawings_mvc_cfg_path.as_posix(),
-        )
+        if priority is None:
+            response = await get_zero_client().call(
+                "start_render",
+                animated_drawings_mvc_cfg_path.as_posix(),
+                timeout_seconds=timeout_seconds,
+            )
+        else:
+            response = await get_zero_client().call(
+                "start_render_with_priority",
+                {
+                    "mvc_cfg_file_path": animated_drawings_mvc_cfg_path.as_posix(),
+                    "priority": priority.value,
+                },
+                timeout_seconds=timeout_seconds,
+            )
 
         if response is None:
             msg = "Failed to start animation rendering, no return value."
@@ -89,9 +93,10 @@ async def cancel_render_async(
     timeout_seconds: Optional[float] = None,
 ):
     try:
-        response = await get_zero_client(timeout_seconds=timeout_seconds).call(
+        response = await get_zero_client().call(
             "cancel_render",
             job_id,
+            timeout_seconds=timeout_seconds,
         )
 
         if response is None:
@@ -118,10 +123,28 @@ async def is_finish_render(
     logger: Logger,
     timeout_seconds: Optional[float] = None,
 ) -> bool:
+    render_status = await get_render_status(
+        job_id=job_id,
+        logger=logger,
+        timeout_seconds=timeout_seconds,
+    )
+    return render_status["is_finished"]
+
+
+async def get_render_status(
+    job_id: str,
+    logger: Logger,
+    timeout_seconds: Optional[float] = None,
+) -> RenderStatus:
+    """
+    렌더링 완료 여부와 진행중인 경우 진행 상황(frames_done, total_frames, phase 등)을 반환합니다.
+    종료된 경우 작업 상태(FINISHED, FAILED, CANCELED)와 exit_code, error를 함께 반환합니다.
+    """
     try:
-        response = await get_zero_client(timeout_seconds=timeout_seconds).call(
+        response = await get_zero_client().call(
             "is_finish_render",
             job_id,
+            timeout_seconds=timeout_seconds,
         )
 
         if response is None:
@@ -132,10 +155,20 @@ async def is_finish_render(
         type = response.get("type")
         if type == "TERMINATE":
             logger.info("Animation rendering is finished.")
-            return True
+            data = response.get("data") or {}
+            return create_render_status(
+                is_finished=True,
+                status=data.get("state"),
+                exit_code=data.get("exit_code"),
+                error=data.get("error"),
+            )
         elif type == "RUNNING":
             logger.info("Animation rendering is in progress.")
-            return False
+            progress = get_value_from_dict(
+                key_list=["data", "progress"],
+                from_dict=response,
+            )
+            return create_render_status(is_finished=False, progress=progress)
         else:
             msg = f"Failed to check if animation rendering is finished, unknown return value. {response}"
             logger.error(msg)
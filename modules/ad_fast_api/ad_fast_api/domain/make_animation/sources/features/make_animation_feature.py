@@ -1,38 +1,156 @@
 from pathlib import Path
+from typing import Callable, Mapping, Optional
+from urllib.parse import urlencode
 from ad_fast_api.domain.make_animation.sources.features.prepare_make_animation import (
     create_animated_drawing_dict,
     create_mvc_config,
+    get_render_quality_config,
     save_mvc_config,
+    save_preview_motion_config,
+)
+from ad_fast_api.domain.make_animation.sources.features.check_make_animation_info import (
+    get_video_file_path,
+)
+from ad_fast_api.snippets.sources.ad_env import (
+    get_ad_env,
+    fetch_env_from_os_or_default,
 )
-from ad_fast_api.snippets.sources.ad_env import get_ad_env
 from ad_fast_api.workspace.sources.conf_workspace import (
     FILES_DIR_NAME,
-    MVC_CFG_FILE_NAME,
+    get_mvc_cfg_file_name,
+    get_render_status_file_name,
 )
 from ad_fast_api.domain.make_animation.sources.features.image_to_animation import (
-    is_finish_render,
+    get_render_status,
+    start_render_async,
     cancel_render_async,
 )
-from ad_fast_api.snippets.sources.ad_websocket import check_connection
-from fastapi.responses import FileResponse
-from fastapi import WebSocket, WebSocketDisconnect
+from ad_fast_api.domain.make_animation.sources.features.render_status_file import (
+    FAILED_RENDER_JOB_STATUSES,
+    get_render_status_watcher,
+)
+from ad_fast_api.domain.make_animation.sources.features.render_session import (
+    close_render_session,
+    detach_render_session,
+    is_last_render_connection,
+    mark_rendering_started,
+)
+from ad_fast_api.domain.make_animation.sources.make_animation_schema import (
+    VIDEO_FORMAT_MEDIA_TYPES,
+    ADRenderQuality,
+    ADVideoFormat,
+    RenderPriority,
+    RenderStatus,
+    WebSocketType,
+    create_websocket_message,
+)
+from ad_fast_api.snippets.sources.ad_websocket import run_with_heartbeat
+from ad_fast_api.snippets.sources.ad_file_response import (
+    create_file_response,
+    get_file_version,
+)
+from fastapi import Response, WebSocket, WebSocketDisconnect
 from logging import Logger
 import asyncio
+import time
 from ad_fast_api.domain.make_animation.sources.errors.make_animation_500_status import (
+    RenderFailedError,
     VideoFileNotExistError,
 )
 
 
-def get_file_response(
+REWARD_ADVERTISEMENT_SECONDS_ENV = "AD_REWARD_ADVERTISEMENT_SECONDS"
+WEBSOCKET_HEARTBEAT_SECONDS_ENV = "AD_WEBSOCKET_HEARTBEAT_SECONDS"
+# 대기열에서 나온 뒤 렌더링을 기다리는 최대 시간
+MAX_RENDER_SECONDS_ENV = "AD_MAX_RENDER_SECONDS"
+STATUS_RPC_SECONDS = 5  # 상태 파일이 없으면 5초 주기로 RPC 확인
+
+
+def get_video_media_type(video_file_path: Path) -> str:
+    # 애니메이션 파일의 확장자는 video_format과 같음 (dab.gif, dab.mp4, dab.webm)
+    return VIDEO_FORMAT_MEDIA_TYPES[ADVideoFormat(video_file_path.suffix[1:])]
+
+
+def get_accepted_video_formats(accept: Optional[str]) -> list[ADVideoFormat]:
+    """
+    Accept 헤더에서 받을 수 있는 애니메이션 형식을 선호(q) 순서대로 반환합니다.
+    video/*, */* 처럼 여러 형식에 해당하면 gif, mp4, webm 순서이며,
+    q=0으로 지정한 형식은 제외합니다. Accept 헤더가 없으면 gif만 반환합니다.
+    """
+    if not accept:
+        return [ADVideoFormat.gif]
+
+    media_ranges: list[tuple[float, str]] = []
+    rejected_media_types: set[str] = set()
+    for media_range in accept.split(","):
+        media_type, *params = [part.strip() for part in media_range.split(";")]
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if q > 0:
+            media_ranges.append((q, media_type.lower()))
+        else:
+            rejected_media_types.add(media_type.lower())
+    # sort는 안정 정렬이므로 q가 같으면 Accept 헤더의 순서를 유지
+    media_ranges.sort(key=lambda media_range: media_range[0], reverse=True)
+
+    video_formats: list[ADVideoFormat] = []
+    for _, media_type in media_ranges:
+        for video_format, video_media_type in VIDEO_FORMAT_MEDIA_TYPES.items():
+            main_type = video_media_type.split("/")[0]
+            if video_media_type in rejected_media_types:
+                continue
+            if video_format not in video_formats and media_type in (
+                video_media_type,
+                f"{main_type}/*",
+                "*/*",
+            ):
+                video_formats.append(video_format)
+    return video_formats
+
+
+async def get_file_response(
     base_path: Path,
     relative_video_file_path: Path,
-) -> FileResponse:
+    request_headers: Optional[Mapping[str, str]] = None,
+    version: Optional[str] = None,
+) -> Response:
     video_file_path = base_path.joinpath(relative_video_file_path)
-    file_response = FileResponse(
-        video_file_path.as_posix(),
-        media_type="image/gif",
+    return await create_file_response(
+        file_path=video_file_path,
+        media_type=get_video_media_type(video_file_path),
+        request_headers=request_headers,
+        version=version,
     )
-    return file_response
+
+
+async def get_download_animation_path(
+    ad_id: str,
+    ad_animation: str,
+    video_file_path: Path,
+    quality: str = ADRenderQuality.full.value,
+) -> str:
+    """
+    애니메이션 파일 내용의 해시를 버전으로 포함한 다운로드 경로를 반환합니다.
+    내용이 바뀌면 경로도 바뀌므로 CDN, 클라이언트가 오래 캐시할 수 있습니다.
+    형식(video_format)도 경로에 포함하여 Accept 헤더와 관계없이 같은 파일을 받습니다.
+    """
+    version = await get_file_version(video_file_path)
+    query = urlencode(
+        {
+            "ad_id": ad_id,
+            "ad_animation": ad_animation,
+            "video_format": video_file_path.suffix[1:],
+            "quality": quality,
+            "v": version,
+        }
+    )
+    return f"/download_animation?{query}"
 
 
 def prepare_make_animation(
@@ -40,7 +158,13 @@ def prepare_make_animation(
     base_path: Path,
     ad_animation: str,
     relative_video_file_path: Path,
+    video_format: str = ADVideoFormat.gif.value,
+    quality: str = ADRenderQuality.full.value,
 ) -> Path:
+    """
+    애니메이션 파일마다 mvc 설정을 저장하고 animated_drawings 서버 기준 경로를 반환합니다.
+    미리보기(preview)는 motion 앞부분만 사용하는 motion 설정을 함께 저장합니다.
+    """
     animated_drawings_workspace_path = Path(
         get_ad_env().animated_drawings_workspace_dir
     )
@@ -48,10 +172,22 @@ def prepare_make_animation(
         FILES_DIR_NAME
     ).joinpath(ad_id)
 
+    quality_config = get_render_quality_config(quality)
+    motion_cfg_path = None
+    if quality_config.MAX_FRAMES is not None:
+        motion_cfg_path = animated_drawings_base_path.joinpath(
+            save_preview_motion_config(
+                ad_animation=ad_animation,
+                max_frames=quality_config.MAX_FRAMES,
+                base_path=base_path,
+            )
+        )
+
     animated_drawings_dict = create_animated_drawing_dict(
         animated_drawings_base_path=animated_drawings_base_path,
         animated_drawings_workspace_path=animated_drawings_workspace_path,
         ad_animation=ad_animation,
+        motion_cfg_path=motion_cfg_path,
     )
 
     video_file_path = animated_drawings_base_path.joinpath(relative_video_file_path)
@@ -60,81 +196,243 @@ def prepare_make_animation(
         animated_drawings_dict=animated_drawings_dict,
         video_file_path=video_file_path,
         ad_animation=ad_animation,
+        video_format=video_format,
+        quality=quality,
     )
+    mvc_cfg_file_name = get_mvc_cfg_file_name(relative_video_file_path.name)
     save_mvc_config(
-        mvc_cfg_file_name=MVC_CFG_FILE_NAME,
+        mvc_cfg_file_name=mvc_cfg_file_name,
         mvc_cfg_dict=mvc_cfg_dict,
         base_path=base_path,
     )
 
     animated_drawings_mvc_cfg_path = animated_drawings_base_path.joinpath(
-        MVC_CFG_FILE_NAME
+        mvc_cfg_file_name
     )
     return animated_drawings_mvc_cfg_path
 
 
-def period_finish_render(
-    timer: int,
-    period: int,
-) -> bool:
-    reward_advertisement_time = 20
-    return reward_advertisement_time < timer and timer % period == 0
+async def start_background_full_render(
+    ad_id: str,
+    base_path: Path,
+    ad_animation: str,
+    video_format: str,
+    logger: Logger,
+) -> Optional[str]:
+    """
+    미리보기 뒤에 전체 렌더링을 낮은 우선순위(LOW)로 예약하고 job_id를 반환합니다.
+    사용자가 전체 렌더링을 요청하면 같은 작업에 합쳐지며 요청한 우선순위로 올라갑니다.
+    이미 애니메이션 파일이 있거나 예약하지 못하면 None을 반환합니다.
+    """
+    video_file_path, relative_video_file_path = get_video_file_path(
+        base_path=base_path,
+        ad_animation=ad_animation,
+        logger=logger,
+        video_format=video_format,
+        quality=ADRenderQuality.full.value,
+    )
+    if video_file_path.exists():
+        return None
+
+    animated_drawings_mvc_cfg_path = prepare_make_animation(
+        ad_id=ad_id,
+        base_path=base_path,
+        ad_animation=ad_animation,
+        relative_video_file_path=relative_video_file_path,
+        video_format=video_format,
+        quality=ADRenderQuality.full.value,
+    )
+    start_websocket_message = await start_render_async(
+        animated_drawings_mvc_cfg_path=animated_drawings_mvc_cfg_path,
+        logger=logger,
+        priority=RenderPriority.LOW,
+    )
+    if start_websocket_message["type"] != WebSocketType.RUNNING:
+        return None
+    return (start_websocket_message["data"] or {}).get("job_id")
+
+
+def get_reward_advertisement_seconds() -> float:
+    return float(
+        fetch_env_from_os_or_default(REWARD_ADVERTISEMENT_SECONDS_ENV, "20"),
+    )
+
+
+def get_websocket_heartbeat_seconds() -> float:
+    return float(
+        fetch_env_from_os_or_default(WEBSOCKET_HEARTBEAT_SECONDS_ENV, "5"),
+    )
+
+
+def get_max_render_seconds() -> float:
+    return float(
+        fetch_env_from_os_or_default(MAX_RENDER_SECONDS_ENV, "180"),
+    )
+
+
+def get_render_failed_message(render_status: RenderStatus) -> str:
+    msg = "Animation rendering has failed."
+    if render_status["status"] == "CANCELED":
+        msg = "Animation rendering has been canceled."
+    if render_status["error"]:
+        msg += f" {render_status['error']}"
+    if render_status["exit_code"] is not None:
+        msg += f" (exit code: {render_status['exit_code']})"
+    return msg
+
+
+async def wait_render_complete(
+    job_id: str,
+    status_file_path: Path,
+    video_file_path: Path,
+    websocket: WebSocket,
+    logger: Logger,
+    complete_at: float,
+    update_render_deadline: Callable[[bool], None],
+):
+    """
+    렌더링이 끝날 때까지 진행 상황이 바뀌면 PROGRESS 메시지로 전달합니다.
+    상태 파일이 바뀔 때만 깨어나며, 상태 파일이 없으면 STATUS_RPC_SECONDS마다 RPC로 확인합니다.
+    확인한 상태가 대기열(queued)인지 update_render_deadline으로 알려 렌더링 최대 시간을 조정합니다.
+    보상 광고가 끝나는 complete_at(event loop 시간) 전에 끝나면 그때까지 기다립니다.
+    렌더링이 실패하거나 취소되면 기다리지 않고 실패 이유와 함께 RenderFailedError를 발생시킵니다.
+    """
+    last_progress = None
+    file_render_status = None
+
+    async with get_render_status_watcher().watch(status_file_path) as render_statuses:
+        while True:
+            try:
+                async with asyncio.timeout(STATUS_RPC_SECONDS):
+                    file_render_status = await render_statuses.get()
+            except TimeoutError:
+                pass
+
+            render_status = file_render_status
+            if render_status is None:
+                render_status = await get_render_status(
+                    job_id=job_id,
+                    logger=logger,
+                    timeout_seconds=7,
+                )
+            if render_status is None:
+                continue
+
+            progress = render_status["progress"]
+            update_render_deadline(
+                not render_status["is_finished"]
+                and (progress or {}).get("phase") == "queued"
+            )
+            if progress is not None and progress != last_progress:
+                await websocket.send_json(
+                    create_websocket_message(
+                        type=WebSocketType.PROGRESS,
+                        message="Animation rendering is in progress.",
+                        data=progress,
+                    )
+                )
+                last_progress = progress
+            if render_status["status"] in FAILED_RENDER_JOB_STATUSES:
+                msg = get_render_failed_message(render_status)
+                logger.error(msg)
+                raise RenderFailedError(msg)
+            if render_status["is_finished"]:
+                break
+
+    remaining_seconds = complete_at - asyncio.get_running_loop().time()
+    if remaining_seconds > 0:
+        await asyncio.sleep(remaining_seconds)
+
+    if not video_file_path.exists():
+        msg = "Rendering has been completed, but the video file does not exist."
+        logger.error(msg)
+        raise VideoFileNotExistError(msg)
+    logger.info("Rendering has been completed.")
 
 
-# 주기적으로 렌더링 완료 확인 및 연결 상태 확인
+# 렌더링 진행 상황, 완료 확인 및 연결 상태 확인
+# heartbeat, 메시지 수신, 렌더링 완료 대기를 각각의 task로 실행하여 필요할 때만 깨어남
+# 렌더링 상태는 animated_drawings 서버가 공유 workspace에 쓰는 상태 파일로 확인하고,
+# 상태 파일이 없을 때만 RPC로 확인
+# 연결이 끊기면 렌더링을 취소하지 않고 다시 연결될 때까지 유예 시간을 줌
+# 다시 연결된 경우 start_timer로 이전 연결에서 지난 시간을 이어서 셈
+# 렌더링 최대 시간은 작업이 대기열에서 나온 뒤부터 세며, 같은 작업의 연결들은 같은 시작 시각을 사용
 async def check_connection_and_rendering(
     job_id: str,
     base_path: Path,
     relative_video_file_path: Path,
     websocket: WebSocket,
     logger: Logger,
+    start_timer: int = 0,
 ):
-    connection_timer = 0
-    connection_period = 5  # 5초 주기로 클라이언트 연결 확인
-    finish_render_period = 2
-    render_timer = 0
-    max_render_time = 60 * 3  # 렌더링 최대 3분 대기
     video_file_path = base_path.joinpath(relative_video_file_path)
+    status_file_path = base_path.joinpath(get_render_status_file_name(job_id))
+    complete_at = (
+        asyncio.get_running_loop().time()
+        + get_reward_advertisement_seconds()
+        - start_timer
+    )
+    is_detached = False
+    max_render_seconds = get_max_render_seconds()
+    rendering_started_at: Optional[float] = None
 
     try:
-        while render_timer < max_render_time:
-            await check_connection(
-                timer=connection_timer,
-                period=connection_period,
-                websocket=websocket,
-                logger=logger,
-            )
-            connection_timer += 1
-
-            if period_finish_render(
-                timer=render_timer,
-                period=finish_render_period,
-            ) and await is_finish_render(
-                job_id=job_id,
-                logger=logger,
-                timeout_seconds=7,
-            ):
-                if not video_file_path.exists():
-                    msg = "Rendering has been completed, but the video file does not exist."
-                    logger.error(msg)
-                    raise VideoFileNotExistError(msg)
-                logger.info("Rendering has been completed.")
-                return
-            render_timer += 1
-
-            await asyncio.sleep(1)
-        else:
+        try:
+            # 상태를 확인하기 전까지는 연결한 시점부터 셈
+            async with asyncio.timeout(max_render_seconds) as render_timeout:
+
+                def update_render_deadline(is_queued: bool):
+                    nonlocal rendering_started_at
+                    loop_time = asyncio.get_running_loop().time()
+                    if is_queued:
+                        # 대기열에서 기다리는 시간은 렌더링 시간에 포함하지 않음
+                        render_timeout.reschedule(loop_time + max_render_seconds)
+                        return
+                    if rendering_started_at is not None:
+                        return
+                    rendering_started_at = mark_rendering_started(video_file_path)
+                    rendering_elapsed_seconds = time.monotonic() - rendering_started_at
+                    render_timeout.reschedule(
+                        loop_time + max_render_seconds - rendering_elapsed_seconds
+                    )
+
+                await run_with_heartbeat(
+                    websocket=websocket,
+                    logger=logger,
+                    main=wait_render_complete(
+                        job_id=job_id,
+                        status_file_path=status_file_path,
+                        video_file_path=video_file_path,
+                        websocket=websocket,
+                        logger=logger,
+                        complete_at=complete_at,
+                        update_render_deadline=update_render_deadline,
+                    ),
+                    heartbeat_seconds=get_websocket_heartbeat_seconds(),
+                )
+        except TimeoutError:
             msg = "Rendering time has exceeded the limit."
             raise Exception(msg)
     except WebSocketDisconnect as e:
         msg = "The websocket connection with the client has been terminated"
         logger.error(f"{msg}: {e}")
-        await cancel_render_async(job_id=job_id, logger=logger)
+        is_detached = detach_render_session(
+            video_file_path=video_file_path,
+            logger=logger,
+        )
+        if not is_detached:
+            await cancel_render_async(job_id=job_id, logger=logger)
         raise Exception(msg)
-    except VideoFileNotExistError as e:
+    except (VideoFileNotExistError, RenderFailedError) as e:
         raise Exception(str(e))
     except Exception as e:
         msg = f"An error occurred while processing the job : {e}"
         logger.error(msg)
-        await cancel_render_async(job_id=job_id, logger=logger)
+        # 같은 작업을 기다리는 다른 연결이 있으면 취소하지 않음
+        if is_last_render_connection(video_file_path):
+            await cancel_render_async(job_id=job_id, logger=logger)
         raise Exception(msg)
+    finally:
+        # 다른 연결이 기다리고 있거나 유예 시간 동안은 다시 연결할 수 있도록 상태 파일을 남겨둠
+        if not is_detached and close_render_session(video_file_path):
+            status_file_path.unlink(missing_ok=True)
@@ -1,10 +1,24 @@
 from ad_fast_api.workspace.sources.conf_workspace import (
     CHAR_CFG_FILE_NAME,
     CONFIG_DIR_NAME,
+    CONFIG_PATH,
+    get_preview_motion_cfg_file_name,
+)
+from ad_fast_api.domain.make_animation.sources.make_animation_schema import (
+    ADRenderQuality,
+    ADVideoFormat,
 )
 from pathlib import Path
-from ad_fast_api.snippets.sources.save_dict import dict_to_file
-from typing import Protocol
+from ad_fast_api.snippets.sources.save_dict import dict_to_file, file_to_dict
+from typing import Optional, Protocol
+
+
+# animated_drawings controller의 OUTPUT_VIDEO_CODEC (cv2.VideoWriter fourcc), gif는 코덱이 없음
+# render 워커의 opencv에 인코더가 없으면 대체 코덱(mp4v, VP80)으로 인코딩
+VIDEO_FORMAT_CODECS = {
+    ADVideoFormat.mp4: "avc1",  # H.264
+    ADVideoFormat.webm: "VP80",  # VP9는 크기가 비슷하고 인코딩이 4배 느림
+}
 
 
 class CameraConfig(Protocol):
@@ -31,12 +45,79 @@ def get_camera_config(ad_animation: str) -> CameraConfig:
         raise ValueError(f"Invalid animation: {ad_animation}")
 
 
+class RenderQualityConfig(Protocol):
+    # view의 WINDOW_DIMENSIONS, None이면 animated_drawings 기본값 (500, 500)
+    WINDOW_DIMENSIONS: Optional[list[int]]
+    # N 프레임마다 한 프레임만 렌더링 (animated_drawings 서버의 FRAME_STEP)
+    FRAME_STEP: int
+    # motion 앞부분에서 렌더링할 최대 프레임 수, None이면 motion 전체
+    MAX_FRAMES: Optional[int]
+
+
+class FullRenderQualityConfig(RenderQualityConfig):
+    WINDOW_DIMENSIONS: Optional[list[int]] = None
+    FRAME_STEP: int = 1
+    MAX_FRAMES: Optional[int] = None
+
+
+class PreviewRenderQualityConfig(RenderQualityConfig):
+    WINDOW_DIMENSIONS: Optional[list[int]] = [250, 250]
+    FRAME_STEP: int = 2
+    MAX_FRAMES: Optional[int] = 120  # bvh 30fps 기준 앞 4초
+
+
+def get_render_quality_config(quality: str) -> RenderQualityConfig:
+    if quality == ADRenderQuality.full:
+        return FullRenderQualityConfig()
+    elif quality == ADRenderQuality.preview:
+        return PreviewRenderQualityConfig()
+    else:
+        raise ValueError(f"Invalid quality: {quality}")
+
+
+def create_trimmed_motion_config(
+    motion_cfg_dict: dict,
+    max_frames: int,
+) -> dict:
+    start_frame_idx = motion_cfg_dict.get("start_frame_idx") or 0
+    end_frame_idx = start_frame_idx + max_frames - 1
+    if motion_cfg_dict.get("end_frame_idx") is not None:
+        end_frame_idx = min(end_frame_idx, motion_cfg_dict["end_frame_idx"])
+    return {
+        **motion_cfg_dict,
+        "end_frame_idx": end_frame_idx,
+    }
+
+
+def save_preview_motion_config(
+    ad_animation: str,
+    max_frames: int,
+    base_path: Path,
+) -> str:
+    """
+    motion 설정의 앞부분만 사용하는 미리보기 motion 설정을 저장하고 파일 이름을 반환합니다.
+    animated_drawings 서버와 같은 workspace/config의 motion 설정을 읽습니다.
+    """
+    motion_cfg_dict = file_to_dict(
+        file_path=CONFIG_PATH.joinpath(f"motion/{ad_animation}.yaml"),
+    )
+    preview_motion_cfg_file_name = get_preview_motion_cfg_file_name(ad_animation)
+    dict_to_file(
+        to_save_dict=create_trimmed_motion_config(motion_cfg_dict, max_frames),
+        file_path=base_path.joinpath(preview_motion_cfg_file_name),
+    )
+    return preview_motion_cfg_file_name
+
+
 def create_mvc_config(
     animated_drawings_dict: dict,
     video_file_path: Path,
     ad_animation: str,
+    video_format: str = ADVideoFormat.gif.value,
+    quality: str = ADRenderQuality.full.value,
 ) -> dict:
     camera_config = get_camera_config(ad_animation)
+    quality_config = get_render_quality_config(quality)
 
     mvc_cfg_dict = {
         "scene": {
@@ -52,6 +133,13 @@ def create_mvc_config(
             "OUTPUT_VIDEO_PATH": video_file_path.as_posix(),  # set the output location
         },
     }
+    video_codec = VIDEO_FORMAT_CODECS.get(ADVideoFormat(video_format))
+    if video_codec is not None:
+        mvc_cfg_dict["controller"]["OUTPUT_VIDEO_CODEC"] = video_codec
+    if quality_config.WINDOW_DIMENSIONS is not None:
+        mvc_cfg_dict["view"]["WINDOW_DIMENSIONS"] = quality_config.WINDOW_DIMENSIONS
+    if quality_config.FRAME_STEP > 1:
+        mvc_cfg_dict["controller"]["FRAME_STEP"] = quality_config.FRAME_STEP
 
     return mvc_cfg_dict
 
@@ -60,6 +148,7 @@ def create_animated_drawing_dict(
     animated_drawings_base_path: Path,
     animated_drawings_workspace_path: Path,
     ad_animation: str,
+    motion_cfg_path: Optional[Path] = None,
 ) -> dict:
     """
     Given a path to a directory with character annotations, a motion configuration file, and a retarget configuration file,
@@ -70,7 +159,9 @@ def create_animated_drawing_dict(
     char_cfg_path = animated_drawings_base_path.joinpath(CHAR_CFG_FILE_NAME)
 
     config_dir_path = animated_drawings_workspace_path.joinpath(CONFIG_DIR_NAME)
-    motion_cfg_path = config_dir_path.joinpath(f"motion/{ad_animation}.yaml")
+    motion_cfg_path = motion_cfg_path or config_dir_path.joinpath(
+        f"motion/{ad_animation}.yaml"
+    )
     retarget_cfg_path = config_dir_path.joinpath("retarget/fair1_ppf.yaml")
 
     animated_drawing_dict = {
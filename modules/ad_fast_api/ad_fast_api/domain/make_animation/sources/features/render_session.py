@@ -0,0 +1,238 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator, Optional
+from logging import Logger
+from ad_fast_api.snippets.sources.ad_env import fetch_env_from_os_or_default
+from ad_fast_api.domain.make_animation.sources.features.image_to_animation import (
+    get_render_status,
+    cancel_render_async,
+)
+from ad_fast_api.domain.make_animation.sources.features.render_status_file import (
+    get_render_status_watcher,
+    read_render_status_file,
+)
+
+
+RENDER_RECONNECT_GRACE_SECONDS_ENV = "AD_RENDER_RECONNECT_GRACE_SECONDS"
+# 유예 시간이 지난 뒤 실행중인 렌더링이 끝나기를 기다리는 최대 시간
+MAX_RENDER_WAIT_SECONDS = 60 * 3
+
+
+class RenderSession:
+    """
+    웹소켓 연결과 별개로 진행되는 렌더링 작업입니다.
+    같은 ad_id, ad_animation의 연결들은 하나의 작업을 함께 기다리며,
+    모든 연결이 끊겨도 유예 시간 동안 유지되어 다시 연결하면 이어서 진행합니다.
+    """
+
+    def __init__(
+        self,
+        job_id: str,
+        status_file_path: Path,
+    ):
+        self.job_id = job_id
+        self.status_file_path = status_file_path
+        self.started_at = time.monotonic()
+        # 작업이 대기열에서 나와 렌더링을 시작한 것을 처음 확인한 시각
+        self.rendering_started_at: Optional[float] = None
+        self.connection_count = 1
+        self.expire_task: Optional[asyncio.Task] = None
+
+    def get_elapsed_seconds(self) -> int:
+        return int(time.monotonic() - self.started_at)
+
+
+# key: 애니메이션 파일 경로 (ad_id, ad_animation 별로 하나)
+_render_sessions: dict[str, RenderSession] = {}
+# key별 렌더링 시작 lock과 lock을 기다리는 연결 수
+_render_start_locks: dict[str, tuple[asyncio.Lock, int]] = {}
+
+
+def get_render_reconnect_grace_seconds() -> float:
+    return float(
+        fetch_env_from_os_or_default(RENDER_RECONNECT_GRACE_SECONDS_ENV, "60")
+    )
+
+
+def get_render_session_key(video_file_path: Path) -> str:
+    return str(video_file_path)
+
+
+@asynccontextmanager
+async def lock_render_start(video_file_path: Path) -> AsyncIterator[None]:
+    """
+    같은 애니메이션의 렌더링 시작을 한 연결씩 진행합니다.
+    먼저 시작한 연결이 작업을 등록하면 뒤의 연결은 attach_render_session으로 같은 작업에 연결합니다.
+    """
+    key = get_render_session_key(video_file_path)
+    lock, waiter_count = _render_start_locks.get(key, (asyncio.Lock(), 0))
+    _render_start_locks[key] = (lock, waiter_count + 1)
+    try:
+        async with lock:
+            yield
+    finally:
+        lock, waiter_count = _render_start_locks[key]
+        if waiter_count <= 1:
+            del _render_start_locks[key]
+        else:
+            _render_start_locks[key] = (lock, waiter_count - 1)
+
+
+def open_render_session(
+    video_file_path: Path,
+    job_id: str,
+    status_file_path: Path,
+) -> RenderSession:
+    render_session = RenderSession(
+        job_id=job_id,
+        status_file_path=status_file_path,
+    )
+    _render_sessions[get_render_session_key(video_file_path)] = render_session
+    return render_session
+
+
+def attach_render_session(video_file_path: Path) -> Optional[RenderSession]:
+    """진행중인 렌더링 작업이 있으면 연결을 추가하고 유예 시간 만료를 취소한 뒤 반환합니다."""
+    render_session = _render_sessions.get(get_render_session_key(video_file_path))
+    if render_session is None:
+        return None
+
+    render_session.connection_count += 1
+    if render_session.expire_task is not None:
+        render_session.expire_task.cancel()
+        render_session.expire_task = None
+    return render_session
+
+
+def mark_rendering_started(video_file_path: Path) -> float:
+    """
+    작업이 대기열에서 나와 렌더링을 시작했음을 기록하고, 처음 확인한 시각(time.monotonic)을 반환합니다.
+    다시 연결한 연결도 같은 시각부터 렌더링 최대 시간을 셉니다.
+    """
+    render_session = _render_sessions.get(get_render_session_key(video_file_path))
+    if render_session is None:
+        return time.monotonic()
+    if render_session.rendering_started_at is None:
+        render_session.rendering_started_at = time.monotonic()
+    return render_session.rendering_started_at
+
+
+def is_last_render_connection(video_file_path: Path) -> bool:
+    render_session = _render_sessions.get(get_render_session_key(video_file_path))
+    return render_session is None or render_session.connection_count <= 1
+
+
+def close_render_session(video_file_path: Path) -> bool:
+    """
+    연결 하나가 끝났음을 기록합니다.
+    작업을 기다리는 마지막 연결이었으면 작업을 정리하고 True를 반환합니다.
+    """
+    key = get_render_session_key(video_file_path)
+    render_session = _render_sessions.get(key)
+    if render_session is None:
+        return True
+
+    render_session.connection_count -= 1
+    if render_session.connection_count > 0:
+        return False
+
+    del _render_sessions[key]
+    expire_task = render_session.expire_task
+    if expire_task is not None and expire_task is not asyncio.current_task():
+        expire_task.cancel()
+    return True
+
+
+def detach_render_session(
+    video_file_path: Path,
+    logger: Logger,
+) -> bool:
+    """
+    연결이 끊긴 렌더링 작업을 유지합니다.
+    같은 작업을 기다리는 다른 연결이 있으면 그대로 두고, 마지막 연결이었으면 유예 시간을 시작합니다.
+    유예 시간이 설정되지 않았거나 진행중인 작업이 없으면 False를 반환합니다.
+    """
+    grace_seconds = get_render_reconnect_grace_seconds()
+    render_session = _render_sessions.get(get_render_session_key(video_file_path))
+    if render_session is None:
+        return False
+    if render_session.connection_count > 1:
+        render_session.connection_count -= 1
+        return True
+    if grace_seconds <= 0:
+        return False
+
+    render_session.connection_count = 0
+
+    if render_session.expire_task is not None:
+        render_session.expire_task.cancel()
+    render_session.expire_task = asyncio.create_task(
+        expire_render_session(
+            video_file_path=video_file_path,
+            render_session=render_session,
+            grace_seconds=grace_seconds,
+            logger=logger,
+        )
+    )
+    logger.info(
+        f"Waiting {grace_seconds} seconds for the client to reconnect. job_id: {render_session.job_id}"
+    )
+    return True
+
+
+async def expire_render_session(
+    video_file_path: Path,
+    render_session: RenderSession,
+    grace_seconds: float,
+    logger: Logger,
+):
+    """
+    유예 시간 동안 다시 연결되지 않으면 작업을 정리합니다.
+    - 대기열에서 시작하지 않은 작업은 취소합니다.
+    - 실행중인 작업은 끝까지 렌더링하여 결과를 캐시에 남기고, 끝날 때까지 다시 연결할 수 있습니다.
+    """
+    await asyncio.sleep(grace_seconds)
+
+    job_id = render_session.job_id
+    render_status = read_render_status_file(render_session.status_file_path)
+    if render_status is None:
+        try:
+            render_status = await get_render_status(
+                job_id=job_id,
+                logger=logger,
+                timeout_seconds=7,
+            )
+        except Exception:
+            render_status = None
+
+    if render_status is not None and not render_status["is_finished"]:
+        progress = render_status["progress"] or {}
+        if progress.get("phase") == "queued":
+            logger.info(f"The client did not reconnect. job_id: {job_id}")
+            await cancel_render_async(job_id=job_id, logger=logger)
+        else:
+            # 웹소켓 연결들과 같은 watcher에서 상태 파일이 완료로 바뀌기를 기다림
+            try:
+                async with asyncio.timeout(MAX_RENDER_WAIT_SECONDS):
+                    async with get_render_status_watcher().watch(
+                        render_session.status_file_path
+                    ) as render_statuses:
+                        while True:
+                            render_status = await render_statuses.get()
+                            if (
+                                render_status is not None
+                                and render_status["is_finished"]
+                            ):
+                                break
+            except TimeoutError:
+                logger.warning(
+                    f"The rendering did not finish in time. job_id: {job_id}"
+                )
+
+    # 그 사이 같은 애니메이션의 새 작업이 시작되었으면 그대로 둠
+    key = get_render_session_key(video_file_path)
+    if _render_sessions.get(key) is render_session:
+        del _render_sessions[key]
+    render_session.status_file_path.unlink(missing_ok=True)
@@ -0,0 +1,172 @@
+import asyncio
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator, Optional
+import yaml
+from ad_fast_api.snippets.sources.ad_env import fetch_env_from_os_or_default
+from ad_fast_api.domain.make_animation.sources.make_animation_schema import (
+    RenderStatus,
+    create_render_status,
+)
+
+
+# animated_drawings 서버가 상태 파일에 쓰는 작업 상태
+FINISHED_RENDER_JOB_STATUSES = ["FINISHED", "FAILED", "CANCELED"]
+FAILED_RENDER_JOB_STATUSES = ["FAILED", "CANCELED"]
+RENDER_STATUS_POLL_SECONDS_ENV = "AD_RENDER_STATUS_POLL_SECONDS"
+
+
+def read_render_status_file(
+    status_file_path: Path,
+) -> Optional[RenderStatus]:
+    """
+    animated_drawings 서버가 공유 workspace에 쓴 render 상태 파일을 읽습니다.
+    파일이 없거나 읽을 수 없으면 None을 반환합니다.
+    """
+    try:
+        with open(status_file_path.as_posix(), "r") as f:
+            content = yaml.safe_load(f) or {}
+    except (OSError, yaml.YAMLError):
+        return None
+
+    status = content.get("status")
+    return create_render_status(
+        is_finished=status in FINISHED_RENDER_JOB_STATUSES,
+        progress=content.get("progress"),
+        status=status,
+        exit_code=content.get("exit_code"),
+        error=content.get("error"),
+    )
+
+
+class RenderStatusWatcher:
+    """
+    웹소켓 연결들이 기다리는 상태 파일을 하나의 task에서 poll_seconds마다 확인합니다.
+    연결마다 깨어나지 않고 같은 파일을 기다리는 연결은 한 번만 확인하지만,
+    확인(stat) 비용은 기다리는 상태 파일 수에 비례합니다.
+    확인과 바뀐 파일 읽기는 한 번에 모아 스레드에서 실행하므로 event loop를 막지 않으며,
+    상태 파일이 바뀌면 poll_seconds 이내에 기다리는 연결에 새 상태를 전달합니다.
+    기다리는 연결이 없으면 확인 task를 종료합니다.
+    """
+
+    def __init__(
+        self,
+        poll_seconds: float,
+    ):
+        self.poll_seconds = poll_seconds
+        self._queues: dict[Path, set[asyncio.Queue]] = {}
+        self._mtimes: dict[Path, Optional[int]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def watching_count(self) -> int:
+        return sum(len(queues) for queues in self._queues.values())
+
+    @staticmethod
+    def _get_mtime(status_file_path: Path) -> Optional[int]:
+        try:
+            return status_file_path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    @staticmethod
+    def _put_latest(
+        queue: asyncio.Queue,
+        render_status: Optional[RenderStatus],
+    ):
+        # 읽지 않은 이전 상태는 버리고 최신 상태만 남김
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(render_status)
+
+    @classmethod
+    def _read_status(
+        cls,
+        status_file_path: Path,
+    ) -> tuple[Optional[int], Optional[RenderStatus]]:
+        mtime = cls._get_mtime(status_file_path)
+        if mtime is None:
+            return None, None
+        return mtime, read_render_status_file(status_file_path)
+
+    @classmethod
+    def _read_changes(
+        cls,
+        mtimes: dict[Path, Optional[int]],
+    ) -> list[tuple[Path, Optional[int], Optional[RenderStatus]]]:
+        """스레드에서 실행됩니다. 마지막으로 읽은 뒤 바뀐 상태 파일만 읽습니다."""
+        changes = []
+        for status_file_path, last_mtime in mtimes.items():
+            if cls._get_mtime(status_file_path) == last_mtime:
+                continue
+            changes.append((status_file_path, *cls._read_status(status_file_path)))
+        return changes
+
+    async def _publish_changes(self):
+        changes = await asyncio.to_thread(self._read_changes, dict(self._mtimes))
+        for status_file_path, mtime, render_status in changes:
+            # 읽는 동안 기다리는 연결이 모두 끝난 파일은 건너뜀
+            queues = self._queues.get(status_file_path)
+            if queues is None:
+                continue
+            self._mtimes[status_file_path] = mtime
+            for queue in queues:
+                self._put_latest(queue, render_status)
+
+    async def _poll(self):
+        while self._queues:
+            await asyncio.sleep(self.poll_seconds)
+            await self._publish_changes()
+
+    def _ensure_polling(self):
+        # task는 만들어진 이벤트 루프에서만 실행됨
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            self._task = loop.create_task(self._poll())
+
+    @asynccontextmanager
+    async def watch(
+        self,
+        status_file_path: Path,
+    ) -> AsyncIterator[asyncio.Queue]:
+        """
+        상태 파일의 현재 상태와 이후 바뀐 상태를 받는 queue를 반환합니다.
+        파일이 없거나 삭제되면 None을 받습니다.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        mtime, render_status = await asyncio.to_thread(
+            self._read_status, status_file_path
+        )
+        if status_file_path not in self._queues:
+            self._queues[status_file_path] = set()
+            self._mtimes[status_file_path] = mtime
+        self._queues[status_file_path].add(queue)
+        self._put_latest(queue, render_status)
+        self._ensure_polling()
+
+        try:
+            yield queue
+        finally:
+            queues = self._queues[status_file_path]
+            queues.discard(queue)
+            if not queues:
+                del self._queues[status_file_path]
+                del self._mtimes[status_file_path]
+            if not self._queues and self._task is not None:
+                self._task.cancel()
+                self._task = None
+
+
+# lazy init
+_render_status_watcher = None
+
+
+def get_render_status_watcher() -> RenderStatusWatcher:
+    global _render_status_watcher
+    if _render_status_watcher is None:
+        _render_status_watcher = RenderStatusWatcher(
+            poll_seconds=float(
+                fetch_env_from_os_or_default(RENDER_STATUS_POLL_SECONDS_ENV, "0.2")
+            ),
+        )
+    return _render_status_watcher
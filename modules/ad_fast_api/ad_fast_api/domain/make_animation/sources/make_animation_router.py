@@ -1,18 +1,32 @@
-from fastapi import APIRouter, WebSocket, FastAPI
-from fastapi.responses import FileResponse
+from pathlib import Path
+from typing import Optional
+from fastapi import APIRouter, WebSocket, FastAPI, Request, Response
 from ad_fast_api.domain.make_animation.sources.features.make_animation_feature import (
     prepare_make_animation,
     get_file_response,
+    get_download_animation_path,
+    get_accepted_video_formats,
+    start_background_full_render,
     check_connection_and_rendering,
 )
 from ad_fast_api.domain.make_animation.sources.features.check_make_animation_info import (
     check_available_animation,
+    check_available_quality,
+    check_available_video_format,
     get_video_file_path,
 )
 from ad_fast_api.domain.make_animation.sources.features.image_to_animation import (
     start_render_async,
 )
-from ad_fast_api.workspace.sources.conf_workspace import get_base_path
+from ad_fast_api.domain.make_animation.sources.features.render_session import (
+    open_render_session,
+    attach_render_session,
+    lock_render_start,
+)
+from ad_fast_api.workspace.sources.conf_workspace import (
+    get_base_path,
+    get_render_status_file_name,
+)
 from ad_fast_api.snippets.sources.ad_websocket import (
     custom_openapi,
 )
@@ -21,6 +35,9 @@ from ad_fast_api.domain.make_animation.sources.errors.make_animation_500_status
     NOT_FOUND_ANIMATION_FILE,
 )
 from ad_fast_api.domain.make_animation.sources.make_animation_schema import (
+    ADRenderQuality,
+    ADVideoFormat,
+    RenderPriority,
     WebSocketType,
     create_websocket_message,
 )
@@ -36,13 +53,24 @@ async def make_animation_websocket(
     websocket: WebSocket,
     ad_id: str,
     ad_animation: str,
+    video_format: str = ADVideoFormat.gif.value,
+    quality: str = ADRenderQuality.full.value,
+    background_full_render: bool = False,
 ):
     """
     웹소켓 연결 수락 후 애니메이션 렌더링 시작 요청을 보냅니다.
-    5초마다 ping 메시지와 pong 응답을 주고 받으며, 최대 3번의 재시도를 통해 연결상태를 확인합니다.
-    연결이 중단되면 렌더링 중단을 요청합니다.
+    video_format(gif, mp4, webm)으로 출력 형식을 선택하며, 형식마다 따로 렌더링합니다.
+    quality=preview는 해상도 절반, 2 프레임마다 한 프레임, motion 앞부분만 높은 우선순위로 렌더링하여
+    캐릭터가 잘 움직이는지 빠르게 확인합니다. 전체 렌더링은 확인 후 quality=full로 다시 요청하거나,
+    background_full_render=true이면 미리보기 완료 시 낮은 우선순위로 예약합니다. (완료 메시지의 full_render_job_id)
+    AD_WEBSOCKET_HEARTBEAT_SECONDS(기본 5초)마다 ping 메시지와 pong 응답을 주고 받으며 연결상태를 확인합니다.
+    같은 ad_id, ad_animation의 연결이 동시에 들어오면 하나의 렌더링 작업을 함께 기다립니다.
+    연결이 중단되면 유예 시간(AD_RENDER_RECONNECT_GRACE_SECONDS) 동안 렌더링을 유지하며,
+    그 사이 같은 ad_id, ad_animation으로 다시 연결하면 진행중인 렌더링 작업에 이어서 연결합니다.
 
-    렌더링 완료는 1초마다 확인하며, 렌더링 완료 시 파일 전송을 시작합니다.
+    렌더링 완료는 상태 파일이 바뀌는 즉시 확인하며, 보상 광고 시간(AD_REWARD_ADVERTISEMENT_SECONDS)이
+    지난 뒤 완료 메시지를 전송합니다.
+    작업이 대기열에서 나온 뒤 렌더링 최대 시간(AD_MAX_RENDER_SECONDS)이 지나면 에러 메시지를 전송합니다.
     파일 전송 완료 시 웹소켓 연결을 종료합니다.
     """
     base_path = get_base_path(ad_id=ad_id)
@@ -58,9 +86,11 @@ async def make_animation_websocket(
         await websocket.close()
         return
 
-    # 애니메이션 이름 유효성 검사
+    # 애니메이션 이름, 형식 유효성 검사
     try:
         check_available_animation(ad_animation, logger)
+        check_available_video_format(video_format, logger)
+        check_available_quality(quality, logger)
     except Exception as e:
         await websocket.send_json(
             create_websocket_message(
@@ -76,8 +106,76 @@ async def make_animation_websocket(
         base_path=base_path,
         ad_animation=ad_animation,
         logger=logger,
+        video_format=video_format,
+        quality=quality,
     )
 
+    # 같은 애니메이션의 연결들이 동시에 렌더링을 시작하지 않도록 한 연결씩 진행
+    async with lock_render_start(video_file_path):
+        # 진행중인 렌더링 작업이 있으면 새로 렌더링하지 않고 같은 작업에 연결
+        render_session = attach_render_session(video_file_path)
+        if render_session is not None:
+            job_id = render_session.job_id
+            start_timer = render_session.get_elapsed_seconds()
+            logger.info(f"Attached to the rendering job in progress. job_id: {job_id}")
+            await websocket.send_json(
+                create_websocket_message(
+                    type=WebSocketType.RUNNING,
+                    message="Attached to the animation rendering in progress.",
+                    data={
+                        "job_id": job_id,
+                        "reattached": True,
+                    },
+                )
+            )
+        else:
+            job_id = await start_render_session(
+                ad_id=ad_id,
+                websocket=websocket,
+                logger=logger,
+                base_path=base_path,
+                ad_animation=ad_animation,
+                video_format=video_format,
+                quality=quality,
+                background_full_render=background_full_render,
+                video_file_path=video_file_path,
+                relative_video_file_path=relative_video_file_path,
+            )
+            start_timer = 0
+            if job_id is None:
+                return
+
+    await check_rendering_and_complete(
+        ad_id=ad_id,
+        ad_animation=ad_animation,
+        video_format=video_format,
+        quality=quality,
+        background_full_render=background_full_render,
+        job_id=job_id,
+        websocket=websocket,
+        logger=logger,
+        base_path=base_path,
+        relative_video_file_path=relative_video_file_path,
+        start_timer=start_timer,
+    )
+
+
+async def start_render_session(
+    ad_id: str,
+    websocket: WebSocket,
+    logger: logging.Logger,
+    base_path: Path,
+    ad_animation: str,
+    video_format: str,
+    quality: str,
+    background_full_render: bool,
+    video_file_path: Path,
+    relative_video_file_path: Path,
+) -> Optional[str]:
+    """
+    렌더링을 시작하고 작업을 등록합니다.
+    이미 애니메이션 파일이 있거나 시작하지 못하면 결과를 전송하고 연결을 종료한 뒤 None을 반환합니다.
+    """
     if video_file_path.exists():
         await websocket.send_json(
             create_websocket_message(
@@ -85,11 +183,21 @@ async def make_animation_websocket(
                 message="Animation rendering has been completed.",
                 data={
                     "file_path": str(relative_video_file_path),
+                    **await create_complete_data(
+                        ad_id=ad_id,
+                        base_path=base_path,
+                        ad_animation=ad_animation,
+                        video_format=video_format,
+                        quality=quality,
+                        background_full_render=background_full_render,
+                        video_file_path=video_file_path,
+                        logger=logger,
+                    ),
                 },
             )
         )
         await websocket.close()
-        return
+        return None
 
     # 애니메이션 렌더링 준비
     try:
@@ -98,6 +206,8 @@ async def make_animation_websocket(
             base_path=base_path,
             ad_animation=ad_animation,
             relative_video_file_path=relative_video_file_path,
+            video_format=video_format,
+            quality=quality,
         )
     except Exception as e:
         logger.error(f"Error preparing make animation: {e}")
@@ -108,18 +218,22 @@ async def make_animation_websocket(
             )
         )
         await websocket.close()
-        return
+        return None
 
     # 애니메이션 렌더링 시작 요청
+    # 미리보기는 대기열에서 먼저 실행
     start_websocket_message = await start_render_async(
         animated_drawings_mvc_cfg_path=animated_drawings_mvc_cfg_path,
         logger=logger,
+        priority=(
+            RenderPriority.HIGH if quality == ADRenderQuality.preview else None
+        ),
     )
     await websocket.send_json(start_websocket_message)
     start_type = start_websocket_message["type"]
     if start_type != WebSocketType.RUNNING:
         await websocket.close()
-        return
+        return None
 
     # 렌더링 작업 ID 추출
     job_id = get_value_from_dict(
@@ -135,8 +249,58 @@ async def make_animation_websocket(
             )
         )
         await websocket.close()
-        return
+        return None
+
+    open_render_session(
+        video_file_path=video_file_path,
+        job_id=job_id,
+        status_file_path=base_path.joinpath(get_render_status_file_name(job_id)),
+    )
+    return job_id
+
+
+async def create_complete_data(
+    ad_id: str,
+    base_path: Path,
+    ad_animation: str,
+    video_format: str,
+    quality: str,
+    background_full_render: bool,
+    video_file_path: Path,
+    logger: logging.Logger,
+) -> dict:
+    data = {
+        "download_path": await get_download_animation_path(
+            ad_id=ad_id,
+            ad_animation=ad_animation,
+            video_file_path=video_file_path,
+            quality=quality,
+        ),
+    }
+    if quality == ADRenderQuality.preview and background_full_render:
+        data["full_render_job_id"] = await start_background_full_render(
+            ad_id=ad_id,
+            base_path=base_path,
+            ad_animation=ad_animation,
+            video_format=video_format,
+            logger=logger,
+        )
+    return data
 
+
+async def check_rendering_and_complete(
+    ad_id: str,
+    ad_animation: str,
+    video_format: str,
+    quality: str,
+    background_full_render: bool,
+    job_id: str,
+    websocket: WebSocket,
+    logger: logging.Logger,
+    base_path: Path,
+    relative_video_file_path: Path,
+    start_timer: int = 0,
+):
     # 주기적으로 렌더링 작업 확인
     try:
         await check_connection_and_rendering(
@@ -145,6 +309,7 @@ async def make_animation_websocket(
             logger=logger,
             base_path=base_path,
             relative_video_file_path=relative_video_file_path,
+            start_timer=start_timer,
         )
     except Exception as e:
         await websocket.send_json(
@@ -161,6 +326,16 @@ async def make_animation_websocket(
         create_websocket_message(
             type=WebSocketType.COMPLETE,
             message="Animation rendering has been completed.",
+            data=await create_complete_data(
+                ad_id=ad_id,
+                base_path=base_path,
+                ad_animation=ad_animation,
+                video_format=video_format,
+                quality=quality,
+                background_full_render=background_full_render,
+                video_file_path=base_path.joinpath(relative_video_file_path),
+                logger=logger,
+            ),
         )
     )
     await websocket.close()
@@ -168,40 +343,68 @@ async def make_animation_websocket(
 
 @router.get(
     "/download_animation",
-    response_class=FileResponse,
+    response_class=Response,
     responses={
         200: {
-            "content": {"image/gif": {}},
-            "description": "Animation gif file.",
-        }
+            "content": {"image/gif": {}, "video/mp4": {}, "video/webm": {}},
+            "description": "Animation file.",
+        },
+        206: {
+            "content": {"image/gif": {}, "video/mp4": {}, "video/webm": {}},
+            "description": "Requested byte range of the animation file.",
+        },
+        304: {
+            "description": "The animation file has not been modified.",
+        },
     },
 )
 async def download_animation(
+    request: Request,
     ad_id: str,
     ad_animation: str,
-) -> FileResponse:
+    video_format: Optional[ADVideoFormat] = None,
+    quality: ADRenderQuality = ADRenderQuality.full,
+    v: Optional[str] = None,
+) -> Response:
     """
-    애니메이션 파일 다운로드
+    애니메이션 파일 다운로드 (quality=preview이면 미리보기 파일)
+    video_format(gif, mp4, webm)이 없으면 Accept 헤더에서 받을 수 있는 형식 중
+    렌더링된 파일이 있는 형식을 선호 순서대로 선택합니다. (Accept 헤더가 없으면 gif)
+    ETag(파일 내용 해시), Last-Modified로 조건부 요청을 받으면 바뀌지 않은 파일은 304로 응답하고,
+    Range 요청은 요청한 범위만 전송하여 끊긴 다운로드를 이어 받을 수 있습니다.
+    렌더링 완료 메시지의 download_path처럼 v(파일 내용 해시)가 현재 파일과 같으면 immutable로 캐시합니다.
     """
     base_path = get_base_path(ad_id=ad_id)
     logger = setup_logger(ad_id=ad_id)
 
-    video_file_path, relative_video_file_path = get_video_file_path(
-        base_path=base_path,
-        ad_animation=ad_animation,
-        logger=logger,
+    video_formats = (
+        [video_format]
+        if video_format is not None
+        else get_accepted_video_formats(request.headers.get("accept"))
     )
-    if not video_file_path.exists():
+    for candidate_video_format in video_formats:
+        video_file_path, relative_video_file_path = get_video_file_path(
+            base_path=base_path,
+            ad_animation=ad_animation,
+            logger=logger,
+            video_format=candidate_video_format.value,
+            quality=quality.value,
+        )
+        if video_file_path.exists():
+            break
+    else:
         raise NOT_FOUND_ANIMATION_FILE
 
-    file_response = get_file_response(
+    response = await get_file_response(
         base_path=base_path,
         relative_video_file_path=relative_video_file_path,
+        request_headers=request.headers,
+        version=v,
     )
-    # 파일 크기를 계산하여 Content-Length 헤더에 추가합니다.
-    file_size = video_file_path.stat().st_size
-    file_response.headers["Content-Length"] = str(file_size)
-    return file_response
+    if video_format is None:
+        # 같은 URL이라도 Accept 헤더에 따라 다른 형식을 응답하므로 캐시가 구분하도록 함
+        response.headers["vary"] = "Accept"
+    return response
 
 
 def make_animation_openapi(app: FastAPI):
@@ -7,10 +7,37 @@ class ADAnimation(str, Enum):
     zombie = "zombie"
 
 
+class ADVideoFormat(str, Enum):
+    gif = "gif"
+    mp4 = "mp4"
+    webm = "webm"
+
+
+class ADRenderQuality(str, Enum):
+    # 해상도 절반, 2 프레임마다 한 프레임, 앞부분만 렌더링하여 빠르게 확인
+    preview = "preview"
+    full = "full"
+
+
+# animated_drawings 서버의 RenderPriority와 같아야 함
+class RenderPriority(str, Enum):
+    HIGH = "HIGH"
+    NORMAL = "NORMAL"
+    LOW = "LOW"
+
+
+VIDEO_FORMAT_MEDIA_TYPES = {
+    ADVideoFormat.gif: "image/gif",
+    ADVideoFormat.mp4: "video/mp4",
+    ADVideoFormat.webm: "video/webm",
+}
+
+
 class WebSocketType(str, Enum):
     ERROR = "ERROR"
     RUNNING = "RUNNING"
     FULL_JOB = "FULL_JOB"
+    PROGRESS = "PROGRESS"
     COMPLETE = "COMPLETE"
 
 
@@ -31,3 +58,28 @@ def create_websocket_message(
         "message": message or "",
         "data": data or {},
     }
+
+
+class RenderStatus(TypedDict):
+    is_finished: bool
+    progress: Optional[dict[str, Any]]
+    # 종료된 작업의 상태 (FINISHED, FAILED, CANCELED)와 실패 이유
+    status: Optional[str]
+    exit_code: Optional[int]
+    error: Optional[str]
+
+
+def create_render_status(
+    is_finished: bool,
+    progress: Optional[dict[str, Any]] = None,
+    status: Optional[str] = None,
+    exit_code: Optional[int] = None,
+    error: Optional[str] = None,
+) -> RenderStatus:
+    return {
+        "is_finished": is_finished,
+        "progress": progress or None,
+        "status": status,
+        "exit_code": exit_code,
+        "error": error,
+    }
@@ -29,9 +29,13 @@ async def case_make_animation_router(ad_id: str):
     from ad_fast_api.snippets.sources import ad_env
     from ad_fast_api.snippets.sources.ad_env import ADEnv
 
-    mock_zero_client = image_to_animation.get_zero_client(
+    from ad_fast_api.snippets.sources.ad_zero_client import ADZeroClient
+
+    mock_zero_client = ADZeroClient(
         host="localhost",
-        timeout=60 * 1000,
+        port=8001,
+        timeout_seconds=60,
+        max_failures=3,
     )
     mock_ad_env = ADEnv(
         internal_port=8001,
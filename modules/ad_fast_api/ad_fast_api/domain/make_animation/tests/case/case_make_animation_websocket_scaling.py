@@ -0,0 +1,174 @@
+import os
+import time
+import random
+import asyncio
+import logging
+import tempfile
+import statistics
+from pathlib import Path
+import yaml
+from fastapi import WebSocketDisconnect
+from ad_fast_api.domain.make_animation.sources.features import make_animation_feature
+from ad_fast_api.domain.make_animation.sources.features.render_status_file import (
+    read_render_status_file,
+    get_render_status_watcher,
+)
+from ad_fast_api.workspace.sources.conf_workspace import get_render_status_file_name
+
+
+NUM_SESSIONS_LIST = [100, 1000, 3000]
+IDLE_SECONDS = 5
+# 렌더링 워커 수가 적어 작업은 하나씩 끝나므로 일부 작업을 차례로 완료하며 지연 시간을 측정
+NUM_LATENCY_SAMPLES = 50
+FINISH_INTERVAL_SECONDS = 0.05
+RELATIVE_VIDEO_FILE_PATH = Path("video.gif")
+
+os.environ.setdefault(make_animation_feature.REWARD_ADVERTISEMENT_SECONDS_ENV, "0")
+
+
+class StandInWebSocket:
+    """
+    PING 메시지를 받으면 바로 PONG으로 응답하는 클라이언트 웹소켓 입니다.
+    네트워크 없이 서버 쪽 세션 처리 비용만 측정합니다.
+    """
+
+    def __init__(self):
+        self.ping_count = 0
+        self._received_messages: asyncio.Queue = asyncio.Queue()
+
+    async def send_json(self, data):
+        if data["type"] == "PING":
+            self.ping_count += 1
+            self._received_messages.put_nowait(
+                {"type": "PONG", "message": "", "data": {}}
+            )
+
+    async def receive_json(self):
+        return await self._received_messages.get()
+
+
+async def check_tick_loop(
+    job_id: str,
+    base_path: Path,
+    relative_video_file_path: Path,
+    websocket: StandInWebSocket,
+    logger: logging.Logger,
+):
+    """
+    비교를 위한 이전 방식입니다.
+    연결마다 1초마다 깨어나 상태 파일을 읽고, 5초마다 ping/pong을 주고 받습니다.
+    """
+    status_file_path = base_path.joinpath(get_render_status_file_name(job_id))
+    timer = 0
+    while True:
+        if timer % 5 == 0:
+            await websocket.send_json({"type": "PING", "message": "", "data": {}})
+            response = await websocket.receive_json()
+            if response["type"] != "PONG":
+                raise WebSocketDisconnect(code=1000)
+        render_status = read_render_status_file(status_file_path)
+        if render_status is not None and render_status["is_finished"]:
+            return
+        timer += 1
+        await asyncio.sleep(1)
+
+
+def write_status_file(
+    base_path: Path,
+    job_id: str,
+    status: str,
+):
+    base_path.joinpath(get_render_status_file_name(job_id)).write_text(
+        yaml.dump({"job_id": job_id, "status": status, "progress": {}})
+    )
+
+
+async def measure_sessions(
+    num_sessions: int,
+    check_session,
+) -> tuple[float, list[float]]:
+    """
+    num_sessions개의 연결이 렌더링을 기다리는 동안의 CPU 사용률과
+    상태 파일이 완료로 바뀐 뒤 연결이 완료를 알기까지의 지연 시간을 반환합니다.
+    """
+    logger = logging.getLogger("case_make_animation_websocket_scaling")
+    logger.setLevel(logging.WARNING)
+    random.seed(0)
+    job_ids = [f"job_{i}" for i in range(num_sessions)]
+    finished_at: dict[str, float] = {}
+    completed_at: dict[str, float] = {}
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        base_path = Path(temp_dir)
+        base_path.joinpath(RELATIVE_VIDEO_FILE_PATH).write_bytes(b"GIF89a")
+        for job_id in job_ids:
+            write_status_file(base_path, job_id, "RUNNING")
+
+        async def run_session(job_id: str):
+            # 클라이언트마다 연결 시점이 다름
+            await asyncio.sleep(random.random())
+            await check_session(
+                job_id=job_id,
+                base_path=base_path,
+                relative_video_file_path=RELATIVE_VIDEO_FILE_PATH,
+                websocket=StandInWebSocket(),
+                logger=logger,
+            )
+            completed_at[job_id] = time.perf_counter()
+
+        tasks = [asyncio.create_task(run_session(job_id)) for job_id in job_ids]
+
+        # 렌더링을 기다리는 동안의 CPU 사용량
+        await asyncio.sleep(2)
+        cpu_start_time = time.process_time()
+        await asyncio.sleep(IDLE_SECONDS)
+        cpu_percent = (time.process_time() - cpu_start_time) / IDLE_SECONDS * 100
+
+        # 나머지 연결이 기다리는 동안 작업을 하나씩 완료
+        sample_job_ids = job_ids[:NUM_LATENCY_SAMPLES]
+        for job_id in sample_job_ids:
+            write_status_file(base_path, job_id, "FINISHED")
+            finished_at[job_id] = time.perf_counter()
+            await asyncio.sleep(FINISH_INTERVAL_SECONDS)
+        await asyncio.gather(*tasks[:NUM_LATENCY_SAMPLES])
+
+        for job_id in job_ids[NUM_LATENCY_SAMPLES:]:
+            write_status_file(base_path, job_id, "FINISHED")
+        await asyncio.gather(*tasks)
+
+    latencies = [
+        completed_at[job_id] - finished_at[job_id] for job_id in sample_job_ids
+    ]
+    return cpu_percent, latencies
+
+
+async def case_benchmark_make_animation_websocket_scaling():
+    print(
+        f"idle seconds: {IDLE_SECONDS}, "
+        f"heartbeat seconds: {make_animation_feature.get_websocket_heartbeat_seconds()}, "
+        f"status poll seconds: {get_render_status_watcher().poll_seconds}"
+    )
+    for num_sessions in NUM_SESSIONS_LIST:
+        for name, check_session in [
+            ("tick loop", check_tick_loop),
+            ("event driven", make_animation_feature.check_connection_and_rendering),
+        ]:
+            cpu_percent, latencies = await measure_sessions(
+                num_sessions=num_sessions,
+                check_session=check_session,
+            )
+            latencies.sort()
+            print(
+                f"sessions {num_sessions}, {name}: "
+                f"idle cpu {cpu_percent:.1f}%, "
+                f"completion latency p50 {statistics.median(latencies) * 1000:.0f}ms, "
+                f"p99 {latencies[int(len(latencies) * 0.99) - 1] * 1000:.0f}ms, "
+                f"max {latencies[-1] * 1000:.0f}ms"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(case_benchmark_make_animation_websocket_scaling())
+
+
+# python -m ad_fast_api.domain.make_animation.tests.case.case_make_animation_websocket_scaling
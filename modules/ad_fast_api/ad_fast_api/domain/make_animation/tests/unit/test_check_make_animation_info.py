@@ -3,7 +3,10 @@ from unittest.mock import patch
 from ad_fast_api.domain.make_animation.sources.features import (
     check_make_animation_info as cmai,
 )
-from ad_fast_api.domain.make_animation.sources.make_animation_schema import ADAnimation
+from ad_fast_api.domain.make_animation.sources.make_animation_schema import (
+    ADAnimation,
+    ADVideoFormat,
+)
 from ad_fast_api.workspace.sources.conf_workspace import (
     get_video_file_name,
     VIDEO_DIR_NAME,
@@ -62,3 +65,13 @@ def test_get_video_file_path(tmp_path, mock_logger):
     )
     assert video_file_path == expected_video_file_path
     assert relative_video_file_path == expected_relative_video_file_path
+
+
+def test_check_available_video_format(mock_logger):
+    # when
+    cmai.check_available_video_format(ADVideoFormat.webm.value, mock_logger)
+    with pytest.raises(Exception) as excinfo:
+        cmai.check_available_video_format("avi", mock_logger)
+
+    # then
+    assert "Invalid video format" in str(excinfo.value)
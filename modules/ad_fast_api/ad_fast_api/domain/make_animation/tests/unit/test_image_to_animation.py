@@ -6,6 +6,7 @@ from ad_fast_api.domain.make_animation.sources.features import (
     image_to_animation as img_anim,
 )
 from ad_fast_api.domain.make_animation.sources.make_animation_schema import (
+    RenderPriority,
     WebSocketType,
 )
 
@@ -247,3 +248,72 @@ async def test_is_finish_render_exception():
         with pytest.raises(Exception) as excinfo:
             await img_anim.is_finish_render("job123", logger, timeout_seconds=1)
         assert "Test exception" in str(excinfo.value)
+
+
+@pytest.mark.asyncio
+async def test_get_render_status_with_progress():
+    """
+    get_render_status 함수가 'RUNNING' 응답의 진행 상황을 반환하는지 확인합니다.
+    """
+    progress = {"phase": "rendering", "frames_done": 5, "total_frames": 10}
+    dummy_client = AsyncMock()
+    dummy_client.call.return_value = {
+        "type": "RUNNING",
+        "data": {"progress": progress},
+    }
+
+    with patch.object(img_anim, "get_zero_client", return_value=dummy_client):
+        logger = logging.getLogger("test_get_render_status_with_progress")
+        result = await img_anim.get_render_status("job123", logger, timeout_seconds=1)
+        assert result["is_finished"] is False
+        assert result["progress"] == progress
+
+
+@pytest.mark.asyncio
+async def test_get_render_status_with_failure():
+    """
+    get_render_status 함수가 'TERMINATE' 응답의 작업 상태와 실패 이유를 반환하는지 확인합니다.
+    """
+    dummy_client = AsyncMock()
+    dummy_client.call.return_value = {
+        "type": "TERMINATE",
+        "data": {"state": "FAILED", "exit_code": 3, "error": "render failed"},
+    }
+
+    with patch.object(img_anim, "get_zero_client", return_value=dummy_client):
+        logger = logging.getLogger("test_get_render_status_with_failure")
+        result = await img_anim.get_render_status("job123", logger, timeout_seconds=1)
+        assert result == {
+            "is_finished": True,
+            "progress": None,
+            "status": "FAILED",
+            "exit_code": 3,
+            "error": "render failed",
+        }
+
+
+@pytest.mark.asyncio
+async def test_start_render_with_priority():
+    """
+    우선순위를 지정하면 start_render_with_priority로 요청하는지 확인합니다.
+    """
+    dummy_client = AsyncMock()
+    dummy_client.call.return_value = {
+        "type": WebSocketType.RUNNING.value,
+        "data": {"job_id": "job123"},
+    }
+
+    with patch.object(img_anim, "get_zero_client", return_value=dummy_client):
+        logger = logging.getLogger("test_start_render_with_priority")
+        result = await img_anim.start_render_async(
+            Path("/dummy/path"),
+            logger,
+            timeout_seconds=1,
+            priority=RenderPriority.HIGH,
+        )
+        assert result["type"] == WebSocketType.RUNNING
+        dummy_client.call.assert_called_once_with(
+            "start_render_with_priority",
+            {"mvc_cfg_file_path": "/dummy/path", "priority": "HIGH"},
+            timeout_seconds=1,
+        )
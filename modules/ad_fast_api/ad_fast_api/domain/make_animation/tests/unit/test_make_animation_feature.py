@@ -1,13 +1,27 @@
+import asyncio
+import time
 import pytest
+import yaml
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 from ad_fast_api.domain.make_animation.sources.features import make_animation_feature
-from ad_fast_api.workspace.sources.conf_workspace import FILES_DIR_NAME
+from ad_fast_api.domain.make_animation.sources.features import render_session
+from ad_fast_api.domain.make_animation.sources.features import render_status_file
+from ad_fast_api.workspace.sources.conf_workspace import (
+    FILES_DIR_NAME,
+    get_mvc_cfg_file_name,
+)
 from ad_fast_api.snippets.sources.ad_env import ADEnv
-from fastapi import WebSocket, WebSocketDisconnect
+from fastapi import WebSocketDisconnect
+from ad_fast_api.domain.make_animation.sources.make_animation_schema import (
+    RenderPriority,
+    WebSocketType,
+    create_render_status,
+)
 
 
-def test_get_file_response(tmp_path: Path):
+@pytest.mark.asyncio
+async def test_get_file_response(tmp_path: Path):
     # 임시 디렉토리(tmp_path)를 기본 경로로 사용
     base_path = tmp_path
 
@@ -19,7 +33,7 @@ def test_get_file_response(tmp_path: Path):
     relative_video_file_path = Path(dummy_file_name)
 
     # 함수 호출: FileResponse 반환
-    response = make_animation_feature.get_file_response(
+    response = await make_animation_feature.get_file_response(
         base_path=base_path,
         relative_video_file_path=relative_video_file_path,
     )
@@ -28,10 +42,55 @@ def test_get_file_response(tmp_path: Path):
     expected_path = (base_path / relative_video_file_path).as_posix()
     # FileResponse의 'path' 속성이 예상 경로와 같아야 합니다.
     assert hasattr(response, "path")
-    assert response.path == expected_path
+    assert response.path == expected_path  # type: ignore
 
     # 미디어 타입이 "image/gif"로 지정되었는지 체크
     assert response.media_type == "image/gif"
+    assert response.headers["content-length"] == "6"
+
+
+@pytest.mark.asyncio
+async def test_get_download_animation_path(tmp_path: Path):
+    # given
+    video_file_path = tmp_path / "dab.gif"
+    video_file_path.write_bytes(b"GIF89a")
+
+    # when
+    download_path = await make_animation_feature.get_download_animation_path(
+        ad_id="ad_1",
+        ad_animation="dab",
+        video_file_path=video_file_path,
+    )
+    video_file_path.write_bytes(b"GIF89a changed")
+    changed_download_path = await make_animation_feature.get_download_animation_path(
+        ad_id="ad_1",
+        ad_animation="dab",
+        video_file_path=video_file_path,
+    )
+
+    # then: 파일 내용이 바뀌면 경로도 바뀜
+    assert download_path.startswith(
+        "/download_animation?ad_id=ad_1&ad_animation=dab"
+        "&video_format=gif&quality=full&v="
+    )
+    assert download_path != changed_download_path
+
+
+def test_get_accepted_video_formats():
+    # when, then
+    assert make_animation_feature.get_accepted_video_formats(None) == ["gif"]
+    assert make_animation_feature.get_accepted_video_formats("*/*") == [
+        "gif",
+        "mp4",
+        "webm",
+    ]
+    assert make_animation_feature.get_accepted_video_formats(
+        "image/gif;q=0.5, video/*;q=0.8, video/webm"
+    ) == ["webm", "mp4", "gif"]
+    assert make_animation_feature.get_accepted_video_formats(
+        "video/*, video/mp4;q=0"
+    ) == ["webm"]
+    assert make_animation_feature.get_accepted_video_formats("text/html") == []
 
 
 @patch(
@@ -83,288 +142,510 @@ def test_prepare_make_animation(
         animated_drawings_base_path=animated_drawings_base_path,
         animated_drawings_workspace_path=animated_drawings_workspace_path,
         ad_animation=ad_animation,
+        motion_cfg_path=None,
     )
     mock_create_mvc_config.assert_called_once_with(
         animated_drawings_dict=animated_drawing_dict,
         video_file_path=video_file_path,
         ad_animation=ad_animation,
+        video_format="gif",
+        quality="full",
     )
+    mvc_cfg_file_name = get_mvc_cfg_file_name(relative_video_file_path.name)
     mock_save_mvc_config.assert_called_once_with(
-        mvc_cfg_file_name=make_animation_feature.MVC_CFG_FILE_NAME,
+        mvc_cfg_file_name=mvc_cfg_file_name,
         mvc_cfg_dict=mvc_cfg_dict,
         base_path=base_path,
     )
 
-    expected_path = animated_drawings_base_path.joinpath(
-        make_animation_feature.MVC_CFG_FILE_NAME
-    )
+    expected_path = animated_drawings_base_path.joinpath(mvc_cfg_file_name)
     assert result == expected_path
 
 
-# 새로 추가된 period_finish_render 함수 테스트
-def test_period_finish_render():
-    # 보상 광고 시간(20초) 이하일 때는 항상 False 반환
-    assert not make_animation_feature.period_finish_render(timer=15, period=5)
-    assert not make_animation_feature.period_finish_render(timer=20, period=5)
+@pytest.mark.asyncio
+async def test_start_background_full_render(tmp_path: Path):
+    # given
+    logger = MagicMock()
+    start_websocket_message = {
+        "type": WebSocketType.RUNNING,
+        "message": "",
+        "data": {"job_id": "full_job"},
+    }
+
+    # when
+    with patch.object(
+        make_animation_feature,
+        "prepare_make_animation",
+        return_value=Path("mvc_cfg_dab_gif.yaml"),
+    ) as mock_prepare_make_animation, patch.object(
+        make_animation_feature,
+        "start_render_async",
+        AsyncMock(return_value=start_websocket_message),
+    ) as mock_start_render_async:
+        job_id = await make_animation_feature.start_background_full_render(
+            ad_id="ad_1",
+            base_path=tmp_path,
+            ad_animation="dab",
+            video_format="gif",
+            logger=logger,
+        )
+        # 전체 애니메이션 파일이 이미 있으면 예약하지 않음
+        tmp_path.joinpath("video").mkdir(exist_ok=True)
+        tmp_path.joinpath("video", "dab.gif").write_bytes(b"GIF89a")
+        existing_job_id = await make_animation_feature.start_background_full_render(
+            ad_id="ad_1",
+            base_path=tmp_path,
+            ad_animation="dab",
+            video_format="gif",
+            logger=logger,
+        )
+
+    # then
+    assert job_id == "full_job"
+    assert existing_job_id is None
+    assert mock_prepare_make_animation.call_args.kwargs["quality"] == "full"
+    mock_start_render_async.assert_called_once_with(
+        animated_drawings_mvc_cfg_path=Path("mvc_cfg_dab_gif.yaml"),
+        logger=logger,
+        priority=RenderPriority.LOW,
+    )
+
 
-    # 보상 광고 시간 초과 & 주기에 맞을 때는 True 반환
-    assert make_animation_feature.period_finish_render(timer=25, period=5)
-    assert make_animation_feature.period_finish_render(timer=30, period=5)
-    assert not make_animation_feature.period_finish_render(timer=26, period=5)
+# FastAPI의 WebSocket은 직접 인스턴스화하기 어려우므로,
+# PING 메시지를 받으면 PONG으로 응답하는 간단한 클래스를 정의합니다.
+class PongWebSocket:
 
-    # 다른 주기에 대한 테스트
-    assert make_animation_feature.period_finish_render(timer=22, period=2)
-    assert not make_animation_feature.period_finish_render(timer=23, period=2)
+    def __init__(self):
+        self.sent_messages = []
+        self.received_messages = asyncio.Queue()
+
+    async def send_json(self, data):
+        self.sent_messages.append(data)
+        if data["type"] == "PING":
+            self.received_messages.put_nowait(
+                {"type": "PONG", "message": "", "data": {}}
+            )
 
+    async def receive_json(self):
+        message = await self.received_messages.get()
+        if isinstance(message, Exception):
+            raise message
+        return message
 
-# FastAPI의 WebSocket은 직접 인스턴스화하기 어려우므로, 간단한 Dummy 클래스를 정의합니다.
-class DummyWebSocket(WebSocket):
-    async def accept(self):
-        pass
+    def disconnect(self):
+        self.received_messages.put_nowait(
+            WebSocketDisconnect(code=1000, reason="Client disconnected")
+        )
 
-    async def send_text(self, data: str):
-        pass
+    def get_sent_messages(self, type: WebSocketType):
+        return [message for message in self.sent_messages if message["type"] == type]
 
-    async def close(self, code: int = 1000):
-        pass
 
-    def __init__(self):
-        # Receive와 Send 타입에 맞는 더미 함수를 생성합니다
-        async def dummy_receive():
-            return {"type": "websocket.receive", "text": ""}
+@pytest.fixture(autouse=True)
+def fast_render_session(monkeypatch):
+    monkeypatch.setenv(make_animation_feature.REWARD_ADVERTISEMENT_SECONDS_ENV, "0")
+    monkeypatch.setattr(
+        render_status_file,
+        "_render_status_watcher",
+        render_status_file.RenderStatusWatcher(poll_seconds=0.01),
+    )
+    monkeypatch.setattr(render_session, "_render_sessions", {})
 
-        async def dummy_send(message):
-            pass
 
-        super().__init__(
-            scope={"type": "websocket"}, receive=dummy_receive, send=dummy_send
-        )
+def write_status_file(file_path: Path, status: str, progress=None):
+    file_path.write_text(yaml.dump({"status": status, "progress": progress or {}}))
 
 
 @pytest.mark.asyncio
-async def test_check_connection_and_rendering_completed():
+async def test_check_connection_and_rendering_completed(tmp_path: Path):
     """
-    렌더링이 즉시 완료된 경우를 테스트합니다.
-    - check_connection은 정상 동작하고,
-    - is_finish_render는 True를 반환하여 바로 렌더링 완료로 간주합니다.
+    상태 파일이 없으면 RPC로 렌더링 상태를 확인하고, 완료되면 바로 반환합니다.
     """
+    # given
     job_id = "job_completed"
-    base_path = Path("/dummy/path")
-    relative_video_file_path = Path("dummy.gif")
-    websocket = DummyWebSocket()
+    (tmp_path / "dummy.gif").write_bytes(b"GIF89a")
+    websocket = PongWebSocket()
     logger = MagicMock()
 
     with patch(
-        "ad_fast_api.domain.make_animation.sources.features.make_animation_feature.check_connection",
-        new_callable=AsyncMock,
-    ) as mock_check_connection, patch(
-        "ad_fast_api.domain.make_animation.sources.features.make_animation_feature.is_finish_render",
+        "ad_fast_api.domain.make_animation.sources.features.make_animation_feature.get_render_status",
         new_callable=AsyncMock,
-        return_value=True,
-    ) as mock_is_finish_render, patch(
+        return_value=create_render_status(is_finished=True),
+    ) as mock_get_render_status, patch(
         "ad_fast_api.domain.make_animation.sources.features.make_animation_feature.cancel_render_async",
         new_callable=AsyncMock,
-    ) as mock_cancel_render_async, patch(
-        "ad_fast_api.domain.make_animation.sources.features.make_animation_feature.period_finish_render",
-        return_value=True,
-    ) as mock_period_finish_render, patch(
-        "asyncio.sleep", new_callable=AsyncMock
-    ) as mock_sleep, patch(
-        "pathlib.Path.exists", return_value=True
-    ) as mock_exists:
+    ) as mock_cancel_render_async:
+        # when
         await make_animation_feature.check_connection_and_rendering(
             job_id=job_id,
-            base_path=base_path,
-            relative_video_file_path=relative_video_file_path,
-            websocket=websocket,
+            base_path=tmp_path,
+            relative_video_file_path=Path("dummy.gif"),
+            websocket=websocket,  # type: ignore
             logger=logger,
         )
 
-        # check_connection이 호출되었는지 확인
-        mock_check_connection.assert_called_with(
-            timer=0,
-            period=5,
-            websocket=websocket,
-            logger=logger,
-        )
-        # period_finish_render가 호출되었는지 확인
-        mock_period_finish_render.assert_called_once()
-        # is_finish_render가 호출되었는지 확인
-        mock_is_finish_render.assert_called_once_with(
-            job_id=job_id,
-            logger=logger,
-            timeout_seconds=7,
-        )
-        # 렌더링 완료 메시지가 로깅되었는지 확인
-        logger.info.assert_called_once()
-        # 렌더링 완료이므로 cancel_render_async는 호출되지 않아야 함
-        mock_cancel_render_async.assert_not_called()
+    # then
+    mock_get_render_status.assert_called_once_with(
+        job_id=job_id,
+        logger=logger,
+        timeout_seconds=7,
+    )
+    logger.info.assert_called_once_with("Rendering has been completed.")
+    mock_cancel_render_async.assert_not_called()
 
 
 @pytest.mark.asyncio
-async def test_check_connection_and_rendering_file_not_exists():
+async def test_check_connection_and_rendering_file_not_exists(tmp_path: Path):
     """
     렌더링은 완료되었지만 파일이 존재하지 않는 경우를 테스트합니다.
     """
-    job_id = "job_completed_no_file"
-    base_path = Path("/dummy/path")
-    relative_video_file_path = Path("dummy.gif")
-    websocket = DummyWebSocket()
+    # given
+    websocket = PongWebSocket()
     logger = MagicMock()
 
     with patch(
-        "ad_fast_api.domain.make_animation.sources.features.make_animation_feature.check_connection",
-        new_callable=AsyncMock,
-    ) as mock_check_connection, patch(
-        "ad_fast_api.domain.make_animation.sources.features.make_animation_feature.is_finish_render",
+        "ad_fast_api.domain.make_animation.sources.features.make_animation_feature.get_render_status",
         new_callable=AsyncMock,
-        return_value=True,
-    ) as mock_is_finish_render, patch(
+        return_value=create_render_status(is_finished=True),
+    ), patch(
         "ad_fast_api.domain.make_animation.sources.features.make_animation_feature.cancel_render_async",
         new_callable=AsyncMock,
-    ) as mock_cancel_render_async, patch(
-        "ad_fast_api.domain.make_animation.sources.features.make_animation_feature.period_finish_render",
-        return_value=True,
-    ) as mock_period_finish_render, patch(
-        "asyncio.sleep", new_callable=AsyncMock
-    ) as mock_sleep, patch(
-        "pathlib.Path.exists", return_value=False
-    ) as mock_exists:
+    ) as mock_cancel_render_async:
+        # when
         with pytest.raises(Exception) as exc_info:
             await make_animation_feature.check_connection_and_rendering(
-                job_id=job_id,
-                base_path=base_path,
-                relative_video_file_path=relative_video_file_path,
-                websocket=websocket,
+                job_id="job_completed_no_file",
+                base_path=tmp_path,
+                relative_video_file_path=Path("dummy.gif"),
+                websocket=websocket,  # type: ignore
                 logger=logger,
             )
 
-        assert (
-            "Rendering has been completed, but the video file does not exist."
-            in str(exc_info.value)
+    # then
+    assert (
+        "Rendering has been completed, but the video file does not exist."
+        in str(exc_info.value)
+    )
+    logger.error.assert_called_once()
+    mock_cancel_render_async.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_check_connection_and_rendering_failed(tmp_path: Path, monkeypatch):
+    """
+    렌더링이 실패하면 보상 광고 시간을 기다리지 않고 실패 이유를 바로 전달합니다.
+    """
+    # given
+    job_id = "job_failed"
+    monkeypatch.setenv(make_animation_feature.REWARD_ADVERTISEMENT_SECONDS_ENV, "60")
+    (tmp_path / f"render_status_{job_id}.yaml").write_text(
+        yaml.dump(
+            {
+                "status": "FAILED",
+                "progress": {},
+                "error": "render worker exited with code 3",
+                "exit_code": 3,
+            }
         )
-        logger.error.assert_called_once()
-        mock_cancel_render_async.assert_not_called()
+    )
+    logger = MagicMock()
+
+    with patch(
+        "ad_fast_api.domain.make_animation.sources.features.make_animation_feature.cancel_render_async",
+        new_callable=AsyncMock,
+    ) as mock_cancel_render_async:
+        # when
+        with pytest.raises(Exception) as exc_info:
+            async with asyncio.timeout(5):
+                await make_animation_feature.check_connection_and_rendering(
+                    job_id=job_id,
+                    base_path=tmp_path,
+                    relative_video_file_path=Path("dummy.gif"),
+                    websocket=PongWebSocket(),  # type: ignore
+                    logger=logger,
+                )
+
+    # then
+    assert str(exc_info.value) == (
+        "Animation rendering has failed. "
+        "render worker exited with code 3 (exit code: 3)"
+    )
+    logger.error.assert_called_once()
+    mock_cancel_render_async.assert_not_called()
 
 
 @pytest.mark.asyncio
-async def test_check_connection_and_rendering_timeout():
+async def test_check_connection_and_rendering_timeout(tmp_path: Path, monkeypatch):
     """
-    렌더링이 완료되지 않아 타임아웃되는 경우를 테스트합니다.
-    최대 대기 시간 후 타임아웃 예외가 발생해야 합니다.
+    렌더링이 완료되지 않아 최대 대기 시간이 지나면 작업을 취소합니다.
     """
+    # given
     job_id = "job_timeout"
-    base_path = Path("/dummy/path")
-    relative_video_file_path = Path("dummy.gif")
-    websocket = DummyWebSocket()
+    monkeypatch.setenv(make_animation_feature.MAX_RENDER_SECONDS_ENV, "0.1")
+    monkeypatch.setattr(make_animation_feature, "STATUS_RPC_SECONDS", 0.01)
     logger = MagicMock()
 
-    # check_connection 함수는 정상 동작, render_timer가 최대값을 초과하도록 설정
     with patch(
-        "ad_fast_api.domain.make_animation.sources.features.make_animation_feature.check_connection",
-        new_callable=AsyncMock,
-    ) as mock_check_connection, patch(
-        "ad_fast_api.domain.make_animation.sources.features.make_animation_feature.is_finish_render",
+        "ad_fast_api.domain.make_animation.sources.features.make_animation_feature.get_render_status",
         new_callable=AsyncMock,
-        return_value=False,
-    ) as mock_is_finish_render, patch(
+        return_value=create_render_status(is_finished=False),
+    ) as mock_get_render_status, patch(
         "ad_fast_api.domain.make_animation.sources.features.make_animation_feature.cancel_render_async",
         new_callable=AsyncMock,
-    ) as mock_cancel_render_async, patch(
-        "ad_fast_api.domain.make_animation.sources.features.make_animation_feature.period_finish_render",
-        return_value=False,  # period_finish_render는 항상 False 반환
-    ) as mock_period_finish_render, patch(
-        "asyncio.sleep",
+    ) as mock_cancel_render_async:
+        # when
+        with pytest.raises(Exception) as exc_info:
+            await make_animation_feature.check_connection_and_rendering(
+                job_id=job_id,
+                base_path=tmp_path,
+                relative_video_file_path=Path("dummy.gif"),
+                websocket=PongWebSocket(),  # type: ignore
+                logger=logger,
+            )
+
+    # then: 상태 파일이 없는 동안 주기적으로 RPC 확인
+    assert "Rendering time has exceeded the limit." in str(exc_info.value)
+    assert mock_get_render_status.call_count > 1
+    mock_cancel_render_async.assert_called_once_with(job_id=job_id, logger=logger)
+    logger.error.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_check_connection_and_rendering_timeout_excludes_queue_wait(
+    tmp_path: Path, monkeypatch
+):
+    """
+    렌더링 최대 시간은 작업이 대기열에서 나온 뒤부터 셉니다.
+    """
+    # given: 최대 시간보다 오래 대기열에서 기다린 뒤 렌더링이 끝남
+    job_id = "job_queued"
+    (tmp_path / "dummy.gif").write_bytes(b"GIF89a")
+    monkeypatch.setenv(make_animation_feature.MAX_RENDER_SECONDS_ENV, "0.2")
+    monkeypatch.setattr(make_animation_feature, "STATUS_RPC_SECONDS", 0.01)
+    logger = MagicMock()
+    queued_until = time.monotonic() + 0.4
+    rendering_until = queued_until + 0.1
+
+    async def get_render_status(**kwargs):
+        now = time.monotonic()
+        if now < queued_until:
+            return create_render_status(
+                is_finished=False,
+                progress={"phase": "queued", "queue_position": 1},
+            )
+        if now < rendering_until:
+            return create_render_status(
+                is_finished=False,
+                progress={"phase": "rendering", "frames_done": 1, "total_frames": 2},
+            )
+        return create_render_status(is_finished=True)
+
+    with patch(
+        "ad_fast_api.domain.make_animation.sources.features.make_animation_feature.get_render_status",
+        new=get_render_status,
+    ), patch(
+        "ad_fast_api.domain.make_animation.sources.features.make_animation_feature.cancel_render_async",
         new_callable=AsyncMock,
-        side_effect=lambda x: setattr(
-            make_animation_feature, "_test_render_timer", 180
-        ),
-    ) as mock_sleep:
-        make_animation_feature._test_render_timer = 0  # type: ignore # 테스트용 타이머 초기화
+    ) as mock_cancel_render_async:
+        # when
+        await make_animation_feature.check_connection_and_rendering(
+            job_id=job_id,
+            base_path=tmp_path,
+            relative_video_file_path=Path("dummy.gif"),
+            websocket=PongWebSocket(),  # type: ignore
+            logger=logger,
+        )
 
-        # render_timer 값을 조작해서 max_render_time을 초과하도록 함
-        def increment_timer(*args, **kwargs):
-            nonlocal render_timer
-            render_timer += 1
-            return False
+    # then
+    logger.info.assert_called_once_with("Rendering has been completed.")
+    mock_cancel_render_async.assert_not_called()
 
-        render_timer = 180  # 최대 시간(180초) 설정
 
+@pytest.mark.asyncio
+async def test_check_connection_and_rendering_websocket_disconnect(tmp_path: Path):
+    """
+    렌더링을 기다리는 중 클라이언트가 연결을 끊으면 바로 작업을 취소합니다.
+    """
+    # given
+    job_id = "job_ws_disconnect"
+    write_status_file(tmp_path / f"render_status_{job_id}.yaml", "RUNNING")
+    websocket = PongWebSocket()
+    websocket.disconnect()
+    logger = MagicMock()
+
+    with patch(
+        "ad_fast_api.domain.make_animation.sources.features.make_animation_feature.cancel_render_async",
+        new_callable=AsyncMock,
+    ) as mock_cancel_render_async:
+        # when
         with pytest.raises(Exception) as exc_info:
             await make_animation_feature.check_connection_and_rendering(
                 job_id=job_id,
-                base_path=base_path,
-                relative_video_file_path=relative_video_file_path,
-                websocket=websocket,
+                base_path=tmp_path,
+                relative_video_file_path=Path("dummy.gif"),
+                websocket=websocket,  # type: ignore
                 logger=logger,
             )
 
-        assert "Rendering time has exceeded the limit." in str(exc_info.value)
-        mock_cancel_render_async.assert_called_once_with(job_id=job_id, logger=logger)
-        logger.error.assert_called_once()
+    # then
+    assert "The websocket connection with the client has been terminated" in str(
+        exc_info.value
+    )
+    mock_cancel_render_async.assert_called_once_with(job_id=job_id, logger=logger)
+    logger.error.assert_called_once()
 
 
 @pytest.mark.asyncio
-async def test_check_connection_and_rendering_websocket_disconnect():
+async def test_check_connection_and_rendering_other_exception(tmp_path: Path):
     """
-    check_connection 호출 시 WebSocketDisconnect 예외가 발생하는 경우를 테스트합니다.
+    렌더링 상태 확인 중 기타 예외가 발생하는 경우를 테스트합니다.
     """
-    job_id = "job_ws_disconnect"
-    base_path = Path("/dummy/path")
-    relative_video_file_path = Path("dummy.gif")
-    websocket = DummyWebSocket()
+    # given
+    job_id = "job_other_exception"
     logger = MagicMock()
 
     with patch(
-        "ad_fast_api.domain.make_animation.sources.features.make_animation_feature.check_connection",
+        "ad_fast_api.domain.make_animation.sources.features.make_animation_feature.get_render_status",
         new_callable=AsyncMock,
-        side_effect=WebSocketDisconnect(code=1000, reason="Client disconnected"),
-    ) as mock_check_connection, patch(
+        side_effect=Exception("Unexpected error"),
+    ), patch(
         "ad_fast_api.domain.make_animation.sources.features.make_animation_feature.cancel_render_async",
         new_callable=AsyncMock,
     ) as mock_cancel_render_async:
+        # when
         with pytest.raises(Exception) as exc_info:
             await make_animation_feature.check_connection_and_rendering(
                 job_id=job_id,
-                base_path=base_path,
-                relative_video_file_path=relative_video_file_path,
-                websocket=websocket,
+                base_path=tmp_path,
+                relative_video_file_path=Path("dummy.gif"),
+                websocket=PongWebSocket(),  # type: ignore
                 logger=logger,
             )
-        assert "The websocket connection with the client has been terminated" in str(
-            exc_info.value
+
+    # then
+    assert "An error occurred while processing the job" in str(exc_info.value)
+    mock_cancel_render_async.assert_called_once_with(job_id=job_id, logger=logger)
+    logger.error.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_check_connection_and_rendering_reads_status_file(tmp_path: Path):
+    """
+    animated_drawings 서버가 쓴 상태 파일이 있으면 RPC를 호출하지 않고,
+    진행 상황이 바뀔 때마다 PROGRESS 메시지를 보낸 뒤 완료로 바뀌면 바로 완료되는지 테스트합니다.
+    """
+    # given
+    job_id = "job_status_file"
+    status_file_path = tmp_path / f"render_status_{job_id}.yaml"
+    progress = {"phase": "rendering", "frames_done": 5, "total_frames": 10}
+    write_status_file(status_file_path, "RUNNING", progress)
+    (tmp_path / "dummy.gif").write_bytes(b"GIF89a")
+    websocket = PongWebSocket()
+
+    async def finish_render():
+        await asyncio.sleep(0.05)
+        write_status_file(status_file_path, "FINISHED")
+
+    with patch(
+        "ad_fast_api.domain.make_animation.sources.features.make_animation_feature.get_render_status",
+        new_callable=AsyncMock,
+    ) as mock_get_render_status:
+        # when
+        finish_task = asyncio.create_task(finish_render())
+        await make_animation_feature.check_connection_and_rendering(
+            job_id=job_id,
+            base_path=tmp_path,
+            relative_video_file_path=Path("dummy.gif"),
+            websocket=websocket,  # type: ignore
+            logger=MagicMock(),
         )
-        mock_cancel_render_async.assert_called_once_with(job_id=job_id, logger=logger)
-        logger.error.assert_called_once()
+        await finish_task
+
+    # then
+    mock_get_render_status.assert_not_called()
+    progress_messages = websocket.get_sent_messages(WebSocketType.PROGRESS)
+    assert [message["data"] for message in progress_messages] == [progress]
+    # 완료 후 상태 파일 삭제
+    assert not status_file_path.exists()
+    # 완료 후 상태 파일 감시를 멈춤
+    assert render_status_file.get_render_status_watcher().watching_count == 0
 
 
 @pytest.mark.asyncio
-async def test_check_connection_and_rendering_other_exception():
+async def test_check_connection_and_rendering_waits_reward_advertisement(
+    tmp_path: Path,
+    monkeypatch,
+):
     """
-    check_connection 호출 중 기타 예외가 발생하는 경우를 테스트합니다.
+    렌더링이 먼저 끝나도 보상 광고 시간이 지난 뒤 완료되며,
+    다시 연결한 경우 이전 연결에서 지난 시간만큼 덜 기다립니다.
     """
-    job_id = "job_other_exception"
-    base_path = Path("/dummy/path")
+    # given
+    job_id = "job_reward"
+    write_status_file(tmp_path / f"render_status_{job_id}.yaml", "FINISHED")
+    (tmp_path / "dummy.gif").write_bytes(b"GIF89a")
+    monkeypatch.setenv(make_animation_feature.REWARD_ADVERTISEMENT_SECONDS_ENV, "0.3")
+
+    async def check(start_timer: int) -> float:
+        started_at = time.perf_counter()
+        await make_animation_feature.check_connection_and_rendering(
+            job_id=job_id,
+            base_path=tmp_path,
+            relative_video_file_path=Path("dummy.gif"),
+            websocket=PongWebSocket(),  # type: ignore
+            logger=MagicMock(),
+            start_timer=start_timer,
+        )
+        return time.perf_counter() - started_at
+
+    # when
+    elapsed_seconds = await check(start_timer=0)
+    write_status_file(tmp_path / f"render_status_{job_id}.yaml", "FINISHED")
+    reattached_elapsed_seconds = await check(start_timer=1)
+
+    # then
+    assert elapsed_seconds >= 0.3
+    assert reattached_elapsed_seconds < 0.3
+
+
+@pytest.mark.asyncio
+async def test_check_connection_and_rendering_websocket_disconnect_keeps_session(
+    tmp_path: Path,
+    monkeypatch,
+):
+    """
+    진행중인 렌더링 작업이 있으면 연결이 끊겨도 취소하지 않고 유예 시간을 시작합니다.
+    """
+    job_id = "job_ws_reattach"
     relative_video_file_path = Path("dummy.gif")
-    websocket = DummyWebSocket()
-    logger = MagicMock()
+    video_file_path = tmp_path / relative_video_file_path
+    status_file_path = tmp_path / f"render_status_{job_id}.yaml"
+    status_file_path.write_text("status: RUNNING\nprogress: {}\n")
+    monkeypatch.setenv(render_session.RENDER_RECONNECT_GRACE_SECONDS_ENV, "60")
+    session = render_session.open_render_session(
+        video_file_path=video_file_path,
+        job_id=job_id,
+        status_file_path=status_file_path,
+    )
+    websocket = PongWebSocket()
+    websocket.disconnect()
 
     with patch(
-        "ad_fast_api.domain.make_animation.sources.features.make_animation_feature.check_connection",
-        new_callable=AsyncMock,
-        side_effect=Exception("Unexpected error"),
-    ) as mock_check_connection, patch(
         "ad_fast_api.domain.make_animation.sources.features.make_animation_feature.cancel_render_async",
         new_callable=AsyncMock,
     ) as mock_cancel_render_async:
-        with pytest.raises(Exception) as exc_info:
+        with pytest.raises(Exception):
             await make_animation_feature.check_connection_and_rendering(
                 job_id=job_id,
-                base_path=base_path,
+                base_path=tmp_path,
                 relative_video_file_path=relative_video_file_path,
-                websocket=websocket,
-                logger=logger,
+                websocket=websocket,  # type: ignore
+                logger=MagicMock(),
             )
-        assert "An error occurred while processing the job" in str(exc_info.value)
-        mock_cancel_render_async.assert_called_once_with(job_id=job_id, logger=logger)
-        logger.error.assert_called_once()
+
+    # then: 다시 연결할 수 있도록 작업과 상태 파일을 유지
+    mock_cancel_render_async.assert_not_called()
+    assert status_file_path.exists()
+    assert session.expire_task is not None
+    assert render_session.attach_render_session(video_file_path) is session
+    assert session.expire_task is None
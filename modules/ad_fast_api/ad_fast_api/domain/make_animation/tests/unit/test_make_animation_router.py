@@ -2,13 +2,16 @@ import logging
 import pytest
 from fastapi import FastAPI, WebSocketDisconnect
 from fastapi.testclient import TestClient
-from fastapi.responses import Response, FileResponse
+from fastapi.responses import Response
 from ad_fast_api.domain.make_animation.sources.make_animation_schema import (
+    RenderPriority,
     WebSocketType,
 )
 
 # 모듈 임포트
 import ad_fast_api.domain.make_animation.sources.make_animation_router as router_module
+from ad_fast_api.domain.make_animation.sources.features import render_session
+from pathlib import Path
 
 # 테스트를 위한 FastAPI 앱 생성 및 라우터 포함
 app = FastAPI()
@@ -37,15 +40,30 @@ class FakePath:
         return FakeStat()
 
 
+def patch_download_animation_path(monkeypatch):
+    async def fake_get_download_animation_path(
+        ad_id, ad_animation, video_file_path, quality
+    ):
+        return f"/download_animation?ad_id={ad_id}&ad_animation={ad_animation}&v=hash"
+
+    monkeypatch.setattr(
+        router_module,
+        "get_download_animation_path",
+        fake_get_download_animation_path,
+    )
+
+
 # /download_animation 엔드포인트 테스트 - 파일이 존재하는 경우
 def test_download_animation_file_exists(monkeypatch):
     fake_video_path = FakePath(True, "fake/full/path.mp4")
     fake_relative_path = "fake/relative/path.mp4"
 
-    def fake_get_video_file_path(base_path, ad_animation, logger):
+    def fake_get_video_file_path(base_path, ad_animation, logger, video_format, quality):
         return fake_video_path, fake_relative_path
 
-    def fake_get_file_response(base_path, relative_video_file_path):
+    async def fake_get_file_response(
+        base_path, relative_video_file_path, request_headers, version
+    ):
         # 더미 파일 응답 반환
         return Response(content="dummy file content", media_type="image/gif")
 
@@ -71,7 +89,7 @@ def test_download_animation_file_not_exists(monkeypatch):
     fake_video_path = FakePath(False, "fake/full/path.mp4")
     fake_relative_path = "fake/relative/path.mp4"
 
-    def fake_get_video_file_path(base_path, ad_animation, logger):
+    def fake_get_video_file_path(base_path, ad_animation, logger, video_format, quality):
         return fake_video_path, fake_relative_path
 
     monkeypatch.setattr(router_module, "get_video_file_path", fake_get_video_file_path)
@@ -89,12 +107,110 @@ def test_download_animation_file_not_exists(monkeypatch):
     assert response.status_code == 500
 
 
+# /download_animation 엔드포인트 테스트 - 조건부 요청, Range 요청, 버전이 포함된 URL
+def test_download_animation_conditional_and_range(monkeypatch, tmp_path):
+    # given
+    video_file_path = tmp_path / "video" / "dab.gif"
+    video_file_path.parent.mkdir()
+    video_file_path.write_bytes(b"GIF89a" + bytes(range(100)))
+    monkeypatch.setattr(
+        router_module,
+        "get_video_file_path",
+        lambda base_path, ad_animation, logger, video_format, quality: (
+            video_file_path,
+            Path("video/dab.gif"),
+        ),
+    )
+    monkeypatch.setattr(router_module, "get_base_path", lambda ad_id: tmp_path)
+    monkeypatch.setattr(
+        router_module,
+        "setup_logger",
+        lambda ad_id, level=logging.DEBUG: logging.getLogger("dummy_logger"),
+    )
+    params = {"ad_id": "123", "ad_animation": "dab"}
+
+    # when
+    response = client.get("/download_animation", params=params)
+    etag = response.headers["etag"]
+    not_modified_response = client.get(
+        "/download_animation",
+        params=params,
+        headers={"If-None-Match": etag},
+    )
+    range_response = client.get(
+        "/download_animation",
+        params=params,
+        headers={"Range": "bytes=6-9"},
+    )
+    versioned_response = client.get(
+        "/download_animation",
+        params={**params, "v": etag.strip('"')},
+    )
+
+    # then
+    assert response.status_code == 200
+    assert response.headers["content-length"] == "106"
+    assert response.headers["cache-control"] == "no-cache"
+    assert not_modified_response.status_code == 304
+    assert not_modified_response.content == b""
+    assert range_response.status_code == 206
+    assert range_response.content == bytes(range(4))
+    assert range_response.headers["content-range"] == "bytes 6-9/106"
+    assert "immutable" in versioned_response.headers["cache-control"]
+
+
+# /download_animation 엔드포인트 테스트 - video_format, Accept 헤더로 형식 선택
+def test_download_animation_selects_video_format(monkeypatch, tmp_path):
+    # given: gif, webm만 렌더링됨
+    video_dir_path = tmp_path / "video"
+    video_dir_path.mkdir()
+    video_dir_path.joinpath("dab.gif").write_bytes(b"GIF89a")
+    video_dir_path.joinpath("dab.webm").write_bytes(b"webm")
+    monkeypatch.setattr(router_module, "get_base_path", lambda ad_id: tmp_path)
+    monkeypatch.setattr(
+        router_module,
+        "setup_logger",
+        lambda ad_id, level=logging.DEBUG: logging.getLogger("dummy_logger"),
+    )
+    params = {"ad_id": "123", "ad_animation": "dab"}
+
+    # when
+    webm_response = client.get(
+        "/download_animation",
+        params=params,
+        headers={"Accept": "video/webm, image/gif;q=0.5"},
+    )
+    fallback_response = client.get(
+        "/download_animation",
+        params=params,
+        headers={"Accept": "video/mp4, image/*;q=0.5"},
+    )
+    query_response = client.get(
+        "/download_animation",
+        params={**params, "video_format": "webm"},
+        headers={"Accept": "image/gif"},
+    )
+    not_found_response = client.get(
+        "/download_animation",
+        params={**params, "video_format": "mp4"},
+    )
+
+    # then
+    assert webm_response.headers["content-type"] == "video/webm"
+    assert webm_response.headers["vary"] == "Accept"
+    # mp4 파일이 없으면 다음으로 선호하는 gif
+    assert fallback_response.headers["content-type"] == "image/gif"
+    assert query_response.headers["content-type"] == "video/webm"
+    assert "vary" not in query_response.headers
+    assert not_found_response.status_code == 500
+
+
 # /make_animation 웹소켓 엔드포인트 테스트 - 파일이 이미 존재하는 경우
 def test_make_animation_websocket_file_exists(monkeypatch):
     fake_video_path = FakePath(True, "fake/full/path.mp4")
     fake_relative_path = "fake/relative/path.mp4"
 
-    def fake_get_video_file_path(base_path, ad_animation, logger):
+    def fake_get_video_file_path(base_path, ad_animation, logger, video_format, quality):
         return fake_video_path, fake_relative_path
 
     monkeypatch.setattr(router_module, "get_video_file_path", fake_get_video_file_path)
@@ -108,6 +224,7 @@ def test_make_animation_websocket_file_exists(monkeypatch):
     monkeypatch.setattr(
         router_module, "check_available_animation", lambda ad_animation, logger: None
     )
+    patch_download_animation_path(monkeypatch)
 
     with client.websocket_connect(
         "/make_animation?ad_id=123&ad_animation=test"
@@ -124,11 +241,14 @@ def test_make_animation_websocket_file_not_exists(monkeypatch):
     fake_video_path = FakePath(False, "fake/full/path.mp4")
     fake_relative_path = "fake/relative/path.mp4"
 
-    def fake_get_video_file_path(base_path, ad_animation, logger):
+    def fake_get_video_file_path(base_path, ad_animation, logger, video_format, quality):
         return fake_video_path, fake_relative_path
 
     monkeypatch.setattr(router_module, "get_video_file_path", fake_get_video_file_path)
-    monkeypatch.setattr(router_module, "get_base_path", lambda ad_id: "dummy_base_path")
+    monkeypatch.setattr(
+        router_module, "get_base_path", lambda ad_id: Path("dummy_base_path")
+    )
+    monkeypatch.setattr(render_session, "_render_sessions", {})
     monkeypatch.setattr(
         router_module,
         "setup_logger",
@@ -139,23 +259,24 @@ def test_make_animation_websocket_file_not_exists(monkeypatch):
     monkeypatch.setattr(
         router_module, "check_available_animation", lambda ad_animation, logger: None
     )
+    patch_download_animation_path(monkeypatch)
 
     # 애니메이션 렌더링 준비를 위한 더미 구성 파일 경로 반환
     monkeypatch.setattr(
         router_module,
         "prepare_make_animation",
-        lambda ad_id, base_path, ad_animation, relative_video_file_path: "dummy_cfg_path.yaml",
+        lambda ad_id, base_path, ad_animation, relative_video_file_path, video_format, quality: "dummy_cfg_path.yaml",
     )
 
     # 렌더링 시작 요청을 모방하는 비동기 함수
-    async def fake_start_render_async(animated_drawings_mvc_cfg_path, logger):
+    async def fake_start_render_async(animated_drawings_mvc_cfg_path, logger, priority):
         return {"type": "RUNNING", "data": {"job_id": "12345"}}
 
     monkeypatch.setattr(router_module, "start_render_async", fake_start_render_async)
 
     # 렌더링 진행 체크 함수를 모방 (짧은 지연을 추가 및 COMPLETE 메시지 전송)
     async def fake_check_connection_and_rendering(
-        job_id, base_path, relative_video_file_path, websocket, logger
+        job_id, base_path, relative_video_file_path, websocket, logger, start_timer
     ):
         import asyncio
 
@@ -183,6 +304,76 @@ def test_make_animation_websocket_file_not_exists(monkeypatch):
         assert second_message["data"]["file_path"] == fake_relative_path
 
 
+# /make_animation 웹소켓 엔드포인트 테스트 - 미리보기 후 전체 렌더링을 백그라운드로 예약하는 경우
+def test_make_animation_websocket_preview_with_background_full_render(
+    monkeypatch, tmp_path
+):
+    # given
+    monkeypatch.setattr(router_module, "get_base_path", lambda ad_id: tmp_path)
+    monkeypatch.setattr(render_session, "_render_sessions", {})
+    monkeypatch.setattr(
+        router_module,
+        "setup_logger",
+        lambda ad_id, level=logging.DEBUG: logging.getLogger("dummy_logger"),
+    )
+    monkeypatch.setattr(
+        router_module, "check_available_animation", lambda ad_animation, logger: None
+    )
+    patch_download_animation_path(monkeypatch)
+    prepared = []
+    priorities = []
+
+    def fake_prepare_make_animation(
+        ad_id, base_path, ad_animation, relative_video_file_path, video_format, quality
+    ):
+        prepared.append((str(relative_video_file_path), quality))
+        return "dummy_cfg_path.yaml"
+
+    async def fake_start_render_async(animated_drawings_mvc_cfg_path, logger, priority):
+        priorities.append(priority)
+        return {"type": "RUNNING", "data": {"job_id": "preview_job"}}
+
+    async def fake_check_connection_and_rendering(
+        job_id, base_path, relative_video_file_path, websocket, logger, start_timer
+    ):
+        return None
+
+    async def fake_start_background_full_render(
+        ad_id, base_path, ad_animation, video_format, logger
+    ):
+        return "full_job"
+
+    monkeypatch.setattr(
+        router_module, "prepare_make_animation", fake_prepare_make_animation
+    )
+    monkeypatch.setattr(router_module, "start_render_async", fake_start_render_async)
+    monkeypatch.setattr(
+        router_module,
+        "check_connection_and_rendering",
+        fake_check_connection_and_rendering,
+    )
+    monkeypatch.setattr(
+        router_module,
+        "start_background_full_render",
+        fake_start_background_full_render,
+    )
+
+    # when
+    with client.websocket_connect(
+        "/make_animation?ad_id=123&ad_animation=dab"
+        "&quality=preview&background_full_render=true"
+    ) as websocket:
+        running_message = websocket.receive_json()
+        complete_message = websocket.receive_json()
+
+    # then: 미리보기는 높은 우선순위로 렌더링
+    assert prepared == [("video/dab_preview.gif", "preview")]
+    assert priorities == [RenderPriority.HIGH]
+    assert running_message["data"]["job_id"] == "preview_job"
+    assert complete_message["type"] == WebSocketType.COMPLETE
+    assert complete_message["data"]["full_render_job_id"] == "full_job"
+
+
 # /make_animation 웹소켓 엔드포인트 테스트 - 유효하지 않은 애니메이션 이름인 경우
 def test_make_animation_websocket_invalid_animation(monkeypatch):
     # check_available_animation이 예외를 발생하도록 패치합니다.
@@ -205,3 +396,63 @@ def test_make_animation_websocket_invalid_animation(monkeypatch):
         error_message = websocket.receive_json()
         assert error_message["type"] == "ERROR"
         assert "유효하지 않은 애니메이션" in error_message["message"]
+
+
+# /make_animation 웹소켓 엔드포인트 테스트 - 연결이 끊겼던 렌더링 작업에 다시 연결하는 경우
+def test_make_animation_websocket_reattach(monkeypatch):
+    fake_video_path = FakePath(False, "fake/reattach/path.gif")
+    fake_relative_path = "fake/relative/path.gif"
+
+    monkeypatch.setattr(
+        router_module,
+        "get_video_file_path",
+        lambda base_path, ad_animation, logger, video_format, quality: (fake_video_path, fake_relative_path),
+    )
+    monkeypatch.setattr(
+        router_module, "get_base_path", lambda ad_id: Path("dummy_base_path")
+    )
+    monkeypatch.setattr(render_session, "_render_sessions", {})
+    monkeypatch.setattr(
+        router_module,
+        "setup_logger",
+        lambda ad_id, level=logging.DEBUG: logging.getLogger("dummy_logger"),
+    )
+    monkeypatch.setattr(
+        router_module, "check_available_animation", lambda ad_animation, logger: None
+    )
+    patch_download_animation_path(monkeypatch)
+    render_session.open_render_session(
+        video_file_path=fake_video_path,  # type: ignore
+        job_id="12345",
+        status_file_path=Path("dummy_base_path/render_status_12345.yaml"),
+    )
+
+    # 렌더링을 새로 시작하면 안됨
+    async def fake_start_render_async(animated_drawings_mvc_cfg_path, logger, priority):
+        raise AssertionError("start_render_async should not be called")
+
+    monkeypatch.setattr(router_module, "start_render_async", fake_start_render_async)
+
+    check_calls = []
+
+    async def fake_check_connection_and_rendering(
+        job_id, base_path, relative_video_file_path, websocket, logger, start_timer
+    ):
+        check_calls.append(job_id)
+
+    monkeypatch.setattr(
+        router_module,
+        "check_connection_and_rendering",
+        fake_check_connection_and_rendering,
+    )
+
+    with client.websocket_connect(
+        "/make_animation?ad_id=123&ad_animation=test"
+    ) as websocket:
+        first_message = websocket.receive_json()
+        assert first_message["type"] == WebSocketType.RUNNING
+        assert first_message["data"] == {"job_id": "12345", "reattached": True}
+        second_message = websocket.receive_json()
+        assert second_message["type"] == WebSocketType.COMPLETE
+
+    assert check_calls == ["12345"]
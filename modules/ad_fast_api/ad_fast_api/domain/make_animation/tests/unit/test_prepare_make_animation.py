@@ -3,13 +3,16 @@ from ad_fast_api.domain.make_animation.sources.features import (
 )
 from ad_fast_api.domain.make_animation.sources.make_animation_schema import (
     ADAnimation,
+    ADRenderQuality,
+    ADVideoFormat,
 )
 from ad_fast_api.workspace.sources.conf_workspace import (
     CHAR_CFG_FILE_NAME,
-    MVC_CFG_FILE_NAME,
     CONFIG_DIR_NAME,
     FILES_DIR_NAME,
+    get_mvc_cfg_file_name,
 )
+from ad_fast_api.snippets.sources.save_dict import file_to_dict
 from unittest.mock import patch, MagicMock
 from pathlib import Path
 
@@ -67,6 +70,87 @@ def test_create_mvc_config():
     assert result["scene"]["ANIMATED_CHARACTERS"] == [animated_drawing_dict]
     assert result["controller"]["MODE"] == "video_render"
     assert result["controller"]["OUTPUT_VIDEO_PATH"] == video_file_path.as_posix()
+    assert "OUTPUT_VIDEO_CODEC" not in result["controller"]
+
+
+def test_create_mvc_config_with_video_format():
+    # when
+    result = pma.create_mvc_config(
+        animated_drawings_dict={},
+        video_file_path=Path("/path/to/output/dab.webm"),
+        ad_animation=ADAnimation.dab.value,
+        video_format=ADVideoFormat.webm.value,
+    )
+
+    # then
+    assert result["controller"]["OUTPUT_VIDEO_CODEC"] == "VP80"
+
+
+def test_create_mvc_config_with_preview_quality():
+    # when
+    full_result = pma.create_mvc_config(
+        animated_drawings_dict={},
+        video_file_path=Path("/path/to/output/dab.gif"),
+        ad_animation=ADAnimation.dab.value,
+    )
+    preview_result = pma.create_mvc_config(
+        animated_drawings_dict={},
+        video_file_path=Path("/path/to/output/dab_preview.gif"),
+        ad_animation=ADAnimation.dab.value,
+        quality=ADRenderQuality.preview.value,
+    )
+
+    # then: 미리보기는 작은 화면에 프레임을 건너뛰며 렌더링
+    assert "WINDOW_DIMENSIONS" not in full_result["view"]
+    assert "FRAME_STEP" not in full_result["controller"]
+    assert preview_result["view"]["WINDOW_DIMENSIONS"] == (
+        pma.PreviewRenderQualityConfig.WINDOW_DIMENSIONS
+    )
+    assert preview_result["controller"]["FRAME_STEP"] == (
+        pma.PreviewRenderQualityConfig.FRAME_STEP
+    )
+
+
+def test_create_trimmed_motion_config():
+    # given
+    motion_cfg_dict = {
+        "filepath": "examples/bvh/fair1/dab.bvh",
+        "start_frame_idx": 10,
+        "end_frame_idx": 300,
+    }
+
+    # when
+    trimmed = pma.create_trimmed_motion_config(motion_cfg_dict, max_frames=120)
+    short_trimmed = pma.create_trimmed_motion_config(
+        {**motion_cfg_dict, "end_frame_idx": 50},
+        max_frames=120,
+    )
+    open_trimmed = pma.create_trimmed_motion_config(
+        {"filepath": "examples/bvh/fair1/dab.bvh"},
+        max_frames=120,
+    )
+
+    # then
+    assert trimmed == {**motion_cfg_dict, "end_frame_idx": 129}
+    assert short_trimmed["end_frame_idx"] == 50
+    assert open_trimmed["end_frame_idx"] == 119
+
+
+def test_save_preview_motion_config(tmp_path):
+    # when
+    file_name = pma.save_preview_motion_config(
+        ad_animation=ADAnimation.dab.value,
+        max_frames=120,
+        base_path=tmp_path,
+    )
+
+    # then
+    preview_motion_cfg = file_to_dict(tmp_path.joinpath(file_name))
+    assert file_name == "motion_dab_preview.yaml"
+    assert preview_motion_cfg["filepath"].endswith("dab.bvh")
+    assert preview_motion_cfg["end_frame_idx"] - (
+        preview_motion_cfg.get("start_frame_idx") or 0
+    ) < 120
 
 
 def test_save_mvc_config(tmp_path):
@@ -79,7 +163,7 @@ def test_save_mvc_config(tmp_path):
             "OUTPUT_VIDEO_PATH": "/path/to/video.mp4",
         },
     }
-    mvc_cfg_file_name = MVC_CFG_FILE_NAME
+    mvc_cfg_file_name = get_mvc_cfg_file_name("dab.gif")
     expected_mvc_cfg_path = base_path.joinpath(mvc_cfg_file_name)
 
     # when
@@ -0,0 +1,185 @@
+import asyncio
+import pytest
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+from ad_fast_api.domain.make_animation.sources.features import render_session
+from ad_fast_api.domain.make_animation.sources.features.render_status_file import (
+    RenderStatusWatcher,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_render_sessions(monkeypatch):
+    monkeypatch.setattr(render_session, "_render_sessions", {})
+
+
+def open_session(tmp_path: Path, status: str, progress: str = "{}"):
+    status_file_path = tmp_path / "render_status_job123.yaml"
+    status_file_path.write_text(f"status: {status}\nprogress: {progress}\n")
+    video_file_path = tmp_path / "dab.gif"
+    session = render_session.open_render_session(
+        video_file_path=video_file_path,
+        job_id="job123",
+        status_file_path=status_file_path,
+    )
+    return video_file_path, session
+
+
+def test_detach_without_grace_seconds(tmp_path: Path, monkeypatch):
+    # given
+    monkeypatch.setenv(render_session.RENDER_RECONNECT_GRACE_SECONDS_ENV, "0")
+    video_file_path, _ = open_session(tmp_path, "RUNNING")
+
+    # when
+    is_detached = render_session.detach_render_session(
+        video_file_path=video_file_path,
+        logger=MagicMock(),
+    )
+
+    # then: 유예 시간이 없으면 기존처럼 바로 취소
+    assert not is_detached
+    assert not render_session.detach_render_session(
+        video_file_path=tmp_path / "other.gif",
+        logger=MagicMock(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_expire_cancels_queued_job(tmp_path: Path):
+    # given
+    video_file_path, session = open_session(
+        tmp_path, "QUEUED", "{phase: queued, queue_position: 1}"
+    )
+
+    # when
+    with patch(
+        "ad_fast_api.domain.make_animation.sources.features.render_session.cancel_render_async",
+        new_callable=AsyncMock,
+    ) as mock_cancel_render_async:
+        await render_session.expire_render_session(
+            video_file_path=video_file_path,
+            render_session=session,
+            grace_seconds=0,
+            logger=MagicMock(),
+        )
+
+    # then: 시작하지 않은 작업은 취소
+    mock_cancel_render_async.assert_called_once()
+    assert render_session.attach_render_session(video_file_path) is None
+    assert not session.status_file_path.exists()
+
+
+@pytest.mark.asyncio
+async def test_expire_waits_running_job(tmp_path: Path):
+    # given
+    video_file_path, session = open_session(tmp_path, "RUNNING")
+
+    watcher = RenderStatusWatcher(poll_seconds=0.01)
+
+    # when
+    with patch(
+        "ad_fast_api.domain.make_animation.sources.features.render_session.cancel_render_async",
+        new_callable=AsyncMock,
+    ) as mock_cancel_render_async, patch(
+        "ad_fast_api.domain.make_animation.sources.features.render_session.get_render_status_watcher",
+        return_value=watcher,
+    ):
+        expire_task = asyncio.create_task(
+            render_session.expire_render_session(
+                video_file_path=video_file_path,
+                render_session=session,
+                grace_seconds=0,
+                logger=MagicMock(),
+            )
+        )
+        await asyncio.sleep(0.05)
+        assert not expire_task.done()
+        session.status_file_path.write_text("status: FINISHED\n")
+        await asyncio.wait_for(expire_task, timeout=1)
+
+    # then: 실행중인 작업은 끝까지 렌더링하여 캐시에 남김
+    mock_cancel_render_async.assert_not_called()
+    assert watcher.watching_count == 0
+    assert render_session.attach_render_session(video_file_path) is None
+
+
+@pytest.mark.asyncio
+async def test_attach_cancels_expire(tmp_path: Path, monkeypatch):
+    # given
+    monkeypatch.setenv(render_session.RENDER_RECONNECT_GRACE_SECONDS_ENV, "60")
+    video_file_path, session = open_session(tmp_path, "RUNNING")
+    render_session.detach_render_session(
+        video_file_path=video_file_path,
+        logger=MagicMock(),
+    )
+    expire_task = session.expire_task
+
+    # when
+    attached_session = render_session.attach_render_session(video_file_path)
+    await asyncio.sleep(0)
+
+    # then
+    assert attached_session is session
+    assert expire_task is not None and expire_task.cancelled()
+    assert session.status_file_path.exists()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_connections_share_one_render(tmp_path: Path):
+    # given
+    video_file_path = tmp_path / "dab.gif"
+    started_job_ids = []
+
+    async def connect():
+        async with render_session.lock_render_start(video_file_path):
+            session = render_session.attach_render_session(video_file_path)
+            if session is None:
+                # 렌더링 시작 요청 중 다른 연결이 들어옴
+                await asyncio.sleep(0.01)
+                session = render_session.open_render_session(
+                    video_file_path=video_file_path,
+                    job_id=f"job_{len(started_job_ids)}",
+                    status_file_path=tmp_path / "render_status.yaml",
+                )
+                started_job_ids.append(session.job_id)
+            return session
+
+    # when
+    sessions = await asyncio.gather(connect(), connect(), connect())
+
+    # then
+    assert started_job_ids == ["job_0"]
+    assert all(session is sessions[0] for session in sessions)
+    assert sessions[0].connection_count == 3
+    assert render_session._render_start_locks == {}
+
+
+def test_close_render_session_after_last_connection(tmp_path: Path):
+    # given
+    video_file_path, _ = open_session(tmp_path, "RUNNING")
+    render_session.attach_render_session(video_file_path)
+
+    # when, then: 마지막 연결이 끝날 때만 정리
+    assert not render_session.is_last_render_connection(video_file_path)
+    assert not render_session.close_render_session(video_file_path)
+    assert render_session.is_last_render_connection(video_file_path)
+    assert render_session.close_render_session(video_file_path)
+    assert render_session.attach_render_session(video_file_path) is None
+
+
+def test_detach_with_other_connection(tmp_path: Path, monkeypatch):
+    # given
+    monkeypatch.setenv(render_session.RENDER_RECONNECT_GRACE_SECONDS_ENV, "0")
+    video_file_path, session = open_session(tmp_path, "RUNNING")
+    render_session.attach_render_session(video_file_path)
+
+    # when
+    is_detached = render_session.detach_render_session(
+        video_file_path=video_file_path,
+        logger=MagicMock(),
+    )
+
+    # then: 다른 연결이 기다리고 있으면 취소하지 않음
+    assert is_detached
+    assert session.connection_count == 1
+    assert session.expire_task is None
@@ -0,0 +1,111 @@
+import asyncio
+import pytest
+import yaml
+from ad_fast_api.domain.make_animation.sources.features import render_status_file
+
+
+def write_status_file(file_path, status, progress=None, error=None, exit_code=None):
+    file_path.write_text(
+        yaml.dump(
+            {
+                "job_id": "job123",
+                "status": status,
+                "progress": progress or {},
+                "error": error,
+                "exit_code": exit_code,
+            }
+        )
+    )
+
+
+def test_read_render_status_file(tmp_path):
+    # given
+    status_file_path = tmp_path / "render_status_job123.yaml"
+    progress = {"phase": "rendering", "frames_done": 5, "total_frames": 10}
+
+    # when, then
+    assert render_status_file.read_render_status_file(status_file_path) is None
+
+    write_status_file(status_file_path, "RUNNING", progress)
+    assert render_status_file.read_render_status_file(status_file_path) == {
+        "is_finished": False,
+        "progress": progress,
+        "status": "RUNNING",
+        "exit_code": None,
+        "error": None,
+    }
+
+    # 실패 이유를 함께 읽음
+    write_status_file(
+        status_file_path,
+        "FAILED",
+        error="render worker exited with code 3",
+        exit_code=3,
+    )
+    assert render_status_file.read_render_status_file(status_file_path) == {
+        "is_finished": True,
+        "progress": None,
+        "status": "FAILED",
+        "exit_code": 3,
+        "error": "render worker exited with code 3",
+    }
+
+
+@pytest.mark.asyncio
+async def test_render_status_watcher_publishes_changes(tmp_path):
+    # given
+    status_file_path = tmp_path / "render_status_job123.yaml"
+    watcher = render_status_file.RenderStatusWatcher(poll_seconds=0.01)
+    progress = {"phase": "rendering", "frames_done": 5, "total_frames": 10}
+
+    async with watcher.watch(status_file_path) as render_statuses:
+        # when, then: 파일이 없으면 None
+        assert await render_statuses.get() is None
+
+        write_status_file(status_file_path, "RUNNING", progress)
+        render_status = await asyncio.wait_for(render_statuses.get(), timeout=1)
+        assert not render_status["is_finished"]
+        assert render_status["progress"] == progress
+
+        write_status_file(status_file_path, "FINISHED")
+        render_status = await asyncio.wait_for(render_statuses.get(), timeout=1)
+        assert render_status["is_finished"]
+
+        # 같은 파일을 기다리는 연결은 하나의 task에서 함께 확인
+        async with watcher.watch(status_file_path) as other_render_statuses:
+            assert (await other_render_statuses.get())["is_finished"]
+            assert watcher.watching_count == 2
+
+    # 기다리는 연결이 없으면 확인 task 종료
+    assert watcher.watching_count == 0
+    assert watcher._task is None
+
+
+@pytest.mark.asyncio
+async def test_render_status_watcher_reads_off_event_loop(tmp_path, monkeypatch):
+    # given
+    status_file_path = tmp_path / "render_status_job123.yaml"
+    write_status_file(status_file_path, "RUNNING")
+    watcher = render_status_file.RenderStatusWatcher(poll_seconds=0.01)
+    event_loop_thread_reads = []
+    read_render_status_file = render_status_file.read_render_status_file
+
+    def read_in_thread(file_path):
+        try:
+            asyncio.get_running_loop()
+            event_loop_thread_reads.append(file_path)
+        except RuntimeError:
+            pass
+        return read_render_status_file(file_path)
+
+    monkeypatch.setattr(render_status_file, "read_render_status_file", read_in_thread)
+
+    # when
+    async with watcher.watch(status_file_path) as render_statuses:
+        assert (await render_statuses.get())["status"] == "RUNNING"
+        write_status_file(status_file_path, "FINISHED")
+        render_status = await asyncio.wait_for(render_statuses.get(), timeout=1)
+
+    # then: 상태 파일은 event loop가 아닌 스레드에서 읽음
+    assert render_status["is_finished"]
+    assert event_loop_thread_reads == []
@@ -1,4 +1,4 @@
-IMAGE_SHAPE_ERROR = "image must have 3 channels (rgb). Found {len_shape}"
+DECODE_IMAGE_ERROR = "Failed to decode uploaded image."
 DETECT_CHARACTER_TORCHSERVE_ERROR = "Failed to get bounding box, please check if the 'docker_torchserve' is running and healthy, resp: {resp}"
 DETECTION_ERROR = "Error performing detection. Check that drawn_humanoid_detector.mar was properly downloaded. Response: {detection_results}"
 NO_DETECTION_ERROR = "Could not detect any drawn humanoids in the image. Aborting"
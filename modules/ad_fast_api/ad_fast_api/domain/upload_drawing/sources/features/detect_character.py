@@ -1,5 +1,4 @@
 import cv2
-from pathlib import Path
 from ad_fast_api.domain.upload_drawing.sources.errors import (
     upload_drawing_500_status as ud5s,
 )
@@ -10,33 +9,28 @@ import httpx
 from numpy.typing import NDArray
 import json
 from ad_fast_api.domain.schema.sources.schemas import BoundingBox
-from ad_fast_api.workspace.sources import conf_workspace as cw
 from fastapi import HTTPException
+from ad_fast_api.snippets.sources.save_image import encode_image
+from ad_fast_api.snippets.sources.ad_torchserve_client import (
+    DRAWN_HUMANOID_DETECTOR,
+    get_prediction_url,
+    get_torchserve_client,
+)
+from ad_fast_api.snippets.sources.ad_torchserve_batcher import get_torchserve_batcher
 
 
-DETECT_CHARACTER_TORCHSERVE_URL = (
-    "http://ad_torchserve:8080/predictions/drawn_humanoid_detector"
-)
+DETECT_CHARACTER_TORCHSERVE_URL = get_prediction_url(DRAWN_HUMANOID_DETECTOR)
+# torchserve 전송용 PNG는 압축률보다 인코딩 속도를 우선 (무손실이므로 검출 결과는 동일)
+DETECTOR_PNG_COMPRESSION = 1
 
 
-def check_image_is_rgb(
-    base_path: Path,
-    logger: Logger,
-    origin_image_name: Optional[str] = None,
-) -> NDArray:
-    origin_image_path = base_path.joinpath(origin_image_name or cw.ORIGIN_IMAGE_NAME)
-
-    img = cv2.imread(origin_image_path.as_posix())
-
-    # ensure it's rgb
-    if len(img.shape) != 3:
-        msg = ud5s.IMAGE_SHAPE_ERROR.format(
-            len_shape=len(
-                img.shape,
-            )
-        )
-        logger.critical(msg)
-        raise Exception(msg)
+def decode_image(file_buffer: NDArray) -> NDArray:
+    # 업로드된 bytes를 디스크를 거치지 않고 바로 디코딩
+    # IMREAD_COLOR는 흑백, 알파 채널 이미지도 3채널(BGR)로 디코딩
+    # image process pool 워커에서 실행되므로 로그는 호출한 프로세스에서 남김
+    img = cv2.imdecode(file_buffer, cv2.IMREAD_COLOR)
+    if img is None:
+        raise Exception(ud5s.DECODE_IMAGE_ERROR)
 
     return img
 
@@ -52,43 +46,63 @@ def resize_image(img: NDArray) -> NDArray:
     return img
 
 
+# image process pool 워커에서 실행, torchserve로 전송할 bytes로 변환
+def resize_and_encode_image(img: NDArray) -> bytes:
+    return encode_image(
+        resize_image(img=img),
+        params=[cv2.IMWRITE_PNG_COMPRESSION, DETECTOR_PNG_COMPRESSION],
+    )
+
+
+# image process pool 워커에서 실행, 업로드 bytes를 한 번만 디코딩하여 전송용 bytes로 변환
+def decode_resize_and_encode_image(file_buffer: NDArray) -> bytes:
+    img = decode_image(file_buffer=file_buffer)
+    return resize_and_encode_image(img=img)
+
+
 async def detect_character_from_origin_async(
-    img: NDArray,
+    img_bytes: bytes,
     logger: Logger,
     url: Optional[str] = None,
 ) -> httpx.Response:
-    # convert to bytes and send to torchserve
-    img_b = cv2.imencode(".png", img)[1].tobytes()
-    request_data = {"data": img_b}
-
-    timeout = httpx.Timeout(25)
-    async with httpx.AsyncClient(verify=False, timeout=timeout) as client:
-        try:
-            resp = await client.post(
-                url or DETECT_CHARACTER_TORCHSERVE_URL,
-                files=request_data,
-            )
-        except Exception as e:
-            msg = ud5s.DETECT_CHARACTER_TORCHSERVE_ERROR.format(resp=str(e))
-            logger.critical(msg)
-            raise Exception(msg)
-
-        if resp.status_code == 503:
-            msg = ud5s.DETECT_CHARACTER_TORCHSERVE_ERROR.format(resp=resp)
-            logger.critical(
-                f"{msg}, work load is too high, status code: {resp.status_code}"
-            )
-            raise HTTPException(
-                status_code=503,
-                detail=msg,
-            )
-
-        if resp.status_code >= 300:
-            msg = ud5s.DETECT_CHARACTER_TORCHSERVE_ERROR.format(resp=resp)
-            logger.critical(msg)
-            raise Exception(msg)
-
-        return resp
+    # send to torchserve
+    request_data = {"data": img_bytes}
+
+    try:
+        resp = await get_torchserve_batcher().post_prediction(
+            model_name=DRAWN_HUMANOID_DETECTOR,
+            files=request_data,
+            url=url or DETECT_CHARACTER_TORCHSERVE_URL,
+        )
+    except HTTPException as he:
+        # limiter가 과부하로 거절한 경우 Retry-After 헤더와 함께 그대로 전달
+        logger.critical(f"{he.detail}, status code: {he.status_code}")
+        raise he
+    except Exception as e:
+        msg = ud5s.DETECT_CHARACTER_TORCHSERVE_ERROR.format(resp=str(e))
+        logger.critical(msg)
+        raise Exception(msg)
+
+    if resp.status_code == 503:
+        msg = ud5s.DETECT_CHARACTER_TORCHSERVE_ERROR.format(resp=resp)
+        logger.critical(
+            f"{msg}, work load is too high, status code: {resp.status_code}"
+        )
+        retry_after_seconds = get_torchserve_client().get_retry_after_seconds(
+            DRAWN_HUMANOID_DETECTOR,
+        )
+        raise HTTPException(
+            status_code=503,
+            detail=msg,
+            headers={"Retry-After": str(retry_after_seconds)},
+        )
+
+    if resp.status_code >= 300:
+        msg = ud5s.DETECT_CHARACTER_TORCHSERVE_ERROR.format(resp=resp)
+        logger.critical(msg)
+        raise Exception(msg)
+
+    return resp
 
 
 def check_detection_results(
@@ -0,0 +1,260 @@
+import os
+import time
+import shutil
+import asyncio
+import hashlib
+import threading
+from uuid import uuid4
+from pathlib import Path
+from typing import Optional, Self
+from ad_fast_api.domain.schema.sources.schemas import BoundingBox
+from ad_fast_api.snippets.sources.ad_env import fetch_env_from_os_or_default
+from ad_fast_api.snippets.sources.save_dict import file_to_dict
+from ad_fast_api.workspace.sources.conf_workspace import (
+    BOUNDING_BOX_FILE_NAME,
+    DRAWING_INDEX_PATH,
+    ORIGIN_IMAGE_NAME,
+)
+
+
+DRAWING_INDEX_MAX_AGE_SECONDS_ENV = "AD_DRAWING_INDEX_MAX_AGE_SECONDS"
+DRAWING_INDEX_MAX_BYTES_ENV = "AD_DRAWING_INDEX_MAX_BYTES"
+TMP_ENTRY_PREFIX = "tmp_"
+# 크기 제한을 넘지 않으면 이 간격마다 한 번만 전체 항목을 확인하여 오래된 항목을 삭제
+DRAWING_INDEX_EVICT_INTERVAL_SECONDS = 60 * 60
+
+
+def hash_file_bytes(file_bytes: bytes) -> str:
+    return hashlib.sha256(file_bytes).hexdigest()
+
+
+def link_or_copy_file(
+    src_path: Path,
+    dst_path: Path,
+):
+    # 같은 파일 시스템이면 하드링크로 복사 비용 없이 공유
+    try:
+        os.link(src_path, dst_path)
+    except OSError:
+        shutil.copyfile(src_path, dst_path)
+
+
+def get_entry_bytes(entry_path: Path) -> int:
+    return sum(f.stat().st_size for f in entry_path.iterdir())
+
+
+class DrawingIndex:
+    """
+    업로드된 그림의 sha256 해시로 원본 이미지와 bounding_box.yaml을 찾는 인덱스 입니다.
+    같은 그림이 다시 업로드되면 torchserve 검출을 건너뛰고 저장된 결과를 재사용합니다.
+
+    - index_path/<content_hash>/ 에 원본 이미지와 bounding_box.yaml을 저장
+    - max_age_seconds 동안 사용되지 않은 항목은 삭제
+    - 전체 크기가 max_bytes를 넘으면 가장 오래 사용되지 않은 항목부터 삭제
+    - 전체 크기는 메모리에서 관리하며, 전체 항목 확인은 크기를 넘거나
+      evict_interval_seconds가 지났을 때만 합니다.
+    - 파일 작업은 event loop를 막지 않도록 restore_async, store_async로 thread에서 실행합니다.
+    """
+
+    index_path: Path
+    max_age_seconds: float
+    max_bytes: int
+
+    def __init__(
+        self,
+        index_path: Path,
+        max_age_seconds: float,
+        max_bytes: int,
+        evict_interval_seconds: float = DRAWING_INDEX_EVICT_INTERVAL_SECONDS,
+    ):
+        self.index_path = index_path
+        self.max_age_seconds = max_age_seconds
+        self.max_bytes = max_bytes
+        self.evict_interval_seconds = evict_interval_seconds
+        self.hit_count = 0
+        self.miss_count = 0
+        self.eviction_count = 0
+        # 마지막 전체 확인 이후 저장한 항목까지 더한 전체 크기, None이면 아직 확인하지 않음
+        self._total_bytes: Optional[int] = None
+        self._evicted_at = 0.0
+        self._lock = threading.Lock()
+        self._evict_lock = threading.Lock()
+
+    @classmethod
+    def mock(cls, index_path: Path) -> Self:
+        return cls(
+            index_path=index_path,
+            max_age_seconds=60,
+            max_bytes=1024 * 1024,
+        )
+
+    def get_entry_path(self, content_hash: str) -> Path:
+        return self.index_path.joinpath(content_hash)
+
+    def restore(
+        self,
+        content_hash: str,
+        base_path: Path,
+    ) -> Optional[BoundingBox]:
+        entry_path = self.get_entry_path(content_hash)
+        origin_image_path = entry_path.joinpath(ORIGIN_IMAGE_NAME)
+        bounding_box_path = entry_path.joinpath(BOUNDING_BOX_FILE_NAME)
+
+        try:
+            bounding_box = BoundingBox(**file_to_dict(file_path=bounding_box_path))
+            link_or_copy_file(
+                src_path=origin_image_path,
+                dst_path=base_path.joinpath(ORIGIN_IMAGE_NAME),
+            )
+        except Exception:
+            # 항목이 없거나 eviction 중 삭제된 경우
+            self.miss_count += 1
+            return None
+
+        # bounding_box.yaml은 find_character에서 덮어쓰므로 하드링크하지 않고 복사
+        shutil.copyfile(bounding_box_path, base_path.joinpath(BOUNDING_BOX_FILE_NAME))
+        # 최근 사용 시간 갱신 (eviction 기준)
+        os.utime(entry_path)
+        self.hit_count += 1
+        return bounding_box
+
+    def store(
+        self,
+        content_hash: str,
+        base_path: Path,
+    ):
+        entry_path = self.get_entry_path(content_hash)
+        if entry_path.exists():
+            return
+
+        # 임시 디렉토리에 모두 저장한 뒤 rename 하여 완성된 항목만 보이도록 함
+        self.index_path.mkdir(parents=True, exist_ok=True)
+        tmp_entry_path = self.index_path.joinpath(TMP_ENTRY_PREFIX + uuid4().hex)
+        tmp_entry_path.mkdir()
+        try:
+            link_or_copy_file(
+                src_path=base_path.joinpath(ORIGIN_IMAGE_NAME),
+                dst_path=tmp_entry_path.joinpath(ORIGIN_IMAGE_NAME),
+            )
+            shutil.copyfile(
+                base_path.joinpath(BOUNDING_BOX_FILE_NAME),
+                tmp_entry_path.joinpath(BOUNDING_BOX_FILE_NAME),
+            )
+            entry_bytes = get_entry_bytes(tmp_entry_path)
+            tmp_entry_path.rename(entry_path)
+        except OSError:
+            # 같은 그림이 동시에 업로드되어 이미 저장된 경우
+            if not entry_path.exists():
+                raise
+            return
+        finally:
+            shutil.rmtree(tmp_entry_path, ignore_errors=True)
+
+        now = time.time()
+        with self._lock:
+            if self._total_bytes is not None:
+                self._total_bytes += entry_bytes
+            should_evict = (
+                self._total_bytes is None
+                or self._total_bytes > self.max_bytes
+                or now - self._evicted_at >= self.evict_interval_seconds
+            )
+        if should_evict:
+            self.evict(now=now)
+
+    async def restore_async(
+        self,
+        content_hash: str,
+        base_path: Path,
+    ) -> Optional[BoundingBox]:
+        return await asyncio.to_thread(
+            self.restore,
+            content_hash=content_hash,
+            base_path=base_path,
+        )
+
+    async def store_async(
+        self,
+        content_hash: str,
+        base_path: Path,
+    ):
+        await asyncio.to_thread(
+            self.store,
+            content_hash=content_hash,
+            base_path=base_path,
+        )
+
+    def evict(self, now: Optional[float] = None):
+        # 다른 thread가 전체 항목을 확인하고 있으면 건너뜀
+        if not self._evict_lock.acquire(blocking=False):
+            return
+        try:
+            self._evict(now or time.time())
+        finally:
+            self._evict_lock.release()
+
+    def _evict(self, now: float):
+        if not self.index_path.exists():
+            return
+
+        entries = []
+        for entry_path in self.index_path.iterdir():
+            if entry_path.name.startswith(TMP_ENTRY_PREFIX):
+                continue
+            try:
+                last_used = entry_path.stat().st_mtime
+                size = get_entry_bytes(entry_path)
+            except OSError:
+                continue
+            entries.append((last_used, size, entry_path))
+
+        # 오래 사용되지 않은 항목부터 삭제
+        entries.sort()
+        total_bytes = sum(size for _, size, _ in entries)
+        for last_used, size, entry_path in entries:
+            is_expired = now - last_used > self.max_age_seconds
+            if not is_expired and total_bytes <= self.max_bytes:
+                break
+            shutil.rmtree(entry_path, ignore_errors=True)
+            total_bytes -= size
+            self.eviction_count += 1
+
+        with self._lock:
+            self._total_bytes = total_bytes
+            self._evicted_at = now
+
+    def get_metrics(self) -> dict:
+        return {
+            "hit_count": self.hit_count,
+            "miss_count": self.miss_count,
+            "eviction_count": self.eviction_count,
+        }
+
+
+# lazy init
+_drawing_index = None
+
+
+def create_drawing_index_instance() -> DrawingIndex:
+    return DrawingIndex(
+        index_path=DRAWING_INDEX_PATH,
+        max_age_seconds=float(
+            fetch_env_from_os_or_default(
+                DRAWING_INDEX_MAX_AGE_SECONDS_ENV,
+                str(7 * 24 * 60 * 60),
+            )
+        ),
+        max_bytes=int(
+            fetch_env_from_os_or_default(
+                DRAWING_INDEX_MAX_BYTES_ENV,
+                str(1024 * 1024 * 1024),
+            )
+        ),
+    )
+
+
+def get_drawing_index() -> DrawingIndex:
+    global _drawing_index
+    if _drawing_index is None:
+        _drawing_index = create_drawing_index_instance()
+    return _drawing_index
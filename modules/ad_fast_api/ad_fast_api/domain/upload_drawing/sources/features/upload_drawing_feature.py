@@ -1,4 +1,7 @@
-from fastapi import UploadFile
+import asyncio
+import numpy as np
+from typing import Tuple
+from fastapi import UploadFile, HTTPException
 from ad_fast_api.domain.upload_drawing.sources.errors import (
     upload_drawing_400_status as ud4s,
 )
@@ -16,46 +19,98 @@ from ad_fast_api.domain.upload_drawing.sources.features.detect_character import
     calculate_bounding_box,
     sort_detection_results,
     check_detection_results,
-    check_image_is_rgb,
-    resize_image,
+    decode_resize_and_encode_image,
+)
+from ad_fast_api.domain.upload_drawing.sources.features.drawing_index import (
+    get_drawing_index,
+    hash_file_bytes,
 )
 from ad_fast_api.snippets.sources.save_image import save_image_async, get_file_bytes
 from ad_fast_api.snippets.sources.save_dict import dict_to_file
 from ad_fast_api.domain.schema.sources.schemas import BoundingBox
 from ad_fast_api.snippets.sources.ad_logger import setup_logger
+from ad_fast_api.snippets.sources.ad_process_pool import run_image_task_async
+from pathlib import Path
+from logging import Logger
 
 
-async def save_origin_image_async(file: UploadFile) -> str:
+async def read_origin_image_async(file: UploadFile) -> Tuple[str, bytes]:
     file_bytes = get_file_bytes(file=file)
     if not file_bytes:
         raise ud4s.UPLOADED_FILE_EMPTY_OR_INVALID
 
     ad_id = make_ad_id()
-    base_path = create_base_dir(ad_id=ad_id)
-    await save_image_async(
-        image_bytes=file_bytes,
-        image_name=ORIGIN_IMAGE_NAME,
-        base_path=base_path,
-    )
-    return ad_id
+    create_base_dir(ad_id=ad_id)
+    return ad_id, file_bytes
 
 
-async def detect_character(ad_id: str) -> BoundingBox:
+async def detect_character(
+    ad_id: str,
+    file_bytes: bytes,
+) -> BoundingBox:
     base_path = get_base_path(ad_id=ad_id)
     logger = setup_logger(ad_id=ad_id)
 
+    # 같은 그림이 이미 업로드된 적 있으면 저장된 원본 이미지와 검출 결과를 재사용
+    drawing_index = get_drawing_index()
+    content_hash = hash_file_bytes(file_bytes)
+    bounding_box = await drawing_index.restore_async(
+        content_hash=content_hash,
+        base_path=base_path,
+    )
+    if bounding_box is not None:
+        logger.info(f"Reuse detection result of drawing {content_hash}")
+        return bounding_box
+
+    # 원본 이미지는 검출과 동시에 백그라운드에서 저장
+    save_origin_image_task = asyncio.create_task(
+        save_image_async(
+            image_bytes=file_bytes,
+            image_name=ORIGIN_IMAGE_NAME,
+            base_path=base_path,
+        )
+    )
     try:
-        img = check_image_is_rgb(
+        bounding_box = await detect_character_from_bytes(
+            file_bytes=file_bytes,
             base_path=base_path,
             logger=logger,
         )
+    finally:
+        # 이후 단계(find_character)에서 원본 이미지를 읽으므로 응답 전에 저장 완료를 보장
+        await save_origin_image_task
+
+    try:
+        await drawing_index.store_async(
+            content_hash=content_hash,
+            base_path=base_path,
+        )
     except Exception as e:
-        raise ud4s.IMAGE_IS_NOT_RGB
+        # 인덱스 저장 실패는 업로드 결과에 영향을 주지 않음
+        logger.warning(f"Failed to store drawing {content_hash} to index: {e}")
+
+    return bounding_box
 
-    img = resize_image(img=img)
+
+async def detect_character_from_bytes(
+    file_bytes: bytes,
+    base_path: Path,
+    logger: Logger,
+) -> BoundingBox:
+    # 디코딩, resize, 인코딩은 image process pool에서 한 번에 실행
+    try:
+        img_bytes = await run_image_task_async(
+            decode_resize_and_encode_image,
+            np.frombuffer(file_bytes, dtype=np.uint8),
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.critical(str(e))
+        raise ud4s.IMAGE_IS_NOT_RGB
 
     resp = await detect_character_from_origin_async(
-        img=img,
+        img_bytes=img_bytes,
         logger=logger,
     )
 
@@ -1,8 +1,11 @@
-from fastapi import APIRouter, UploadFile, File
+from fastapi import APIRouter, BackgroundTasks, UploadFile, File
 from ad_fast_api.domain.upload_drawing.sources.features.upload_drawing_feature import (
-    save_origin_image_async,
+    read_origin_image_async,
     detect_character,
 )
+from ad_fast_api.domain.find_character.sources.features.speculative_segmentation import (
+    segment_character_speculatively,
+)
 from ad_fast_api.snippets.sources.ad_http_exception import handle_operation_async
 from ad_fast_api.domain.upload_drawing.sources.upload_drawing_schema import (
     UploadDrawingResponse,
@@ -14,20 +17,29 @@ router = APIRouter()
 
 @router.post("/upload_drawing")
 async def upload_drawing(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
 ) -> UploadDrawingResponse:
-    ad_id = await handle_operation_async(
-        save_origin_image_async,
+    ad_id, file_bytes = await handle_operation_async(
+        read_origin_image_async,
         file=file,
         status_code=500,
     )
     bounding_box = await handle_operation_async(
         detect_character,
         ad_id=ad_id,
+        file_bytes=file_bytes,
         status_code=501,
     )
     bounding_box_dict = bounding_box.model_dump(mode="json")
 
+    # 대부분 검출된 bbox 그대로 find_character를 호출하므로 응답 후 미리 계산
+    background_tasks.add_task(
+        segment_character_speculatively,
+        ad_id=ad_id,
+        bounding_box=bounding_box,
+    )
+
     return UploadDrawingResponse(
         ad_id=ad_id,
         bounding_box=bounding_box_dict,
@@ -0,0 +1,126 @@
+import time
+import random
+import asyncio
+import httpx
+from ad_fast_api.snippets.sources.ad_torchserve_client import (
+    ADTorchServeClient,
+    DRAWN_HUMANOID_DETECTOR,
+)
+from ad_fast_api.snippets.sources.ad_torchserve_batcher import ADTorchServeBatcher
+
+
+NUM_REQUESTS = 32
+DUPLICATE_RATIO = 0.25
+INFERENCE_SECONDS = 0.05
+MAX_BATCH_DELAY_SECONDS = 0.01
+
+
+class StandInModelServer:
+    """
+    TorchServe 워커 1개를 흉내내는 stand-in 서버 입니다.
+    batch_size 만큼의 요청을 max_batch_delay 동안 모아 한 번의 추론(INFERENCE_SECONDS)으로 처리합니다.
+    """
+
+    def __init__(self, batch_size: int):
+        self.batch_size = batch_size
+        self.inference_count = 0
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._worker_task = asyncio.create_task(self._run_worker())
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put(future)
+        await future
+        return httpx.Response(200, json=[{"bbox": [0, 0, 10, 10], "score": 0.9}])
+
+    async def _run_worker(self):
+        while True:
+            batch = [await self._queue.get()]
+            deadline = time.perf_counter() + MAX_BATCH_DELAY_SECONDS
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.perf_counter()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            await asyncio.sleep(INFERENCE_SECONDS)
+            self.inference_count += 1
+            for future in batch:
+                future.set_result(None)
+
+    def close(self):
+        self._worker_task.cancel()
+
+
+def create_payloads() -> list[bytes]:
+    random.seed(0)
+    payloads = [f"image_{i}".encode() for i in range(NUM_REQUESTS)]
+    # 재시도, 중복 업로드로 같은 이미지가 동시에 들어오는 경우
+    for i in random.sample(range(1, NUM_REQUESTS), int(NUM_REQUESTS * DUPLICATE_RATIO)):
+        payloads[i] = payloads[i - 1]
+    return payloads
+
+
+async def measure_elapsed(
+    server_batch_size: int,
+    use_batcher: bool,
+) -> tuple[float, int]:
+    server = StandInModelServer(batch_size=server_batch_size)
+    torchserve_client = ADTorchServeClient(
+        max_connections=NUM_REQUESTS,
+        max_keepalive_connections=NUM_REQUESTS,
+        keepalive_expiry=30,
+        timeout_seconds=30,
+        transport=httpx.MockTransport(server.handle),
+    )
+    # 진행중인 같은 이미지 요청만 합치고, 다른 이미지는 기다리지 않고 바로 전송
+    post_prediction = (
+        ADTorchServeBatcher(torchserve_client=torchserve_client).post_prediction
+        if use_batcher
+        else torchserve_client.post_prediction
+    )
+    torchserve_client.start()
+
+    try:
+        start_time = time.perf_counter()
+        await asyncio.gather(
+            *[
+                post_prediction(
+                    model_name=DRAWN_HUMANOID_DETECTOR,
+                    files={"data": payload},
+                    url="http://stand_in:8080/predictions/drawn_humanoid_detector",
+                )
+                for payload in create_payloads()
+            ]
+        )
+        elapsed = time.perf_counter() - start_time
+    finally:
+        await torchserve_client.aclose()
+        server.close()
+
+    return elapsed, server.inference_count
+
+
+async def case_benchmark_torchserve_batcher():
+    print(f"requests: {NUM_REQUESTS}, duplicate ratio: {DUPLICATE_RATIO}")
+    for server_batch_size in [1, 4]:
+        for use_batcher in [False, True]:
+            elapsed, inference_count = await measure_elapsed(
+                server_batch_size=server_batch_size,
+                use_batcher=use_batcher,
+            )
+            print(
+                f"server batch_size {server_batch_size}, batcher {use_batcher}: "
+                f"{NUM_REQUESTS / elapsed:.2f} req/s, "
+                f"inference count {inference_count}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(case_benchmark_torchserve_batcher())
+
+
+# python -m ad_fast_api.domain.upload_drawing.tests.case.case_torchserve_batcher
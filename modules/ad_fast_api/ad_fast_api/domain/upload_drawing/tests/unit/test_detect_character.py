@@ -1,56 +1,18 @@
 import pytest
 import json
+import cv2
 import httpx
 import respx
 import numpy as np
-from ad_fast_api.domain.upload_drawing.testings import fake_upload_drawing as fud
-from unittest.mock import patch, Mock
+from unittest.mock import patch, Mock, AsyncMock
+from fastapi import HTTPException
 from ad_fast_api.domain.upload_drawing.sources.features import detect_character as dc
 from ad_fast_api.domain.upload_drawing.sources.errors import (
     upload_drawing_500_status as ud5s,
 )
 from ad_fast_api.snippets.testings.mock_logger import mock_logger
 from ad_fast_api.domain.schema.sources.schemas import BoundingBox
-
-
-def test_check_image_is_rgb_success():
-    # given
-    mock_logger = Mock()
-    origin_image_name = "test.png"
-
-    # Mock cv2.imread to return a numpy array with correct shape (3D array)
-    mock_image = np.zeros((2, 2, 3), dtype=np.uint8)  # 2x2 RGB image
-
-    with patch("cv2.imread", return_value=mock_image):
-        # when
-        img = dc.check_image_is_rgb(
-            base_path=fud.fake_workspace_files_path,
-            logger=mock_logger,
-            origin_image_name=origin_image_name,
-        )
-
-        # then
-        assert img is not None
-        assert img.shape == (2, 2, 3)  # Check the image dimensions
-        assert isinstance(img, np.ndarray)
-
-
-def test_check_image_is_rgb_raises_exception(mock_logger):
-    # given
-    origin_image_name = "test.png"
-
-    with patch("cv2.imread", return_value=[[0, 0], [0, 0]]):
-        # when
-        with pytest.raises(Exception) as excinfo:
-            dc.check_image_is_rgb(
-                base_path=fud.fake_workspace_files_path,
-                logger=mock_logger,
-                origin_image_name=origin_image_name,
-            )
-            # then
-            expected_msg = ud5s.IMAGE_SHAPE_ERROR.format(len_shape=2)
-            assert expected_msg == str(excinfo.value)
-            mock_logger.critical.assert_called_once_with(expected_msg)
+from ad_fast_api.workspace.sources import reqeust_files as rf
 
 
 def test_resize_image_when_larger_than_1000():
@@ -95,8 +57,8 @@ async def test_detect_character_from_origin_async_success(mock_logger):
     )
 
     # when
-    test_img = np.zeros((224, 224, 3), dtype=np.uint8)
-    response = await dc.detect_character_from_origin_async(test_img, mock_logger)
+    test_img_bytes = dc.resize_and_encode_image(np.zeros((224, 224, 3), dtype=np.uint8))
+    response = await dc.detect_character_from_origin_async(test_img_bytes, mock_logger)
 
     # then
     assert response.status_code == mock_response.status_code
@@ -111,11 +73,11 @@ async def test_detect_character_from_origin_async_fail_status_code_300(mock_logg
     # given
     mock_response = httpx.Response(300, content=b"Bad Request")
     respx.post(dc.DETECT_CHARACTER_TORCHSERVE_URL).mock(return_value=mock_response)
-    test_img = np.zeros((224, 224, 3), dtype=np.uint8)
+    test_img_bytes = dc.resize_and_encode_image(np.zeros((224, 224, 3), dtype=np.uint8))
 
     # when
     with pytest.raises(Exception) as exc_info:
-        await dc.detect_character_from_origin_async(test_img, mock_logger)
+        await dc.detect_character_from_origin_async(test_img_bytes, mock_logger)
 
     # then
     expected_msg = ud5s.DETECT_CHARACTER_TORCHSERVE_ERROR.format(resp=mock_response)
@@ -129,11 +91,11 @@ async def test_detect_character_from_origin_async_fail_connection_error(mock_log
     # given
     test_exception = httpx.ConnectError("Connection failed")
     respx.post(dc.DETECT_CHARACTER_TORCHSERVE_URL).mock(side_effect=test_exception)
-    test_img = np.zeros((224, 224, 3), dtype=np.uint8)
+    test_img_bytes = dc.resize_and_encode_image(np.zeros((224, 224, 3), dtype=np.uint8))
 
     # when
     with pytest.raises(Exception) as exc_info:
-        await dc.detect_character_from_origin_async(test_img, mock_logger)
+        await dc.detect_character_from_origin_async(test_img_bytes, mock_logger)
 
     # then
     expected_msg = ud5s.DETECT_CHARACTER_TORCHSERVE_ERROR.format(
@@ -143,6 +105,94 @@ async def test_detect_character_from_origin_async_fail_connection_error(mock_log
     mock_logger.critical.assert_called_once_with(expected_msg)
 
 
+@pytest.mark.asyncio
+@respx.mock
+async def test_detect_character_from_origin_async_fail_status_code_503(mock_logger):
+    # given
+    mock_response = httpx.Response(503, content=b"Service Unavailable")
+    respx.post(dc.DETECT_CHARACTER_TORCHSERVE_URL).mock(return_value=mock_response)
+
+    # when
+    with pytest.raises(HTTPException) as exc_info:
+        await dc.detect_character_from_origin_async(b"image", mock_logger)
+
+    # then
+    assert exc_info.value.status_code == 503
+    assert "Retry-After" in exc_info.value.headers
+
+
+@pytest.mark.asyncio
+async def test_detect_character_from_origin_async_passes_limiter_rejection(
+    mock_logger,
+):
+    # given
+    rejection = HTTPException(
+        status_code=503,
+        detail="overloaded",
+        headers={"Retry-After": "7"},
+    )
+    mock_batcher = Mock()
+    mock_batcher.post_prediction = AsyncMock(side_effect=rejection)
+
+    with patch.object(dc, "get_torchserve_batcher", return_value=mock_batcher):
+        # when
+        with pytest.raises(HTTPException) as exc_info:
+            await dc.detect_character_from_origin_async(b"image", mock_logger)
+
+    # then
+    assert exc_info.value is rejection
+    mock_logger.critical.assert_called_once()
+
+
+def test_resize_and_encode_image():
+    # given
+    test_image = np.zeros((1500, 2000, 3), dtype=np.uint8)
+
+    # when
+    img_bytes = dc.resize_and_encode_image(test_image)
+
+    # then
+    decoded_image = cv2.imdecode(np.frombuffer(img_bytes, np.uint8), cv2.IMREAD_COLOR)
+    assert decoded_image.shape == dc.resize_image(test_image).shape
+
+
+def test_decode_image_same_as_imread():
+    # given
+    upload_image_path = rf.EXAMPLE1_DIR_PATH.joinpath(rf.UPLOAD_IMAGE_FILE_NAME)
+    file_buffer = np.fromfile(upload_image_path.as_posix(), dtype=np.uint8)
+
+    # when
+    img = dc.decode_image(file_buffer=file_buffer)
+
+    # then
+    assert np.array_equal(img, cv2.imread(upload_image_path.as_posix()))
+
+
+def test_decode_image_raises_exception():
+    # given
+    file_buffer = np.frombuffer(b"fake image content", dtype=np.uint8)
+
+    # when
+    with pytest.raises(Exception) as excinfo:
+        dc.decode_image(file_buffer=file_buffer)
+
+    # then
+    assert str(excinfo.value) == ud5s.DECODE_IMAGE_ERROR
+
+
+def test_decode_resize_and_encode_image():
+    # given
+    test_image = np.random.randint(0, 255, (1500, 2000, 3), dtype=np.uint8)
+    file_buffer = np.frombuffer(cv2.imencode(".png", test_image)[1], dtype=np.uint8)
+
+    # when
+    img_bytes = dc.decode_resize_and_encode_image(file_buffer=file_buffer)
+
+    # then: 빠른 압축 설정이어도 무손실
+    decoded_image = cv2.imdecode(np.frombuffer(img_bytes, np.uint8), cv2.IMREAD_COLOR)
+    assert np.array_equal(decoded_image, dc.resize_image(test_image))
+
+
 def test_check_detection_results_success(mock_logger):
     # given
     expected_results = {"predictions": [{"bbox": [1, 2, 3, 4]}]}
@@ -0,0 +1,180 @@
+import os
+import time
+import pytest
+from unittest.mock import patch
+from ad_fast_api.domain.schema.sources.schemas import BoundingBox
+from ad_fast_api.domain.upload_drawing.sources.features.drawing_index import (
+    DrawingIndex,
+    hash_file_bytes,
+)
+from ad_fast_api.snippets.sources.save_dict import dict_to_file
+from ad_fast_api.workspace.sources.conf_workspace import (
+    BOUNDING_BOX_FILE_NAME,
+    ORIGIN_IMAGE_NAME,
+)
+
+
+def create_fake_work_dir(
+    base_path,
+    file_bytes: bytes,
+    bounding_box: BoundingBox,
+):
+    base_path.mkdir()
+    base_path.joinpath(ORIGIN_IMAGE_NAME).write_bytes(file_bytes)
+    dict_to_file(
+        to_save_dict=bounding_box.model_dump(mode="json"),
+        file_path=base_path.joinpath(BOUNDING_BOX_FILE_NAME),
+    )
+
+
+def test_hash_file_bytes():
+    # when
+    content_hash = hash_file_bytes(b"drawing")
+
+    # then
+    assert content_hash == hash_file_bytes(b"drawing")
+    assert content_hash != hash_file_bytes(b"other drawing")
+    assert len(content_hash) == 64
+
+
+def test_store_and_restore(tmp_path):
+    # given
+    drawing_index = DrawingIndex.mock(index_path=tmp_path.joinpath("index"))
+    file_bytes = b"drawing"
+    content_hash = hash_file_bytes(file_bytes)
+    bounding_box = BoundingBox.mock()
+    create_fake_work_dir(tmp_path.joinpath("first"), file_bytes, bounding_box)
+    new_base_path = tmp_path.joinpath("second")
+    new_base_path.mkdir()
+
+    # when
+    drawing_index.store(content_hash, tmp_path.joinpath("first"))
+    result = drawing_index.restore(content_hash, new_base_path)
+
+    # then
+    assert result == bounding_box
+    assert new_base_path.joinpath(ORIGIN_IMAGE_NAME).read_bytes() == file_bytes
+    assert new_base_path.joinpath(BOUNDING_BOX_FILE_NAME).exists()
+    assert drawing_index.get_metrics() == {
+        "hit_count": 1,
+        "miss_count": 0,
+        "eviction_count": 0,
+    }
+
+
+def test_restore_does_not_share_bounding_box_file(tmp_path):
+    # given
+    drawing_index = DrawingIndex.mock(index_path=tmp_path.joinpath("index"))
+    content_hash = hash_file_bytes(b"drawing")
+    create_fake_work_dir(tmp_path.joinpath("first"), b"drawing", BoundingBox.mock())
+    drawing_index.store(content_hash, tmp_path.joinpath("first"))
+    new_base_path = tmp_path.joinpath("second")
+    new_base_path.mkdir()
+    drawing_index.restore(content_hash, new_base_path)
+
+    # when: find_character에서 bounding_box.yaml을 덮어써도
+    changed_bounding_box = BoundingBox(top=1, bottom=2, left=3, right=4)
+    dict_to_file(
+        to_save_dict=changed_bounding_box.model_dump(mode="json"),
+        file_path=new_base_path.joinpath(BOUNDING_BOX_FILE_NAME),
+    )
+
+    # then: 인덱스의 검출 결과는 그대로 유지
+    third_base_path = tmp_path.joinpath("third")
+    third_base_path.mkdir()
+    assert drawing_index.restore(content_hash, third_base_path) == BoundingBox.mock()
+
+
+def test_restore_miss(tmp_path):
+    # given
+    drawing_index = DrawingIndex.mock(index_path=tmp_path.joinpath("index"))
+
+    # when
+    result = drawing_index.restore(hash_file_bytes(b"drawing"), tmp_path)
+
+    # then
+    assert result is None
+    assert drawing_index.miss_count == 1
+    assert not tmp_path.joinpath(ORIGIN_IMAGE_NAME).exists()
+
+
+def test_evict_expired_entry(tmp_path):
+    # given
+    drawing_index = DrawingIndex.mock(index_path=tmp_path.joinpath("index"))
+    content_hash = hash_file_bytes(b"drawing")
+    create_fake_work_dir(tmp_path.joinpath("first"), b"drawing", BoundingBox.mock())
+    drawing_index.store(content_hash, tmp_path.joinpath("first"))
+
+    # when
+    entry_path = drawing_index.get_entry_path(content_hash)
+    old_time = entry_path.stat().st_mtime - drawing_index.max_age_seconds - 1
+    os.utime(entry_path, (old_time, old_time))
+    drawing_index.evict()
+
+    # then
+    assert not entry_path.exists()
+    assert drawing_index.eviction_count == 1
+
+
+def test_evict_least_recently_used_when_over_max_bytes(tmp_path):
+    # given
+    drawing_index = DrawingIndex.mock(index_path=tmp_path.joinpath("index"))
+    drawing_index.max_bytes = 1500
+    now = time.time()
+    content_hashes = []
+    for i, name in enumerate(["first", "second", "third"]):
+        file_bytes = name.encode() * 100
+        content_hash = hash_file_bytes(file_bytes)
+        create_fake_work_dir(tmp_path.joinpath(name), file_bytes, BoundingBox.mock())
+        drawing_index.store(content_hash, tmp_path.joinpath(name))
+        entry_path = drawing_index.get_entry_path(content_hash)
+        os.utime(entry_path, (now - 10 + i, now - 10 + i))
+        content_hashes.append(content_hash)
+
+    # when
+    drawing_index.evict(now=now)
+
+    # then
+    assert not drawing_index.get_entry_path(content_hashes[0]).exists()
+    assert drawing_index.get_entry_path(content_hashes[1]).exists()
+    assert drawing_index.get_entry_path(content_hashes[2]).exists()
+
+
+def test_store_scans_index_only_when_needed(tmp_path):
+    # given
+    drawing_index = DrawingIndex.mock(index_path=tmp_path.joinpath("index"))
+    drawing_index.max_bytes = 1500
+
+    # when
+    with patch.object(
+        drawing_index,
+        "_evict",
+        wraps=drawing_index._evict,
+    ) as mock_evict:
+        for name in ["first", "second", "third", "fourth"]:
+            file_bytes = name.encode() * 100
+            create_fake_work_dir(tmp_path.joinpath(name), file_bytes, BoundingBox.mock())
+            drawing_index.store(hash_file_bytes(file_bytes), tmp_path.joinpath(name))
+
+    # then: 처음 한 번 전체 크기를 확인하고, 이후에는 크기 제한을 넘었을 때만 확인
+    scanned_counts = mock_evict.call_count
+    assert 1 < scanned_counts < 4
+    assert drawing_index.eviction_count > 0
+
+
+@pytest.mark.asyncio
+async def test_store_async_and_restore_async(tmp_path):
+    # given
+    drawing_index = DrawingIndex.mock(index_path=tmp_path.joinpath("index"))
+    content_hash = hash_file_bytes(b"drawing")
+    create_fake_work_dir(tmp_path.joinpath("first"), b"drawing", BoundingBox.mock())
+    new_base_path = tmp_path.joinpath("second")
+    new_base_path.mkdir()
+
+    # when
+    await drawing_index.store_async(content_hash, tmp_path.joinpath("first"))
+    result = await drawing_index.restore_async(content_hash, new_base_path)
+
+    # then
+    assert result == BoundingBox.mock()
+    assert new_base_path.joinpath(ORIGIN_IMAGE_NAME).read_bytes() == b"drawing"
@@ -9,14 +9,18 @@ from ad_fast_api.domain.upload_drawing.testings import (
 )
 from ad_fast_api.domain.upload_drawing.sources.errors import (
     upload_drawing_400_status as ud4s,
+    upload_drawing_500_status as ud5s,
 )
 from unittest.mock import patch, Mock, AsyncMock
 from ad_fast_api.domain.schema.sources.schemas import BoundingBox
 from ad_fast_api.workspace.sources.conf_workspace import BOUNDING_BOX_FILE_NAME
+from ad_fast_api.domain.upload_drawing.sources.features.drawing_index import (
+    DrawingIndex,
+)
 
 
 @pytest.mark.asyncio
-async def test_save_origin_image_success():
+async def test_read_origin_image_success():
     # given
     ad_id = "1234567890_hexcode"
     with (
@@ -34,75 +38,57 @@ async def test_save_origin_image_success():
             udf,
             "create_base_dir",
             return_value=fud.fake_workspace_files_path.joinpath(ad_id),
-        ),
-        patch.object(
-            udf,
-            "save_image_async",
-            return_value=ad_id,
-        ),
+        ) as mock_create_base_dir,
     ):
         # when
-        expect_ad_id = await udf.save_origin_image_async(
+        expect_ad_id, file_bytes = await udf.read_origin_image_async(
             file=UploadFile(
                 filename="test.png",
                 file=BytesIO(b"Hello, Async World!"),
             )
         )
-        # then
-        assert expect_ad_id == ad_id
+
+    # then
+    assert expect_ad_id == ad_id
+    assert file_bytes == b"Hello, Async World!"
+    mock_create_base_dir.assert_called_once_with(ad_id=ad_id)
 
 
 @pytest.mark.asyncio
-async def test_save_origin_image_fail_file_bytes_is_empty():
+async def test_read_origin_image_fail_file_bytes_is_empty():
     # given
-    ad_id = "1234567890_hexcode"
-    with (
-        patch.object(
-            udf,
-            "make_ad_id",
-            return_value=ad_id,
-        ),
-        patch.object(
-            udf,
-            "create_base_dir",
-            return_value=fud.fake_workspace_files_path.joinpath(ad_id),
-        ),
-        patch.object(
-            udf,
-            "get_file_bytes",
-            return_value=None,
-        ),
-        patch.object(
-            udf,
-            "save_image_async",
-            side_effect=ud4s.UPLOADED_FILE_EMPTY_OR_INVALID,
-        ),
-    ):
+    with patch.object(
+        udf,
+        "get_file_bytes",
+        return_value=b"",
+    ), patch.object(
+        udf,
+        "create_base_dir",
+    ) as mock_create_base_dir:
         # when
         with pytest.raises(HTTPException) as exc_info:
-            await udf.save_origin_image_async(
+            await udf.read_origin_image_async(
                 file=UploadFile(
                     filename="test.png",
-                    file=BytesIO(b"Hello, Async World!"),
+                    file=BytesIO(b""),
                 )
             )
 
-        # then
-        assert (
-            exc_info.value.status_code
-            == ud4s.UPLOADED_FILE_EMPTY_OR_INVALID.status_code
-        )
-        assert exc_info.value.detail == ud4s.UPLOADED_FILE_EMPTY_OR_INVALID.detail
+    # then
+    assert exc_info.value.status_code == ud4s.UPLOADED_FILE_EMPTY_OR_INVALID.status_code
+    assert exc_info.value.detail == ud4s.UPLOADED_FILE_EMPTY_OR_INVALID.detail
+    mock_create_base_dir.assert_not_called()
 
 
 @pytest.mark.asyncio
-async def test_detect_character_success():
+async def test_detect_character_success(tmp_path):
     # given
+    drawing_index = DrawingIndex.mock(index_path=tmp_path)
     ad_id = "test_ad_id"
+    file_bytes = b"fake_image_bytes"
     fake_base_path = fud.fake_workspace_files_path
     fake_logger = Mock()
-    fake_img = "fake_image"  # check_image_is_rgb가 반환할 가짜 이미지 (string, numpy array 등 상관없음)
-    fake_img_after_resize = "resized_image"  # resize_image 결과
+    fake_img_bytes = b"resized_image"  # decode_resize_and_encode_image 결과
     fake_response = Mock()  # send_to_torchserve가 반환할 응답 객체
     fake_detection_results = [
         "detection1",
@@ -114,12 +100,18 @@ async def test_detect_character_success():
     with patch.object(
         udf, "get_base_path", return_value=fake_base_path
     ) as mock_get_base_path, patch.object(
+        udf, "get_drawing_index", return_value=drawing_index
+    ), patch.object(
+        drawing_index, "store"
+    ) as mock_store, patch.object(
         udf, "setup_logger", return_value=fake_logger
     ) as mock_setup_logger, patch.object(
-        udf, "check_image_is_rgb", return_value=fake_img
-    ) as mock_check_image, patch.object(
-        udf, "resize_image", return_value=fake_img_after_resize
-    ) as mock_resize, patch.object(
+        udf, "save_image_async", new=AsyncMock()
+    ) as mock_save_image, patch.object(
+        udf,
+        "run_image_task_async",
+        new=AsyncMock(return_value=fake_img_bytes),
+    ) as mock_run_image_task, patch.object(
         udf,
         "detect_character_from_origin_async",
         new=AsyncMock(return_value=fake_response),
@@ -134,16 +126,24 @@ async def test_detect_character_success():
     ) as mock_save:
 
         # when
-        await udf.detect_character(ad_id)
+        bounding_box = await udf.detect_character(ad_id, file_bytes)
 
     # then: 함수들이 올바른 인자와 순서로 호출되었는지 확인
+    assert bounding_box == fake_bounding_box
     mock_get_base_path.assert_called_once_with(ad_id=ad_id)
     mock_setup_logger.assert_called_once_with(ad_id=ad_id)
-    mock_check_image.assert_called_once_with(
-        base_path=fake_base_path, logger=fake_logger
+    mock_save_image.assert_awaited_once_with(
+        image_bytes=file_bytes,
+        image_name=udf.ORIGIN_IMAGE_NAME,
+        base_path=fake_base_path,
     )
-    mock_resize.assert_called_once_with(img=fake_img)
-    mock_send.assert_awaited_once_with(img=fake_img_after_resize, logger=fake_logger)
+    mock_run_image_task.assert_awaited_once()
+    operation, file_buffer = mock_run_image_task.await_args.args
+    assert operation == udf.decode_resize_and_encode_image
+    assert file_buffer.tobytes() == file_bytes
+    # logger는 image process pool 워커에 전달하지 않음
+    assert mock_run_image_task.await_args.kwargs == {}
+    mock_send.assert_awaited_once_with(img_bytes=fake_img_bytes, logger=fake_logger)
     mock_check_detections.assert_called_once_with(
         resp=fake_response, logger=fake_logger
     )
@@ -157,48 +157,115 @@ async def test_detect_character_success():
         to_save_dict=fake_bounding_box.model_dump(mode="json"),
         file_path=fake_base_path.joinpath(BOUNDING_BOX_FILE_NAME),
     )
+    mock_store.assert_called_once_with(
+        content_hash=udf.hash_file_bytes(file_bytes),
+        base_path=fake_base_path,
+    )
+    assert drawing_index.miss_count == 1
 
 
 @pytest.mark.asyncio
-async def test_detect_character_fail_image_is_not_rgb():
+async def test_detect_character_fail_image_is_not_rgb(tmp_path):
     # given
+    drawing_index = DrawingIndex.mock(index_path=tmp_path)
     ad_id = "test_ad_id"
     fake_base_path = fud.fake_workspace_files_path
     fake_logger = Mock()
-    fake_img_after_resize = "resized_image"  # resize_image 결과
-    fake_response = Mock()  # send_to_torchserve가 반환할 응답 객체
-    fake_detection_results = [
-        "detection1",
-        "detection2",
-    ]  # check_detection_results 반환값
-    fake_bounding_box = BoundingBox.mock()  # calculate_bounding_box 반환값
 
-    # 내부 의존함수 모두 patch 처리
     with patch.object(
         udf, "get_base_path", return_value=fake_base_path
-    ) as mock_get_base_path, patch.object(
+    ), patch.object(
+        udf, "get_drawing_index", return_value=drawing_index
+    ), patch.object(
         udf, "setup_logger", return_value=fake_logger
-    ) as mock_setup_logger, patch.object(
-        udf, "check_image_is_rgb", side_effect=Exception("Image is not RGB")
-    ) as mock_check_image, patch.object(
-        udf, "resize_image", return_value=fake_img_after_resize
-    ) as mock_resize, patch.object(
+    ), patch.object(
+        udf, "save_image_async", new=AsyncMock()
+    ) as mock_save_image, patch.object(
         udf,
         "detect_character_from_origin_async",
-        new=AsyncMock(return_value=fake_response),
-    ) as mock_send, patch.object(
-        udf, "check_detection_results", return_value=fake_detection_results
-    ) as mock_check_detections, patch.object(
-        udf, "sort_detection_results"
-    ) as mock_sort, patch.object(
-        udf, "calculate_bounding_box", return_value=fake_bounding_box
-    ) as mock_calc, patch.object(
-        udf, "dict_to_file", new=Mock()
-    ) as mock_save:
+        new=AsyncMock(),
+    ) as mock_send:
+
+        # when
+        with pytest.raises(HTTPException) as exc_info:
+            await udf.detect_character(ad_id, b"not an image")
+
+    # then: 검출이 실패해도 원본 이미지 저장은 완료되어야 함
+    assert exc_info.value.status_code == ud4s.IMAGE_IS_NOT_RGB.status_code
+    assert exc_info.value.detail == ud4s.IMAGE_IS_NOT_RGB.detail
+    # 워커의 에러는 요청의 logger로 남김
+    fake_logger.critical.assert_called_once_with(ud5s.DECODE_IMAGE_ERROR)
+    mock_save_image.assert_awaited_once()
+    mock_send.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_detect_character_passes_http_exception(tmp_path):
+    # given
+    drawing_index = DrawingIndex.mock(index_path=tmp_path)
+    ad_id = "test_ad_id"
+    pool_full_exception = HTTPException(status_code=503, detail="full")
+
+    with patch.object(
+        udf, "get_base_path", return_value=fud.fake_workspace_files_path
+    ), patch.object(
+        udf, "get_drawing_index", return_value=drawing_index
+    ), patch.object(
+        udf, "setup_logger", return_value=Mock()
+    ), patch.object(
+        udf, "save_image_async", new=AsyncMock()
+    ), patch.object(
+        udf,
+        "run_image_task_async",
+        new=AsyncMock(side_effect=pool_full_exception),
+    ):
+
+        # when
+        with pytest.raises(HTTPException) as exc_info:
+            await udf.detect_character(ad_id, b"fake_image_bytes")
+
+    # then
+    assert exc_info.value is pool_full_exception
+
+
+@pytest.mark.asyncio
+async def test_detect_character_reuses_indexed_drawing(tmp_path):
+    # given
+    ad_id = "test_ad_id"
+    file_bytes = b"fake_image_bytes"
+    drawing_index = DrawingIndex.mock(index_path=tmp_path.joinpath("index"))
+    base_path = tmp_path.joinpath(ad_id)
+    base_path.mkdir()
+    bounding_box = BoundingBox.mock()
+
+    with patch.object(
+        udf, "get_base_path", return_value=base_path
+    ), patch.object(
+        udf, "setup_logger", return_value=Mock()
+    ), patch.object(
+        udf, "get_drawing_index", return_value=drawing_index
+    ), patch.object(
+        drawing_index,
+        "restore",
+        return_value=bounding_box,
+    ) as mock_restore, patch.object(
+        udf,
+        "run_image_task_async",
+        new=AsyncMock(),
+    ) as mock_run_image_task, patch.object(
+        udf,
+        "detect_character_from_origin_async",
+        new=AsyncMock(),
+    ) as mock_send:
 
         # when
-        try:
-            await udf.detect_character(ad_id)
-        except HTTPException as e:
-            assert e.status_code == ud4s.IMAGE_IS_NOT_RGB.status_code
-            assert e.detail == ud4s.IMAGE_IS_NOT_RGB.detail
+        result = await udf.detect_character(ad_id, file_bytes)
+
+    # then
+    assert result == bounding_box
+    mock_restore.assert_called_once_with(
+        content_hash=udf.hash_file_bytes(file_bytes),
+        base_path=base_path,
+    )
+    mock_run_image_task.assert_not_awaited()
+    mock_send.assert_not_awaited()
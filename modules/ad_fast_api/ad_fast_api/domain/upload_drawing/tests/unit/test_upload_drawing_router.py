@@ -1,5 +1,5 @@
 from fastapi import HTTPException
-from unittest.mock import patch, AsyncMock, ANY
+from unittest.mock import patch, AsyncMock, Mock, ANY
 from ad_fast_api.domain.upload_drawing.testings import fake_upload_drawing as fud
 from ad_fast_api.domain.upload_drawing.sources import upload_drawing_router as udr
 from ad_fast_api.domain.schema.sources.schemas import BoundingBox
@@ -11,13 +11,17 @@ def test_upload_drawing_success(mock_client):
 
     with patch.object(
         udr,
-        "save_origin_image_async",
-        new=AsyncMock(return_value=fud.fake_ad_id),
+        "read_origin_image_async",
+        new=AsyncMock(return_value=(fud.fake_ad_id, fud.fake_file_bytes)),
     ) as mock_save_image, patch.object(
         udr,
         "detect_character",
         new=AsyncMock(return_value=bounding_box),
-    ) as mock_detect:
+    ) as mock_detect, patch.object(
+        udr,
+        "segment_character_speculatively",
+        new=Mock(),
+    ) as mock_segment_speculatively:
 
         # when
         response = mock_client.post(
@@ -33,7 +37,14 @@ def test_upload_drawing_success(mock_client):
         "bounding_box": bounding_box_dict,
     }
     mock_save_image.assert_awaited_once_with(file=ANY)
-    mock_detect.assert_awaited_once_with(ad_id=fud.fake_ad_id)
+    mock_detect.assert_awaited_once_with(
+        ad_id=fud.fake_ad_id,
+        file_bytes=fud.fake_file_bytes,
+    )
+    mock_segment_speculatively.assert_called_once_with(
+        ad_id=fud.fake_ad_id,
+        bounding_box=bounding_box,
+    )
 
 
 def test_upload_drawing_save_image_http_exception(mock_client):
@@ -42,7 +53,7 @@ def test_upload_drawing_save_image_http_exception(mock_client):
 
     with patch.object(
         udr,
-        "save_origin_image_async",
+        "read_origin_image_async",
         new=AsyncMock(
             side_effect=HTTPException(
                 status_code=400,
@@ -67,8 +78,8 @@ def test_upload_drawing_detect_character_http_exception(mock_client):
 
     with patch.object(
         udr,
-        "save_origin_image_async",
-        new=AsyncMock(return_value=fud.fake_ad_id),
+        "read_origin_image_async",
+        new=AsyncMock(return_value=(fud.fake_ad_id, fud.fake_file_bytes)),
     ) as mock_save_image, patch.object(
         udr,
         "detect_character",
@@ -85,7 +96,10 @@ def test_upload_drawing_detect_character_http_exception(mock_client):
     assert response.status_code == 415
     assert response.json() == {"detail": detail}
     mock_save_image.assert_awaited_once_with(file=ANY)
-    mock_detect.assert_awaited_once_with(ad_id=fud.fake_ad_id)
+    mock_detect.assert_awaited_once_with(
+        ad_id=fud.fake_ad_id,
+        file_bytes=fud.fake_file_bytes,
+    )
 
 
 def test_upload_drawing_server_error(mock_client):
@@ -93,7 +107,7 @@ def test_upload_drawing_server_error(mock_client):
     detail = "Unexpected server error"
     with patch.object(
         udr,
-        "save_origin_image_async",
+        "read_origin_image_async",
         new=AsyncMock(
             side_effect=HTTPException(
                 status_code=500,
@@ -71,3 +71,4 @@ class ConfigureSkeletonUser(HttpUser):
 
 
 # locust --processes -1 -f locust_configure_skeleton.py
+# ad_torchserve 없이 테스트: python -m ad_fast_api.snippets.testings.fake_torchserve_server
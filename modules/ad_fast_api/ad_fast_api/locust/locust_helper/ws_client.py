@@ -133,6 +133,12 @@ class WebSocketClient:
                 response_length=len(message),
             )
 
+        elif data_type == WebSocketType.PROGRESS:
+            self.log_event(
+                name=f"{data_type}",
+                response_length=len(message),
+            )
+
         elif data_type == WebSocketType.FULL_JOB:
             msg = data.get("message", "Unknown full job")
             self.log_event(
@@ -35,3 +35,4 @@ class UploadDrawingUser(HttpUser):
 # sudo $(poetry run which python) locust_upload_drawing.py
 # sudo $(which locust) -f locust_upload_drawing.py --host http://localhost:2010
 # locust -f locust_upload_drawing.py --host http://localhost:2010
+# ad_torchserve 없이 테스트: python -m ad_fast_api.snippets.testings.fake_torchserve_server
@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 
 from ad_fast_api.domain.upload_drawing.sources import upload_drawing_router
@@ -7,9 +8,34 @@ from ad_fast_api.domain.configure_character_joints.sources import (
     configure_character_joints_router,
 )
 from ad_fast_api.domain.make_animation.sources import make_animation_router
+from ad_fast_api.snippets.sources.ad_process_pool import get_image_process_pool
+from ad_fast_api.snippets.sources.ad_torchserve_batcher import get_torchserve_batcher
+from ad_fast_api.snippets.sources.ad_torchserve_client import (
+    get_torchserve_client,
+    get_torchserve_url,
+)
+from ad_fast_api.snippets.sources.ad_zero_client import get_zero_client
+
+
+# image process pool 워커가 시작될 때 미리 import 할 모듈
+IMAGE_PROCESS_PRELOAD_MODULES = [
+    "ad_fast_api.domain.find_character.sources.features.find_character_feature",
+    "ad_fast_api.domain.upload_drawing.sources.features.detect_character",
+]
 
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    get_image_process_pool().start(preload_modules=IMAGE_PROCESS_PRELOAD_MODULES)
+    get_torchserve_client().start()
+    get_zero_client().start()
+    yield
+    get_zero_client().close()
+    await get_torchserve_client().aclose()
+    get_image_process_pool().shutdown()
+
+
+app = FastAPI(lifespan=lifespan)
 app.include_router(upload_drawing_router.router)
 app.include_router(find_character_router.router)
 app.include_router(cutout_character_router.router)
@@ -31,10 +57,6 @@ def ping():
 
 @app.get("/ping_animated_drawings")
 async def ping_animated_drawings(test_param: int):
-    from ad_fast_api.domain.make_animation.sources.features.image_to_animation import (
-        get_zero_client,
-    )
-
     respone = await get_zero_client().call("ping", test_param)
     return {"ping_animated_drawings": respone}
 
@@ -44,10 +66,54 @@ def ping_torchserve():
     from httpx import Client
 
     with Client() as client:
-        response = client.get("http://torchserve:8080/ping")
+        response = client.get(f"{get_torchserve_url()}/ping")
     return {"ping_torchserve": response.json()}
 
 
+@app.get("/torchserve_metrics")
+def torchserve_metrics():
+    return {
+        "torchserve_metrics": get_torchserve_client().get_metrics(),
+        "batch_metrics": get_torchserve_batcher().get_metrics(),
+    }
+
+
+@app.get("/render_rpc_metrics")
+def render_rpc_metrics():
+    return {"render_rpc_metrics": get_zero_client().get_metrics()}
+
+
+@app.get("/drawing_index_metrics")
+def drawing_index_metrics():
+    from ad_fast_api.domain.upload_drawing.sources.features.drawing_index import (
+        get_drawing_index,
+    )
+
+    return {"drawing_index_metrics": get_drawing_index().get_metrics()}
+
+
+@app.get("/speculative_segmentation_metrics")
+def speculative_segmentation_metrics():
+    from ad_fast_api.domain.find_character.sources.features.speculative_segmentation import (
+        get_speculative_segmentation,
+    )
+
+    return {
+        "speculative_segmentation_metrics": (
+            get_speculative_segmentation().get_metrics()
+        ),
+    }
+
+
+@app.get("/speculative_pose_metrics")
+def speculative_pose_metrics():
+    from ad_fast_api.domain.cutout_character.sources.features.speculative_pose import (
+        get_speculative_pose,
+    )
+
+    return {"speculative_pose_metrics": get_speculative_pose().get_metrics()}
+
+
 if __name__ == "__main__":
     import uvicorn
     from ad_fast_api.snippets.sources.ad_env import get_ad_env
@@ -0,0 +1,215 @@
+import math
+import time
+import asyncio
+from enum import Enum
+from collections import deque
+from typing import Callable, Self
+from fastapi import HTTPException
+
+
+LIMITER_QUEUE_TIMEOUT = "Too many requests waiting for {name}. Please try again later."
+LIMITER_CIRCUIT_OPEN = "{name} is overloaded. Please try again later."
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class ADAdaptiveLimiter:
+    """
+    AIMD 방식으로 동시 요청 수를 조절하고, 과부하가 이어지면 요청을 차단하는 limiter 입니다.
+
+    - 응답이 정상이면 limit을 천천히 늘리고 (additive increase)
+      503, 연결 실패, latency_threshold_seconds 초과 시 limit을 decrease_factor 배로 줄입니다.
+    - limit 만큼 요청이 진행중이면 queue_timeout_seconds 동안 대기 후 503을 반환합니다.
+    - 과부하가 failure_threshold 번 연속되면 open_seconds 동안 모든 요청을 바로 거절(open)하고,
+      이후 요청 하나만 통과(half open)시켜 성공하면 다시 정상(closed) 상태가 됩니다.
+      circuit이 열리기 전에 시작한 요청이 늦게 끝나도 확인 요청으로 보지 않으므로,
+      half open 상태는 acquire가 확인 요청이라고 알려준 요청의 결과로만 바뀝니다.
+    - 거절시 Retry-After 헤더로 재시도 시점을 알려줍니다.
+    """
+
+    name: str
+    min_limit: int
+    max_limit: int
+    queue_timeout_seconds: float
+    latency_threshold_seconds: float
+    decrease_factor: float
+    failure_threshold: int
+    open_seconds: float
+
+    def __init__(
+        self,
+        name: str,
+        min_limit: int,
+        max_limit: int,
+        initial_limit: int,
+        queue_timeout_seconds: float,
+        latency_threshold_seconds: float,
+        failure_threshold: int,
+        open_seconds: float,
+        decrease_factor: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.queue_timeout_seconds = queue_timeout_seconds
+        self.latency_threshold_seconds = latency_threshold_seconds
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self.decrease_factor = decrease_factor
+        self._clock = clock
+
+        self.limit = float(initial_limit)
+        self.in_flight = 0
+        self.circuit_state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        self.rejected_count = 0
+        self._opened_at = 0.0
+        self._is_probing = False
+        self._waiters: deque[asyncio.Future] = deque()
+
+    @classmethod
+    def mock(cls) -> Self:
+        return cls(
+            name="mock",
+            min_limit=1,
+            max_limit=4,
+            initial_limit=2,
+            queue_timeout_seconds=0.1,
+            latency_threshold_seconds=1,
+            failure_threshold=2,
+            open_seconds=1,
+        )
+
+    @property
+    def retry_after_seconds(self) -> int:
+        if self.circuit_state == CircuitState.OPEN:
+            remaining = self._opened_at + self.open_seconds - self._clock()
+            return max(1, math.ceil(remaining))
+        return 1
+
+    def _reject(self, detail: str) -> HTTPException:
+        self.rejected_count += 1
+        return HTTPException(
+            status_code=503,
+            detail=detail.format(name=self.name),
+            headers={"Retry-After": str(self.retry_after_seconds)},
+        )
+
+    def _check_circuit(self) -> bool:
+        """요청을 통과시킬 수 없으면 거절하고, half open 상태의 확인 요청이면 True를 반환합니다."""
+        if self.circuit_state == CircuitState.OPEN:
+            if self._clock() - self._opened_at < self.open_seconds:
+                raise self._reject(LIMITER_CIRCUIT_OPEN)
+            self.circuit_state = CircuitState.HALF_OPEN
+
+        if self.circuit_state == CircuitState.HALF_OPEN:
+            # 회복 여부를 확인하는 요청 하나만 통과
+            if self._is_probing:
+                raise self._reject(LIMITER_CIRCUIT_OPEN)
+            self._is_probing = True
+            return True
+        return False
+
+    async def acquire(self) -> bool:
+        """
+        슬롯을 얻고, half open 상태의 확인 요청이면 True를 반환합니다.
+        반환값을 release, release_without_feedback의 is_probe로 넘겨야 합니다.
+        """
+        is_probe = self._check_circuit()
+
+        try:
+            await self._wait_for_slot()
+        except BaseException:
+            # 대기 시간 초과, 취소(클라이언트 연결 종료 등)로 슬롯을 얻지 못한 확인 요청은
+            # 다음 요청이 다시 확인할 수 있도록 해제
+            if is_probe:
+                self._is_probing = False
+            # 깨운 뒤 취소된 경우 받은 슬롯을 다음 대기 요청에 넘김
+            self._wake_waiters()
+            raise
+
+        self.in_flight += 1
+        return is_probe
+
+    async def _wait_for_slot(self):
+        deadline = self._clock() + self.queue_timeout_seconds
+        while self.in_flight >= int(self.limit):
+            timeout = deadline - self._clock()
+            if timeout <= 0:
+                raise self._reject(LIMITER_QUEUE_TIMEOUT)
+
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await asyncio.wait_for(waiter, timeout)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+
+    def release(
+        self,
+        latency: float,
+        is_overload: bool,
+        is_probe: bool = False,
+    ):
+        self.in_flight -= 1
+        is_slow = latency > self.latency_threshold_seconds
+
+        if is_overload or is_slow:
+            self.limit = max(self.min_limit, self.limit * self.decrease_factor)
+        else:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+
+        if is_probe:
+            # 확인 요청의 결과로만 half open 상태를 닫거나 다시 엶
+            self._is_probing = False
+            if is_overload:
+                self.consecutive_failures += 1
+                self.circuit_state = CircuitState.OPEN
+                self._opened_at = self._clock()
+            else:
+                self.consecutive_failures = 0
+                self.circuit_state = CircuitState.CLOSED
+        elif self.circuit_state == CircuitState.CLOSED:
+            # circuit이 열리기 전에 시작한 요청은 open, half open 상태를 바꾸지 않음
+            if is_overload:
+                self.consecutive_failures += 1
+                if self.consecutive_failures >= self.failure_threshold:
+                    self.circuit_state = CircuitState.OPEN
+                    self._opened_at = self._clock()
+            else:
+                self.consecutive_failures = 0
+
+        self._wake_waiters()
+
+    def release_without_feedback(self, is_probe: bool = False):
+        """
+        과부하 여부를 알 수 없이 끝난 요청(취소, 요청 전 에러)의 슬롯을 반환합니다.
+        limit과 circuit 상태는 바꾸지 않으며, 확인 요청이었다면 다음 요청이 다시 확인합니다.
+        """
+        self.in_flight -= 1
+        if is_probe:
+            self._is_probing = False
+        self._wake_waiters()
+
+    def _wake_waiters(self):
+        available = int(self.limit) - self.in_flight
+        while available > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                available -= 1
+
+    def to_dict(self) -> dict:
+        return {
+            "concurrency_limit": self.limit,
+            "circuit_state": self.circuit_state.value,
+            "rejected_count": self.rejected_count,
+        }
@@ -16,6 +16,13 @@ def fetch_env_from_os(
     return env_value
 
 
+def fetch_env_from_os_or_default(
+    env_name: str,
+    default: str,
+) -> str:
+    return os.environ.get(env_name, default)
+
+
 class ADEnv:
     internal_port: int
     animated_drawings_workspace_dir: str
@@ -0,0 +1,141 @@
+import os
+import asyncio
+import hashlib
+from collections import OrderedDict
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from typing import Mapping, Optional
+from fastapi import Response
+from fastapi.responses import FileResponse
+
+
+# 버전(내용 해시)이 포함된 URL은 내용이 바뀌지 않으므로 1년 동안 캐시
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# 버전이 없는 URL은 캐시하되 매번 ETag로 확인 (바뀌지 않았으면 304)
+REVALIDATE_CACHE_CONTROL = "no-cache"
+FILE_HASH_CHUNK_SIZE = 1024 * 1024
+MAX_FILE_ETAG_ENTRIES = 1024
+
+
+class ADFileResponse(FileResponse):
+    """
+    정적 파일 응답 입니다.
+    Range, If-Range 요청은 FileResponse가 처리하며,
+    서버가 http.response.pathsend 확장을 지원하면 파일 경로만 넘겨 서버가 직접 전송합니다. (sendfile)
+    지원하지 않는 서버(uvicorn)에서는 한 번에 큰 chunk를 읽어 전송 횟수를 줄입니다.
+    """
+
+    chunk_size = 1024 * 1024
+
+
+# key: 파일 경로, value: (mtime_ns, 파일 크기, 내용 해시)
+# 렌더링 결과 파일은 임시 파일에 쓴 뒤 교체되므로 mtime, 크기가 같으면 내용도 같음
+_file_etags: OrderedDict[str, tuple[int, int, str]] = OrderedDict()
+
+
+def hash_file(file_path: Path) -> str:
+    file_hash = hashlib.sha256()
+    with open(file_path.as_posix(), "rb") as f:
+        while chunk := f.read(FILE_HASH_CHUNK_SIZE):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()[:32]
+
+
+async def get_file_version(
+    file_path: Path,
+    stat_result: Optional[os.stat_result] = None,
+) -> str:
+    """
+    파일 내용의 해시를 반환합니다. URL의 버전과 ETag로 사용합니다.
+    같은 파일은 다시 읽지 않으며, 처음 계산할 때는 event loop를 막지 않도록 thread에서 읽습니다.
+    """
+    stat_result = stat_result or file_path.stat()
+    key = file_path.as_posix()
+    cached = _file_etags.get(key)
+    if cached is not None and cached[:2] == (
+        stat_result.st_mtime_ns,
+        stat_result.st_size,
+    ):
+        _file_etags.move_to_end(key)
+        return cached[2]
+
+    version = await asyncio.to_thread(hash_file, file_path)
+    _file_etags[key] = (stat_result.st_mtime_ns, stat_result.st_size, version)
+    _file_etags.move_to_end(key)
+    while len(_file_etags) > MAX_FILE_ETAG_ENTRIES:
+        _file_etags.popitem(last=False)
+    return version
+
+
+def create_etag(version: str) -> str:
+    return f'"{version}"'
+
+
+def is_not_modified(
+    request_headers: Mapping[str, str],
+    etag: str,
+    stat_result: os.stat_result,
+) -> bool:
+    """
+    조건부 요청(If-None-Match, If-Modified-Since)의 파일이 바뀌지 않았는지 확인합니다.
+    If-None-Match가 있으면 If-Modified-Since는 무시합니다. (RFC 9110)
+    """
+    if_none_match = request_headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        # 약한 비교: W/ 접두어는 무시
+        request_etags = [
+            request_etag.strip().removeprefix("W/")
+            for request_etag in if_none_match.split(",")
+        ]
+        return etag in request_etags
+
+    if_modified_since = request_headers.get("if-modified-since")
+    if if_modified_since is not None:
+        try:
+            modified_since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        return int(stat_result.st_mtime) <= modified_since
+
+    return False
+
+
+async def create_file_response(
+    file_path: Path,
+    media_type: str,
+    request_headers: Optional[Mapping[str, str]] = None,
+    version: Optional[str] = None,
+) -> Response:
+    """
+    파일 응답을 생성합니다.
+    - ETag는 파일 내용의 해시이며, 바뀌지 않은 파일의 조건부 요청에는 304를 응답합니다.
+    - version이 현재 파일의 해시와 같으면 immutable로 캐시하도록 응답합니다.
+    """
+    stat_result = file_path.stat()
+    current_version = await get_file_version(file_path, stat_result)
+    etag = create_etag(current_version)
+    headers = {
+        "etag": etag,
+        "last-modified": formatdate(stat_result.st_mtime, usegmt=True),
+        "cache-control": (
+            IMMUTABLE_CACHE_CONTROL
+            if version == current_version
+            else REVALIDATE_CACHE_CONTROL
+        ),
+    }
+
+    if request_headers is not None and is_not_modified(
+        request_headers=request_headers,
+        etag=etag,
+        stat_result=stat_result,
+    ):
+        return Response(status_code=304, headers=headers)
+
+    return ADFileResponse(
+        file_path.as_posix(),
+        media_type=media_type,
+        headers=headers,
+        stat_result=stat_result,
+    )
@@ -0,0 +1,291 @@
+import asyncio
+import importlib
+import os
+import threading
+import numpy as np
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, Optional, Self
+from fastapi import HTTPException
+from ad_fast_api.snippets.sources.ad_env import fetch_env_from_os_or_default
+
+
+IMAGE_PROCESS_WORKERS_ENV = "AD_IMAGE_PROCESS_WORKERS"
+IMAGE_PROCESS_QUEUE_DEPTH_ENV = "AD_IMAGE_PROCESS_QUEUE_DEPTH"
+IMAGE_PROCESS_POOL_FULL = "The image processing queue is full. Please try again later."
+IMAGE_PROCESS_POOL_RETRY_AFTER_SECONDS = 1
+
+
+def preload_worker_modules(module_names: list[str]):
+    # 워커 시작 시 무거운 모듈(cv2, skimage, scipy 등)을 미리 import 하여 첫 요청 지연을 없앰
+    for module_name in module_names:
+        importlib.import_module(module_name)
+
+
+def attach_shared_memory(name: str) -> SharedMemory:
+    # 워커는 부모 프로세스가 만든 공유 메모리를 빌려 쓰기만 하므로
+    # resource tracker에 등록하지 않음 (해제는 부모 프로세스가 담당)
+    try:
+        return SharedMemory(name=name, track=False)
+    except TypeError:
+        # python 3.13 미만은 track 인자를 지원하지 않음
+        return SharedMemory(name=name)
+
+
+def run_with_shared_image(
+    operation: Callable,
+    shm_name: str,
+    shape: tuple,
+    dtype: str,
+    kwargs: dict,
+) -> Any:
+    """
+    워커 프로세스에서 실행됩니다.
+    공유 메모리의 이미지를 복사 없이 numpy 배열로 감싸 operation에 전달합니다.
+    operation은 전달받은 이미지를 참조하지 않는 결과(인코딩된 bytes 등)를 반환해야 합니다.
+    """
+    shm = attach_shared_memory(shm_name)
+    image = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+    try:
+        return operation(image, **kwargs)
+    except Exception as e:
+        # traceback의 프레임들이 공유 메모리 버퍼를 계속 참조하지 않도록 제거
+        raise e.with_traceback(None)
+    finally:
+        # 공유 메모리를 닫기 전에 버퍼 참조를 해제해야 함
+        del image
+        shm.close()
+
+
+class ADImageProcessPool:
+    """
+    cv2, scikit-image, scipy 등 CPU bound 이미지 작업을 전용 프로세스 풀에서 실행합니다.
+
+    - max_workers: 워커 프로세스 수
+    - max_queue_depth: 모든 워커가 사용중일 때 대기할 수 있는 작업 수
+    - 실행중 + 대기중 작업 수가 가득 차면 바로 503 에러를 반환합니다.
+    - 이미지는 pickle 직렬화 없이 공유 메모리를 통해 워커에 전달됩니다.
+    - logger는 워커에 전달하지 않습니다. (pickle 되면 ad_id별 file handler가 없는 logger가 됨)
+      작업은 에러를 raise 하고 호출한 프로세스에서 로그를 남깁니다.
+    - start() 전에는 현재 프로세스에서 바로 실행합니다. (테스트, case 스크립트)
+    """
+
+    max_workers: int
+    max_queue_depth: int
+
+    def __init__(
+        self,
+        max_workers: int,
+        max_queue_depth: int,
+    ):
+        self.max_workers = max_workers
+        self.max_queue_depth = max_queue_depth
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._preload_modules: list[str] = []
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def mock(cls) -> Self:
+        return cls(
+            max_workers=1,
+            max_queue_depth=1,
+        )
+
+    @property
+    def max_pending(self) -> int:
+        return self.max_workers + self.max_queue_depth
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    @property
+    def is_started(self) -> bool:
+        return self._executor is not None
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        # uvicorn 이벤트 루프, 스레드가 있는 프로세스를 fork 하지 않도록 spawn 사용
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=get_context("spawn"),
+            initializer=preload_worker_modules,
+            initargs=(self._preload_modules,),
+        )
+
+    def start(
+        self,
+        preload_modules: Optional[list[str]] = None,
+    ):
+        if self._executor is not None:
+            return
+        self._preload_modules = preload_modules or []
+        self._executor = self._create_executor()
+
+    def shutdown(self):
+        if self._executor is None:
+            return
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._executor = None
+
+    def _acquire_slot(self):
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise HTTPException(
+                    status_code=503,
+                    detail=IMAGE_PROCESS_POOL_FULL,
+                    headers={
+                        "Retry-After": str(IMAGE_PROCESS_POOL_RETRY_AFTER_SECONDS),
+                    },
+                )
+            self._pending += 1
+
+    def _release_slot(self):
+        with self._lock:
+            self._pending -= 1
+
+    def _run_inline(
+        self,
+        operation: Callable,
+        image: np.ndarray,
+        kwargs: dict,
+    ) -> Future:
+        future = Future()
+        try:
+            future.set_result(operation(image, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        finally:
+            self._release_slot()
+        return future
+
+    def _submit_to_executor(
+        self,
+        operation: Callable,
+        shm: SharedMemory,
+        image: np.ndarray,
+        kwargs: dict,
+    ) -> Future:
+        args = (operation, shm.name, image.shape, image.dtype.str, kwargs)
+        executor = self._executor
+        try:
+            return executor.submit(run_with_shared_image, *args)  # type: ignore
+        except BrokenProcessPool:
+            # 워커가 비정상 종료되어 풀이 깨진 경우 새 풀로 교체 후 한 번 더 시도
+            # 동시에 제출한 호출자들이 각자 새 풀을 만들지 않도록 lock 안에서 한 번만 교체
+            with self._lock:
+                if self._executor is executor:
+                    executor.shutdown(wait=False, cancel_futures=True)  # type: ignore
+                    self._executor = self._create_executor()
+                executor = self._executor
+            return executor.submit(run_with_shared_image, *args)  # type: ignore
+
+    def submit(
+        self,
+        operation: Callable,
+        image: np.ndarray,
+        **kwargs,
+    ) -> Future:
+        self._acquire_slot()
+
+        if self._executor is None:
+            return self._run_inline(operation, image, kwargs)
+
+        shm = None
+        try:
+            image = np.ascontiguousarray(image)
+            shm = SharedMemory(create=True, size=max(image.nbytes, 1))
+            shared_image = np.ndarray(image.shape, dtype=image.dtype, buffer=shm.buf)
+            shared_image[...] = image
+            del shared_image
+
+            future = self._submit_to_executor(operation, shm, image, kwargs)
+        except BaseException:
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+            self._release_slot()
+            raise
+
+        # 호출자가 결과를 받는 시점에는 공유 메모리와 슬롯이 이미 해제되어 있도록
+        # 정리 작업 후 결과를 전달하는 future를 반환
+        result_future = Future()
+
+        def on_done(done_future: Future):
+            shm.close()
+            shm.unlink()
+            self._release_slot()
+
+            if done_future.cancelled():
+                result_future.cancel()
+            elif done_future.exception() is not None:
+                result_future.set_exception(done_future.exception())
+            else:
+                result_future.set_result(done_future.result())
+
+        future.add_done_callback(on_done)
+        return result_future
+
+    def run(
+        self,
+        operation: Callable,
+        image: np.ndarray,
+        **kwargs,
+    ) -> Any:
+        return self.submit(operation, image, **kwargs).result()
+
+    async def run_async(
+        self,
+        operation: Callable,
+        image: np.ndarray,
+        **kwargs,
+    ) -> Any:
+        return await asyncio.wrap_future(self.submit(operation, image, **kwargs))
+
+
+# lazy init
+_image_process_pool = None
+
+
+def create_image_process_pool_instance() -> ADImageProcessPool:
+    max_workers = int(
+        fetch_env_from_os_or_default(
+            IMAGE_PROCESS_WORKERS_ENV,
+            str(os.cpu_count() or 1),
+        )
+    )
+    max_queue_depth = int(
+        fetch_env_from_os_or_default(
+            IMAGE_PROCESS_QUEUE_DEPTH_ENV,
+            str(max_workers * 2),
+        )
+    )
+    return ADImageProcessPool(
+        max_workers=max_workers,
+        max_queue_depth=max_queue_depth,
+    )
+
+
+def get_image_process_pool() -> ADImageProcessPool:
+    global _image_process_pool
+    if _image_process_pool is None:
+        _image_process_pool = create_image_process_pool_instance()
+    return _image_process_pool
+
+
+def run_image_task(
+    operation: Callable,
+    image: np.ndarray,
+    **kwargs,
+) -> Any:
+    return get_image_process_pool().run(operation, image, **kwargs)
+
+
+async def run_image_task_async(
+    operation: Callable,
+    image: np.ndarray,
+    **kwargs,
+) -> Any:
+    return await get_image_process_pool().run_async(operation, image, **kwargs)
@@ -0,0 +1,152 @@
+import asyncio
+import hashlib
+import httpx
+from functools import partial
+from typing import Optional, Self, Tuple
+from ad_fast_api.snippets.sources.ad_torchserve_client import (
+    ADTorchServeClient,
+    get_torchserve_client,
+)
+
+
+def hash_request_files(files: dict[str, bytes]) -> str:
+    request_hash = hashlib.sha1()
+    for name in sorted(files.keys()):
+        request_hash.update(name.encode())
+        request_hash.update(files[name])
+    return request_hash.hexdigest()
+
+
+class InFlightRequest:
+    task: asyncio.Task
+    waiter_count: int
+
+    def __init__(
+        self,
+        task: asyncio.Task,
+    ):
+        self.task = task
+        self.waiter_count = 0
+
+
+class BatchMetrics:
+    request_count: int
+    sent_count: int
+    coalesced_count: int
+
+    def __init__(self):
+        self.request_count = 0
+        self.sent_count = 0
+        self.coalesced_count = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "request_count": self.request_count,
+            "sent_count": self.sent_count,
+            "coalesced_count": self.coalesced_count,
+        }
+
+
+class ADTorchServeBatcher:
+    """
+    같은 모델에 같은 이미지(재시도, 중복 업로드)를 보내는 요청이 이미 진행중이면
+    새로 보내지 않고 진행중인 요청의 응답을 함께 받습니다. (single flight)
+
+    - drawn_humanoid_detector, drawn_humanoid_pose_estimator 핸들러와 TorchServe 설정(batch_size=1)은
+      요청 하나에 이미지 하나만 처리하므로, 다른 이미지는 모으지 않고 기다림 없이 바로 보냅니다.
+    - 응답을 받은 뒤에는 합치지 않으므로 같은 이미지라도 다음 요청은 새로 보냅니다.
+    - 기다리는 요청이 모두 취소되면 진행중인 요청도 취소합니다.
+    """
+
+    def __init__(
+        self,
+        torchserve_client: Optional[ADTorchServeClient] = None,
+    ):
+        self._torchserve_client = torchserve_client
+        self._in_flight: dict[Tuple[str, str, str], InFlightRequest] = {}
+        self.batch_metrics: dict[str, BatchMetrics] = {}
+
+    @classmethod
+    def mock(cls) -> Self:
+        return cls(torchserve_client=ADTorchServeClient.mock())
+
+    @property
+    def torchserve_client(self) -> ADTorchServeClient:
+        return self._torchserve_client or get_torchserve_client()
+
+    def get_batch_metrics(self, model_name: str) -> BatchMetrics:
+        if model_name not in self.batch_metrics:
+            self.batch_metrics[model_name] = BatchMetrics()
+        return self.batch_metrics[model_name]
+
+    def get_metrics(self) -> dict:
+        return {
+            model_name: batch_metrics.to_dict()
+            for model_name, batch_metrics in self.batch_metrics.items()
+        }
+
+    def _forget(
+        self,
+        request_key: Tuple[str, str, str],
+        in_flight_request: InFlightRequest,
+        task: asyncio.Task,
+    ):
+        if self._in_flight.get(request_key) is in_flight_request:
+            del self._in_flight[request_key]
+
+    async def post_prediction(
+        self,
+        model_name: str,
+        files: dict[str, bytes],
+        url: Optional[str] = None,
+    ) -> httpx.Response:
+        batch_metrics = self.get_batch_metrics(model_name)
+        batch_metrics.request_count += 1
+
+        request_key = (model_name, url or "", hash_request_files(files))
+        in_flight_request = self._in_flight.get(request_key)
+        if in_flight_request is None:
+            in_flight_request = InFlightRequest(
+                task=asyncio.create_task(
+                    self.torchserve_client.post_prediction(
+                        model_name=model_name,
+                        files=files,
+                        url=url,
+                    )
+                ),
+            )
+            self._in_flight[request_key] = in_flight_request
+            in_flight_request.task.add_done_callback(
+                partial(self._forget, request_key, in_flight_request)
+            )
+            batch_metrics.sent_count += 1
+        else:
+            batch_metrics.coalesced_count += 1
+
+        in_flight_request.waiter_count += 1
+        try:
+            # 한 요청이 취소되어도 같은 응답을 기다리는 다른 요청은 계속 기다림
+            return await asyncio.shield(in_flight_request.task)
+        finally:
+            in_flight_request.waiter_count -= 1
+            # 기다리는 요청이 모두 취소되면 전송도 취소
+            if (
+                in_flight_request.waiter_count == 0
+                and not in_flight_request.task.done()
+            ):
+                in_flight_request.task.cancel()
+
+
+# lazy init
+_torchserve_batcher = None
+
+
+def create_torchserve_batcher_instance() -> ADTorchServeBatcher:
+    return ADTorchServeBatcher()
+
+
+def get_torchserve_batcher() -> ADTorchServeBatcher:
+    global _torchserve_batcher
+    if _torchserve_batcher is None:
+        _torchserve_batcher = create_torchserve_batcher_instance()
+    return _torchserve_batcher
@@ -0,0 +1,283 @@
+import time
+import httpx
+from bisect import bisect_left
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Optional, Self
+from ad_fast_api.snippets.sources.ad_env import fetch_env_from_os_or_default
+from ad_fast_api.snippets.sources.ad_adaptive_limiter import ADAdaptiveLimiter
+
+
+TORCHSERVE_URL_ENV = "AD_TORCHSERVE_URL"
+TORCHSERVE_MAX_CONNECTIONS_ENV = "AD_TORCHSERVE_MAX_CONNECTIONS"
+TORCHSERVE_MAX_KEEPALIVE_CONNECTIONS_ENV = "AD_TORCHSERVE_MAX_KEEPALIVE"
+TORCHSERVE_KEEPALIVE_EXPIRY_ENV = "AD_TORCHSERVE_KEEPALIVE_EXPIRY"
+TORCHSERVE_TIMEOUT_ENV = "AD_TORCHSERVE_TIMEOUT"
+TORCHSERVE_MAX_CONCURRENCY_ENV = "AD_TORCHSERVE_MAX_CONCURRENCY"
+TORCHSERVE_QUEUE_TIMEOUT_ENV = "AD_TORCHSERVE_QUEUE_TIMEOUT"
+TORCHSERVE_LATENCY_THRESHOLD_ENV = "AD_TORCHSERVE_LATENCY_THRESHOLD"
+TORCHSERVE_BREAKER_FAILURES_ENV = "AD_TORCHSERVE_BREAKER_FAILURES"
+TORCHSERVE_BREAKER_OPEN_SECONDS_ENV = "AD_TORCHSERVE_BREAKER_OPEN_SECONDS"
+
+DEFAULT_TORCHSERVE_URL = "http://ad_torchserve:8080"
+DRAWN_HUMANOID_DETECTOR = "drawn_humanoid_detector"
+DRAWN_HUMANOID_POSE_ESTIMATOR = "drawn_humanoid_pose_estimator"
+
+# 응답 시간 히스토그램 구간 (초)
+LATENCY_HISTOGRAM_BUCKETS = [0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0]
+
+
+def get_torchserve_url() -> str:
+    return fetch_env_from_os_or_default(
+        TORCHSERVE_URL_ENV,
+        DEFAULT_TORCHSERVE_URL,
+    ).rstrip("/")
+
+
+def get_prediction_url(model_name: str) -> str:
+    return f"{get_torchserve_url()}/predictions/{model_name}"
+
+
+class ModelMetrics:
+    in_flight: int
+    request_count: int
+    error_count: int
+    latency_sum: float
+    latency_bucket_counts: list[int]
+
+    def __init__(self):
+        self.in_flight = 0
+        self.request_count = 0
+        self.error_count = 0
+        self.latency_sum = 0.0
+        # 마지막 칸은 LATENCY_HISTOGRAM_BUCKETS 보다 오래 걸린 요청 (+Inf)
+        self.latency_bucket_counts = [0] * (len(LATENCY_HISTOGRAM_BUCKETS) + 1)
+
+    def observe(self, latency: float, is_error: bool):
+        self.request_count += 1
+        if is_error:
+            self.error_count += 1
+        self.latency_sum += latency
+        bucket_index = bisect_left(LATENCY_HISTOGRAM_BUCKETS, latency)
+        self.latency_bucket_counts[bucket_index] += 1
+
+    def to_dict(self) -> dict:
+        # prometheus 히스토그램처럼 각 구간 이하의 누적 개수로 표현
+        buckets = {}
+        cumulative_count = 0
+        bucket_names = [str(bucket) for bucket in LATENCY_HISTOGRAM_BUCKETS]
+        bucket_names.append("+Inf")
+        for bucket_name, count in zip(bucket_names, self.latency_bucket_counts):
+            cumulative_count += count
+            buckets[bucket_name] = cumulative_count
+
+        return {
+            "in_flight": self.in_flight,
+            "request_count": self.request_count,
+            "error_count": self.error_count,
+            "latency_sum": self.latency_sum,
+            "latency_buckets": buckets,
+        }
+
+
+class ADTorchServeClient:
+    """
+    TorchServe 요청에 사용하는 공유 httpx.AsyncClient 입니다.
+    앱 시작 시 start(), 종료 시 aclose()를 호출하며,
+    연결 수 제한과 keep-alive로 요청마다 TCP 연결을 새로 맺지 않습니다.
+    start() 전에는 요청마다 일회용 클라이언트를 사용합니다. (테스트, case 스크립트)
+    """
+
+    max_connections: int
+    max_keepalive_connections: int
+    keepalive_expiry: float
+    timeout_seconds: float
+
+    def __init__(
+        self,
+        max_connections: int,
+        max_keepalive_connections: int,
+        keepalive_expiry: float,
+        timeout_seconds: float,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        create_limiter: Optional[Callable[[str], ADAdaptiveLimiter]] = None,
+    ):
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.timeout_seconds = timeout_seconds
+        # 테스트, 벤치마크에서 stand-in 서버를 연결할 때 사용
+        self.transport = transport
+        # 모델별 동시 요청 수 제한, None이면 제한하지 않음
+        self.create_limiter = create_limiter
+        self.limiters: dict[str, ADAdaptiveLimiter] = {}
+        self.model_metrics: dict[str, ModelMetrics] = {}
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @classmethod
+    def mock(cls) -> Self:
+        return cls(
+            max_connections=2,
+            max_keepalive_connections=1,
+            keepalive_expiry=1,
+            timeout_seconds=1,
+        )
+
+    @property
+    def is_started(self) -> bool:
+        return self._client is not None
+
+    def _create_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            verify=False,
+            timeout=httpx.Timeout(self.timeout_seconds),
+            transport=self.transport,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+        )
+
+    def start(self):
+        if self._client is None:
+            self._client = self._create_client()
+
+    async def aclose(self):
+        if self._client is None:
+            return
+        await self._client.aclose()
+        self._client = None
+
+    @asynccontextmanager
+    async def _get_client(self) -> AsyncIterator[httpx.AsyncClient]:
+        if self._client is not None:
+            yield self._client
+            return
+
+        async with self._create_client() as client:
+            yield client
+
+    def get_model_metrics(self, model_name: str) -> ModelMetrics:
+        if model_name not in self.model_metrics:
+            self.model_metrics[model_name] = ModelMetrics()
+        return self.model_metrics[model_name]
+
+    def get_limiter(self, model_name: str) -> Optional[ADAdaptiveLimiter]:
+        if self.create_limiter is None:
+            return None
+        if model_name not in self.limiters:
+            self.limiters[model_name] = self.create_limiter(model_name)
+        return self.limiters[model_name]
+
+    def get_retry_after_seconds(self, model_name: str) -> int:
+        limiter = self.get_limiter(model_name)
+        return limiter.retry_after_seconds if limiter is not None else 1
+
+    def get_metrics(self) -> dict:
+        metrics = {}
+        for model_name, model_metrics in self.model_metrics.items():
+            metrics[model_name] = model_metrics.to_dict()
+            limiter = self.get_limiter(model_name)
+            if limiter is not None:
+                metrics[model_name].update(limiter.to_dict())
+        return metrics
+
+    async def post_prediction(
+        self,
+        model_name: str,
+        files: dict,
+        url: Optional[str] = None,
+    ) -> httpx.Response:
+        # 과부하 상태면 대기하거나 TorchServe에 보내지 않고 바로 503 (HTTPException)
+        limiter = self.get_limiter(model_name)
+        is_probe = False
+        if limiter is not None:
+            is_probe = await limiter.acquire()
+
+        model_metrics = self.get_model_metrics(model_name)
+        model_metrics.in_flight += 1
+        is_error = True
+        # None: 응답도 과부하 에러도 없이 끝남 (취소, 그 외 에러), limiter에 반영하지 않음
+        is_overload: Optional[bool] = None
+        start_time = time.perf_counter()
+
+        try:
+            async with self._get_client() as client:
+                resp = await client.post(
+                    url or get_prediction_url(model_name),
+                    files=files,
+                )
+            is_error = resp.status_code >= 300
+            is_overload = resp.status_code == 503
+            return resp
+        except (httpx.TimeoutException, httpx.ConnectError):
+            is_overload = True
+            raise
+        finally:
+            latency = time.perf_counter() - start_time
+            model_metrics.in_flight -= 1
+            model_metrics.observe(
+                latency=latency,
+                is_error=is_error,
+            )
+            if limiter is not None:
+                if is_overload is None:
+                    limiter.release_without_feedback(is_probe=is_probe)
+                else:
+                    limiter.release(
+                        latency=latency,
+                        is_overload=is_overload,
+                        is_probe=is_probe,
+                    )
+
+
+# lazy init
+_torchserve_client = None
+
+
+def create_torchserve_limiter_instance(model_name: str) -> ADAdaptiveLimiter:
+    # TorchServe 워커 1개, job_queue_size=5 기준 기본값
+    max_limit = int(fetch_env_from_os_or_default(TORCHSERVE_MAX_CONCURRENCY_ENV, "6"))
+    return ADAdaptiveLimiter(
+        name=model_name,
+        min_limit=1,
+        max_limit=max_limit,
+        initial_limit=max(1, max_limit // 2),
+        queue_timeout_seconds=float(
+            fetch_env_from_os_or_default(TORCHSERVE_QUEUE_TIMEOUT_ENV, "3"),
+        ),
+        latency_threshold_seconds=float(
+            fetch_env_from_os_or_default(TORCHSERVE_LATENCY_THRESHOLD_ENV, "10"),
+        ),
+        failure_threshold=int(
+            fetch_env_from_os_or_default(TORCHSERVE_BREAKER_FAILURES_ENV, "5"),
+        ),
+        open_seconds=float(
+            fetch_env_from_os_or_default(TORCHSERVE_BREAKER_OPEN_SECONDS_ENV, "10"),
+        ),
+    )
+
+
+def create_torchserve_client_instance() -> ADTorchServeClient:
+    return ADTorchServeClient(
+        max_connections=int(
+            fetch_env_from_os_or_default(TORCHSERVE_MAX_CONNECTIONS_ENV, "10")
+        ),
+        max_keepalive_connections=int(
+            fetch_env_from_os_or_default(TORCHSERVE_MAX_KEEPALIVE_CONNECTIONS_ENV, "5"),
+        ),
+        keepalive_expiry=float(
+            fetch_env_from_os_or_default(TORCHSERVE_KEEPALIVE_EXPIRY_ENV, "30")
+        ),
+        timeout_seconds=float(
+            fetch_env_from_os_or_default(TORCHSERVE_TIMEOUT_ENV, "25"),
+        ),
+        create_limiter=create_torchserve_limiter_instance,
+    )
+
+
+def get_torchserve_client() -> ADTorchServeClient:
+    global _torchserve_client
+    if _torchserve_client is None:
+        _torchserve_client = create_torchserve_client_instance()
+    return _torchserve_client
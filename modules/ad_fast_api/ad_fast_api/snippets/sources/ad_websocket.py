@@ -1,4 +1,5 @@
 import asyncio
+from typing import Awaitable, TypeVar
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.openapi.utils import get_openapi
 from logging import Logger
@@ -7,6 +8,10 @@ from logging import Logger
 MAX_RETRIES = 4
 TIMEOUT = 3
 INTERVAL_SLEEP = 0.3
+# ping 전송 후 pong 응답을 기다리는 최대 시간
+PONG_TIMEOUT = TIMEOUT * MAX_RETRIES
+
+T = TypeVar("T")
 
 
 # 웹소켓 연결
@@ -32,16 +37,14 @@ async def retry_ping(
 
     while retry_count < MAX_RETRIES:
         try:
-            await asyncio.wait_for(
-                websocket.send_json(
+            async with asyncio.timeout(TIMEOUT):
+                await websocket.send_json(
                     {
                         "type": "PING",
                         "message": "",
                         "data": {},
                     }
-                ),
-                timeout=TIMEOUT,
-            )
+                )
             logger.debug("ping 메시지 전송")
             return
         except Exception as e:
@@ -105,6 +108,100 @@ async def check_connection(
         logger.debug(f"서버 클라이언트 ping/pong 연결 확인 완료, 현재 {timer}초")
 
 
+async def receive_pong(
+    websocket: WebSocket,
+    logger: Logger,
+    pong_event: asyncio.Event,
+):
+    """
+    클라이언트 메시지를 계속 수신하며, PONG 응답을 받으면 pong_event를 설정합니다.
+    클라이언트가 연결을 끊으면 바로 WebSocketDisconnect가 발생합니다.
+    """
+    while True:
+        try:
+            response = await websocket.receive_json()
+        except ValueError as e:
+            logger.warning(f"유효하지 않은 응답 : {e}")
+            continue
+
+        if isinstance(response, dict) and response.get("type") == "PONG":
+            logger.debug("PONG 응답 수신")
+            pong_event.set()
+        else:
+            logger.warning(f"유효하지 않은 응답 : {response}")
+
+
+async def send_heartbeat(
+    websocket: WebSocket,
+    logger: Logger,
+    pong_event: asyncio.Event,
+    period_seconds: float,
+    pong_timeout_seconds: float = PONG_TIMEOUT,
+):
+    """
+    period_seconds마다 ping 메시지를 보내고 receive_pong이 PONG 응답을 받을 때까지 기다립니다.
+    pong_timeout_seconds 안에 응답이 없으면 WebSocketDisconnect가 발생합니다.
+    """
+    while True:
+        pong_event.clear()
+        await retry_ping(websocket, logger)
+        # wait_for는 완료와 취소가 동시에 일어나면 취소를 무시할 수 있어 timeout을 사용
+        try:
+            async with asyncio.timeout(pong_timeout_seconds):
+                await pong_event.wait()
+        except TimeoutError:
+            msg = f"pong 응답 대기 시간 초과 ({pong_timeout_seconds}초)"
+            logger.error(msg)
+            raise WebSocketDisconnect(code=1000, reason=msg)
+        await asyncio.sleep(period_seconds)
+
+
+async def run_with_heartbeat(
+    websocket: WebSocket,
+    logger: Logger,
+    main: Awaitable[T],
+    heartbeat_seconds: float,
+) -> T:
+    """
+    main과 함께 heartbeat, 메시지 수신 task를 실행하고 main의 결과를 반환합니다.
+    각 task는 필요할 때만 깨어나며, 어느 하나가 끝나거나 예외가 발생하면 나머지 task를 모두 취소합니다.
+    """
+    pong_event = asyncio.Event()
+    main_task = asyncio.ensure_future(main)
+    tasks = [
+        main_task,
+        asyncio.create_task(
+            send_heartbeat(
+                websocket=websocket,
+                logger=logger,
+                pong_event=pong_event,
+                period_seconds=heartbeat_seconds,
+            )
+        ),
+        asyncio.create_task(
+            receive_pong(
+                websocket=websocket,
+                logger=logger,
+                pong_event=pong_event,
+            )
+        ),
+    ]
+
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    if main_task.done() and not main_task.cancelled():
+        return main_task.result()
+    for task in tasks:
+        if not task.cancelled() and task.exception() is not None:
+            raise task.exception()  # type: ignore
+    raise WebSocketDisconnect(code=1000, reason="The websocket session has ended.")
+
+
 def custom_openapi(
     app: FastAPI,
     paths: str,
@@ -0,0 +1,202 @@
+import asyncio
+import time
+from typing import Any, Callable, Optional, Self
+from zero import AsyncZeroClient
+from zero.error import ConnectionException, TimeoutException
+from ad_fast_api.snippets.sources.ad_env import fetch_env_from_os_or_default
+from ad_fast_api.snippets.sources.ad_torchserve_client import ModelMetrics
+
+
+ANIMATED_DRAWINGS_HOST_ENV = "AD_ANIMATED_DRAWINGS_HOST"
+ANIMATED_DRAWINGS_PORT_ENV = "AD_ANIMATED_DRAWINGS_PORT"
+ANIMATED_DRAWINGS_TIMEOUT_ENV = "AD_ANIMATED_DRAWINGS_TIMEOUT"
+ANIMATED_DRAWINGS_MAX_FAILURES_ENV = "AD_ANIMATED_DRAWINGS_MAX_FAILURES"
+
+DEFAULT_ANIMATED_DRAWINGS_HOST = "animated_drawings"
+DEFAULT_ANIMATED_DRAWINGS_PORT = "8001"
+# 소켓의 수신 timeout을 두지 않음 (ms)
+# timeout이 있으면 요청이 없는 동안 응답 수신 루프가 종료되어 공유 클라이언트를 쓸 수 없게 됨
+ZERO_SOCKET_NO_TIMEOUT = -1
+
+
+def create_async_zero_client(
+    host: str,
+    port: int,
+) -> AsyncZeroClient:
+    return AsyncZeroClient(
+        host,
+        port,
+        default_timeout=ZERO_SOCKET_NO_TIMEOUT,
+    )
+
+
+class ADZeroClient:
+    """
+    animated_drawings 서버 RPC에 사용하는 공유 AsyncZeroClient 입니다.
+    AsyncZeroClient는 하나의 소켓에서 요청 id로 동시 요청을 구분하므로
+    api 워커마다 하나의 클라이언트를 모든 웹소켓이 함께 사용합니다.
+    앱 시작 시 start(), 종료 시 close()를 호출하며,
+    start() 전에는 호출마다 일회용 클라이언트를 사용합니다. (테스트, case 스크립트)
+    연속으로 max_failures번 timeout, 연결 오류가 발생하면 소켓을 닫고 다음 호출에서 다시 연결합니다.
+    """
+
+    host: str
+    port: int
+    timeout_seconds: float
+    max_failures: int
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        timeout_seconds: float,
+        max_failures: int,
+        create_client: Callable[[str, int], Any] = create_async_zero_client,
+    ):
+        self.host = host
+        self.port = port
+        self.timeout_seconds = timeout_seconds
+        self.max_failures = max_failures
+        # 테스트에서 stand-in 클라이언트를 연결할 때 사용
+        self.create_client = create_client
+        self.method_metrics: dict[str, ModelMetrics] = {}
+        self.reconnect_count = 0
+        self.consecutive_failure_count = 0
+        self._is_started = False
+        self._client = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @classmethod
+    def mock(cls) -> Self:
+        return cls(
+            host="localhost",
+            port=1234,
+            timeout_seconds=1,
+            max_failures=2,
+        )
+
+    @property
+    def is_started(self) -> bool:
+        return self._is_started
+
+    def start(self):
+        self._is_started = True
+
+    def close(self):
+        self._is_started = False
+        self._close_client()
+
+    def _close_client(self):
+        if self._client is None:
+            return
+        self._client.close()
+        self._client = None
+        self._client_loop = None
+
+    def _get_client(self):
+        # 소켓은 만들어진 이벤트 루프에서만 사용할 수 있음
+        loop = asyncio.get_running_loop()
+        if self._client is not None and self._client_loop is not loop:
+            self._close_client()
+        if self._client is None:
+            self._client = self.create_client(self.host, self.port)
+            self._client_loop = loop
+        return self._client
+
+    def get_method_metrics(self, rpc_func_name: str) -> ModelMetrics:
+        if rpc_func_name not in self.method_metrics:
+            self.method_metrics[rpc_func_name] = ModelMetrics()
+        return self.method_metrics[rpc_func_name]
+
+    def get_metrics(self) -> dict:
+        return {
+            "methods": {
+                rpc_func_name: method_metrics.to_dict()
+                for rpc_func_name, method_metrics in self.method_metrics.items()
+            },
+            "reconnect_count": self.reconnect_count,
+        }
+
+    def _observe_failure(self, client):
+        self.consecutive_failure_count += 1
+        if (
+            self.consecutive_failure_count >= self.max_failures
+            and client is self._client
+        ):
+            # 다음 호출에서 새 소켓으로 다시 연결
+            self._close_client()
+            self.reconnect_count += 1
+            self.consecutive_failure_count = 0
+
+    async def call(
+        self,
+        rpc_func_name: str,
+        msg: Any,
+        timeout_seconds: Optional[float] = None,
+    ) -> Any:
+        timeout_seconds = (
+            timeout_seconds if timeout_seconds is not None else self.timeout_seconds
+        )
+        method_metrics = self.get_method_metrics(rpc_func_name)
+        method_metrics.in_flight += 1
+        is_error = True
+        start_time = time.perf_counter()
+        client = (
+            self._get_client()
+            if self._is_started
+            else self.create_client(self.host, self.port)
+        )
+
+        try:
+            response = await client.call(
+                rpc_func_name,
+                msg,
+                timeout=int(timeout_seconds * 1000),
+            )
+            is_error = False
+            self.consecutive_failure_count = 0
+            return response
+        except (TimeoutException, ConnectionException):
+            if self._is_started:
+                self._observe_failure(client)
+            raise
+        finally:
+            method_metrics.in_flight -= 1
+            method_metrics.observe(
+                latency=time.perf_counter() - start_time,
+                is_error=is_error,
+            )
+            if not self._is_started:
+                client.close()
+
+
+# lazy init
+_zero_client = None
+
+
+def create_zero_client_instance() -> ADZeroClient:
+    return ADZeroClient(
+        host=fetch_env_from_os_or_default(
+            ANIMATED_DRAWINGS_HOST_ENV,
+            DEFAULT_ANIMATED_DRAWINGS_HOST,
+        ),
+        port=int(
+            fetch_env_from_os_or_default(
+                ANIMATED_DRAWINGS_PORT_ENV,
+                DEFAULT_ANIMATED_DRAWINGS_PORT,
+            )
+        ),
+        timeout_seconds=float(
+            fetch_env_from_os_or_default(ANIMATED_DRAWINGS_TIMEOUT_ENV, "3"),
+        ),
+        max_failures=int(
+            fetch_env_from_os_or_default(ANIMATED_DRAWINGS_MAX_FAILURES_ENV, "3"),
+        ),
+    )
+
+
+def get_zero_client() -> ADZeroClient:
+    global _zero_client
+    if _zero_client is None:
+        _zero_client = create_zero_client_instance()
+    return _zero_client
@@ -1,12 +1,39 @@
+import cv2
 import aiofiles
+import numpy as np
 from pathlib import Path
 from fastapi import UploadFile
+from typing import Optional
+
+
+ENCODE_IMAGE_ERROR = "Failed to encode image to {ext}"
 
 
 def get_file_bytes(file: UploadFile) -> bytes:
     return file.file.read()
 
 
+def encode_image(
+    image: np.ndarray,
+    ext: str = ".png",
+    params: Optional[list[int]] = None,
+) -> bytes:
+    is_success, encoded_image = cv2.imencode(ext, image, params or [])
+    if not is_success:
+        raise Exception(ENCODE_IMAGE_ERROR.format(ext=ext))
+    return encoded_image.tobytes()
+
+
+def save_image(
+    image_bytes: bytes,
+    image_name: str,
+    base_path: Path,
+):
+    image_path = base_path.joinpath(image_name)
+    with open(image_path.as_posix(), "wb") as f:
+        f.write(image_bytes)
+
+
 async def save_image_async(
     image_bytes: bytes,
     image_name: str,
@@ -0,0 +1,272 @@
+import random
+import asyncio
+import cv2
+import numpy as np
+from typing import Optional, Self
+from fastapi import FastAPI, UploadFile, File
+from fastapi.responses import JSONResponse
+from ad_fast_api.snippets.sources.ad_env import fetch_env_from_os_or_default
+from ad_fast_api.snippets.sources.ad_torchserve_client import (
+    DRAWN_HUMANOID_DETECTOR,
+    DRAWN_HUMANOID_POSE_ESTIMATOR,
+)
+
+
+FAKE_TORCHSERVE_PORT_ENV = "AD_FAKE_TORCHSERVE_PORT"
+FAKE_TORCHSERVE_LATENCY_MS_ENV = "AD_FAKE_TORCHSERVE_LATENCY_MS"
+FAKE_TORCHSERVE_JITTER_MS_ENV = "AD_FAKE_TORCHSERVE_JITTER_MS"
+FAKE_TORCHSERVE_ERROR_RATE_ENV = "AD_FAKE_TORCHSERVE_ERROR_RATE"
+FAKE_TORCHSERVE_OVERLOAD_RATE_ENV = "AD_FAKE_TORCHSERVE_OVERLOAD_RATE"
+FAKE_TORCHSERVE_WORKERS_ENV = "AD_FAKE_TORCHSERVE_WORKERS"
+FAKE_TORCHSERVE_JOB_QUEUE_SIZE_ENV = "AD_FAKE_TORCHSERVE_JOB_QUEUE_SIZE"
+
+# 끊어진 선을 이어 하나의 그림으로 판단하기 위한 closing 크기
+FOREGROUND_CLOSE_KERNEL_SIZE = 15
+
+# COCO 17개 keypoint를 (bbox 기준 x 비율, y 비율)로 표현한 사람 형태 템플릿
+KEYPOINT_TEMPLATE = [
+    (0.50, 0.10),  # nose
+    (0.56, 0.07),  # left_eye
+    (0.44, 0.07),  # right_eye
+    (0.62, 0.09),  # left_ear
+    (0.38, 0.09),  # right_ear
+    (0.68, 0.25),  # left_shoulder
+    (0.32, 0.25),  # right_shoulder
+    (0.80, 0.40),  # left_elbow
+    (0.20, 0.40),  # right_elbow
+    (0.90, 0.55),  # left_wrist
+    (0.10, 0.55),  # right_wrist
+    (0.60, 0.58),  # left_hip
+    (0.40, 0.58),  # right_hip
+    (0.62, 0.78),  # left_knee
+    (0.38, 0.78),  # right_knee
+    (0.64, 0.97),  # left_ankle
+    (0.36, 0.97),  # right_ankle
+]
+
+
+def create_torchserve_error(
+    code: int,
+    error_type: str,
+    message: str,
+) -> JSONResponse:
+    # TorchServe 에러 응답과 같은 형식
+    return JSONResponse(
+        status_code=code,
+        content={"code": code, "type": error_type, "message": message},
+    )
+
+
+def find_foreground_bbox(image_bytes: bytes) -> Optional[list[int]]:
+    img = cv2.imdecode(np.frombuffer(image_bytes, np.uint8), cv2.IMREAD_GRAYSCALE)
+    if img is None:
+        return None
+
+    # 종이보다 어두운 선을 전경으로 보고, 가장 큰 덩어리를 그림으로 판단
+    blurred_img = cv2.GaussianBlur(img, (5, 5), 0)
+    _, foreground = cv2.threshold(
+        blurred_img,
+        0,
+        255,
+        cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU,
+    )
+    foreground = cv2.morphologyEx(
+        foreground,
+        cv2.MORPH_CLOSE,
+        np.ones((FOREGROUND_CLOSE_KERNEL_SIZE, FOREGROUND_CLOSE_KERNEL_SIZE), np.uint8),
+    )
+    num_labels, _, stats, _ = cv2.connectedComponentsWithStats(foreground)
+    if num_labels < 2:
+        # 그림이 없으면 이미지 전체를 bbox로 사용
+        return [0, 0, img.shape[1], img.shape[0]]
+
+    largest_label = 1 + int(np.argmax(stats[1:, cv2.CC_STAT_AREA]))
+    x, y, w, h = [int(v) for v in stats[largest_label, :4]]
+    return [x, y, x + w, y + h]
+
+
+def predict_detection(image_bytes: bytes) -> Optional[list[dict]]:
+    bbox = find_foreground_bbox(image_bytes)
+    if bbox is None:
+        return None
+    return [{"bbox": [float(v) for v in bbox], "score": 0.99}]
+
+
+def predict_pose(image_bytes: bytes) -> Optional[list[dict]]:
+    bbox = find_foreground_bbox(image_bytes)
+    if bbox is None:
+        return None
+
+    left, top, right, bottom = bbox
+    keypoints = [
+        [left + x_ratio * (right - left), top + y_ratio * (bottom - top), 0.9]
+        for x_ratio, y_ratio in KEYPOINT_TEMPLATE
+    ]
+    return [{"keypoints": keypoints}]
+
+
+PREDICTORS = {
+    DRAWN_HUMANOID_DETECTOR: predict_detection,
+    DRAWN_HUMANOID_POSE_ESTIMATOR: predict_pose,
+}
+
+
+class FakeTorchServeConfig:
+    """
+    - latency_ms, jitter_ms: 추론 1회에 걸리는 시간
+    - error_rate: 500 에러를 반환할 확률
+    - overload_rate: 503 에러를 반환할 확률
+    - workers: 동시에 추론하는 모델 워커 수 (모델별)
+    - job_queue_size: 워커를 기다릴 수 있는 요청 수, 넘치면 503 (모델별)
+    """
+
+    latency_ms: float
+    jitter_ms: float
+    error_rate: float
+    overload_rate: float
+    workers: int
+    job_queue_size: int
+
+    def __init__(
+        self,
+        latency_ms: float,
+        jitter_ms: float,
+        error_rate: float,
+        overload_rate: float,
+        workers: int,
+        job_queue_size: int,
+    ):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.overload_rate = overload_rate
+        self.workers = workers
+        self.job_queue_size = job_queue_size
+
+    @classmethod
+    def mock(cls) -> Self:
+        return cls(
+            latency_ms=0,
+            jitter_ms=0,
+            error_rate=0,
+            overload_rate=0,
+            workers=1,
+            job_queue_size=5,
+        )
+
+    def get_latency_seconds(self) -> float:
+        jitter_ms = random.uniform(-self.jitter_ms, self.jitter_ms)
+        return max(0.0, self.latency_ms + jitter_ms) / 1000
+
+
+def create_fake_torchserve_config_instance() -> FakeTorchServeConfig:
+    # ad_torchserve/config.properties 기본값과 같은 워커, 큐 크기
+    return FakeTorchServeConfig(
+        latency_ms=float(
+            fetch_env_from_os_or_default(FAKE_TORCHSERVE_LATENCY_MS_ENV, "300"),
+        ),
+        jitter_ms=float(
+            fetch_env_from_os_or_default(FAKE_TORCHSERVE_JITTER_MS_ENV, "50"),
+        ),
+        error_rate=float(
+            fetch_env_from_os_or_default(FAKE_TORCHSERVE_ERROR_RATE_ENV, "0"),
+        ),
+        overload_rate=float(
+            fetch_env_from_os_or_default(FAKE_TORCHSERVE_OVERLOAD_RATE_ENV, "0"),
+        ),
+        workers=int(
+            fetch_env_from_os_or_default(FAKE_TORCHSERVE_WORKERS_ENV, "1"),
+        ),
+        job_queue_size=int(
+            fetch_env_from_os_or_default(FAKE_TORCHSERVE_JOB_QUEUE_SIZE_ENV, "5"),
+        ),
+    )
+
+
+class FakeModelWorkers:
+    def __init__(self, config: FakeTorchServeConfig):
+        self.config = config
+        self.semaphore = asyncio.Semaphore(config.workers)
+        self.pending = 0
+
+    @property
+    def is_queue_full(self) -> bool:
+        return self.pending >= self.config.workers + self.config.job_queue_size
+
+
+def create_fake_torchserve_app(
+    config: Optional[FakeTorchServeConfig] = None,
+) -> FastAPI:
+    """
+    ad_torchserve의 /ping, /predictions/{model_name} 를 흉내내는 stand-in 서버 입니다.
+    모델 없이 그림 영역으로 bbox, keypoint를 만들어 반환하므로
+    API 서버만 따로 벤치마크, 부하 테스트 할 때 사용합니다.
+    """
+    config = config or create_fake_torchserve_config_instance()
+    app = FastAPI()
+    model_workers = {
+        model_name: FakeModelWorkers(config=config) for model_name in PREDICTORS
+    }
+
+    @app.get("/ping")
+    async def ping():
+        return {"status": "Healthy"}
+
+    @app.post("/predictions/{model_name}")
+    async def predictions(
+        model_name: str,
+        data: UploadFile = File(...),
+    ):
+        if model_name not in PREDICTORS:
+            return create_torchserve_error(
+                code=404,
+                error_type="ModelNotFoundException",
+                message=f"Model not found: {model_name}",
+            )
+
+        workers = model_workers[model_name]
+        if workers.is_queue_full or random.random() < config.overload_rate:
+            return create_torchserve_error(
+                code=503,
+                error_type="ServiceUnavailableException",
+                message=f"Model {model_name} has no worker to serve inference request.",
+            )
+
+        workers.pending += 1
+        try:
+            image_bytes = await data.read()
+            async with workers.semaphore:
+                await asyncio.sleep(config.get_latency_seconds())
+                if random.random() < config.error_rate:
+                    return create_torchserve_error(
+                        code=500,
+                        error_type="InternalServerException",
+                        message="Worker died.",
+                    )
+                result = await asyncio.to_thread(PREDICTORS[model_name], image_bytes)
+        finally:
+            workers.pending -= 1
+
+        if result is None:
+            return create_torchserve_error(
+                code=400,
+                error_type="BadRequestException",
+                message="Failed to decode image.",
+            )
+        return result
+
+    return app
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(
+        create_fake_torchserve_app(),
+        host="0.0.0.0",
+        port=int(fetch_env_from_os_or_default(FAKE_TORCHSERVE_PORT_ENV, "8080")),
+    )
+
+
+# AD_FAKE_TORCHSERVE_LATENCY_MS=300 python -m ad_fast_api.snippets.testings.fake_torchserve_server
+# API 서버는 AD_TORCHSERVE_URL=http://localhost:8080 로 실행
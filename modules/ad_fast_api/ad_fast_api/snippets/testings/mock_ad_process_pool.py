@@ -0,0 +1,16 @@
+import time
+import numpy as np
+
+
+# image process pool 워커에서 실행되는 테스트용 함수들 (spawn 워커에서 import 가능해야 함)
+def sum_image(image: np.ndarray) -> int:
+    return int(image.sum())
+
+
+def sleep_and_sum_image(image: np.ndarray, seconds: float) -> int:
+    time.sleep(seconds)
+    return int(image.sum())
+
+
+def raise_exception(image: np.ndarray, message: str):
+    raise Exception(message)
@@ -0,0 +1,279 @@
+import asyncio
+import httpx
+import pytest
+import respx
+from fastapi import HTTPException
+from ad_fast_api.snippets.sources.ad_adaptive_limiter import (
+    ADAdaptiveLimiter,
+    CircuitState,
+)
+from ad_fast_api.snippets.sources.ad_torchserve_client import ADTorchServeClient
+
+
+TEST_URL = "http://test_torchserve:8080/predictions/test_model"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def create_limiter(clock: FakeClock) -> ADAdaptiveLimiter:
+    return ADAdaptiveLimiter(
+        name="test_model",
+        min_limit=1,
+        max_limit=4,
+        initial_limit=2,
+        queue_timeout_seconds=0.05,
+        latency_threshold_seconds=1,
+        failure_threshold=2,
+        open_seconds=10,
+        clock=clock,
+    )
+
+
+@pytest.mark.asyncio
+async def test_additive_increase_and_multiplicative_decrease():
+    # given
+    limiter = create_limiter(FakeClock())
+
+    # when: 정상 응답
+    await limiter.acquire()
+    limiter.release(latency=0.1, is_overload=False)
+
+    # then
+    assert limiter.limit == 2.5
+
+    # when: 느린 응답
+    await limiter.acquire()
+    limiter.release(latency=2, is_overload=False)
+
+    # then: limit은 줄지만 circuit은 그대로
+    assert limiter.limit == 1.25
+    assert limiter.circuit_state == CircuitState.CLOSED
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_acquire_rejects_after_queue_timeout():
+    # given
+    limiter = ADAdaptiveLimiter.mock()
+    await limiter.acquire()
+    await limiter.acquire()
+
+    # when
+    with pytest.raises(HTTPException) as exc_info:
+        await limiter.acquire()
+
+    # then
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.headers == {"Retry-After": "1"}
+    assert limiter.rejected_count == 1
+    assert limiter.in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_acquire_waits_for_release():
+    # given
+    limiter = ADAdaptiveLimiter.mock()
+    limiter.queue_timeout_seconds = 1
+    await limiter.acquire()
+    await limiter.acquire()
+
+    # when
+    waiting_task = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0.01)
+    assert not waiting_task.done()
+    limiter.release(latency=0.1, is_overload=False)
+    await asyncio.wait_for(waiting_task, timeout=1)
+
+    # then
+    assert limiter.in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_open_half_open_closed():
+    # given
+    clock = FakeClock()
+    limiter = create_limiter(clock)
+
+    # when: 과부하가 연속되면 open
+    for _ in range(limiter.failure_threshold):
+        await limiter.acquire()
+        limiter.release(latency=0.1, is_overload=True)
+
+    # then
+    assert limiter.circuit_state == CircuitState.OPEN
+    clock.now += 3
+    with pytest.raises(HTTPException) as exc_info:
+        await limiter.acquire()
+    assert exc_info.value.headers == {"Retry-After": "7"}
+
+    # when: open_seconds가 지나면 요청 하나만 통과 (half open)
+    clock.now += 7
+    is_probe = await limiter.acquire()
+    assert is_probe
+    assert limiter.circuit_state == CircuitState.HALF_OPEN
+    with pytest.raises(HTTPException):
+        await limiter.acquire()
+
+    # then: 통과한 요청이 성공하면 closed
+    limiter.release(latency=0.1, is_overload=False, is_probe=is_probe)
+    assert limiter.circuit_state == CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_reopens_when_probe_fails():
+    # given
+    clock = FakeClock()
+    limiter = create_limiter(clock)
+    for _ in range(limiter.failure_threshold):
+        await limiter.acquire()
+        limiter.release(latency=0.1, is_overload=True)
+    clock.now += limiter.open_seconds
+
+    # when
+    is_probe = await limiter.acquire()
+    limiter.release(latency=0.1, is_overload=True, is_probe=is_probe)
+
+    # then
+    assert limiter.circuit_state == CircuitState.OPEN
+    assert limiter.retry_after_seconds == limiter.open_seconds
+
+
+@pytest.mark.asyncio
+async def test_cancelled_probe_does_not_keep_circuit_half_open():
+    # given: open_seconds가 지나 half open, 확인 요청이 슬롯을 기다리는 중
+    clock = FakeClock()
+    limiter = create_limiter(clock)
+    limiter.queue_timeout_seconds = 10
+    for _ in range(limiter.failure_threshold):
+        await limiter.acquire()
+        limiter.release(latency=0.1, is_overload=True)
+    clock.now += limiter.open_seconds
+    limiter.in_flight = int(limiter.limit)
+    probe_task = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+
+    # when: 확인 요청이 취소됨 (클라이언트 연결 종료 등)
+    probe_task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await probe_task
+    limiter.in_flight = 0
+
+    # then: 다음 요청이 다시 확인 요청으로 통과
+    is_probe = await limiter.acquire()
+    assert is_probe
+    assert limiter.circuit_state == CircuitState.HALF_OPEN
+    limiter.release(latency=0.1, is_overload=False, is_probe=is_probe)
+    assert limiter.circuit_state == CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_stale_request_does_not_change_half_open_circuit():
+    # given: circuit이 열리기 전에 시작한 요청이 진행중
+    clock = FakeClock()
+    limiter = create_limiter(clock)
+    limiter.limit = limiter.max_limit
+    stale_is_probes = [await limiter.acquire() for _ in range(2)]
+    for _ in range(limiter.failure_threshold):
+        limiter.limit = limiter.max_limit
+        await limiter.acquire()
+        limiter.release(latency=0.1, is_overload=True)
+    clock.now += limiter.open_seconds
+    limiter.limit = limiter.max_limit
+    is_probe = await limiter.acquire()
+    assert is_probe
+    assert stale_is_probes == [False, False]
+
+    # when: 확인 요청보다 먼저 이전 요청들이 끝남
+    limiter.release(latency=0.1, is_overload=False, is_probe=stale_is_probes[0])
+    limiter.release_without_feedback(is_probe=stale_is_probes[1])
+
+    # then: half open 상태로 남고 두번째 확인 요청은 거절
+    assert limiter.circuit_state == CircuitState.HALF_OPEN
+    with pytest.raises(HTTPException):
+        await limiter.acquire()
+
+    # then: 확인 요청의 결과로만 닫힘
+    limiter.release(latency=0.1, is_overload=False, is_probe=is_probe)
+    assert limiter.circuit_state == CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_release_without_feedback_keeps_limit_and_circuit():
+    # given
+    clock = FakeClock()
+    limiter = create_limiter(clock)
+    limit = limiter.limit
+
+    # when
+    for _ in range(limiter.failure_threshold):
+        await limiter.acquire()
+        limiter.release_without_feedback()
+
+    # then
+    assert limiter.in_flight == 0
+    assert limiter.limit == limit
+    assert limiter.consecutive_failures == 0
+    assert limiter.circuit_state == CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_cancelled_torchserve_request_is_not_overload():
+    # given: speculative pose 처럼 진행중인 요청을 취소
+    clock = FakeClock()
+    client = ADTorchServeClient.mock()
+    client.create_limiter = lambda model_name: create_limiter(clock)
+
+    async def slow_response(request):
+        await asyncio.sleep(10)
+        return httpx.Response(200)
+
+    respx.post(TEST_URL).mock(side_effect=slow_response)
+
+    # when
+    for _ in range(3):
+        task = asyncio.create_task(
+            client.post_prediction("test_model", {"data": b"x"}, TEST_URL)
+        )
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    # then
+    limiter = client.get_limiter("test_model")
+    assert limiter is not None
+    assert limiter.in_flight == 0
+    assert limiter.limit == 2
+    assert limiter.circuit_state == CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_torchserve_client_uses_limiter():
+    # given
+    clock = FakeClock()
+    client = ADTorchServeClient.mock()
+    client.create_limiter = lambda model_name: create_limiter(clock)
+    respx.post(TEST_URL).mock(return_value=httpx.Response(503))
+
+    # when: TorchServe 503이 이어지면 더 이상 요청을 보내지 않음
+    for _ in range(2):
+        resp = await client.post_prediction("test_model", {"data": b"x"}, TEST_URL)
+        assert resp.status_code == 503
+    with pytest.raises(HTTPException) as exc_info:
+        await client.post_prediction("test_model", {"data": b"x"}, TEST_URL)
+
+    # then
+    assert exc_info.value.status_code == 503
+    assert respx.calls.call_count == 2
+    assert client.get_retry_after_seconds("test_model") == 10
+    metrics = client.get_metrics()["test_model"]
+    assert metrics["circuit_state"] == CircuitState.OPEN.value
+    assert metrics["rejected_count"] == 1
@@ -3,6 +3,7 @@ import pytest
 from unittest.mock import patch
 from ad_fast_api.snippets.sources.ad_env import (
     fetch_env_from_os,
+    fetch_env_from_os_or_default,
     FETCH_ENV_FROM_OS_ERROR,
 )
 
@@ -32,3 +33,20 @@ def test_fetch_env_from_os_raises_error_when_not_set():
     # then
     expect_msg = FETCH_ENV_FROM_OS_ERROR.format(env_name=env_name)
     assert expect_msg in str(excinfo.value)
+
+
+def test_fetch_env_from_os_or_default():
+    # given
+    env_name = "TEST_ENV"
+    env_value = "test_value"
+    default = "default_value"
+
+    # when
+    with patch.dict(os.environ, {env_name: env_value}):
+        result_set = fetch_env_from_os_or_default(env_name, default)
+    with patch.dict(os.environ, {}, clear=True):
+        result_not_set = fetch_env_from_os_or_default(env_name, default)
+
+    # then
+    assert result_set == env_value
+    assert result_not_set == default
@@ -0,0 +1,92 @@
+import pytest
+from email.utils import formatdate
+from unittest.mock import patch
+from ad_fast_api.snippets.sources import ad_file_response
+from ad_fast_api.snippets.sources.ad_file_response import (
+    IMMUTABLE_CACHE_CONTROL,
+    ADFileResponse,
+    create_file_response,
+    get_file_version,
+    is_not_modified,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_file_etags(monkeypatch):
+    monkeypatch.setattr(ad_file_response, "_file_etags", ad_file_response.OrderedDict())
+
+
+@pytest.mark.asyncio
+async def test_get_file_version_reuses_hash_until_file_changes(tmp_path):
+    # given
+    file_path = tmp_path / "dab.gif"
+    file_path.write_bytes(b"GIF89a")
+
+    # when
+    with patch.object(
+        ad_file_response,
+        "hash_file",
+        wraps=ad_file_response.hash_file,
+    ) as mock_hash_file:
+        version = await get_file_version(file_path)
+        cached_version = await get_file_version(file_path)
+        file_path.write_bytes(b"GIF89a changed")
+        changed_version = await get_file_version(file_path)
+
+    # then
+    assert version == cached_version
+    assert version != changed_version
+    assert mock_hash_file.call_count == 2
+
+
+def test_is_not_modified(tmp_path):
+    # given
+    file_path = tmp_path / "dab.gif"
+    file_path.write_bytes(b"GIF89a")
+    stat_result = file_path.stat()
+    etag = '"abc"'
+    last_modified = formatdate(stat_result.st_mtime, usegmt=True)
+    older = formatdate(stat_result.st_mtime - 60, usegmt=True)
+
+    # when, then
+    assert is_not_modified({"if-none-match": '"abc"'}, etag, stat_result)
+    assert is_not_modified({"if-none-match": 'W/"abc", "def"'}, etag, stat_result)
+    assert is_not_modified({"if-none-match": "*"}, etag, stat_result)
+    assert not is_not_modified({"if-none-match": '"def"'}, etag, stat_result)
+    assert is_not_modified({"if-modified-since": last_modified}, etag, stat_result)
+    assert not is_not_modified({"if-modified-since": older}, etag, stat_result)
+    assert not is_not_modified({"if-modified-since": "invalid"}, etag, stat_result)
+    # If-None-Match가 있으면 If-Modified-Since는 무시
+    assert not is_not_modified(
+        {"if-none-match": '"def"', "if-modified-since": last_modified},
+        etag,
+        stat_result,
+    )
+    assert not is_not_modified({}, etag, stat_result)
+
+
+@pytest.mark.asyncio
+async def test_create_file_response(tmp_path):
+    # given
+    file_path = tmp_path / "dab.gif"
+    file_path.write_bytes(b"GIF89a")
+    version = await get_file_version(file_path)
+
+    # when
+    response = await create_file_response(
+        file_path=file_path,
+        media_type="image/gif",
+        version=version,
+    )
+    not_modified_response = await create_file_response(
+        file_path=file_path,
+        media_type="image/gif",
+        request_headers={"if-none-match": f'"{version}"'},
+    )
+
+    # then
+    assert isinstance(response, ADFileResponse)
+    assert response.headers["etag"] == f'"{version}"'
+    assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+    assert not_modified_response.status_code == 304
+    assert not_modified_response.headers["etag"] == f'"{version}"'
@@ -0,0 +1,125 @@
+import threading
+import pytest
+import numpy as np
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import MagicMock
+from fastapi import HTTPException
+from ad_fast_api.snippets.sources.ad_process_pool import ADImageProcessPool
+from ad_fast_api.snippets.testings import mock_ad_process_pool as mapp
+
+
+@pytest.fixture
+def started_pool():
+    pool = ADImageProcessPool(
+        max_workers=1,
+        max_queue_depth=0,
+    )
+    pool.start()
+    yield pool
+    pool.shutdown()
+
+
+def test_run_inline_when_not_started():
+    # given
+    pool = ADImageProcessPool.mock()
+    image = np.ones((10, 10, 3), dtype=np.uint8)
+
+    # when
+    result = pool.run(mapp.sum_image, image)
+
+    # then
+    assert not pool.is_started
+    assert result == 300
+    assert pool.pending == 0
+
+
+def test_run_with_shared_image(started_pool):
+    # given
+    image = np.random.randint(0, 255, (100, 80, 3), dtype=np.uint8)
+    # 연속되지 않은 메모리(crop view)도 전달 가능해야 함
+    cropped_image = image[10:60, 20:70]
+
+    # when
+    result = started_pool.run(mapp.sum_image, cropped_image)
+
+    # then
+    assert result == int(cropped_image.sum())
+    assert started_pool.pending == 0
+
+
+def test_run_raises_exception_from_worker(started_pool):
+    # given
+    image = np.zeros((10, 10), dtype=np.uint8)
+    message = "worker error"
+
+    # when
+    with pytest.raises(Exception) as excinfo:
+        started_pool.run(mapp.raise_exception, image, message=message)
+
+    # then
+    assert message in str(excinfo.value)
+    assert started_pool.pending == 0
+
+
+def test_submit_sheds_load_when_queue_is_full(started_pool):
+    # given
+    image = np.zeros((10, 10), dtype=np.uint8)
+    future = started_pool.submit(mapp.sleep_and_sum_image, image, seconds=1)
+
+    # when
+    with pytest.raises(HTTPException) as excinfo:
+        started_pool.submit(mapp.sum_image, image)
+
+    # then
+    assert excinfo.value.status_code == 503
+    assert "Retry-After" in excinfo.value.headers  # type: ignore
+    assert future.result() == 0
+    assert started_pool.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_run_async(started_pool):
+    # given
+    image = np.ones((5, 5), dtype=np.uint8)
+
+    # when
+    result = await started_pool.run_async(mapp.sum_image, image)
+
+    # then
+    assert result == 25
+
+
+def test_broken_pool_is_replaced_once_by_concurrent_submitters():
+    # given: 워커가 비정상 종료되어 깨진 풀
+    pool = ADImageProcessPool.mock()
+    broken_executor = MagicMock()
+    broken_executor.submit.side_effect = BrokenProcessPool()
+    pool._executor = broken_executor  # type: ignore
+    created_executors = []
+
+    def create_executor():
+        executor = MagicMock()
+        created_executors.append(executor)
+        return executor
+
+    pool._create_executor = create_executor  # type: ignore
+    image = np.zeros((10, 10), dtype=np.uint8)
+    threads = [
+        threading.Thread(
+            target=pool._submit_to_executor,
+            args=(mapp.sum_image, MagicMock(name="shm"), image, {}),
+        )
+        for _ in range(8)
+    ]
+
+    # when
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # then: 새 풀은 한 번만 만들고 모든 호출자가 같은 풀에 제출
+    assert len(created_executors) == 1
+    assert pool._executor is created_executors[0]
+    assert created_executors[0].submit.call_count == 8
+    broken_executor.shutdown.assert_called_once()
@@ -0,0 +1,169 @@
+import asyncio
+import httpx
+import pytest
+from ad_fast_api.snippets.sources.ad_torchserve_batcher import (
+    ADTorchServeBatcher,
+    hash_request_files,
+)
+from ad_fast_api.snippets.sources.ad_torchserve_client import ADTorchServeClient
+
+
+TEST_MODEL_NAME = "test_model"
+TEST_URL = "http://test_torchserve:8080/predictions/test_model"
+
+
+def create_batcher(handler) -> ADTorchServeBatcher:
+    torchserve_client = ADTorchServeClient.mock()
+    torchserve_client.transport = httpx.MockTransport(handler)
+    return ADTorchServeBatcher(torchserve_client=torchserve_client)
+
+
+def echo_handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, content=request.content)
+
+
+async def slow_echo_handler(request: httpx.Request) -> httpx.Response:
+    await asyncio.sleep(0.05)
+    return echo_handler(request)
+
+
+def test_hash_request_files():
+    # when
+    request_hash = hash_request_files({"data": b"image"})
+
+    # then
+    assert request_hash == hash_request_files({"data": b"image"})
+    assert request_hash != hash_request_files({"data": b"other image"})
+
+
+@pytest.mark.asyncio
+async def test_post_prediction_coalesces_same_files():
+    # given
+    requests = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return await slow_echo_handler(request)
+
+    batcher = create_batcher(handler)
+
+    # when
+    responses = await asyncio.gather(
+        batcher.post_prediction(TEST_MODEL_NAME, {"data": b"first"}, TEST_URL),
+        batcher.post_prediction(TEST_MODEL_NAME, {"data": b"first"}, TEST_URL),
+        batcher.post_prediction(TEST_MODEL_NAME, {"data": b"second"}, TEST_URL),
+    )
+
+    # then: 각 요청은 자신의 이미지에 대한 응답을 받음
+    assert len(requests) == 2
+    assert b"first" in responses[0].content
+    assert responses[0] is responses[1]
+    assert b"second" in responses[2].content
+    assert batcher.get_metrics()[TEST_MODEL_NAME] == {
+        "request_count": 3,
+        "sent_count": 2,
+        "coalesced_count": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_post_prediction_sends_different_files_without_waiting():
+    # given
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return echo_handler(request)
+
+    batcher = create_batcher(handler)
+
+    # when: 진행중인 요청이 없으면 바로 전송
+    task = asyncio.create_task(
+        batcher.post_prediction(TEST_MODEL_NAME, {"data": b"first"}, TEST_URL)
+    )
+    await asyncio.sleep(0.01)
+
+    # then
+    assert len(requests) == 1
+    assert b"first" in (await task).content
+
+
+@pytest.mark.asyncio
+async def test_post_prediction_sends_again_after_response():
+    # given
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return echo_handler(request)
+
+    batcher = create_batcher(handler)
+
+    # when: 응답을 받은 뒤의 같은 이미지는 새로 전송
+    await batcher.post_prediction(TEST_MODEL_NAME, {"data": b"first"}, TEST_URL)
+    await batcher.post_prediction(TEST_MODEL_NAME, {"data": b"first"}, TEST_URL)
+
+    # then
+    assert len(requests) == 2
+    assert batcher.get_metrics()[TEST_MODEL_NAME]["coalesced_count"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_request_does_not_cancel_other_waiters():
+    # given
+    batcher = create_batcher(slow_echo_handler)
+    first_task = asyncio.create_task(
+        batcher.post_prediction(TEST_MODEL_NAME, {"data": b"first"}, TEST_URL)
+    )
+    second_task = asyncio.create_task(
+        batcher.post_prediction(TEST_MODEL_NAME, {"data": b"first"}, TEST_URL)
+    )
+    await asyncio.sleep(0.01)
+
+    # when
+    first_task.cancel()
+
+    # then
+    with pytest.raises(asyncio.CancelledError):
+        await first_task
+    assert b"first" in (await second_task).content
+
+
+@pytest.mark.asyncio
+async def test_request_is_cancelled_when_all_waiters_cancelled():
+    # given
+    batcher = create_batcher(slow_echo_handler)
+    task = asyncio.create_task(
+        batcher.post_prediction(TEST_MODEL_NAME, {"data": b"first"}, TEST_URL)
+    )
+    await asyncio.sleep(0.01)
+    (in_flight_request,) = batcher._in_flight.values()
+
+    # when
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    await asyncio.sleep(0)
+
+    # then
+    assert in_flight_request.task.cancelled()
+    assert batcher._in_flight == {}
+
+
+@pytest.mark.asyncio
+async def test_post_prediction_propagates_exception():
+    # given
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("Connection failed")
+
+    batcher = create_batcher(handler)
+
+    # when
+    results = await asyncio.gather(
+        batcher.post_prediction(TEST_MODEL_NAME, {"data": b"first"}, TEST_URL),
+        batcher.post_prediction(TEST_MODEL_NAME, {"data": b"first"}, TEST_URL),
+        return_exceptions=True,
+    )
+
+    # then
+    assert all(isinstance(result, httpx.ConnectError) for result in results)
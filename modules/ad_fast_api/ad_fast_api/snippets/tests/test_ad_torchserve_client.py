@@ -0,0 +1,130 @@
+import asyncio
+import httpx
+import pytest
+import respx
+from ad_fast_api.snippets.sources import ad_torchserve_client as atc
+from ad_fast_api.snippets.sources.ad_torchserve_client import (
+    ADTorchServeClient,
+    ModelMetrics,
+)
+
+
+TEST_MODEL_NAME = "test_model"
+TEST_URL = "http://test_torchserve:8080/predictions/test_model"
+
+
+def test_get_prediction_url(monkeypatch):
+    # given
+    monkeypatch.setenv(atc.TORCHSERVE_URL_ENV, "http://localhost:8080/")
+
+    # when
+    url = atc.get_prediction_url(TEST_MODEL_NAME)
+
+    # then
+    assert url == "http://localhost:8080/predictions/test_model"
+
+
+def test_model_metrics_observe():
+    # given
+    model_metrics = ModelMetrics()
+
+    # when
+    model_metrics.observe(latency=0.01, is_error=False)
+    model_metrics.observe(latency=0.3, is_error=True)
+    model_metrics.observe(latency=100, is_error=False)
+    result = model_metrics.to_dict()
+
+    # then
+    assert result["request_count"] == 3
+    assert result["error_count"] == 1
+    assert result["latency_sum"] == pytest.approx(100.31)
+    assert result["latency_buckets"]["0.05"] == 1
+    assert result["latency_buckets"]["0.5"] == 2
+    assert result["latency_buckets"]["25.0"] == 2
+    assert result["latency_buckets"]["+Inf"] == 3
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_post_prediction_when_not_started():
+    # given
+    client = ADTorchServeClient.mock()
+    route = respx.post(TEST_URL).mock(return_value=httpx.Response(200, json=[]))
+
+    # when
+    resp = await client.post_prediction(
+        model_name=TEST_MODEL_NAME,
+        files={"data": b"test"},
+        url=TEST_URL,
+    )
+
+    # then
+    assert not client.is_started
+    assert resp.status_code == 200
+    assert route.called
+    metrics = client.get_metrics()[TEST_MODEL_NAME]
+    assert metrics["in_flight"] == 0
+    assert metrics["request_count"] == 1
+    assert metrics["error_count"] == 0
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_post_prediction_reuses_started_client():
+    # given
+    client = ADTorchServeClient.mock()
+    client.start()
+    shared_client = client._client
+    respx.post(TEST_URL).mock(return_value=httpx.Response(200, json=[]))
+
+    # when
+    await asyncio.gather(
+        *[
+            client.post_prediction(
+                model_name=TEST_MODEL_NAME,
+                files={"data": b"test"},
+                url=TEST_URL,
+            )
+            for _ in range(3)
+        ]
+    )
+
+    # then
+    assert client._client is shared_client
+    assert client.get_metrics()[TEST_MODEL_NAME]["request_count"] == 3
+    await client.aclose()
+    assert not client.is_started
+    assert shared_client.is_closed
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_post_prediction_counts_errors():
+    # given
+    client = ADTorchServeClient.mock()
+    respx.post(TEST_URL).mock(
+        side_effect=[
+            httpx.Response(503),
+            httpx.ConnectError("Connection failed"),
+        ]
+    )
+
+    # when
+    resp = await client.post_prediction(
+        model_name=TEST_MODEL_NAME,
+        files={"data": b"test"},
+        url=TEST_URL,
+    )
+    with pytest.raises(httpx.ConnectError):
+        await client.post_prediction(
+            model_name=TEST_MODEL_NAME,
+            files={"data": b"test"},
+            url=TEST_URL,
+        )
+
+    # then
+    assert resp.status_code == 503
+    metrics = client.get_metrics()[TEST_MODEL_NAME]
+    assert metrics["in_flight"] == 0
+    assert metrics["request_count"] == 2
+    assert metrics["error_count"] == 2
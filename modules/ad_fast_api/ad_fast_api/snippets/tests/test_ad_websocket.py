@@ -7,6 +7,9 @@ from fastapi.websockets import WebSocket
 from ad_fast_api.snippets.sources.ad_websocket import (
     retry_ping,
     retry_pong,
+    receive_pong,
+    send_heartbeat,
+    run_with_heartbeat,
     custom_openapi,
     accept_websocket,
     MAX_RETRIES,
@@ -266,6 +269,114 @@ async def test_retry_pong_exception():
     logger.error.assert_called_once()
 
 
+# receive_pong 함수 테스트
+@pytest.mark.asyncio
+async def test_receive_pong_sets_event_until_disconnect():
+    # given
+    websocket = AsyncMock(spec=WebSocket)
+    websocket.receive_json = AsyncMock(
+        side_effect=[
+            {"type": "invalid"},
+            {"type": "PONG", "message": "", "data": {}},
+            WebSocketDisconnect(code=1000),
+        ]
+    )
+    logger = MagicMock(spec=logging.Logger)
+    pong_event = asyncio.Event()
+
+    # when
+    with pytest.raises(WebSocketDisconnect):
+        await receive_pong(websocket, logger, pong_event)
+
+    # then
+    assert pong_event.is_set()
+    logger.warning.assert_called_once()
+
+
+# send_heartbeat 함수 테스트
+@pytest.mark.asyncio
+async def test_send_heartbeat_pong_timeout():
+    # given: pong 응답이 오지 않음
+    websocket = AsyncMock(spec=WebSocket)
+    logger = MagicMock(spec=logging.Logger)
+
+    # when
+    with pytest.raises(WebSocketDisconnect):
+        await send_heartbeat(
+            websocket=websocket,
+            logger=logger,
+            pong_event=asyncio.Event(),
+            period_seconds=0.01,
+            pong_timeout_seconds=0.05,
+        )
+
+    # then
+    websocket.send_json.assert_called_once()
+    logger.error.assert_called_once()
+
+
+# run_with_heartbeat 함수 테스트
+@pytest.mark.asyncio
+async def test_run_with_heartbeat_returns_main_result_and_cancels_tasks():
+    # given: PING을 보내면 PONG으로 응답하는 웹소켓
+    received_messages = asyncio.Queue()
+
+    async def send_json(data):
+        received_messages.put_nowait({"type": "PONG", "message": "", "data": {}})
+
+    websocket = AsyncMock(spec=WebSocket)
+    websocket.send_json = AsyncMock(side_effect=send_json)
+    websocket.receive_json = AsyncMock(side_effect=received_messages.get)
+    logger = MagicMock(spec=logging.Logger)
+
+    async def main():
+        await asyncio.sleep(0.1)
+        return "done"
+
+    # when
+    result = await run_with_heartbeat(
+        websocket=websocket,
+        logger=logger,
+        main=main(),
+        heartbeat_seconds=0.02,
+    )
+
+    # then: heartbeat는 main과 별개의 주기로 동작하고, main이 끝나면 함께 종료
+    assert result == "done"
+    assert websocket.send_json.call_count > 1
+    assert len(asyncio.all_tasks()) == 1
+    logger.error.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_run_with_heartbeat_disconnect_cancels_main():
+    # given
+    websocket = AsyncMock(spec=WebSocket)
+    websocket.receive_json = AsyncMock(side_effect=WebSocketDisconnect(code=1000))
+    logger = MagicMock(spec=logging.Logger)
+    is_cancelled = False
+
+    async def main():
+        nonlocal is_cancelled
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            is_cancelled = True
+            raise
+
+    # when
+    with pytest.raises(WebSocketDisconnect):
+        await run_with_heartbeat(
+            websocket=websocket,
+            logger=logger,
+            main=main(),
+            heartbeat_seconds=5,
+        )
+
+    # then
+    assert is_cancelled
+
+
 # custom_openapi 함수 테스트
 def test_custom_openapi():
     app = FastAPI()
@@ -0,0 +1,114 @@
+import asyncio
+import pytest
+from zero.error import TimeoutException
+from ad_fast_api.snippets.sources import ad_zero_client as azc
+from ad_fast_api.snippets.sources.ad_zero_client import ADZeroClient
+
+
+class FakeAsyncZeroClient:
+    def __init__(self, responses):
+        self.responses = responses
+        self.calls = []
+        self.is_closed = False
+
+    async def call(self, rpc_func_name, msg, timeout=None):
+        self.calls.append((rpc_func_name, msg, timeout))
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    def close(self):
+        self.is_closed = True
+
+
+def create_client(responses):
+    fake_clients = []
+
+    def create_fake_client(host, port):
+        fake_client = FakeAsyncZeroClient(responses)
+        fake_clients.append(fake_client)
+        return fake_client
+
+    client = ADZeroClient.mock()
+    client.create_client = create_fake_client
+    return client, fake_clients
+
+
+def test_create_zero_client_instance_from_env(monkeypatch):
+    # given
+    monkeypatch.setenv(azc.ANIMATED_DRAWINGS_HOST_ENV, "localhost")
+    monkeypatch.setenv(azc.ANIMATED_DRAWINGS_PORT_ENV, "9001")
+    monkeypatch.setenv(azc.ANIMATED_DRAWINGS_TIMEOUT_ENV, "7")
+
+    # when
+    client = azc.create_zero_client_instance()
+
+    # then
+    assert client.host == "localhost"
+    assert client.port == 9001
+    assert client.timeout_seconds == 7
+
+
+@pytest.mark.asyncio
+async def test_call_when_not_started():
+    # given
+    client, fake_clients = create_client(["pong", "pong"])
+
+    # when
+    await client.call("ping", 1)
+    await client.call("ping", 2, timeout_seconds=0.5)
+
+    # then: 호출마다 일회용 클라이언트를 사용하고 닫음
+    assert len(fake_clients) == 2
+    assert all(fake_client.is_closed for fake_client in fake_clients)
+    assert fake_clients[0].calls == [("ping", 1, 1000)]
+    assert fake_clients[1].calls == [("ping", 2, 500)]
+
+
+@pytest.mark.asyncio
+async def test_started_client_is_shared():
+    # given
+    client, fake_clients = create_client(["a", "b", "c"])
+    client.start()
+
+    # when
+    results = await asyncio.gather(
+        client.call("is_finish_render", "job1"),
+        client.call("is_finish_render", "job2"),
+        client.call("start_render", "path"),
+    )
+
+    # then
+    assert sorted(results) == ["a", "b", "c"]
+    assert len(fake_clients) == 1
+    assert not fake_clients[0].is_closed
+    metrics = client.get_metrics()["methods"]
+    assert metrics["is_finish_render"]["request_count"] == 2
+    assert metrics["start_render"]["request_count"] == 1
+    assert metrics["start_render"]["in_flight"] == 0
+
+    client.close()
+    assert fake_clients[0].is_closed
+
+
+@pytest.mark.asyncio
+async def test_reconnect_after_consecutive_failures():
+    # given
+    client, fake_clients = create_client(
+        [TimeoutException("timeout"), TimeoutException("timeout"), "pong"]
+    )
+    client.start()
+
+    # when
+    for _ in range(2):
+        with pytest.raises(TimeoutException):
+            await client.call("ping", 1)
+    result = await client.call("ping", 1)
+
+    # then: max_failures(2)번 연속 실패하면 새 소켓으로 다시 연결
+    assert result == "pong"
+    assert len(fake_clients) == 2
+    assert fake_clients[0].is_closed
+    assert client.get_metrics()["reconnect_count"] == 1
+    assert client.get_metrics()["methods"]["ping"]["error_count"] == 2
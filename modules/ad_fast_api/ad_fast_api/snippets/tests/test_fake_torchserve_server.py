@@ -0,0 +1,148 @@
+import cv2
+import httpx
+import pytest
+import numpy as np
+from fastapi.testclient import TestClient
+from ad_fast_api.snippets.testings.fake_torchserve_server import (
+    FakeTorchServeConfig,
+    create_fake_torchserve_app,
+    find_foreground_bbox,
+)
+from ad_fast_api.snippets.sources.ad_torchserve_client import (
+    ADTorchServeClient,
+    DRAWN_HUMANOID_DETECTOR,
+    DRAWN_HUMANOID_POSE_ESTIMATOR,
+)
+from ad_fast_api.domain.upload_drawing.sources.features.detect_character import (
+    calculate_bounding_box,
+    check_detection_results,
+    sort_detection_results,
+)
+from ad_fast_api.domain.cutout_character.sources.features.configure_skeleton import (
+    check_pose_results,
+    make_skeleton,
+)
+from ad_fast_api.snippets.testings.mock_logger import mock_logger
+
+
+def create_drawing_bytes() -> bytes:
+    img = np.full((200, 100, 3), 255, dtype=np.uint8)
+    cv2.rectangle(img, (20, 30), (79, 169), (0, 0, 0), -1)
+    return cv2.imencode(".png", img)[1].tobytes()
+
+
+def create_client(**config_kwargs) -> TestClient:
+    config = FakeTorchServeConfig.mock()
+    for key, value in config_kwargs.items():
+        setattr(config, key, value)
+    return TestClient(create_fake_torchserve_app(config=config))
+
+
+def test_find_foreground_bbox():
+    # when
+    bbox = find_foreground_bbox(create_drawing_bytes())
+
+    # then
+    assert bbox == [20, 30, 80, 170]
+
+
+def test_find_foreground_bbox_blank_image():
+    # given
+    img = np.full((50, 40, 3), 255, dtype=np.uint8)
+
+    # when
+    bbox = find_foreground_bbox(cv2.imencode(".png", img)[1].tobytes())
+
+    # then
+    assert bbox == [0, 0, 40, 50]
+
+
+def test_ping():
+    # when
+    response = create_client().get("/ping")
+
+    # then
+    assert response.status_code == 200
+    assert response.json() == {"status": "Healthy"}
+
+
+def test_predict_detection(mock_logger):
+    # when
+    response = create_client().post(
+        f"/predictions/{DRAWN_HUMANOID_DETECTOR}",
+        files={"data": create_drawing_bytes()},
+    )
+
+    # then: API 서버의 검출 결과 처리와 호환
+    assert response.status_code == 200
+    detection_results = check_detection_results(resp=response, logger=mock_logger)
+    sort_detection_results(detection_results=detection_results, logger=mock_logger)
+    bounding_box = calculate_bounding_box(
+        detection_results=detection_results,
+        logger=mock_logger,
+    )
+    assert bounding_box.model_dump() == {
+        "left": 20,
+        "top": 30,
+        "right": 80,
+        "bottom": 170,
+    }
+
+
+def test_predict_pose(mock_logger):
+    # when
+    response = create_client().post(
+        f"/predictions/{DRAWN_HUMANOID_POSE_ESTIMATOR}",
+        files={"data": create_drawing_bytes()},
+    )
+
+    # then: API 서버의 skeleton 생성과 호환
+    assert response.status_code == 200
+    kpts = check_pose_results(pose_results=response.json(), logger=mock_logger)
+    assert kpts.shape == (17, 2)
+    assert len(make_skeleton(kpts)) == 16
+
+
+@pytest.mark.parametrize(
+    "config_kwargs, model_name, files, expected_status_code",
+    [
+        ({}, "unknown_model", {"data": b"image"}, 404),
+        ({}, DRAWN_HUMANOID_DETECTOR, {"data": b"not an image"}, 400),
+        ({"overload_rate": 1}, DRAWN_HUMANOID_DETECTOR, {"data": b"image"}, 503),
+        ({"error_rate": 1}, DRAWN_HUMANOID_DETECTOR, {"data": b"image"}, 500),
+    ],
+)
+def test_predict_error(
+    config_kwargs,
+    model_name,
+    files,
+    expected_status_code,
+):
+    # when
+    response = create_client(**config_kwargs).post(
+        f"/predictions/{model_name}",
+        files=files,
+    )
+
+    # then
+    assert response.status_code == expected_status_code
+    assert response.json()["code"] == expected_status_code
+
+
+@pytest.mark.asyncio
+async def test_torchserve_client_with_fake_server():
+    # given
+    app = create_fake_torchserve_app(config=FakeTorchServeConfig.mock())
+    torchserve_client = ADTorchServeClient.mock()
+    torchserve_client.transport = httpx.ASGITransport(app=app)
+
+    # when
+    resp = await torchserve_client.post_prediction(
+        model_name=DRAWN_HUMANOID_DETECTOR,
+        files={"data": create_drawing_bytes()},
+        url=f"http://fake_torchserve/predictions/{DRAWN_HUMANOID_DETECTOR}",
+    )
+
+    # then
+    assert resp.status_code == 200
+    assert resp.json()[0]["bbox"] == [20.0, 30.0, 80.0, 170.0]
@@ -1,7 +1,13 @@
+import cv2
 import pytest
+import numpy as np
 from pathlib import Path
 from faker import Faker
-from ad_fast_api.snippets.sources.save_image import save_image_async
+from ad_fast_api.snippets.sources.save_image import (
+    save_image_async,
+    save_image,
+    encode_image,
+)
 from ad_fast_api.snippets.testings.ad_test.ad_test_helper import measure_execution_time
 
 
@@ -24,3 +30,35 @@ async def test_save_image_async(tmp_path: Path):
     image_path = base_path.joinpath(image_name)
     assert image_path.exists()
     assert image_path.read_bytes() == file_bytes
+
+
+def test_encode_image():
+    # given
+    image = np.zeros((10, 20, 3), dtype=np.uint8)
+    image[2:5, 3:7] = 255
+
+    # when
+    image_bytes = encode_image(image)
+
+    # then
+    decoded_image = cv2.imdecode(
+        np.frombuffer(image_bytes, np.uint8),
+        cv2.IMREAD_UNCHANGED,
+    )
+    assert np.array_equal(decoded_image, image)
+
+
+def test_save_image(tmp_path: Path):
+    # given
+    image_name = "test.png"
+    file_bytes = b"image bytes"
+
+    # when
+    save_image(
+        image_bytes=file_bytes,
+        image_name=image_name,
+        base_path=tmp_path,
+    )
+
+    # then
+    assert tmp_path.joinpath(image_name).read_bytes() == file_bytes
@@ -3,16 +3,25 @@ from typing import Optional
 
 FILES_DIR_NAME = "files"
 CONFIG_DIR_NAME = "config"
+DRAWING_INDEX_DIR_NAME = "drawing_index"
 
 FILES_PATH = Path(__file__).parent.parent.joinpath(FILES_DIR_NAME)
+CONFIG_PATH = Path(__file__).parent.parent.joinpath(CONFIG_DIR_NAME)
+DRAWING_INDEX_PATH = Path(__file__).parent.parent.joinpath(DRAWING_INDEX_DIR_NAME)
 ORIGIN_IMAGE_NAME = "origin_image.png"
 BOUNDING_BOX_FILE_NAME = "bounding_box.yaml"
 CROPPED_IMAGE_NAME = "texture.png"
 MASK_IMAGE_NAME = "mask.png"
 CUTOUT_CHARACTER_IMAGE_NAME = "cutout_character_image.png"
 CHAR_CFG_FILE_NAME = "char_cfg.yaml"
+PROVISIONAL_CHAR_CFG_FILE_NAME = "provisional_char_cfg.yaml"
 VIDEO_DIR_NAME = "video"
-MVC_CFG_FILE_NAME = "mvc_cfg.yaml"
+# 애니메이션 파일마다 설정을 따로 두어 같은 ad_id의 렌더링 요청이 서로의 설정을 덮어쓰지 않도록 함
+MVC_CFG_FILE_NAME_FORMAT = "mvc_cfg_{video_file_name}.yaml"
+PREVIEW_MOTION_CFG_FILE_NAME_FORMAT = "motion_{ad_animation}_preview.yaml"
+PREVIEW_QUALITY = "preview"
+# animated_drawings 서버의 render_status_file과 같아야 함
+RENDER_STATUS_FILE_NAME_FORMAT = "render_status_{job_id}.yaml"
 
 
 def get_video_dir_path(
@@ -21,8 +30,29 @@ def get_video_dir_path(
     return base_path.joinpath(VIDEO_DIR_NAME)
 
 
-def get_video_file_name(ad_animation: str) -> str:
-    return f"{ad_animation}.gif"
+def get_video_file_name(
+    ad_animation: str,
+    video_format: str = "gif",
+    quality: str = "full",
+) -> str:
+    if quality == PREVIEW_QUALITY:
+        return f"{ad_animation}_{PREVIEW_QUALITY}.{video_format}"
+    return f"{ad_animation}.{video_format}"
+
+
+def get_mvc_cfg_file_name(video_file_name: str) -> str:
+    # dab_preview.gif -> mvc_cfg_dab_preview_gif.yaml
+    return MVC_CFG_FILE_NAME_FORMAT.format(
+        video_file_name=video_file_name.replace(".", "_"),
+    )
+
+
+def get_preview_motion_cfg_file_name(ad_animation: str) -> str:
+    return PREVIEW_MOTION_CFG_FILE_NAME_FORMAT.format(ad_animation=ad_animation)
+
+
+def get_render_status_file_name(job_id: str) -> str:
+    return RENDER_STATUS_FILE_NAME_FORMAT.format(job_id=job_id)
 
 
 def get_base_path(
@@ -18,6 +18,20 @@ def test_get_video_file_name():
 
     # then
     assert result == expected, f"Expected {expected}, got {result}"
+    assert conf_workspace.get_video_file_name(ad_animation, "webm") == (
+        "sample_animation.webm"
+    )
+    assert conf_workspace.get_video_file_name(ad_animation, "gif", "preview") == (
+        "sample_animation_preview.gif"
+    )
+
+
+def test_get_mvc_cfg_file_name():
+    # when, then: 애니메이션 파일마다 다른 설정 파일 이름
+    assert conf_workspace.get_mvc_cfg_file_name("dab.gif") == "mvc_cfg_dab_gif.yaml"
+    assert conf_workspace.get_mvc_cfg_file_name("dab_preview.gif") == (
+        "mvc_cfg_dab_preview_gif.yaml"
+    )
 
 
 def test_get_video_dir_path(tmp_path):